@@ -0,0 +1,386 @@
+#!/usr/bin/python
+"""
+Module regex_lib.Adaptive
+
+Resolution of the date / time stamps with the order of the patterns adapted to
+the stream of the strings. The functions ResolveDateTuple() and
+ResolveTimeTuple() try the patterns always in the same fixed order of priority,
+thus a stream of stamps of a low priority pattern always pays for the failed
+searches of all patterns of the higher priority first. The resolvers of this
+module count, which pattern wins on the stream, and try the patterns in the
+order of their counts, i.e. the dominant pattern first. The results are
+exactly the same as of the fixed order: if a pattern is found, all not yet
+tried patterns of the higher priority are verified not to be present in the
+string. The verification is cheap, since each pattern has a signature - the
+alternative fragments of the shape of the string (see Search.SHAPE_TABLE), at
+least one of which must be present for the pattern to be found; a pattern,
+which signature is absent, is not searched for at all. The compact stamps are
+resolved by the same regular expressions free fast paths as used by the fixed
+order functions (ScanCompactDate() and ScanCompactTime()) before any pattern
+is tried.
+
+Globals:
+    DATE_NAMES - tuple(str), names of the date patterns in the order of
+        priority used by ResolveDate()
+    DATE_SIGNATURES - tuple(tuple(str)), the signatures of the date patterns
+        in the same order
+    TIME_NAMES - tuple(str), names of the time patterns in the order of
+        priority used by ResolveTime()
+    TIME_SIGNATURES - tuple(tuple(str)), the signatures of the time patterns
+        in the same order
+
+Functions:
+    MakeSignature()
+        str -> str
+
+Classes:
+    AdaptiveResolver
+    AdaptiveDateResolver
+    AdaptiveTimeResolver
+"""
+
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+
+#imports
+
+#+ package modules
+
+from .Search import SearchLast, SHAPE_TABLE
+
+from .Date import C_DATE_SEARCH_PATTERNS, ConvertDateMatchTuple, \
+                                                                ScanCompactDate
+
+from .Time import C_TIME_SEARCH_PATTERNS, ConvertTimeMatchTuple, \
+                                                                ScanCompactTime
+
+#globals
+
+#+ ISO_DATE, REVERSED_DATE, SCREWED_DATE, SHORT_DATE, COMPACT_DATE
+
+DATE_NAMES = ('ISO_DATE', 'REVERSED_DATE', 'SCREWED_DATE', 'SHORT_DATE',
+                                                                'COMPACT_DATE')
+
+DATE_SIGNATURES = (('0000-0-0', '0000-00-0'), ('0-0-0000', '0-00-0000'),
+                    ('0-00-0000', ), ('00-0-0', '00-00-0'), ('00000000', ))
+
+#+ TIME_PATTERN, SHORT_TIME_PATTERN, COMPACT_TIME_PATTERN,
+#+ SHORT_COMPACT_TIME_PATTERN
+
+TIME_NAMES = ('TIME', 'SHORT_TIME', 'COMPACT_TIME', 'SHORT_COMPACT_TIME')
+
+TIME_SIGNATURES = (('0:0:0', '0:00:0'), ('0:0', ), ('000000', ), ('0000', ))
+
+#functions
+
+def MakeSignature(strStamp):
+    """
+    Returns the string matched against the signatures of the patterns, see
+    Search.SHAPE_TABLE: the digits are replaced by '0', the date separators by
+    '-', and all other characters except for ':' by spaces. The not ASCII
+    characters of a unicode string are replaced by spaces as well. Unlike
+    Shape.MakeShape(), which keeps all not digit characters, the separators
+    are folded, so a signature covers all separators of a pattern.
+    
+    Signature:
+        str -> str
+    
+    Version 0.2.0.0
+    """
+    if isinstance(strStamp, unicode):
+        strStamp = strStamp.encode('ascii', 'replace')
+    return strStamp.translate(SHAPE_TABLE)
+
+#classes
+
+class AdaptiveResolver(object):
+    """
+    Callable resolver trying the search patterns in the order of the counts of
+    the strings resolved by each of them, with the same result as of trying
+    them in the fixed order of priority and selecting the last occurrence of
+    the first found pattern (see function Search.SearchLast()). After a pattern
+    is found, all not yet tried patterns of the higher priority are searched
+    for as the verification, and the first of them found in the order of
+    priority overrides the result. The patterns, which signatures are absent
+    from the shape of the string, are not searched for at all. The optional
+    fast path is tried before any pattern.
+    
+    The ordering is adapted after each resolved string: the winning pattern is
+    moved ahead of the preceding pattern in the ordering if its count becomes
+    greater. The instances are not thread-safe.
+    
+    Usage:
+        objResolver = AdaptiveResolver(C_DATE_SEARCH_PATTERNS, DATE_NAMES,
+                            DATE_SIGNATURES, ConvertDateMatchTuple, False)
+        tupleDate = objResolver('MSC00000001_20170502_1448_PASS.xml')
+    
+    Attributes:
+        Patterns: tuple(re.RegexObject), the search patterns in the order of
+            priority
+        Names: tuple(str), the names of the patterns
+        Signatures: tuple(tuple(str)), the signatures of the patterns
+        Function: function(re.MatchObject) -> type A, the conversion of the
+            found match
+        Upper: bool, flag if the patterns are searched for in the string
+            converted to the upper case
+        FastPath: function(str) -> bool, type A OR None; OR None, the
+            regular expressions free fast path tried before the patterns
+        Counts: dict(str -> int), number of the strings resolved by each of
+            the patterns
+        Calls: int >= 0, number of the resolved strings
+        FastPaths: int >= 0, number of the strings resolved by the fast path
+        Verifications: int >= 0, number of the verification searches
+        Overrides: int >= 0, number of the results overridden by a pattern of
+            the higher priority found by the verification
+    
+    Methods:
+        __call__(strStamp)
+            str -> type A OR None
+        GetOrdering()
+            None -> list(str)
+        Clear()
+            None -> None
+        GetStatistics()
+            None -> dict(str -> int OR float OR list(str) OR dict(str -> int))
+    
+    Version 0.2.0.0
+    """
+    
+    def __init__(self, tuplePatterns, tupleNames, tupleSignatures, fFunction,
+                                                    bUpper, fFastPath = None):
+        """
+        Initialization.
+        
+        Signature:
+            tuple(re.RegexObject), tuple(str), tuple(tuple(str)),
+                function(re.MatchObject) -> type A, bool,
+                    function(str) -> bool, type A OR None -> None
+        
+        Args:
+            tuplePatterns: tuple(re.RegexObject), the search patterns in the
+                order of priority
+            tupleNames: tuple(str), the names of the patterns
+            tupleSignatures: tuple(tuple(str)), the alternative fragments of
+                the shape of the string, at least one of which must be present
+                for the respective pattern to be found
+            fFunction: function(re.MatchObject) -> type A, the conversion of
+                the found match
+            bUpper: bool, flag if the patterns are searched for in the string
+                converted to the upper case
+            fFastPath: (optional) function(str) -> bool, type A OR None, the
+                regular expressions free fast path returning the flag if the
+                string is resolved and the result, e.g. Date.ScanCompactDate(),
+                defaults to None (no fast path)
+        
+        Raises:
+            ValueError: the numbers of the patterns, names and signatures are
+                not equal
+        
+        Version 0.2.0.0
+        """
+        if not (len(tuplePatterns) == len(tupleNames) == len(tupleSignatures)):
+            strError = 'numbers of patterns {}, names {} and {}'.format(
+                                    len(tuplePatterns), len(tupleNames),
+                                    'signatures {} are not equal'.format(
+                                                        len(tupleSignatures)))
+            raise ValueError(strError)
+        self.Patterns = tuple(tuplePatterns)
+        self.Names = tuple(tupleNames)
+        self.Signatures = tuple(tupleSignatures)
+        self.Function = fFunction
+        self.Upper = bUpper
+        self.FastPath = fFastPath
+        self.Clear()
+    
+    def __call__(self, strStamp):
+        """
+        Resolves the passed string with the patterns tried in the current
+        ordering, with the same result as with the patterns tried in the
+        order of priority.
+        
+        Signature:
+            str -> type A OR None
+        
+        Returns:
+            type A: the converted last occurrence of the first found pattern in
+                the order of priority
+            None: none of the patterns is found
+        
+        Raises:
+            TypeError: if the passed argument is not a string.
+        
+        Version 0.2.0.0
+        """
+        if not isinstance(strStamp, basestring):
+            strError = '{} of {} is not a string'.format(strStamp,
+                                                            type(strStamp))
+            raise TypeError(strError)
+        self.Calls += 1
+        if not (self.FastPath is None):
+            bResolved, gResult = self.FastPath(strStamp)
+            if bResolved:
+                self.FastPaths += 1
+                return gResult
+        strSignature = MakeSignature(strStamp)
+        if self.Upper:
+            strStamp = strStamp.upper()
+        tupleSignatures = self.Signatures
+        tuplePatterns = self.Patterns
+        lstOrder = self._lstOrder
+        iPosition = 0
+        for iWinner in lstOrder:
+            for strFragment in tupleSignatures[iWinner]:
+                if strFragment in strSignature:
+                    objMatch = SearchLast(tuplePatterns[iWinner], strStamp)
+                    break
+            else:
+                objMatch = None
+            if objMatch:
+                break
+            iPosition += 1
+        else:
+            return None
+        #+ verification of the not tried patterns of the higher priority
+        lstTried = lstOrder[:iPosition]
+        for iIndex in xrange(iWinner):
+            if iIndex in lstTried:
+                continue
+            for strFragment in tupleSignatures[iIndex]:
+                if strFragment in strSignature:
+                    self.Verifications += 1
+                    objVerified = SearchLast(tuplePatterns[iIndex], strStamp)
+                    break
+            else:
+                objVerified = None
+            if objVerified:
+                self.Overrides += 1
+                iWinner = iIndex
+                objMatch = objVerified
+                iPosition = lstOrder.index(iWinner)
+                break
+        #+ adaptation of the ordering: the winner is moved ahead of the
+        #+ preceding pattern if its count has become greater
+        lstCounts = self._lstCounts
+        lstCounts[iWinner] += 1
+        if iPosition and (lstCounts[lstOrder[iPosition - 1]] <
+                                                        lstCounts[iWinner]):
+            lstOrder[iPosition - 1], lstOrder[iPosition] = (iWinner,
+                                                    lstOrder[iPosition - 1])
+        return self.Function(objMatch)
+    
+    @property
+    def Counts(self):
+        """
+        Number of the strings resolved by each of the patterns.
+        
+        Signature:
+            None -> dict(str -> int)
+        
+        Version 0.2.0.0
+        """
+        return dict(zip(self.Names, self._lstCounts))
+    
+    def GetOrdering(self):
+        """
+        Returns the names of the patterns in the current (learned) order, in
+        which they are tried.
+        
+        Signature:
+            None -> list(str)
+        
+        Version 0.2.0.0
+        """
+        return [self.Names[iIndex] for iIndex in self._lstOrder]
+    
+    def Clear(self):
+        """
+        Resets the ordering to the order of priority and resets the counters.
+        
+        Signature:
+            None -> None
+        
+        Version 0.2.0.0
+        """
+        self._lstOrder = range(len(self.Patterns))
+        self._lstCounts = [0] * len(self.Patterns)
+        self.Calls = 0
+        self.FastPaths = 0
+        self.Verifications = 0
+        self.Overrides = 0
+    
+    def GetStatistics(self):
+        """
+        Returns the usage statistics.
+        
+        Signature:
+            None -> dict(str -> int OR float OR list(str) OR dict(str -> int))
+        
+        Returns:
+            dict(str -> int OR float OR list(str) OR dict(str -> int)): with
+                the keys 'Calls', 'FastPaths', 'Verifications', 'Overrides',
+                'Resolved' (fraction of the calls resolved by the search
+                patterns, 0.0 if there were no calls), 'Ordering' (see method
+                GetOrdering()) and 'Counts' (see attribute Counts)
+        
+        Version 0.2.0.0
+        """
+        iResolved = sum(self._lstCounts)
+        if self.Calls:
+            fResolved = float(iResolved) / self.Calls
+        else:
+            fResolved = 0.0
+        return {'Calls' : self.Calls, 'FastPaths' : self.FastPaths,
+                'Verifications' : self.Verifications,
+                'Overrides' : self.Overrides, 'Resolved' : fResolved,
+                'Ordering' : self.GetOrdering(), 'Counts' : self.Counts}
+
+class AdaptiveDateResolver(AdaptiveResolver):
+    """
+    Adaptive version of the function ResolveDateTuple() of the module Date,
+    with exactly the same results, see class AdaptiveResolver.
+    
+    Usage:
+        objResolver = AdaptiveDateResolver()
+        tupleDate = objResolver('MSC00000001_20170502_1448_PASS.xml')
+    
+    Version 0.2.0.0
+    """
+    
+    def __init__(self):
+        """
+        Initialization.
+        
+        Signature:
+            None -> None
+        
+        Version 0.2.0.0
+        """
+        super(AdaptiveDateResolver, self).__init__(C_DATE_SEARCH_PATTERNS,
+                        DATE_NAMES, DATE_SIGNATURES, ConvertDateMatchTuple,
+                                                        False, ScanCompactDate)
+
+class AdaptiveTimeResolver(AdaptiveResolver):
+    """
+    Adaptive version of the function ResolveTimeTuple() of the module Time,
+    with exactly the same results, see class AdaptiveResolver.
+    
+    Usage:
+        objResolver = AdaptiveTimeResolver()
+        tupleTime = objResolver('MSC00000001_20170502_1448_PASS.xml')
+    
+    Version 0.2.0.0
+    """
+    
+    def __init__(self):
+        """
+        Initialization.
+        
+        Signature:
+            None -> None
+        
+        Version 0.2.0.0
+        """
+        super(AdaptiveTimeResolver, self).__init__(C_TIME_SEARCH_PATTERNS,
+                        TIME_NAMES, TIME_SIGNATURES, ConvertTimeMatchTuple,
+                                                        True, ScanCompactTime)
@@ -0,0 +1,145 @@
+#usr/bin/python
+"""
+Benchmark of the per-character cost of the date / time stamps resolution as a
+function of the input string length (100 characters to 1 MB) for the legacy
+'(.*[^0-9]|^)' wrapped patterns used with the match() method and for the search
+patterns (see module regex_lib.Search) used by ResolveDate() and ResolveTime().
+
+Usage:
+    python BM001_Search_Scaling.py [max_length]
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import timeit
+
+#+ benchmarked module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Date import ResolveDate, C_ISO_DATE, C_REVERSED_DATE, \
+                                C_SCREWED_DATE, C_SHORT_DATE, C_COMPACT_DATE
+
+from regex_lib.Time import ResolveTime, C_TIME_PATTERN, C_SHORT_TIME_PATTERN, \
+                        C_COMPACT_TIME_PATTERN, C_SHORT_COMPACT_TIME_PATTERN
+
+#globals
+
+LENGTHS = [100, 1000, 10000, 100000, 1000000]
+
+#+ the total number of characters processed per measurement
+
+CHARACTERS = 2000000
+
+#functions
+
+def LegacyDate(strStamp):
+    """
+    The legacy patterns cascade of ResolveDate(), only the matching part.
+    
+    Signature:
+        str -> re.MatchObject OR None
+    
+    Version 0.2.0.0
+    """
+    for objPattern in [C_ISO_DATE, C_REVERSED_DATE, C_SCREWED_DATE,
+                                                C_SHORT_DATE, C_COMPACT_DATE]:
+        objMatch = objPattern.match(strStamp)
+        if objMatch:
+            break
+    return objMatch
+
+def LegacyTime(strStamp):
+    """
+    The legacy patterns cascade of ResolveTime(), only the matching part.
+    
+    Signature:
+        str -> re.MatchObject OR None
+    
+    Version 0.2.0.0
+    """
+    _strStamp = strStamp.upper()
+    for objPattern in [C_TIME_PATTERN, C_SHORT_TIME_PATTERN,
+                        C_COMPACT_TIME_PATTERN, C_SHORT_COMPACT_TIME_PATTERN]:
+        objMatch = objPattern.match(_strStamp)
+        if objMatch:
+            break
+    return objMatch
+
+def MakeCorpus(iLength):
+    """
+    Generates the benchmark input strings of the required length.
+    
+    Signature:
+        int -> list(tuple(str, str))
+    
+    Returns:
+        list(tuple(str, str)): pairs of the input name and the input string:
+            'noise' - text without digits, 'digits' - many short digit runs,
+            'stamp' - a date and time stamps at the end of the text, 'head' - a
+            date and time stamps at the start of the text
+    
+    Version 0.2.0.0
+    """
+    strStamps = ' 2018-05-09 12:30:01 '
+    strText = 'log line text ' * (iLength // 14 + 1)
+    strDigits = '12 3-4 5:6 ' * (iLength // 11 + 1)
+    return [('noise', strText[:iLength]),
+            ('digits', strDigits[:iLength]),
+            ('stamp', strText[:iLength - len(strStamps)] + strStamps),
+            ('head', strStamps + strText[:iLength - len(strStamps)])]
+
+def Measure(fFunction, strInput):
+    """
+    Measures the average time per input character in nanoseconds.
+    
+    Signature:
+        function(str) -> type A, str -> float
+    
+    Version 0.2.0.0
+    """
+    iLength = len(strInput)
+    iNumber = max(1, CHARACTERS // iLength)
+    fTime = min(timeit.repeat(lambda : fFunction(strInput), number = iNumber,
+                                                                repeat = 3))
+    return fTime * 1.0E9 / (iNumber * iLength)
+
+#execution entry point
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        iMaxLength = int(sys.argv[1])
+    else:
+        iMaxLength = LENGTHS[-1]
+    lstFunctions = [('legacy date', LegacyDate), ('ResolveDate', ResolveDate),
+                    ('legacy time', LegacyTime), ('ResolveTime', ResolveTime)]
+    sys.stdout.write('Time per character, ns\n')
+    sys.stdout.write('{:>8} {:>7}'.format('length', 'input'))
+    for strName, _ in lstFunctions:
+        sys.stdout.write(' {:>12}'.format(strName))
+    sys.stdout.write('\n')
+    for iLength in LENGTHS:
+        if iLength > iMaxLength:
+            break
+        for strName, strInput in MakeCorpus(iLength):
+            sys.stdout.write('{:>8} {:>7}'.format(iLength, strName))
+            for _, fFunction in lstFunctions:
+                sys.stdout.write(' {:>12.2f}'.format(Measure(fFunction,
+                                                                    strInput)))
+            sys.stdout.write('\n')
+            sys.stdout.flush()
@@ -0,0 +1,121 @@
+#usr/bin/python
+"""
+Benchmark of the per-item time of the batch functions ResolveDates() and
+ResolveTimes() compared to the scalar functions ResolveDate() and ResolveTime()
+called in a Python loop, on a generated corpus of short file names.
+
+Usage:
+    python BM002_Batch_Overhead.py [number_of_items]
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import timeit
+import random
+
+#+ benchmarked module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Date import ResolveDate, ResolveDates
+
+from regex_lib.Time import ResolveTime, ResolveTimes
+
+#globals
+
+ITEMS = 20000
+
+#functions
+
+def MakeCorpus(iItems):
+    """
+    Generates the list of file names, about a half with both date and time
+    stamps in the different formats and the rest without stamps.
+    
+    Signature:
+        int -> list(str)
+    
+    Version 0.2.0.0
+    """
+    objRandom = random.Random(20181026)
+    lstTemplates = ['MSC{:08}_{:04}{:02}{:02}_{:02}{:02}_PROGRAMMING_PASS.xml',
+                    'run_{:03}_{:04}-{:02}-{:02}_{:02}:{:02}.log',
+                    'sample_{:06}_plate_{:02}_{:02}_{:02}_{:02}_{:02}.csv',
+                    'report_{:04}_{:02}_{:02}_{:02}_{:02}_{:02}_final.pdf']
+    lstResult = []
+    for _ in range(iItems):
+        strTemplate = objRandom.choice(lstTemplates)
+        if strTemplate.startswith('MSC'):
+            tupleValues = (objRandom.randint(0, 99999999),
+                            objRandom.randint(1990, 2030),
+                            objRandom.randint(1, 12), objRandom.randint(1, 28),
+                            objRandom.randint(0, 23), objRandom.randint(0, 59))
+        elif strTemplate.startswith('run'):
+            tupleValues = (objRandom.randint(0, 999),
+                            objRandom.randint(1990, 2030),
+                            objRandom.randint(1, 12), objRandom.randint(1, 28),
+                            objRandom.randint(0, 23), objRandom.randint(0, 59))
+        else:
+            tupleValues = tuple(objRandom.randint(0, 999) for _ in range(6))
+        lstResult.append(strTemplate.format(*tupleValues))
+    return lstResult
+
+def Measure(fFunction, lstCorpus):
+    """
+    Measures the average time per item in microseconds.
+    
+    Signature:
+        function(list(str)) -> type A, list(str) -> float
+    
+    Version 0.2.0.0
+    """
+    fTime = min(timeit.repeat(lambda : fFunction(lstCorpus), number = 1,
+                                                                repeat = 3))
+    return fTime * 1.0E6 / len(lstCorpus)
+
+#execution entry point
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        iItems = int(sys.argv[1])
+    else:
+        iItems = ITEMS
+    lstCorpus = MakeCorpus(iItems)
+    lstCases = [
+        ('date', lambda lstItems: [ResolveDate(strItem)
+                                                    for strItem in lstItems],
+            [('ResolveDates()', ResolveDates),
+            ('ResolveDates(bUnion = True)', lambda lstItems:
+                                        ResolveDates(lstItems, bUnion = True))
+            ]),
+        ('time', lambda lstItems: [ResolveTime(strItem)
+                                                    for strItem in lstItems],
+            [('ResolveTimes()', ResolveTimes),
+            ('ResolveTimes(bUnion = True)', lambda lstItems:
+                                        ResolveTimes(lstItems, bUnion = True))
+            ])]
+    sys.stdout.write('{} items, time per item, us\n'.format(iItems))
+    for strName, fScalar, lstBatches in lstCases:
+        fReference = Measure(fScalar, lstCorpus)
+        sys.stdout.write('{:<30} {:>8.2f}\n'.format('{} loop'.format(strName),
+                                                                fReference))
+        for strBatch, fBatch in lstBatches:
+            fTime = Measure(fBatch, lstCorpus)
+            sys.stdout.write('{:<30} {:>8.2f} speed-up x{:.2f}\n'.format(
+                                        strBatch, fTime, fReference / fTime))
+        sys.stdout.flush()
@@ -0,0 +1,117 @@
+#usr/bin/python
+"""
+Benchmark of the throughput (files per second) of the function CrawlDirectory()
+as a function of the number of the worker processes, on a generated temporary
+directory tree with empty files named as the corpus of BM002_Batch_Overhead.
+
+Usage:
+    python BM003_Crawler_Scaling.py [number_of_files [max_workers]]
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import time
+import tempfile
+import shutil
+import multiprocessing
+
+#+ benchmarked module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Crawler import CrawlDirectory
+
+from BM002_Batch_Overhead import MakeCorpus
+
+#globals
+
+FILES = 100000
+
+FOLDERS = 100
+
+#functions
+
+def MakeTree(iFiles):
+    """
+    Creates a temporary directory tree with the empty files and returns the
+    path to its top directory.
+    
+    Signature:
+        int -> str
+    
+    Version 0.2.0.0
+    """
+    strTop = tempfile.mkdtemp()
+    for iIndex, strName in enumerate(MakeCorpus(iFiles)):
+        strFolder = os.path.join(strTop, 'folder{:03}'.format(iIndex % FOLDERS))
+        if not os.path.isdir(strFolder):
+            os.mkdir(strFolder)
+        #+ the prefix keeps the names unique
+        strPath = os.path.join(strFolder, '{}_{}'.format(iIndex, strName))
+        open(strPath, 'w').close()
+    return strTop
+
+def Measure(strTop, iWorkers, bOrdered):
+    """
+    Measures the throughput of CrawlDirectory() in files per second, the best
+    of 3 runs.
+    
+    Signature:
+        str, int, bool -> float
+    
+    Version 0.2.0.0
+    """
+    fBest = None
+    for _ in range(3):
+        fStart = time.time()
+        iFiles = 0
+        for _ in CrawlDirectory(strTop, iWorkers, bOrdered = bOrdered):
+            iFiles += 1
+        fTime = time.time() - fStart
+        if fBest is None or fTime < fBest:
+            fBest = fTime
+    return iFiles / fBest
+
+#execution entry point
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        iFiles = int(sys.argv[1])
+    else:
+        iFiles = FILES
+    if len(sys.argv) > 2:
+        iMaxWorkers = int(sys.argv[2])
+    else:
+        iMaxWorkers = multiprocessing.cpu_count()
+    strTop = MakeTree(iFiles)
+    try:
+        sys.stdout.write('{} files, {} CPUs, files per second\n'.format(
+                                        iFiles, multiprocessing.cpu_count()))
+        sys.stdout.write('{:>8} {:>12} {:>12} {:>8}\n'.format('workers',
+                                            'ordered', 'unordered', 'scaling'))
+        fReference = None
+        for iWorkers in range(1, iMaxWorkers + 1):
+            fOrdered = Measure(strTop, iWorkers, True)
+            fUnordered = Measure(strTop, iWorkers, False)
+            if fReference is None:
+                fReference = fOrdered
+            sys.stdout.write('{:>8} {:>12.0f} {:>12.0f} {:>7.2f}x\n'.format(
+                        iWorkers, fOrdered, fUnordered, fOrdered / fReference))
+            sys.stdout.flush()
+    finally:
+        shutil.rmtree(strTop)
@@ -0,0 +1,366 @@
+#usr/bin/python
+"""
+Reproducible benchmark suite of the date / time stamps resolution. The
+functions ResolveDate() and ResolveTime(), and each compiled pattern (legacy
+wrapped version with the method match() and search version with the function
+SearchLast()) are measured on the generated corpora: short file names, long log
+lines, non-matching noise, stamps of each pattern family and digit-heavy
+adversarial strings.
+
+For each function and corpus the throughput (calls per second), the latency
+percentiles (per call, in microseconds) and the peak memory increase (KB,
+measured in a separate process; only on the platforms with the standard module
+resource, otherwise null) are reported. The results are saved as JSON, and they
+can be compared with the results of a previous run, in which case the exit
+code is 1 if any throughput has decreased by more than the threshold.
+
+Usage:
+    python BM004_Resolution_Suite.py [-h] [--items N] [--output FILE]
+                                    [--compare FILE] [--threshold FRACTION]
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import json
+import random
+import timeit
+import platform
+import argparse
+import datetime
+import multiprocessing
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+#+ benchmarked module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+import regex_lib
+
+import regex_lib.Date as Date
+
+import regex_lib.Time as Time
+
+from regex_lib.Search import SearchLast
+
+#globals
+
+ITEMS = 1000
+
+SEED = 20181018
+
+OUTPUT = 'BM004_results.json'
+
+THRESHOLD = 0.1
+
+#+ latency percentiles to report
+
+PERCENTILES = (50, 90, 99)
+
+#+ format of the printed result row
+
+ROW = '{:<40} {:<26} {:>10.0f} {:>8.2f} {:>8.2f}\n'
+
+#+ pattern families: name, legacy pattern, search pattern
+
+FAMILIES = [
+    ('ISO_DATE', Date.C_ISO_DATE, Date.C_ISO_DATE_SEARCH),
+    ('REVERSED_DATE', Date.C_REVERSED_DATE, Date.C_REVERSED_DATE_SEARCH),
+    ('SCREWED_DATE', Date.C_SCREWED_DATE, Date.C_SCREWED_DATE_SEARCH),
+    ('COMPACT_DATE', Date.C_COMPACT_DATE, Date.C_COMPACT_DATE_SEARCH),
+    ('SHORT_DATE', Date.C_SHORT_DATE, Date.C_SHORT_DATE_SEARCH),
+    ('TIME', Time.C_TIME_PATTERN, Time.C_TIME_SEARCH),
+    ('SHORT_TIME', Time.C_SHORT_TIME_PATTERN, Time.C_SHORT_TIME_SEARCH),
+    ('COMPACT_TIME', Time.C_COMPACT_TIME_PATTERN, Time.C_COMPACT_TIME_SEARCH),
+    ('SHORT_COMPACT_TIME', Time.C_SHORT_COMPACT_TIME_PATTERN,
+                                            Time.C_SHORT_COMPACT_TIME_SEARCH)]
+
+#functions
+
+def GenerateStamp(strFamily, objRandom):
+    """
+    Generates a random stamp of the pattern family.
+    
+    Signature:
+        str, random.Random -> str
+    
+    Version 0.2.0.0
+    """
+    fInt = objRandom.randint
+    strSeparator = objRandom.choice('-_/.')
+    strModifier = objRandom.choice(['', ' AM', 'p.m.'])
+    if strFamily == 'ISO_DATE':
+        strResult = '{:04}{}{}{}{}'.format(fInt(1900, 2099), strSeparator,
+                                        fInt(1, 12), strSeparator, fInt(1, 31))
+    elif strFamily == 'REVERSED_DATE':
+        strResult = '{}{}{:02}{}{:04}'.format(fInt(1, 31), strSeparator,
+                                    fInt(1, 12), strSeparator, fInt(1900, 2099))
+    elif strFamily == 'SCREWED_DATE':
+        strResult = '{}{}{}{}{:04}'.format(fInt(1, 12), strSeparator,
+                                fInt(13, 31), strSeparator, fInt(1900, 2099))
+    elif strFamily == 'COMPACT_DATE':
+        strResult = '{:04}{:02}{:02}'.format(fInt(1900, 2099), fInt(1, 12),
+                                                                fInt(1, 31))
+    elif strFamily == 'SHORT_DATE':
+        strResult = '{:02}{}{}{}{}'.format(fInt(0, 99), strSeparator,
+                                        fInt(1, 12), strSeparator, fInt(1, 31))
+    elif strFamily == 'TIME':
+        strResult = '{}:{:02}:{:02}.{}{}'.format(fInt(0, 23), fInt(0, 59),
+                                    fInt(0, 59), fInt(0, 999), strModifier)
+    elif strFamily == 'SHORT_TIME':
+        strResult = '{}:{:02}{}'.format(fInt(1, 12), fInt(0, 59), strModifier)
+    elif strFamily == 'COMPACT_TIME':
+        strResult = '{:02}{:02}{:02}'.format(fInt(0, 23), fInt(0, 59),
+                                                                fInt(0, 59))
+    else:
+        strResult = '{:02}{:02}'.format(fInt(0, 23), fInt(0, 59))
+    return strResult
+
+def MakeCorpora(iItems, iSeed = SEED):
+    """
+    Generates the benchmark corpora, the same for the same arguments.
+    
+    Signature:
+        int, int -> dict(str -> list(str))
+    
+    Returns:
+        dict(str -> list(str)): corpus name -> list of the input strings:
+            'filenames' - short file names with the date and time stamps
+            'log_lines' - ~500 characters log lines with a stamp at the start
+                and many numbers
+            'noise' - text without any digits
+            'adversarial' - long sequences of short digit runs and separators
+            'family_<NAME>' - a stamp of the respective pattern family within a
+                short text
+    
+    Version 0.2.0.0
+    """
+    objRandom = random.Random(iSeed)
+    dictCorpora = {}
+    dictCorpora['filenames'] = ['MSC{:08}_{}_{}_{}.xml'.format(
+                    objRandom.randint(0, 99999999),
+                    GenerateStamp('COMPACT_DATE', objRandom),
+                    GenerateStamp('SHORT_COMPACT_TIME', objRandom),
+                            objRandom.choice(['PASS', 'FAIL', 'PROGRAMMING']))
+                                                    for _ in range(iItems)]
+    lstLines = []
+    for _ in range(iItems):
+        lstWords = [GenerateStamp('ISO_DATE', objRandom),
+                                        GenerateStamp('TIME', objRandom)]
+        while sum(len(strWord) + 1 for strWord in lstWords) < 500:
+            lstWords.append(objRandom.choice(['channel', 'value', 'status',
+                                            'ok', 'warning', 'sample', '=']))
+            lstWords.append(str(objRandom.randint(0, 10 ** 6)))
+        lstLines.append(' '.join(lstWords))
+    dictCorpora['log_lines'] = lstLines
+    strLetters = 'abcdefghijklmnopqrstuvwxyz_-./: '
+    dictCorpora['noise'] = [''.join(objRandom.choice(strLetters)
+                    for _ in range(objRandom.randint(20, 200)))
+                                                    for _ in range(iItems)]
+    strSeparators = '-_/.:'
+    dictCorpora['adversarial'] = [''.join(
+                    '{}{}'.format(objRandom.randint(0, 99),
+                                            objRandom.choice(strSeparators))
+                                                    for _ in range(100))
+                                                    for _ in range(iItems)]
+    for strName, _, _ in FAMILIES:
+        dictCorpora['family_{}'.format(strName)] = [
+                            'data_{}_{}.log'.format(objRandom.randint(0, 9999),
+                                            GenerateStamp(strName, objRandom))
+                                                    for _ in range(iItems)]
+    return dictCorpora
+
+def MakeCases():
+    """
+    Defines the benchmark cases: the measured function and the names of the
+    corpora it is measured on.
+    
+    Signature:
+        None -> list(tuple(str, function(str) -> type A, list(str)))
+    
+    Version 0.2.0.0
+    """
+    lstGeneral = ['filenames', 'log_lines', 'noise', 'adversarial']
+    lstFamilies = ['family_{}'.format(tupleFamily[0])
+                                                for tupleFamily in FAMILIES]
+    lstCases = [('ResolveDate', Date.ResolveDate, lstGeneral + lstFamilies),
+                ('ResolveTime', Time.ResolveTime, lstGeneral + lstFamilies)]
+    for strName, objLegacy, objSearch in FAMILIES:
+        lstCorpora = ['family_{}'.format(strName), 'noise', 'adversarial']
+        lstCases.append(('C_{}.match'.format(strName), objLegacy.match,
+                                                                lstCorpora))
+        lstCases.append(('SearchLast(C_{}_SEARCH)'.format(strName),
+                    lambda strStamp, objPattern = objSearch:
+                                    SearchLast(objPattern, strStamp),
+                                                                lstCorpora))
+    return lstCases
+
+def Measure(fFunction, lstCorpus):
+    """
+    Measures the throughput and the latency percentiles of the function on the
+    corpus.
+    
+    Signature:
+        function(str) -> type A, list(str) -> dict(str -> float)
+    
+    Returns:
+        dict(str -> float): with the keys 'calls_per_second', 'p50_us',
+            'p90_us', 'p99_us' and 'max_us'
+    
+    Version 0.2.0.0
+    """
+    def Loop():
+        for strItem in lstCorpus:
+            fFunction(strItem)
+    fTime = min(timeit.repeat(Loop, number = 1, repeat = 3))
+    fTimer = timeit.default_timer
+    lstLatencies = []
+    for strItem in lstCorpus:
+        fStart = fTimer()
+        fFunction(strItem)
+        lstLatencies.append(fTimer() - fStart)
+    lstLatencies.sort()
+    iLast = len(lstLatencies) - 1
+    dictResult = {'calls_per_second' : len(lstCorpus) / fTime,
+                    'max_us' : lstLatencies[-1] * 1.0E6}
+    for iPercentile in PERCENTILES:
+        fLatency = lstLatencies[int(round(iLast * iPercentile / 100.0))]
+        dictResult['p{}_us'.format(iPercentile)] = fLatency * 1.0E6
+    return dictResult
+
+def MeasureMemory(fFunction, lstCorpus):
+    """
+    Measures the peak memory increase in KB during a single pass of the
+    function over the corpus, in a separate process. Returns None if the
+    standard module resource is not available.
+    
+    Signature:
+        function(str) -> type A, list(str) -> int OR None
+    
+    Version 0.2.0.0
+    """
+    if resource is None:
+        return None
+    objReceiver, objSender = multiprocessing.Pipe(False)
+    def Child():
+        iBefore = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        lstResults = [fFunction(strItem) for strItem in lstCorpus]
+        iAfter = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        objSender.send(iAfter - iBefore)
+        objSender.close()
+    objProcess = multiprocessing.Process(target = Child)
+    objProcess.start()
+    iResult = objReceiver.recv()
+    objProcess.join()
+    if sys.platform == 'darwin':
+        iResult //= 1024 # bytes on Mac OS
+    return iResult
+
+def RunSuite(iItems):
+    """
+    Runs all benchmark cases and returns the results ready to be saved as JSON.
+    
+    Signature:
+        int -> dict(str -> type A)
+    
+    Version 0.2.0.0
+    """
+    dictCorpora = MakeCorpora(iItems)
+    lstResults = []
+    for strFunction, fFunction, lstCorpora in MakeCases():
+        for strCorpus in lstCorpora:
+            lstCorpus = dictCorpora[strCorpus]
+            dictResult = {'function' : strFunction, 'corpus' : strCorpus}
+            dictResult.update(Measure(fFunction, lstCorpus))
+            dictResult['peak_memory_kb'] = MeasureMemory(fFunction, lstCorpus)
+            lstResults.append(dictResult)
+            sys.stdout.write(ROW.format(strFunction, strCorpus,
+                                        dictResult['calls_per_second'],
+                                    dictResult['p50_us'], dictResult['p99_us']))
+            sys.stdout.flush()
+    return {'suite' : 'BM004_Resolution_Suite',
+            'library_version' : regex_lib.__version__,
+            'python' : platform.python_version(),
+            'platform' : platform.platform(),
+            'timestamp' : datetime.datetime.now().isoformat(),
+            'items' : iItems, 'seed' : SEED, 'results' : lstResults}
+
+def Compare(dictOld, dictNew, fThreshold):
+    """
+    Compares the throughput of the two runs and prints the ratios. Returns the
+    number of the regressions, i.e. the cases with the throughput decreased by
+    more than the threshold fraction.
+    
+    Signature:
+        dict(str -> type A), dict(str -> type A), float -> int
+    
+    Version 0.2.0.0
+    """
+    dictReference = {}
+    for dictResult in dictOld['results']:
+        tupleKey = (dictResult['function'], dictResult['corpus'])
+        dictReference[tupleKey] = dictResult['calls_per_second']
+    iRegressions = 0
+    sys.stdout.write('Comparison with the run of {}\n'.format(
+                                                        dictOld['timestamp']))
+    for strKey in ['items', 'seed', 'python', 'platform']:
+        if dictOld.get(strKey) != dictNew.get(strKey):
+            sys.stdout.write('Warning: different {} - {} vs {}\n'.format(
+                            strKey, dictOld.get(strKey), dictNew.get(strKey)))
+    for dictResult in dictNew['results']:
+        tupleKey = (dictResult['function'], dictResult['corpus'])
+        if not (tupleKey in dictReference):
+            continue
+        fRatio = dictResult['calls_per_second'] / dictReference[tupleKey]
+        if fRatio < 1.0 - fThreshold:
+            strFlag = 'REGRESSION'
+            iRegressions += 1
+        else:
+            strFlag = ''
+        sys.stdout.write('{:<40} {:<26} x{:>6.2f} {}\n'.format(tupleKey[0],
+                                                tupleKey[1], fRatio, strFlag))
+    return iRegressions
+
+#execution entry point
+
+if __name__ == "__main__":
+    objParser = argparse.ArgumentParser(description = 'Date / time stamps '
+                                            'resolution benchmark suite')
+    objParser.add_argument('--items', type = int, default = ITEMS,
+                                        help = 'number of strings per corpus')
+    objParser.add_argument('--output', default = OUTPUT,
+                                        help = 'path to the JSON results file')
+    objParser.add_argument('--compare', default = None,
+                            help = 'path to the JSON results of a previous run')
+    objParser.add_argument('--threshold', type = float, default = THRESHOLD,
+                help = 'allowed relative decrease of the throughput')
+    objArguments = objParser.parse_args()
+    sys.stdout.write('{:<40} {:<26} {:>10} {:>8} {:>8}\n'.format('function',
+                                'corpus', 'calls/s', 'p50 us', 'p99 us'))
+    dictNew = RunSuite(objArguments.items)
+    with open(objArguments.output, 'w') as objFile:
+        json.dump(dictNew, objFile, indent = 1, sort_keys = True)
+    sys.stdout.write('Results are saved into {}\n'.format(objArguments.output))
+    if not (objArguments.compare is None):
+        with open(objArguments.compare) as objFile:
+            dictOld = json.load(objFile)
+        if Compare(dictOld, dictNew, objArguments.threshold):
+            sys.exit(1)
@@ -0,0 +1,241 @@
+#usr/bin/python
+"""
+Adversarial fuzz and timing harness checking that the matching time of every
+compiled pattern of the library (legacy wrapped versions with the method
+match(), search and union versions with the method finditer(), i.e. the worst
+case of the function SearchLast()) and of the resolution functions grows at
+most linearly with the length of the input string.
+
+The worst case inputs are the long runs of the fragments of the stamps, i.e.
+the digits, separators, colons, fractions and a.m. / p.m. modifiers, which
+force the regular expression engine to start and abandon a partial match at
+almost every position; and the random strings over the same alphabet. For each
+pattern the time per character is measured on the inputs of the base length
+and of 10 times the base length, and the pattern fails the check if the time
+per character has grown by more than the allowed factor on any input. The
+guarded functions (see module regex_lib.Guard) must also resolve any input in
+less than the time limit per call. The exit code is 1 if any check fails.
+
+Usage:
+    python BM005_ReDoS_Fuzz.py [-h] [--length N] [--growth FACTOR]
+                                [--limit SECONDS] [--seed N]
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import random
+import timeit
+import argparse
+
+#+ benchmarked module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+import regex_lib.Date as Date
+
+import regex_lib.Time as Time
+
+import regex_lib.Stamp as Stamp
+
+import regex_lib.Scanner as Scanner
+
+import regex_lib.Guard as Guard
+
+from BM004_Resolution_Suite import FAMILIES, SEED
+
+#globals
+
+LENGTH = 1000
+
+GROWTH = 2.0
+
+LIMIT = 0.05
+
+#+ the total number of characters processed per measurement
+
+CHARACTERS = 100000
+
+#+ number of the random strings per pattern
+
+RANDOM_INPUTS = 4
+
+#+ alphabet of the random strings and repeated fragments of the stamps
+
+ALPHABET = '0123456789-/_.:, APM'
+
+FRAGMENTS = ['0', '9', '1-', '11.', '1/1/', '19_1', '2018-05-', '31.12.',
+            '1:', '12:', '12:3', '1:1:1,', '235959.', '1:1 A', '1:1 A.',
+            '12:30 P.', '1-1:1.1_', '0:0 AP']
+
+#functions
+
+def MakeInputs(iLength, objRandom):
+    """
+    Generates the adversarial input strings of the required length.
+    
+    Signature:
+        int, random.Random -> list(tuple(str, str))
+    
+    Returns:
+        list(tuple(str, str)): pairs of the input name (the repeated fragment
+            or 'random N') and the input string
+    
+    Version 0.2.0.0
+    """
+    lstResult = []
+    for strFragment in FRAGMENTS:
+        strInput = strFragment * (iLength // len(strFragment) + 1)
+        lstResult.append((repr(strFragment), strInput[:iLength]))
+    for iIndex in range(RANDOM_INPUTS):
+        strInput = ''.join(objRandom.choice(ALPHABET) for _ in xrange(iLength))
+        lstResult.append(('random {}'.format(iIndex), strInput))
+    return lstResult
+
+def MakeCases():
+    """
+    Collects the checked compiled patterns and functions.
+    
+    Signature:
+        None -> list(tuple(str, function(str) -> type A))
+    
+    Version 0.2.0.0
+    """
+    lstResult = []
+    for strName, objLegacy, objSearch in FAMILIES:
+        lstResult.append(('{} legacy'.format(strName), objLegacy.match))
+        lstResult.append(('{} search'.format(strName),
+                            lambda strInput, objPattern = objSearch :
+                                        list(objPattern.finditer(strInput))))
+    for strName, objUnion in [('DATE_UNION', Date.C_DATE_UNION),
+                            ('TIME_UNION', Time.C_TIME_UNION),
+                            ('STAMP_UNION', Scanner.C_STAMP_UNION),
+                            ('DATETIME_UNION', Stamp.C_DATETIME_UNION)]:
+        lstResult.append((strName, lambda strInput, objPattern = objUnion :
+                                        list(objPattern.finditer(strInput))))
+    for fFunction in [Date.ResolveDate, Date.ResolveDateUnion, Time.ResolveTime,
+                                Time.ResolveTimeUnion, Stamp.ResolveDateTime]:
+        lstResult.append(('{}()'.format(fFunction.__name__), fFunction))
+    return lstResult
+
+def MeasureCall(fFunction, strInput):
+    """
+    Measures the best of 3 average times per call in seconds.
+    
+    Signature:
+        function(str) -> type A, str -> float
+    
+    Version 0.2.0.0
+    """
+    iNumber = max(1, CHARACTERS // max(1, len(strInput)))
+    fTime = min(timeit.repeat(lambda : fFunction(strInput), number = iNumber,
+                                                                repeat = 3))
+    return fTime / iNumber
+
+def CheckGrowth(iLength, fGrowth, iSeed = SEED):
+    """
+    Checks that the time per character of each pattern and function does not
+    grow by more than the allowed factor when the input length is increased 10
+    times, and prints the worst case input for each.
+    
+    Signature:
+        int, float, int -> int
+    
+    Returns:
+        int: number of the failed checks
+    
+    Version 0.2.0.0
+    """
+    objRandom = random.Random(iSeed)
+    lstShort = MakeInputs(iLength, objRandom)
+    lstLong = MakeInputs(10 * iLength, objRandom)
+    iFailures = 0
+    sys.stdout.write('{:<30} {:<14} {:>10} {:>10} {:>7}\n'.format('pattern',
+                        'worst input', 'ns/char', 'ns/char', 'growth'))
+    for strName, fFunction in MakeCases():
+        tupleWorst = None
+        for (strInput, strShort), (_, strLong) in zip(lstShort, lstLong):
+            fShort = MeasureCall(fFunction, strShort) * 1.0E9 / iLength
+            fLong = MeasureCall(fFunction, strLong) * 1.0E9 / (10 * iLength)
+            tupleCase = (fLong / fShort, strInput, fShort, fLong)
+            if tupleWorst is None or tupleCase > tupleWorst:
+                tupleWorst = tupleCase
+        fRatio, strInput, fShort, fLong = tupleWorst
+        if fRatio > fGrowth:
+            strFlag = 'FAIL'
+            iFailures += 1
+        else:
+            strFlag = ''
+        sys.stdout.write('{:<30} {:<14} {:>10.1f} {:>10.1f} {:>7.2f} {}\n'
+                .format(strName, strInput, fShort, fLong, fRatio, strFlag))
+        sys.stdout.flush()
+    return iFailures
+
+def CheckGuarded(fLimit, iSeed = SEED):
+    """
+    Checks that the guarded functions resolve any adversarial input, including
+    the inputs much longer than the maximum length, in less than the time
+    limit per call.
+    
+    Signature:
+        float, int -> int
+    
+    Returns:
+        int: number of the failed checks
+    
+    Version 0.2.0.0
+    """
+    objRandom = random.Random(iSeed)
+    iFailures = 0
+    sys.stdout.write('{:<30} {:>10} {:>10}\n'.format('guarded function',
+                                                        'length', 'max us'))
+    for fFunction in [Guard.ResolveDateGuarded, Guard.ResolveTimeGuarded,
+                                                Guard.ResolveDateTimeGuarded]:
+        for iLength in [Guard.MAX_LENGTH, 100 * Guard.MAX_LENGTH]:
+            fWorst = max(MeasureCall(fFunction, strInput)
+                        for _, strInput in MakeInputs(iLength, objRandom))
+            if fWorst > fLimit:
+                strFlag = 'FAIL'
+                iFailures += 1
+            else:
+                strFlag = ''
+            sys.stdout.write('{:<30} {:>10} {:>10.1f} {}\n'.format(
+                    fFunction.__name__, iLength, fWorst * 1.0E6, strFlag))
+            sys.stdout.flush()
+    return iFailures
+
+#execution entry point
+
+if __name__ == "__main__":
+    objParser = argparse.ArgumentParser(description = 'Adversarial fuzz and '
+                                            'timing harness of the patterns')
+    objParser.add_argument('--length', type = int, default = LENGTH,
+                                        help = 'base length of the inputs')
+    objParser.add_argument('--growth', type = float, default = GROWTH,
+                help = 'allowed growth of the time per character')
+    objParser.add_argument('--limit', type = float, default = LIMIT,
+                help = 'allowed time per call of a guarded function, s')
+    objParser.add_argument('--seed', type = int, default = SEED,
+                                    help = 'seed of the random inputs')
+    objArguments = objParser.parse_args()
+    iFailures = CheckGrowth(objArguments.length, objArguments.growth,
+                                                            objArguments.seed)
+    iFailures += CheckGuarded(objArguments.limit, objArguments.seed)
+    if iFailures:
+        sys.stdout.write('{} check(s) failed\n'.format(iFailures))
+        sys.exit(1)
+    sys.stdout.write('All checks passed\n')
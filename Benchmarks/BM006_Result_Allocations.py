@@ -0,0 +1,171 @@
+#usr/bin/python
+"""
+Benchmark of the string and structured (tuples of integers) result modes of the
+date / time stamps resolution functions, as well as of the string mode followed
+by the parsing of the result back into the integers (ParseDate() and
+ParseTime()): the time per call, and the number of the objects and bytes
+allocated for a result and retained by the caller. The small integers (-5 to
+256), None and the booleans are shared singletons in CPython, thus they are not
+counted.
+
+The standard library of Python 2.7 has no tracer of the memory allocations, so
+the allocations are measured as the objects reachable from the retained result
+and as the increase of the number of the objects tracked by the garbage
+collector over many calls (with the garbage collection disabled).
+
+Usage:
+    python BM006_Result_Allocations.py [number_of_strings]
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import gc
+import timeit
+
+#+ benchmarked module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Date import ResolveDate, ResolveDateTuple
+
+from regex_lib.Time import ResolveTime, ResolveTimeTuple
+
+from regex_lib.Stamp import ResolveDateTime, ResolveDateTimeTuple
+
+from BM002_Batch_Overhead import MakeCorpus
+
+#globals
+
+STRINGS = 10000
+
+#functions
+
+def ParseDate(strStamp):
+    """
+    The string mode of the date resolution followed by the parsing of the
+    result back into the integers, as done by the typical caller.
+    
+    Signature:
+        str -> tuple(int, int, int) OR None
+    
+    Version 0.2.0.0
+    """
+    strDate = ResolveDate(strStamp)
+    if strDate is None:
+        return None
+    return tuple(int(strItem) for strItem in strDate.split('-'))
+
+def ParseTime(strStamp):
+    """
+    The string mode of the time resolution followed by the parsing of the
+    result back into the integers, as done by the typical caller.
+    
+    Signature:
+        str -> tuple(int, int, int, bool) OR None
+    
+    Version 0.2.0.0
+    """
+    strTime, bIncrementDate = ResolveTime(strStamp)
+    if strTime is None:
+        return None
+    iHour, iMinute, iSecond = [int(strItem) for strItem in strTime.split(':')]
+    return iHour, iMinute, iSecond, bIncrementDate
+
+def GetRetained(gResult):
+    """
+    Counts the objects and bytes reachable from the result, except for the
+    shared singletons.
+    
+    Signature:
+        type A -> tuple(int, int)
+    
+    Version 0.2.0.0
+    """
+    if gResult is None or isinstance(gResult, bool) or (
+                        isinstance(gResult, int) and -5 <= gResult <= 256):
+        return 0, 0
+    iObjects = 1
+    iBytes = sys.getsizeof(gResult)
+    if isinstance(gResult, tuple):
+        for gItem in gResult:
+            iItemObjects, iItemBytes = GetRetained(gItem)
+            iObjects += iItemObjects
+            iBytes += iItemBytes
+    return iObjects, iBytes
+
+def MeasureTracked(fFunction, lstCorpus):
+    """
+    Measures the increase of the number of the objects tracked by the garbage
+    collector per call, with the results retained.
+    
+    Signature:
+        function(str) -> type A, list(str) -> float
+    
+    Version 0.2.0.0
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        iBefore = len(gc.get_objects())
+        lstResults = [fFunction(strStamp) for strStamp in lstCorpus]
+        iAfter = len(gc.get_objects())
+    finally:
+        gc.enable()
+    #+ the list of the results itself is tracked
+    del lstResults
+    return (iAfter - iBefore - 1) / float(len(lstCorpus))
+
+def Measure(fFunction, lstCorpus):
+    """
+    Measures the time per call in microseconds (best of 3), the numbers of the
+    retained objects and bytes per result and the tracked objects per call.
+    
+    Signature:
+        function(str) -> type A, list(str) -> tuple(float, float, float, float)
+    
+    Version 0.2.0.0
+    """
+    fTime = min(timeit.repeat(lambda : [fFunction(strStamp)
+                                            for strStamp in lstCorpus],
+                                                    number = 1, repeat = 3))
+    iObjects = 0
+    iBytes = 0
+    for strStamp in lstCorpus:
+        iResultObjects, iResultBytes = GetRetained(fFunction(strStamp))
+        iObjects += iResultObjects
+        iBytes += iResultBytes
+    fItems = float(len(lstCorpus))
+    return (fTime * 1.0E6 / fItems, iObjects / fItems, iBytes / fItems,
+                                        MeasureTracked(fFunction, lstCorpus))
+
+#execution entry point
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        iStrings = int(sys.argv[1])
+    else:
+        iStrings = STRINGS
+    lstCorpus = MakeCorpus(iStrings)
+    sys.stdout.write('{:<24} {:>10} {:>10} {:>10} {:>10}\n'.format('function',
+                            'us/call', 'objects', 'bytes', 'tracked'))
+    for fFunction in [ResolveDate, ParseDate, ResolveDateTuple, ResolveTime,
+                        ParseTime, ResolveTimeTuple, ResolveDateTime,
+                                                        ResolveDateTimeTuple]:
+        sys.stdout.write('{:<24} {:>10.2f} {:>10.2f} {:>10.1f} {:>10.2f}\n'
+                    .format(fFunction.__name__, *Measure(fFunction, lstCorpus)))
+        sys.stdout.flush()
@@ -0,0 +1,100 @@
+#usr/bin/python
+"""
+Benchmark of the date and time stamps resolution with the grammars matched
+against a single shared tokenization of the string (module regex_lib.Tokens)
+versus the regular expression patterns: the separate date and time resolution
+(ResolveDateTuple() + ResolveTimeTuple() versus ResolveDateTokens() +
+ResolveTimeTokens()) and the combined resolution (ResolveDateTimeTuple()
+versus ResolveDateTimeTokens()). The time per string in microseconds is
+reported for the general corpora of the benchmark BM004_Resolution_Suite.
+
+Usage:
+    python BM007_Shared_Tokenization.py [number_of_strings]
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import timeit
+
+#+ benchmarked module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Date import ResolveDateTuple
+
+from regex_lib.Time import ResolveTimeTuple
+
+from regex_lib.Stamp import ResolveDateTimeTuple
+
+from regex_lib.Tokens import ResolveDateTokens, ResolveTimeTokens, \
+                                                        ResolveDateTimeTokens
+
+from BM004_Resolution_Suite import MakeCorpora
+
+#globals
+
+STRINGS = 1000
+
+CORPORA = ['filenames', 'log_lines', 'noise', 'adversarial']
+
+#+ measured cases: name and function
+
+CASES = [('regex date + time',
+            lambda strStamp : (ResolveDateTuple(strStamp),
+                                                ResolveTimeTuple(strStamp))),
+        ('tokens date + time',
+            lambda strStamp : (ResolveDateTokens(strStamp),
+                                                ResolveTimeTokens(strStamp))),
+        ('regex combined', ResolveDateTimeTuple),
+        ('tokens combined', ResolveDateTimeTokens)]
+
+#functions
+
+def Measure(fFunction, lstCorpus):
+    """
+    Measures the time per string in microseconds (best of 3).
+    
+    Signature:
+        function(str) -> type A, list(str) -> float
+    
+    Version 0.2.0.0
+    """
+    fTime = min(timeit.repeat(lambda : [fFunction(strStamp)
+                                            for strStamp in lstCorpus],
+                                                    number = 1, repeat = 3))
+    return fTime * 1.0E6 / len(lstCorpus)
+
+#execution entry point
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        iStrings = int(sys.argv[1])
+    else:
+        iStrings = STRINGS
+    dictCorpora = MakeCorpora(iStrings)
+    sys.stdout.write('{:<20}'.format('us/string'))
+    for strCorpus in CORPORA:
+        sys.stdout.write(' {:>12}'.format(strCorpus))
+    sys.stdout.write('\n')
+    for strName, fFunction in CASES:
+        sys.stdout.write('{:<20}'.format(strName))
+        for strCorpus in CORPORA:
+            sys.stdout.write(' {:>12.2f}'.format(Measure(fFunction,
+                                                    dictCorpora[strCorpus])))
+            sys.stdout.flush()
+        sys.stdout.write('\n')
@@ -0,0 +1,132 @@
+#usr/bin/python
+"""
+Benchmark of the import time of the modules of the library, which compile
+their regular expression patterns lazily on the first use (see class
+regex_lib.Search.LazyPattern). Each module is imported in a fresh interpreter
+process, and the time of the import, of the explicit warm-up (function
+regex_lib.Search.WarmUp(), compiling all patterns of the imported modules up
+front) and of the first resolution call (compiling only the patterns it needs)
+are measured, all in milliseconds as the median of the repeated runs.
+
+Usage:
+    python BM008_Import_Time.py [number_of_runs]
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import json
+import subprocess
+
+#globals
+
+RUNS = 11
+
+#+ folder containing the package, for the child processes
+
+ROOT = os.path.abspath(os.path.join(os.path.abspath(__file__), '../../..'))
+
+#+ measured modules and the resolution function called first
+
+MODULES = [('regex_lib.Date', 'ResolveDate'),
+            ('regex_lib.Time', 'ResolveTime'),
+            ('regex_lib.Stamp', 'ResolveDateTime'),
+            ('regex_lib.Scanner', None),
+            ('regex_lib.Guard', 'ResolveDateTimeGuarded'),
+            ('regex_lib.Crawler', None),
+            ('regex_lib.Tokens', 'ResolveDateTimeTokens')]
+
+#+ code executed by the child process; the arguments are the module name, the
+#+ function name (or 'None') and the flag of the warm-up
+
+CHILD = """
+import sys, json, timeit
+sys.path.insert(0, sys.argv[1])
+fStart = timeit.default_timer()
+objModule = __import__(sys.argv[2], fromlist = ['*'])
+fImport = timeit.default_timer() - fStart
+from regex_lib.Search import WarmUp
+fStart = timeit.default_timer()
+if sys.argv[4] == '1':
+    WarmUp()
+fWarmUp = timeit.default_timer() - fStart
+fStart = timeit.default_timer()
+if sys.argv[3] != 'None':
+    getattr(objModule, sys.argv[3])('2018-05-09 12:30:01')
+fCall = timeit.default_timer() - fStart
+sys.stdout.write(json.dumps([fImport, fWarmUp, fCall]))
+"""
+
+#functions
+
+def RunChild(strModule, strFunction, bWarmUp):
+    """
+    Runs a single measurement in a fresh interpreter process.
+    
+    Signature:
+        str, str OR None, bool -> list(float)
+    
+    Returns:
+        list(float): the import, warm-up and first call times in seconds
+    
+    Version 0.2.0.0
+    """
+    strOutput = subprocess.check_output([sys.executable, '-c', CHILD, ROOT,
+                            strModule, str(strFunction), str(int(bWarmUp))])
+    return json.loads(strOutput)
+
+def Median(lstValues):
+    """
+    Median of the list of the values.
+    
+    Signature:
+        list(float) -> float
+    
+    Version 0.2.0.0
+    """
+    lstSorted = sorted(lstValues)
+    return lstSorted[len(lstSorted) // 2]
+
+def Measure(strModule, strFunction, iRuns):
+    """
+    Measures the median times of the import, the first call without the
+    warm-up, the warm-up and the first call after the warm-up, in ms.
+    
+    Signature:
+        str, str OR None, int -> tuple(float, float, float, float)
+    
+    Version 0.2.0.0
+    """
+    lstCold = [RunChild(strModule, strFunction, False) for _ in range(iRuns)]
+    lstWarm = [RunChild(strModule, strFunction, True) for _ in range(iRuns)]
+    return (Median([lstItem[0] for lstItem in lstCold]) * 1.0E3,
+            Median([lstItem[2] for lstItem in lstCold]) * 1.0E3,
+            Median([lstItem[1] for lstItem in lstWarm]) * 1.0E3,
+            Median([lstItem[2] for lstItem in lstWarm]) * 1.0E3)
+
+#execution entry point
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        iRuns = int(sys.argv[1])
+    else:
+        iRuns = RUNS
+    sys.stdout.write('{:<20} {:>10} {:>12} {:>10} {:>12}\n'.format('module, ms',
+                        'import', 'first call', 'warm-up', 'warmed call'))
+    for strModule, strFunction in MODULES:
+        sys.stdout.write('{:<20} {:>10.2f} {:>12.2f} {:>10.2f} {:>12.2f}\n'
+                    .format(strModule, *Measure(strModule, strFunction, iRuns)))
+        sys.stdout.flush()
@@ -0,0 +1,104 @@
+#usr/bin/python
+"""
+Benchmark of the resolution of the date and time stamps with the candidate
+placements of the stamps remembered per shape of the string (class
+regex_lib.Shape.ShapeCache) versus the regular expression patterns (function
+regex_lib.Stamp.ResolveDateTimeTuple()). The time per string in microseconds
+and the shape cache hit rate are reported for the general corpora of the
+benchmark BM004_Resolution_Suite: the file names of a few repeated layouts
+profit from the cache, whereas the strings of mostly unique shapes (log lines,
+noise) pay the cost of the planning of each new shape, and the adversarial
+strings are resolved by the fallback.
+
+Usage:
+    python BM009_Shape_Cache.py [number_of_strings]
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import timeit
+
+#+ benchmarked module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Stamp import ResolveDateTimeTuple
+
+from regex_lib.Shape import ShapeCache
+
+from BM004_Resolution_Suite import MakeCorpora
+
+#globals
+
+STRINGS = 1000
+
+CORPORA = ['filenames', 'log_lines', 'noise', 'adversarial']
+
+#functions
+
+def Measure(fFunction, lstCorpus):
+    """
+    Measures the time per string in microseconds (best of 3).
+    
+    Signature:
+        function(str) -> type A, list(str) -> float
+    
+    Version 0.2.0.0
+    """
+    fTime = min(timeit.repeat(lambda : [fFunction(strStamp)
+                                            for strStamp in lstCorpus],
+                                                    number = 1, repeat = 3))
+    return fTime * 1.0E6 / len(lstCorpus)
+
+def MeasureCache(lstCorpus):
+    """
+    Measures the time per string in microseconds (best of 3) of a new shape
+    cache, and returns its statistics as well.
+    
+    Signature:
+        list(str) -> float, dict(str -> int OR float)
+    
+    Version 0.2.0.0
+    """
+    lstCaches = []
+    def Resolve():
+        objCache = ShapeCache()
+        lstCaches.append(objCache)
+        return [objCache(strStamp) for strStamp in lstCorpus]
+    fTime = min(timeit.repeat(Resolve, number = 1, repeat = 3))
+    return fTime * 1.0E6 / len(lstCorpus), lstCaches[-1].GetStatistics()
+
+#execution entry point
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        iStrings = int(sys.argv[1])
+    else:
+        iStrings = STRINGS
+    dictCorpora = MakeCorpora(iStrings)
+    sys.stdout.write('{:<14} {:>10} {:>10} {:>10} {:>10}\n'.format(
+                    'us/string', 'regex', 'shape', 'hit rate', 'fallbacks'))
+    for strCorpus in CORPORA:
+        lstCorpus = dictCorpora[strCorpus]
+        fRegex = Measure(ResolveDateTimeTuple, lstCorpus)
+        fShape, dictStatistics = MeasureCache(lstCorpus)
+        sys.stdout.write('{:<14} {:>10.2f} {:>10.2f} {:>10.3f} {:>10}\n'.format(
+                            strCorpus, fRegex, fShape,
+                            dictStatistics['HitRate'],
+                                                dictStatistics['Fallbacks']))
+        sys.stdout.flush()
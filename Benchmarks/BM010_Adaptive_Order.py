@@ -0,0 +1,109 @@
+#usr/bin/python
+"""
+Benchmark of the date and time stamps resolution with the order of the
+patterns adapted to the stream of the strings (classes
+regex_lib.Adaptive.AdaptiveDateResolver and AdaptiveTimeResolver) versus the
+fixed order of priority (functions ResolveDateTuple() and ResolveTimeTuple()).
+Each corpus of the benchmark BM004_Resolution_Suite is resolved as a single
+stream by a new resolver, and the time per string in microseconds as well as
+the learned dominant pattern are reported.
+
+Usage:
+    python BM010_Adaptive_Order.py [number_of_strings]
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import timeit
+
+#+ benchmarked module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Date import ResolveDateTuple
+
+from regex_lib.Time import ResolveTimeTuple
+
+from regex_lib.Adaptive import AdaptiveDateResolver, AdaptiveTimeResolver
+
+from BM004_Resolution_Suite import MakeCorpora, FAMILIES
+
+#globals
+
+STRINGS = 1000
+
+CORPORA = (['family_{}'.format(strName) for strName, _, _ in FAMILIES] +
+                            ['filenames', 'log_lines', 'noise', 'adversarial'])
+
+#+ measured cases: name, fixed order function and adaptive resolver class
+
+CASES = [('date', ResolveDateTuple, AdaptiveDateResolver),
+            ('time', ResolveTimeTuple, AdaptiveTimeResolver)]
+
+#functions
+
+def Measure(fFunction, lstCorpus):
+    """
+    Measures the time per string in microseconds (best of 3).
+    
+    Signature:
+        function(str) -> type A, list(str) -> float
+    
+    Version 0.2.0.0
+    """
+    fTime = min(timeit.repeat(lambda : [fFunction(strStamp)
+                                            for strStamp in lstCorpus],
+                                                    number = 1, repeat = 3))
+    return fTime * 1.0E6 / len(lstCorpus)
+
+def MeasureAdaptive(cResolver, lstCorpus):
+    """
+    Measures the time per string in microseconds (best of 3) of a new
+    adaptive resolver, and returns its learned dominant pattern as well.
+    
+    Signature:
+        class AdaptiveResolver, list(str) -> float, str
+    
+    Version 0.2.0.0
+    """
+    lstResolvers = []
+    def Resolve():
+        objResolver = cResolver()
+        lstResolvers.append(objResolver)
+        return [objResolver(strStamp) for strStamp in lstCorpus]
+    fTime = min(timeit.repeat(Resolve, number = 1, repeat = 3))
+    return fTime * 1.0E6 / len(lstCorpus), lstResolvers[-1].GetOrdering()[0]
+
+#execution entry point
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        iStrings = int(sys.argv[1])
+    else:
+        iStrings = STRINGS
+    dictCorpora = MakeCorpora(iStrings)
+    sys.stdout.write('{:<28} {:<5} {:>8} {:>9} {:<20}\n'.format('us/string',
+                                'kind', 'fixed', 'adaptive', 'dominant'))
+    for strCorpus in CORPORA:
+        lstCorpus = dictCorpora[strCorpus]
+        for strKind, fFixed, cResolver in CASES:
+            fAdaptive, strDominant = MeasureAdaptive(cResolver, lstCorpus)
+            sys.stdout.write('{:<28} {:<5} {:>8.2f} {:>9.2f} {:<20}\n'.format(
+                            strCorpus, strKind, Measure(fFixed, lstCorpus),
+                                                    fAdaptive, strDominant))
+            sys.stdout.flush()
@@ -0,0 +1,111 @@
+#usr/bin/python
+"""
+Benchmark of the columnar resolution of the date / time stamps (functions
+ResolveDateColumn() and ResolveTimeColumn() of the module Columns) against the
+batch functions ResolveDates() and ResolveTimes() returning the lists of the
+strings: the time per string in microseconds (best of 3) and the bytes retained
+per string by the results, i.e. the list and its string / tuple elements
+versus the array buffers of the values and of the mask.
+
+Usage:
+    python BM011_Columnar_Output.py [number_of_strings]
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import timeit
+
+#+ benchmarked module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Date import ResolveDates
+
+from regex_lib.Time import ResolveTimes
+
+from regex_lib.Columns import ResolveDateColumn, ResolveTimeColumn
+
+from BM004_Resolution_Suite import MakeCorpora
+
+#globals
+
+STRINGS = 10000
+
+CORPORA = ['filenames', 'log_lines', 'noise']
+
+#+ pairs of the list and the columnar functions
+
+CASES = [('date', ResolveDates, ResolveDateColumn),
+            ('time', ResolveTimes, ResolveTimeColumn)]
+
+#functions
+
+def GetRetained(gResult):
+    """
+    Counts the bytes of the result and of its elements, except for the shared
+    singletons None and the booleans; for an array - the bytes of its buffer.
+    
+    Signature:
+        type A -> int
+    
+    Version 0.2.0.0
+    """
+    if gResult is None or isinstance(gResult, bool):
+        return 0
+    if hasattr(gResult, 'buffer_info'):
+        return gResult.buffer_info()[1] * gResult.itemsize
+    iBytes = sys.getsizeof(gResult)
+    if isinstance(gResult, (list, tuple)):
+        for gItem in gResult:
+            iBytes += GetRetained(gItem)
+    return iBytes
+
+def Measure(fFunction, lstCorpus):
+    """
+    Measures the time per string in microseconds (best of 3) and the bytes
+    retained by the results per string.
+    
+    Signature:
+        function(list(str)) -> type A, list(str) -> float, float
+    
+    Version 0.2.0.0
+    """
+    fTime = min(timeit.repeat(lambda : fFunction(lstCorpus), number = 1,
+                                                                repeat = 3))
+    fItems = float(len(lstCorpus))
+    return fTime * 1.0E6 / fItems, GetRetained(fFunction(lstCorpus)) / fItems
+
+#execution entry point
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        iStrings = int(sys.argv[1])
+    else:
+        iStrings = STRINGS
+    dictCorpora = MakeCorpora(iStrings)
+    sys.stdout.write('{:<20} {:>10} {:>10} {:>10} {:>10}\n'.format('corpus',
+                        'list us', 'column us', 'list B', 'column B'))
+    for strCorpus in CORPORA:
+        lstCorpus = dictCorpora[strCorpus]
+        for strCase, fList, fColumn in CASES:
+            fListTime, fListBytes = Measure(fList, lstCorpus)
+            fColumnTime, fColumnBytes = Measure(fColumn, lstCorpus)
+            sys.stdout.write('{:<20} {:>10.2f} {:>10.2f} {:>10.1f} {:>10.1f}\n'
+                        .format('{} {}'.format(strCorpus, strCase), fListTime,
+                                    fColumnTime, fListBytes, fColumnBytes))
+            sys.stdout.flush()
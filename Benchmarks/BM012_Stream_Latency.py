@@ -0,0 +1,113 @@
+#usr/bin/python
+"""
+Benchmark of the event loop stalls caused by the resolution of the stamps in
+a burst of the received log lines (class regex_lib.Stream.StreamResolver):
+the lines are resolved directly in the loop, or offloaded in batches to a
+pool of threads or of worker processes. The burst is fed in chunks, as
+received from a socket, and the records are collected without blocking after
+each chunk. The maximum and the total time spent in the loop callbacks per
+chunk (ms), and the total time until all records are collected (ms) are
+reported.
+
+Usage:
+    python BM012_Stream_Latency.py [number_of_lines]
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import timeit
+import multiprocessing
+import multiprocessing.pool
+
+#+ benchmarked module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Stream import StreamResolver
+
+from BM004_Resolution_Suite import MakeCorpora
+
+#globals
+
+LINES = 20000
+
+CHUNK = 65536
+
+BATCH = 256
+
+PENDING = 64
+
+#functions
+
+def Measure(objExecutor, strData):
+    """
+    Feeds the data in chunks and collects the records without blocking, then
+    waits for the rest of the records.
+    
+    Signature:
+        type A OR None, str -> tuple(float, float, float)
+    
+    Returns:
+        tuple(float, float, float): the maximum and the total time spent in
+            the loop callbacks per chunk, and the total time, all in ms
+    
+    Version 0.2.0.0
+    """
+    fTimer = timeit.default_timer
+    objResolver = StreamResolver(objExecutor, BATCH, PENDING)
+    iRecords = 0
+    fMax = 0.0
+    fLoop = 0.0
+    fStart = fTimer()
+    for iStart in range(0, len(strData), CHUNK):
+        fCallback = fTimer()
+        objResolver.Feed(strData[iStart : iStart + CHUNK])
+        iRecords += len(objResolver.GetRecords())
+        fCallback = fTimer() - fCallback
+        fMax = max(fMax, fCallback)
+        fLoop += fCallback
+    objResolver.Close()
+    while not objResolver.Finished:
+        iRecords += len(objResolver.GetRecords(True))
+    fTotal = fTimer() - fStart
+    return fMax * 1.0E3, fLoop * 1.0E3, fTotal * 1.0E3
+
+#execution entry point
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        iLines = int(sys.argv[1])
+    else:
+        iLines = LINES
+    strData = '\n'.join(MakeCorpora(iLines)['log_lines']) + '\n'
+    iWorkers = max(2, multiprocessing.cpu_count())
+    sys.stdout.write('{:<20} {:>12} {:>12} {:>12}\n'.format('executor, ms',
+                                'max chunk', 'loop total', 'total'))
+    for strName, fMakeExecutor in [('none', lambda : None),
+            ('threads', lambda : multiprocessing.pool.ThreadPool(iWorkers)),
+                ('processes', lambda : multiprocessing.Pool(iWorkers))]:
+        objExecutor = fMakeExecutor()
+        try:
+            tupleResult = Measure(objExecutor, strData)
+            sys.stdout.write('{:<20} {:>12.2f} {:>12.2f} {:>12.2f}\n'.format(
+                                                    strName, *tupleResult))
+            sys.stdout.flush()
+        finally:
+            if not (objExecutor is None):
+                objExecutor.terminate()
+                objExecutor.join()
@@ -0,0 +1,89 @@
+#usr/bin/python
+"""
+Benchmark of the overhead of the instrumentation of the module Metrics: the
+time per string in microseconds (best of 3) of the functions ResolveDate() and
+ResolveTime() before the instrumentation is enabled, while it is enabled and
+after it is disabled again, followed by the report of the counters.
+
+Usage:
+    python BM013_Instrumentation_Overhead.py [number_of_strings]
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import timeit
+
+#+ benchmarked module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Date import ResolveDate
+
+from regex_lib.Time import ResolveTime
+
+from regex_lib.Metrics import Enable, Disable, Reset, FormatReport
+
+from BM004_Resolution_Suite import MakeCorpora
+
+#globals
+
+STRINGS = 10000
+
+CORPORA = ['filenames', 'log_lines', 'noise']
+
+CASES = [('date', ResolveDate), ('time', ResolveTime)]
+
+#functions
+
+def Measure(fFunction, lstCorpus):
+    """
+    Measures the time per string in microseconds (best of 3).
+    
+    Signature:
+        function(str) -> type A, list(str) -> float
+    
+    Version 0.2.0.0
+    """
+    fTime = min(timeit.repeat(lambda : [fFunction(strItem)
+                    for strItem in lstCorpus], number = 1, repeat = 3))
+    return fTime * 1.0E6 / len(lstCorpus)
+
+#execution entry point
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        iStrings = int(sys.argv[1])
+    else:
+        iStrings = STRINGS
+    dictCorpora = MakeCorpora(iStrings)
+    sys.stdout.write('{:<20} {:>10} {:>10} {:>10}\n'.format('corpus, us',
+                                            'before', 'enabled', 'disabled'))
+    Reset()
+    for strCorpus in CORPORA:
+        lstCorpus = dictCorpora[strCorpus]
+        for strCase, fFunction in CASES:
+            fBefore = Measure(fFunction, lstCorpus)
+            Enable()
+            fEnabled = Measure(fFunction, lstCorpus)
+            Disable()
+            fDisabled = Measure(fFunction, lstCorpus)
+            sys.stdout.write('{:<20} {:>10.2f} {:>10.2f} {:>10.2f}\n'.format(
+                                        '{} {}'.format(strCorpus, strCase),
+                                                fBefore, fEnabled, fDisabled))
+            sys.stdout.flush()
+    sys.stdout.write('\n{}\n'.format(FormatReport()))
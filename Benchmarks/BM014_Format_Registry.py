@@ -0,0 +1,147 @@
+#usr/bin/python
+"""
+Benchmark of the cost of the added formats: the time per string in
+microseconds (best of 3) of the registry of the module Formats compiled into
+a single union pattern versus the cascade of the search per format (as by the
+function ResolveDate()), with the built-in date formats only, with the
+site-specific formats and with the additional synthetic formats (the ISO
+layout with the other separators).
+
+Usage:
+    python BM014_Format_Registry.py [number_of_strings]
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import re
+import timeit
+
+#+ benchmarked module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Search import MakeSearchPattern, SearchLast
+
+from regex_lib.Formats import MakeDateRegistry, MakeFormatPattern, \
+                                            DATE_FORMATS, SITE_DATE_FORMATS
+
+from BM004_Resolution_Suite import MakeCorpora
+
+#globals
+
+STRINGS = 10000
+
+CORPORA = ['filenames', 'log_lines', 'noise', 'adversarial']
+
+#+ separators of the synthetic formats
+
+SEPARATORS = '#~+|=;!@'
+
+#functions
+
+def MakeFormats(iExtra):
+    """
+    Builds the list of the formats: the built-in and site-specific date
+    formats and the passed number of the synthetic formats.
+    
+    Signature:
+        int -> list(tuple(str, str OR tuple(str), int, str))
+    
+    Version 0.2.0.0
+    """
+    lstFormats = list(DATE_FORMATS) + list(SITE_DATE_FORMATS)
+    for iIndex in range(iExtra):
+        strSeparator = SEPARATORS[iIndex % len(SEPARATORS)] * (
+                                                1 + iIndex // len(SEPARATORS))
+        lstFormats.append(('SYNTHETIC_{}'.format(iIndex), ('year',
+                strSeparator, 'month', strSeparator, 'day'), 5, '0-9'))
+    return lstFormats
+
+def MakeCascade(lstFormats):
+    """
+    Compiles the search pattern of each format in the order of the priorities
+    and returns the resolution function trying them one by one.
+    
+    Signature:
+        list(tuple(str, str OR tuple(str), int, str)) -> function(str)
+    
+    Version 0.2.0.0
+    """
+    lstPatterns = [re.compile(MakeSearchPattern(MakeFormatPattern(gLayout),
+                strExcluded)) for _, gLayout, _, strExcluded in sorted(
+                    lstFormats, key = lambda tupleItem: - tupleItem[2])]
+    
+    def Resolve(strStamp):
+        for objPattern in lstPatterns:
+            objMatch = SearchLast(objPattern, strStamp)
+            if objMatch:
+                return objMatch
+        return None
+    
+    return Resolve
+
+def MakeRegistry(lstFormats):
+    """
+    Creates the registry of the passed formats.
+    
+    Signature:
+        list(tuple(str, str OR tuple(str), int, str)) -> FormatRegistry
+    
+    Version 0.2.0.0
+    """
+    objRegistry = MakeDateRegistry()
+    for strName, gLayout, iPriority, strExcluded in lstFormats[
+                                                        len(DATE_FORMATS):]:
+        objRegistry.Register(strName, gLayout, iPriority, strExcluded)
+    return objRegistry
+
+def Measure(fFunction, lstCorpus):
+    """
+    Measures the time per string in microseconds (best of 3).
+    
+    Signature:
+        function(str) -> type A, list(str) -> float
+    
+    Version 0.2.0.0
+    """
+    fTime = min(timeit.repeat(lambda : [fFunction(strItem)
+                    for strItem in lstCorpus], number = 1, repeat = 3))
+    return fTime * 1.0E6 / len(lstCorpus)
+
+#execution entry point
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        iStrings = int(sys.argv[1])
+    else:
+        iStrings = STRINGS
+    dictCorpora = MakeCorpora(iStrings)
+    sys.stdout.write('{:<14} {:>8} {:>10} {:>10}\n'.format('corpus',
+                                            'formats', 'cascade', 'registry'))
+    for strCorpus in CORPORA:
+        lstCorpus = dictCorpora[strCorpus]
+        for iExtra in (- len(SITE_DATE_FORMATS), 0, 8, 24):
+            lstFormats = MakeFormats(max(iExtra, 0))
+            if iExtra < 0:
+                lstFormats = lstFormats[:len(DATE_FORMATS)]
+            fCascade = Measure(MakeCascade(lstFormats), lstCorpus)
+            fRegistry = Measure(MakeRegistry(lstFormats).ResolveTuple,
+                                                                    lstCorpus)
+            sys.stdout.write('{:<14} {:>8} {:>10.2f} {:>10.2f}\n'.format(
+                        strCorpus, len(lstFormats), fCascade, fRegistry))
+            sys.stdout.flush()
@@ -0,0 +1,118 @@
+#usr/bin/python
+"""
+Benchmark of the interned output of the batch functions ResolveDates() and
+ResolveTimes() (flag bInterned) against the formatted output: the time per
+string in microseconds (best of 3) and the bytes retained per string by the
+results, i.e. the list and its distinct string / tuple elements. Each corpus
+is repeated several times, as the stamps of the long logs are repeated, and
+the memory of the built tables of the interned strings is reported once.
+
+Usage:
+    python BM015_Interned_Output.py [number_of_strings] [repeats]
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import timeit
+
+#+ benchmarked module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Date import ResolveDates, DATE_TABLES
+
+from regex_lib.Time import ResolveTimes, TIME_TABLES
+
+from BM004_Resolution_Suite import MakeCorpora
+
+#globals
+
+STRINGS = 10000
+
+REPEATS = 10
+
+CORPORA = ['filenames', 'log_lines']
+
+CASES = [('date', ResolveDates), ('time', ResolveTimes)]
+
+#functions
+
+def GetRetained(gResult, setSeen):
+    """
+    Counts the bytes of the result and of its elements not counted yet (by
+    their identity), except for the shared singletons None and the booleans.
+    
+    Signature:
+        type A, set(int) -> int
+    
+    Version 0.2.0.0
+    """
+    if gResult is None or isinstance(gResult, bool) or id(gResult) in setSeen:
+        return 0
+    setSeen.add(id(gResult))
+    iBytes = sys.getsizeof(gResult)
+    if isinstance(gResult, (list, tuple)):
+        for gItem in gResult:
+            iBytes += GetRetained(gItem, setSeen)
+    return iBytes
+
+def Measure(fFunction, lstCorpus, bInterned):
+    """
+    Measures the time per string in microseconds (best of 3) and the bytes
+    retained by the results per string.
+    
+    Signature:
+        function, list(str), bool -> float, float
+    
+    Version 0.2.0.0
+    """
+    fTime = min(timeit.repeat(lambda : fFunction(lstCorpus,
+                        bInterned = bInterned), number = 1, repeat = 3))
+    fItems = float(len(lstCorpus))
+    lstResults = fFunction(lstCorpus, bInterned = bInterned)
+    return fTime * 1.0E6 / fItems, GetRetained(lstResults, set()) / fItems
+
+#execution entry point
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        iStrings = int(sys.argv[1])
+    else:
+        iStrings = STRINGS
+    if len(sys.argv) > 2:
+        iRepeats = int(sys.argv[2])
+    else:
+        iRepeats = REPEATS
+    dictCorpora = MakeCorpora(iStrings)
+    sys.stdout.write('{:<20} {:>10} {:>10} {:>10} {:>10}\n'.format('corpus',
+                        'format us', 'intern us', 'format B', 'intern B'))
+    for strCorpus in CORPORA:
+        lstCorpus = dictCorpora[strCorpus] * iRepeats
+        for strCase, fFunction in CASES:
+            fFormatTime, fFormatBytes = Measure(fFunction, lstCorpus, False)
+            fInternTime, fInternBytes = Measure(fFunction, lstCorpus, True)
+            sys.stdout.write('{:<20} {:>10.2f} {:>10.2f} {:>10.1f} {:>10.1f}\n'
+                        .format('{} {}'.format(strCorpus, strCase),
+                            fFormatTime, fInternTime, fFormatBytes,
+                                                                fInternBytes))
+            sys.stdout.flush()
+    setSeen = set()
+    iDates = sum(GetRetained(lstTable, setSeen) for lstTable in DATE_TABLES)
+    iTimes = sum(GetRetained(lstTable, setSeen) for lstTable in TIME_TABLES)
+    sys.stdout.write('built tables: dates {} KB, times {} KB\n'.format(
+                                                iDates // 1024, iTimes // 1024))
@@ -0,0 +1,140 @@
+#usr/bin/python
+"""
+Benchmark of the dictionary encoded batch results (module Encoded) against
+the lists returned by the batch functions ResolveDates() and ResolveTimes():
+the time per string in microseconds (best of 3) and the bytes retained per
+string by the results. Each corpus is repeated several times, as the stamps of
+the long logs are repeated. The merging of the encoded chunks (as returned by
+the parallel workers) is compared with the concatenation of the lists.
+
+Usage:
+    python BM016_Dictionary_Encoding.py [number_of_strings] [repeats] [chunks]
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import timeit
+
+#+ benchmarked module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Date import ResolveDates
+
+from regex_lib.Time import ResolveTimes
+
+from regex_lib.Encoded import EncodeDates, EncodeTimes, MergeResults
+
+from BM004_Resolution_Suite import MakeCorpora
+
+from BM015_Interned_Output import GetRetained
+
+#globals
+
+STRINGS = 10000
+
+REPEATS = 10
+
+CHUNKS = 10
+
+CORPORA = ['filenames', 'log_lines']
+
+CASES = [('date', ResolveDates, EncodeDates),
+                                        ('time', ResolveTimes, EncodeTimes)]
+
+#functions
+
+def GetEncodedRetained(objResults):
+    """
+    Counts the bytes of the encoded results: the instance, the codes array and
+    the table of the unique values with its elements; the look-up dictionary
+    is counted as well, since it is kept by the instance.
+    
+    Signature:
+        EncodedResults -> int
+    
+    Version 0.2.0.0
+    """
+    setSeen = set()
+    return (sys.getsizeof(objResults) + sys.getsizeof(objResults.Codes) +
+                        sys.getsizeof(objResults._dictCodes) +
+                                GetRetained(objResults.Values, setSeen))
+
+def Measure(fFunction, lstCorpus):
+    """
+    Measures the time per string in microseconds (best of 3) and returns it
+    with the results of the last call.
+    
+    Signature:
+        function, list(str) -> float, type A
+    
+    Version 0.2.0.0
+    """
+    lstResults = []
+    def Call():
+        lstResults[:] = [fFunction(lstCorpus)]
+    fTime = min(timeit.repeat(Call, number = 1, repeat = 3))
+    return fTime * 1.0E6 / len(lstCorpus), lstResults[0]
+
+#execution entry point
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        iStrings = int(sys.argv[1])
+    else:
+        iStrings = STRINGS
+    if len(sys.argv) > 2:
+        iRepeats = int(sys.argv[2])
+    else:
+        iRepeats = REPEATS
+    if len(sys.argv) > 3:
+        iChunks = int(sys.argv[3])
+    else:
+        iChunks = CHUNKS
+    dictCorpora = MakeCorpora(iStrings)
+    sys.stdout.write('{:<20} {:>9} {:>9} {:>9} {:>9} {:>9} {:>9}\n'.format(
+                            'corpus', 'list us', 'code us', 'list B',
+                                        'code B', 'concat us', 'merge us'))
+    for strCorpus in CORPORA:
+        lstCorpus = dictCorpora[strCorpus] * iRepeats
+        fItems = float(len(lstCorpus))
+        iChunk = -(-len(lstCorpus) // iChunks)
+        lstChunks = [lstCorpus[iStart : iStart + iChunk]
+                                for iStart in range(0, len(lstCorpus), iChunk)]
+        for strCase, fResolve, fEncode in CASES:
+            fListTime, lstResults = Measure(fResolve, lstCorpus)
+            fListBytes = GetRetained(lstResults, set()) / fItems
+            fCodeTime, objResults = Measure(fEncode, lstCorpus)
+            fCodeBytes = GetEncodedRetained(objResults) / fItems
+            assert objResults.Decode() == lstResults
+            #+ merging of the already resolved chunks only
+            lstLists = [fResolve(lstChunk) for lstChunk in lstChunks]
+            lstEncoded = [fEncode(lstChunk) for lstChunk in lstChunks]
+            fConcatTime = min(timeit.repeat(lambda : [gResult
+                                                    for lstList in lstLists
+                                                        for gResult in lstList],
+                                                    number = 1, repeat = 3))
+            fMergeTime = min(timeit.repeat(lambda : MergeResults(lstEncoded),
+                                                    number = 1, repeat = 3))
+            sys.stdout.write(
+                '{:<20} {:>9.2f} {:>9.2f} {:>9.1f} {:>9.1f} {:>9.3f} {:>9.3f}\n'
+                        .format('{} {}'.format(strCorpus, strCase),
+                            fListTime, fCodeTime, fListBytes, fCodeBytes,
+                                    fConcatTime * 1.0E6 / fItems,
+                                                fMergeTime * 1.0E6 / fItems))
+            sys.stdout.flush()
@@ -0,0 +1,114 @@
+#usr/bin/python
+"""
+Benchmark of the positional hint resolvers (module Hint) against the fixed
+order functions ResolveDateTuple() and ResolveTimeTuple(): the time per string
+in microseconds (best of 3) and the fraction of the strings resolved with the
+hint. The uniform log stream has the stamps at the same offset of each line
+with the successive values differing slightly, and the message with the other
+numbers following them; the generated log lines and file names of the suite
+BM004 are given for the comparison.
+
+Usage:
+    python BM017_Positional_Hint.py [number_of_strings]
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import timeit
+
+#+ benchmarked module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Date import ResolveDateTuple
+
+from regex_lib.Time import ResolveTimeTuple
+
+from regex_lib.Hint import HintDateResolver, HintTimeResolver
+
+from BM004_Resolution_Suite import MakeCorpora
+
+#globals
+
+STRINGS = 20000
+
+CORPORA = ['log_lines', 'filenames']
+
+CASES = [('date', ResolveDateTuple, HintDateResolver),
+                                ('time', ResolveTimeTuple, HintTimeResolver)]
+
+#functions
+
+def MakeUniformLog(iStrings):
+    """
+    Generates the lines of a sorted, uniformly formatted log: the date and the
+    time with the milliseconds at the start of each line, one second apart,
+    followed by the message with the other numbers.
+    
+    Signature:
+        int -> list(str)
+    
+    Version 0.2.0.0
+    """
+    strFormat = ''.join(['2018-05-{:02} {:02}:{:02}:{:02},{:03} INFO ',
+                        '[worker-{}] processed request {} in {} ms ',
+                                                        'from 10.0.{}.{}'])
+    return [strFormat.format(9 + iIndex // 86400, (iIndex // 3600) % 24,
+                    (iIndex // 60) % 60, iIndex % 60, (iIndex * 37) % 1000,
+                        iIndex % 8, iIndex * 7, iIndex % 300, iIndex % 255,
+                                    iIndex % 200) for iIndex in range(iStrings)]
+
+def Measure(fFunction, lstCorpus):
+    """
+    Measures the time per string in microseconds (best of 3).
+    
+    Signature:
+        function, list(str) -> float
+    
+    Version 0.2.0.0
+    """
+    fTime = min(timeit.repeat(lambda : [fFunction(strLine)
+                                                for strLine in lstCorpus],
+                                                    number = 1, repeat = 3))
+    return fTime * 1.0E6 / len(lstCorpus)
+
+#execution entry point
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        iStrings = int(sys.argv[1])
+    else:
+        iStrings = STRINGS
+    dictCorpora = MakeCorpora(iStrings)
+    lstCorpora = [('uniform_log', MakeUniformLog(iStrings))]
+    lstCorpora.extend((strCorpus, dictCorpora[strCorpus])
+                                                    for strCorpus in CORPORA)
+    sys.stdout.write('{:<20} {:>10} {:>10} {:>10}\n'.format('corpus',
+                                            'fixed us', 'hint us', 'hit rate'))
+    for strCorpus, lstCorpus in lstCorpora:
+        for strCase, fFunction, cResolver in CASES:
+            objResolver = cResolver()
+            assert ([objResolver(strLine) for strLine in lstCorpus] ==
+                                [fFunction(strLine) for strLine in lstCorpus])
+            fHitRate = objResolver.GetStatistics()['HitRate']
+            fFixedTime = Measure(fFunction, lstCorpus)
+            fHintTime = Measure(cResolver(), lstCorpus)
+            sys.stdout.write('{:<20} {:>10.2f} {:>10.2f} {:>10.2f}\n'.format(
+                                    '{} {}'.format(strCorpus, strCase),
+                                        fFixedTime, fHintTime, fHitRate))
+            sys.stdout.flush()
@@ -0,0 +1,127 @@
+#usr/bin/python
+"""
+Benchmark of the polling of a growing log file with the follow mode scanner
+(module Follow) against the re-scanning of the whole file by the function
+ScanFile() of the module Scanner at each poll: the time per poll in
+milliseconds and per newly appended line in microseconds. The file initially
+holds the given number of the lines of a uniformly formatted log, and a batch
+of the new lines is appended before each poll.
+
+Usage:
+    python BM018_Follow_Polling.py [number_of_strings] [polls] [appended]
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import shutil
+import tempfile
+import timeit
+
+#+ benchmarked module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Scanner import ScanFile
+
+from regex_lib.Follow import FollowScanner
+
+from BM017_Positional_Hint import MakeUniformLog
+
+#globals
+
+STRINGS = 20000
+
+POLLS = 10
+
+APPENDED = 100
+
+#functions
+
+def Run(strPath, lstLines, iStrings, iPolls, iAppended, bFollow):
+    """
+    Writes the initial lines into the file, then appends the batches of the
+    lines and polls the file after each batch, either by the follow mode
+    scanner (with a checkpoint file) or by the re-scanning of the whole file.
+    Returns the total time of the polls in seconds and the number of the
+    newly resolved lines.
+    
+    Signature:
+        str, list(str), int, int, int, bool -> float, int
+    
+    Version 0.2.0.0
+    """
+    with open(strPath, 'wb') as objFile:
+        objFile.write('\n'.join(lstLines[:iStrings]) + '\n')
+    strCheckpoint = strPath + '.checkpoint'
+    if os.path.exists(strCheckpoint):
+        os.remove(strCheckpoint)
+    if bFollow:
+        objScanner = FollowScanner(strPath, strCheckpoint)
+        objScanner.Poll()
+    fTime = 0.0
+    iLines = 0
+    iSeen = iStrings
+    for iPoll in range(iPolls):
+        iStart = iStrings + iPoll * iAppended
+        with open(strPath, 'ab') as objFile:
+            objFile.write('\n'.join(lstLines[iStart : iStart + iAppended])
+                                                                        + '\n')
+        fStart = timeit.default_timer()
+        if bFollow:
+            iLines += len(objScanner.Poll())
+        else:
+            lstRecords = list(ScanFile(strPath))
+            iLines += len(lstRecords) - iSeen
+            iSeen = len(lstRecords)
+        fTime += timeit.default_timer() - fStart
+    if bFollow:
+        objScanner.Close()
+    return fTime, iLines
+
+#execution entry point
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        iStrings = int(sys.argv[1])
+    else:
+        iStrings = STRINGS
+    if len(sys.argv) > 2:
+        iPolls = int(sys.argv[2])
+    else:
+        iPolls = POLLS
+    if len(sys.argv) > 3:
+        iAppended = int(sys.argv[3])
+    else:
+        iAppended = APPENDED
+    lstLines = MakeUniformLog(iStrings + iPolls * iAppended)
+    strFolder = tempfile.mkdtemp()
+    try:
+        strPath = os.path.join(strFolder, 'growing.log')
+        sys.stdout.write('{:<10} {:>10} {:>10} {:>12}\n'.format('mode',
+                                            'new lines', 'ms / poll',
+                                                            'us / new line'))
+        for strMode, bFollow in [('rescan', False), ('follow', True)]:
+            fTime, iLines = Run(strPath, lstLines, iStrings, iPolls,
+                                                            iAppended, bFollow)
+            assert iLines == iPolls * iAppended
+            sys.stdout.write('{:<10} {:>10} {:>10.2f} {:>12.2f}\n'.format(
+                        strMode, iLines, fTime * 1.0E3 / iPolls,
+                                                    fTime * 1.0E6 / iLines))
+            sys.stdout.flush()
+    finally:
+        shutil.rmtree(strFolder)
@@ -0,0 +1,195 @@
+#!/usr/bin/python
+"""
+Module regex_lib.Cache
+
+Bounded memoization (least recently used eviction) of the date / time stamps
+resolution functions, e.g. ResolveDate() and ResolveTime(), for the input data
+with many repeated stamps.
+
+Classes:
+    StampCache
+"""
+
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+
+#globals
+
+#+ indexes of the fields of the doubly linked list node [previous, next, key,
+#+ result]
+
+PREVIOUS = 0
+
+NEXT = 1
+
+KEY = 2
+
+RESULT = 3
+
+#classes
+
+class StampCache(object):
+    """
+    Callable wrapper around a stamp resolution function, which memoizes the
+    results for at most MaxSize most recently used strings. The results for
+    the least recently used strings are evicted first.
+    
+    Only the strings are cached; any other argument is passed to the wrapped
+    function directly, so its TypeError exception is raised as usual. The
+    exceptions are never cached. The instances are not thread-safe.
+    
+    Usage:
+        objCache = StampCache(ResolveDate, 4096)
+        strDate = objCache('MSC00000001_20170502_1448_PROGRAMMING_PASS.xml')
+    
+    Attributes:
+        Function: function, the wrapped resolution function
+        MaxSize: int > 0, the maximum number of the cached results
+        Hits: int >= 0, number of the calls resolved from the cache
+        Misses: int >= 0, number of the calls resolved by the wrapped function
+        Evictions: int >= 0, number of the evicted results
+    
+    Methods:
+        __call__(strStamp)
+            str -> type A
+        Clear()
+            None -> None
+        GetStatistics()
+            None -> dict(str -> int OR float)
+    
+    Version 0.2.0.0
+    """
+    
+    def __init__(self, fFunction, iMaxSize = 1024):
+        """
+        Initialization.
+        
+        Signature:
+            function(str) -> type A, int -> None
+        
+        Args:
+            fFunction: function(str) -> type A, the wrapped resolution function
+                returning an immutable result
+            iMaxSize: (optional) int > 0, the maximum number of the cached
+                results, defaults to 1024
+        
+        Raises:
+            TypeError: the function is not callable, or the size is not an
+                integer
+            ValueError: the size is not positive
+        
+        Version 0.2.0.0
+        """
+        if not callable(fFunction):
+            strError = '{} of {} is not callable'.format(fFunction,
+                                                            type(fFunction))
+            raise TypeError(strError)
+        if (not isinstance(iMaxSize, (int, long))) or isinstance(iMaxSize,
+                                                                        bool):
+            strError = '{} of {} is not an integer'.format(iMaxSize,
+                                                            type(iMaxSize))
+            raise TypeError(strError)
+        if iMaxSize < 1:
+            strError = 'cache size {} is not positive'.format(iMaxSize)
+            raise ValueError(strError)
+        self.Function = fFunction
+        self.MaxSize = iMaxSize
+        self.Clear()
+    
+    def __len__(self):
+        """
+        Returns the current number of the cached results.
+        
+        Signature:
+            None -> int
+        
+        Version 0.2.0.0
+        """
+        return len(self._dictNodes)
+    
+    def __call__(self, strStamp):
+        """
+        Returns the cached result of the wrapped function for the passed string
+        if present, otherwise calls the wrapped function and caches its result.
+        
+        Signature:
+            str -> type A
+        
+        Raises:
+            TypeError: the argument is not a string, raised by the wrapped
+                function
+        
+        Version 0.2.0.0
+        """
+        if not isinstance(strStamp, basestring):
+            return self.Function(strStamp)
+        lstRoot = self._lstRoot
+        lstNode = self._dictNodes.get(strStamp)
+        if not (lstNode is None):
+            #+ unlink the node and re-link it as the most recent one
+            lstPrevious, lstNext = lstNode[PREVIOUS], lstNode[NEXT]
+            lstPrevious[NEXT] = lstNext
+            lstNext[PREVIOUS] = lstPrevious
+            lstLast = lstRoot[PREVIOUS]
+            lstLast[NEXT] = lstRoot[PREVIOUS] = lstNode
+            lstNode[PREVIOUS] = lstLast
+            lstNode[NEXT] = lstRoot
+            self.Hits += 1
+            return lstNode[RESULT]
+        gResult = self.Function(strStamp)
+        self.Misses += 1
+        if len(self._dictNodes) >= self.MaxSize:
+            #+ evict the least recently used node
+            lstOldest = lstRoot[NEXT]
+            lstRoot[NEXT] = lstOldest[NEXT]
+            lstOldest[NEXT][PREVIOUS] = lstRoot
+            del self._dictNodes[lstOldest[KEY]]
+            self.Evictions += 1
+        lstLast = lstRoot[PREVIOUS]
+        lstNode = [lstLast, lstRoot, strStamp, gResult]
+        lstLast[NEXT] = lstRoot[PREVIOUS] = lstNode
+        self._dictNodes[strStamp] = lstNode
+        return gResult
+    
+    def Clear(self):
+        """
+        Removes all cached results and resets the counters.
+        
+        Signature:
+            None -> None
+        
+        Version 0.2.0.0
+        """
+        self._dictNodes = {}
+        #+ circular doubly linked list, the root node is a sentinel; the oldest
+        #+ node follows it, the most recent one precedes it
+        self._lstRoot = []
+        self._lstRoot[:] = [self._lstRoot, self._lstRoot, None, None]
+        self.Hits = 0
+        self.Misses = 0
+        self.Evictions = 0
+    
+    def GetStatistics(self):
+        """
+        Returns the cache usage statistics.
+        
+        Signature:
+            None -> dict(str -> int OR float)
+        
+        Returns:
+            dict(str -> int OR float): with the keys 'Hits', 'Misses',
+                'Evictions', 'Size' (current number of the cached results),
+                'MaxSize' and 'HitRate' (fraction of the calls resolved from
+                the cache, 0.0 if there were no calls)
+        
+        Version 0.2.0.0
+        """
+        iCalls = self.Hits + self.Misses
+        if iCalls:
+            fHitRate = float(self.Hits) / iCalls
+        else:
+            fHitRate = 0.0
+        return {'Hits' : self.Hits, 'Misses' : self.Misses,
+                'Evictions' : self.Evictions, 'Size' : len(self._dictNodes),
+                'MaxSize' : self.MaxSize, 'HitRate' : fHitRate}
@@ -0,0 +1,432 @@
+#!/usr/bin/python
+"""
+Module regex_lib.Columns
+
+Columnar (vectorized) resolution of the date / time stamps for the analytics
+of large data sets. The stamps of a sequence of strings are resolved directly
+into the preallocated numeric buffers: the dates as the number of days since
+the epoch 1970-01-01 and the times as the number of seconds since the
+midnight, together with the mask of the not matched entries (1 - not matched,
+0 - resolved). No string result is created per entry, only the integer fields
+returned by the functions ResolveDateTuple() and ResolveTimeTuple().
+
+The buffers are array.array('i') for the values and array.array('B') for the
+mask by default, but any mutable sequence of the sufficient length supporting
+the item assignment by index can be passed, e.g. a NumPy array. If NumPy is
+installed, the functions ResolveDateArray() and ResolveTimeArray() return the
+NumPy datetime64[D] (with NaT for the not matched entries) and int32 arrays
+with the boolean mask.
+
+The day beyond the end of the month (e.g. 31st of April or 29th of February
+of a common year, which are accepted by the date patterns) is an impossible
+calendar date, and such entry is masked as not matched. The rounding up of
+the seconds to the next day (e.g. 23:59:59.5) gives the second 0 of the time
+column; use the function ResolveDateTimeColumns() for the dates with such
+increment applied.
+
+Globals:
+    FIRST_YEAR - int, the first year of the precomputed tables
+    LAST_YEAR - int, the last year of the precomputed tables
+    MONTH_STARTS - list(int), days since the epoch of the first day of each
+        month of the years FIRST_YEAR to LAST_YEAR inclusively and of January
+        of the next year (reached by the increment of the date due to the
+        rounding up of the seconds), indexed by (year - FIRST_YEAR) * 12 +
+        month - 1
+    MONTH_LENGTHS - list(int), number of days of each month, indexed as
+        MONTH_STARTS
+    COLUMN_POLICIES - tuple(str), the allowed policies for the non-string
+        elements
+
+Functions:
+    DateToDays()
+        int, int, int -> int
+    PrepareBuffers()
+        seq(str), tuple(tuple(seq(int) OR None, str)), str
+            -> seq(str), list(seq(int))
+    ResolveDateColumn()
+        seq(str), seq(int) OR None, seq(int) OR None, str
+            -> tuple(seq(int), seq(int))
+    ResolveTimeColumn()
+        seq(str), seq(int) OR None, seq(int) OR None, str
+            -> tuple(seq(int), seq(int))
+    ResolveDateTimeColumns()
+        seq(str), seq(int) OR None, seq(int) OR None, seq(int) OR None,
+            seq(int) OR None, str
+                -> tuple(seq(int), seq(int), seq(int), seq(int))
+    ResolveDateArray()
+        seq(str), str -> tuple(numpy.ndarray, numpy.ndarray)
+    ResolveTimeArray()
+        seq(str), str -> tuple(numpy.ndarray, numpy.ndarray)
+"""
+
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+
+#imports
+
+#+ standard libraries
+
+import array
+
+#+ optional third party libraries
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#+ package modules
+
+from .Date import ResolveDateTuple
+
+from .Time import ResolveTimeTuple
+
+from .Stamp import ResolveDateTimeTuple
+
+#globals
+
+FIRST_YEAR = 1900
+
+LAST_YEAR = 2099
+
+COLUMN_POLICIES = ('raise', 'none')
+
+#functions
+
+def DateToDays(iYear, iMonth, iDay):
+    """
+    Converts the date into the number of days since the epoch 1970-01-01 of
+    the proleptic Gregorian calendar, negative for the earlier dates. The day
+    beyond the end of the month is not corrected, i.e. it is counted into the
+    next month.
+    
+    Signature:
+        int, int, int -> int
+    
+    Version 0.2.0.0
+    """
+    if iMonth > 2:
+        iMonth -= 3
+    else:
+        iMonth += 9
+        iYear -= 1
+    iEra = iYear // 400
+    iYearOfEra = iYear - iEra * 400
+    iDayOfEra = (iYearOfEra * 365 + iYearOfEra // 4 - iYearOfEra // 100 +
+                                        (153 * iMonth + 2) // 5 + iDay - 1)
+    return iEra * 146097 + iDayOfEra - 719468
+
+#+ precomputed tables of the months
+
+#+ 2099-12-31 23:59:59.5 is incremented to 2100-01-01
+
+MONTH_STARTS = [DateToDays(iYear, iMonth, 1)
+                        for iYear in range(FIRST_YEAR, LAST_YEAR + 1)
+                                                for iMonth in range(1, 13)]
+MONTH_STARTS.append(DateToDays(LAST_YEAR + 1, 1, 1))
+
+MONTH_LENGTHS = [iNext - iStart for iStart, iNext in zip(MONTH_STARTS,
+                        MONTH_STARTS[1:] + [DateToDays(LAST_YEAR + 1, 2, 1)])]
+
+def PrepareBuffers(gStamps, tupleBuffers, strNonString):
+    """
+    Helper function checking the non-string policy and the lengths of the
+    passed buffers, and creating the not passed (None) buffers as the arrays
+    of the paired type codes filled with zeros.
+    
+    Signature:
+        seq(str), tuple(tuple(seq(int) OR None, str)), str
+            -> seq(str), list(seq(int))
+    
+    Raises:
+        ValueError: the policy is not one of the COLUMN_POLICIES, or a buffer
+            is shorter than the sequence of the strings
+    
+    Version 0.2.0.0
+    """
+    if not (strNonString in COLUMN_POLICIES):
+        strError = '{} is not one of the policies {}'.format(strNonString,
+                                                            COLUMN_POLICIES)
+        raise ValueError(strError)
+    if not hasattr(gStamps, '__len__'):
+        gStamps = list(gStamps)
+    iLength = len(gStamps)
+    lstBuffers = []
+    for gBuffer, strTypeCode in tupleBuffers:
+        if gBuffer is None:
+            gBuffer = array.array(strTypeCode, [0]) * iLength
+        elif len(gBuffer) < iLength:
+            strError = 'buffer of length {} is shorter than {} strings'.format(
+                                                        len(gBuffer), iLength)
+            raise ValueError(strError)
+        lstBuffers.append(gBuffer)
+    return gStamps, lstBuffers
+
+def ResolveDateColumn(gStamps, arrDays = None, arrMask = None,
+                                                    strNonString = 'raise'):
+    """
+    Resolves the date stamps of the passed strings exactly as the function
+    ResolveDateTuple() into the buffer of the numbers of days since the epoch
+    1970-01-01, with the mask of the not matched entries. The value of a not
+    matched entry is 0. The impossible calendar dates (the day beyond the end
+    of the month), which are returned by ResolveDateTuple(), are masked as not
+    matched.
+    
+    The policy for the elements, which are not strings, is defined by the
+    argument strNonString:
+        'raise' - TypeError exception is raised, as by ResolveDateTuple()
+        'none' - the entry is not matched
+    
+    Signature:
+        seq(str), seq(int) OR None, seq(int) OR None, str
+            -> tuple(seq(int), seq(int))
+    
+    Args:
+        gStamps: seq(str), sequence of the strings; any other iterable is
+            converted into a list first
+        arrDays: (optional) seq(int) OR None, the preallocated buffer of the
+            days, at least as long as the sequence of the strings, defaults to
+            None - array.array('i') is created
+        arrMask: (optional) seq(int) OR None, the preallocated buffer of the
+            mask, at least as long as the sequence of the strings, defaults to
+            None - array.array('B') is created
+        strNonString: (optional) str, the policy for the non-string elements,
+            one of the COLUMN_POLICIES, defaults to 'raise'
+    
+    Returns:
+        tuple(seq(int), seq(int)): the filled buffers of the days and of the
+            mask, the elements beyond the length of the sequence of the strings
+            are not changed
+    
+    Raises:
+        ValueError: the policy is not one of the COLUMN_POLICIES, or a buffer
+            is shorter than the sequence of the strings
+        TypeError: an element is not a string and the policy is 'raise'
+    
+    Version 0.2.0.0
+    """
+    gStamps, (arrDays, arrMask) = PrepareBuffers(gStamps,
+                            ((arrDays, 'i'), (arrMask, 'B')), strNonString)
+    #+ local aliases of the globals
+    fResolve = ResolveDateTuple
+    lstStarts = MONTH_STARTS
+    lstLengths = MONTH_LENGTHS
+    iBase = FIRST_YEAR * 12 + 1
+    typeString = basestring
+    bNone = strNonString == 'none'
+    for iIndex, gStamp in enumerate(gStamps):
+        if isinstance(gStamp, typeString) or not bNone:
+            tupleDate = fResolve(gStamp)
+        else:
+            tupleDate = None
+        if tupleDate is None:
+            arrDays[iIndex] = 0
+            arrMask[iIndex] = 1
+        else:
+            iYear, iMonth, iDay = tupleDate
+            iKey = iYear * 12 + iMonth - iBase
+            if iDay > lstLengths[iKey]:
+                #+ impossible calendar date, e.g. 31st of April
+                arrDays[iIndex] = 0
+                arrMask[iIndex] = 1
+            else:
+                arrDays[iIndex] = lstStarts[iKey] + iDay - 1
+                arrMask[iIndex] = 0
+    return arrDays, arrMask
+
+def ResolveTimeColumn(gStamps, arrSeconds = None, arrMask = None,
+                                                    strNonString = 'raise'):
+    """
+    Resolves the time stamps of the passed strings exactly as the function
+    ResolveTimeTuple() into the buffer of the numbers of seconds since the
+    midnight, with the mask of the not matched entries. The value of a not
+    matched entry is 0. The microseconds are dropped, and the increment of the
+    date due to the rounding up of the seconds is not indicated.
+    
+    The policy for the elements, which are not strings, is the same as for the
+    function ResolveDateColumn().
+    
+    Signature:
+        seq(str), seq(int) OR None, seq(int) OR None, str
+            -> tuple(seq(int), seq(int))
+    
+    Args:
+        gStamps: seq(str), sequence of the strings; any other iterable is
+            converted into a list first
+        arrSeconds: (optional) seq(int) OR None, the preallocated buffer of
+            the seconds, at least as long as the sequence of the strings,
+            defaults to None - array.array('i') is created
+        arrMask: (optional) seq(int) OR None, the preallocated buffer of the
+            mask, at least as long as the sequence of the strings, defaults to
+            None - array.array('B') is created
+        strNonString: (optional) str, the policy for the non-string elements,
+            one of the COLUMN_POLICIES, defaults to 'raise'
+    
+    Returns:
+        tuple(seq(int), seq(int)): the filled buffers of the seconds and of
+            the mask
+    
+    Raises:
+        ValueError: the policy is not one of the COLUMN_POLICIES, or a buffer
+            is shorter than the sequence of the strings
+        TypeError: an element is not a string and the policy is 'raise'
+    
+    Version 0.2.0.0
+    """
+    gStamps, (arrSeconds, arrMask) = PrepareBuffers(gStamps,
+                        ((arrSeconds, 'i'), (arrMask, 'B')), strNonString)
+    #+ local aliases of the globals
+    fResolve = ResolveTimeTuple
+    typeString = basestring
+    bNone = strNonString == 'none'
+    for iIndex, gStamp in enumerate(gStamps):
+        if isinstance(gStamp, typeString) or not bNone:
+            tupleTime = fResolve(gStamp)
+        else:
+            tupleTime = None
+        if tupleTime is None:
+            arrSeconds[iIndex] = 0
+            arrMask[iIndex] = 1
+        else:
+            arrSeconds[iIndex] = (tupleTime[0] * 3600 + tupleTime[1] * 60 +
+                                                                tupleTime[2])
+            arrMask[iIndex] = 0
+    return arrSeconds, arrMask
+
+def ResolveDateTimeColumns(gStamps, arrDays = None, arrSeconds = None,
+                    arrDateMask = None, arrTimeMask = None,
+                                                    strNonString = 'raise'):
+    """
+    Resolves both the date and the time stamps of the passed strings exactly
+    as the function ResolveDateTimeTuple() into the buffers of the days since
+    the epoch 1970-01-01 and of the seconds since the midnight, with the masks
+    of the not matched dates and times. The increment of the date due to the
+    rounding up of the seconds is applied to the days. The time is not
+    resolved (masked) if the date is not found or it is an impossible calendar
+    date (see ResolveDateColumn()).
+    
+    The policy for the elements, which are not strings, is the same as for the
+    function ResolveDateColumn().
+    
+    Signature:
+        seq(str), seq(int) OR None, seq(int) OR None, seq(int) OR None,
+            seq(int) OR None, str
+                -> tuple(seq(int), seq(int), seq(int), seq(int))
+    
+    Args:
+        gStamps: seq(str), sequence of the strings; any other iterable is
+            converted into a list first
+        arrDays: (optional) seq(int) OR None, the preallocated buffer of the
+            days, defaults to None - array.array('i') is created
+        arrSeconds: (optional) seq(int) OR None, the preallocated buffer of
+            the seconds, defaults to None - array.array('i') is created
+        arrDateMask: (optional) seq(int) OR None, the preallocated buffer of
+            the mask of the dates, defaults to None - array.array('B') is
+            created
+        arrTimeMask: (optional) seq(int) OR None, the preallocated buffer of
+            the mask of the times, defaults to None - array.array('B') is
+            created
+        strNonString: (optional) str, the policy for the non-string elements,
+            one of the COLUMN_POLICIES, defaults to 'raise'
+    
+    Returns:
+        tuple(seq(int), seq(int), seq(int), seq(int)): the filled buffers of
+            the days, seconds, and the masks of the dates and times
+    
+    Raises:
+        ValueError: the policy is not one of the COLUMN_POLICIES, or a buffer
+            is shorter than the sequence of the strings
+        TypeError: an element is not a string and the policy is 'raise'
+    
+    Version 0.2.0.0
+    """
+    gStamps, lstBuffers = PrepareBuffers(gStamps, ((arrDays, 'i'),
+                        (arrSeconds, 'i'), (arrDateMask, 'B'),
+                                        (arrTimeMask, 'B')), strNonString)
+    arrDays, arrSeconds, arrDateMask, arrTimeMask = lstBuffers
+    #+ local aliases of the globals
+    fResolve = ResolveDateTimeTuple
+    lstStarts = MONTH_STARTS
+    lstLengths = MONTH_LENGTHS
+    iBase = FIRST_YEAR * 12 + 1
+    typeString = basestring
+    bNone = strNonString == 'none'
+    for iIndex, gStamp in enumerate(gStamps):
+        if isinstance(gStamp, typeString) or not bNone:
+            tupleResult = fResolve(gStamp)
+        else:
+            tupleResult = None
+        if tupleResult is None:
+            arrDays[iIndex] = 0
+            arrDateMask[iIndex] = 1
+            arrSeconds[iIndex] = 0
+            arrTimeMask[iIndex] = 1
+            continue
+        iYear, iMonth, iDay, iHour, iMinute, iSecond, _, _ = tupleResult
+        iKey = iYear * 12 + iMonth - iBase
+        if iDay > lstLengths[iKey]:
+            #+ impossible calendar date, e.g. 31st of April
+            arrDays[iIndex] = 0
+            arrDateMask[iIndex] = 1
+            arrSeconds[iIndex] = 0
+            arrTimeMask[iIndex] = 1
+            continue
+        arrDays[iIndex] = lstStarts[iKey] + iDay - 1
+        arrDateMask[iIndex] = 0
+        if iHour is None:
+            arrSeconds[iIndex] = 0
+            arrTimeMask[iIndex] = 1
+        else:
+            arrSeconds[iIndex] = iHour * 3600 + iMinute * 60 + iSecond
+            arrTimeMask[iIndex] = 0
+    return arrDays, arrSeconds, arrDateMask, arrTimeMask
+
+def ResolveDateArray(gStamps, strNonString = 'raise'):
+    """
+    NumPy version of the function ResolveDateColumn(), returning the dates as
+    the NumPy datetime64[D] array with NaT (not a time) for the not matched
+    entries, and the boolean NumPy array of the mask.
+    
+    Signature:
+        seq(str), str -> tuple(numpy.ndarray, numpy.ndarray)
+    
+    Raises:
+        ImportError: NumPy is not installed
+        ValueError: the policy is not one of the COLUMN_POLICIES
+        TypeError: an element is not a string and the policy is 'raise'
+    
+    Version 0.2.0.0
+    """
+    if numpy is None:
+        raise ImportError('NumPy is required for ResolveDateArray()')
+    arrDays, arrMask = ResolveDateColumn(gStamps, strNonString = strNonString)
+    arrDates = numpy.frombuffer(arrDays, dtype = numpy.int32).astype(
+                                                            'datetime64[D]')
+    arrMask = numpy.frombuffer(arrMask, dtype = numpy.uint8).astype(bool)
+    arrDates[arrMask] = numpy.datetime64('NaT')
+    return arrDates, arrMask
+
+def ResolveTimeArray(gStamps, strNonString = 'raise'):
+    """
+    NumPy version of the function ResolveTimeColumn(), returning the seconds
+    since the midnight as the NumPy int32 array (0 for the not matched
+    entries), and the boolean NumPy array of the mask.
+    
+    Signature:
+        seq(str), str -> tuple(numpy.ndarray, numpy.ndarray)
+    
+    Raises:
+        ImportError: NumPy is not installed
+        ValueError: the policy is not one of the COLUMN_POLICIES
+        TypeError: an element is not a string and the policy is 'raise'
+    
+    Version 0.2.0.0
+    """
+    if numpy is None:
+        raise ImportError('NumPy is required for ResolveTimeArray()')
+    arrSeconds, arrMask = ResolveTimeColumn(gStamps,
+                                                strNonString = strNonString)
+    arrSeconds = numpy.frombuffer(arrSeconds, dtype = numpy.int32).copy()
+    arrMask = numpy.frombuffer(arrMask, dtype = numpy.uint8).astype(bool)
+    return arrSeconds, arrMask
@@ -0,0 +1,259 @@
+#!/usr/bin/python
+"""
+Module regex_lib.Crawler
+
+Resolution of the date / time stamps in the names of the files found in a
+directory tree, optionally distributed over a pool of worker processes.
+
+Note that on the platforms without fork() (i.e. MS Windows) the function
+CrawlDirectory() with more than one worker must be called only from within the
+'if __name__ == "__main__":' block of the main script.
+
+Globals:
+    CHUNK_SIZE - int, default number of the file names per task of a worker
+    PENDING_FACTOR - int, maximum number of the chunks per worker submitted
+        to the pool, but not yet consumed by the caller
+
+Functions:
+    CrawlDirectory()
+        str, int OR None, int, bool, bool, bool
+            -> generator(tuple(str, str OR None, str OR None, bool))
+    GenerateCrawl()
+        str, int OR None, int, bool, bool, bool
+            -> generator(tuple(str, str OR None, str OR None, bool))
+    GeneratePaths()
+        str, bool -> generator(str)
+    GenerateChunks()
+        iterable(type A), int -> generator(list(type A))
+    GenerateThrottled()
+        iterable(type A), threading.Semaphore, threading.Event
+            -> generator(type A)
+    ResolvePaths()
+        list(str), bool -> list(tuple(str, str OR None, str OR None, bool))
+"""
+
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+
+#imports
+
+#+ standard library
+
+import os
+import itertools
+import functools
+import threading
+import multiprocessing
+
+#+ package modules
+
+from .Date import ResolveDates
+
+from .Time import ResolveTimes
+
+#globals
+
+CHUNK_SIZE = 1000
+
+PENDING_FACTOR = 2
+
+#functions
+
+def CrawlDirectory(strPath, iWorkers = None, iChunkSize = CHUNK_SIZE,
+                        bOrdered = True, bRecursive = True, bUnion = False):
+    """
+    Walks the directory tree and resolves the date and time stamps in the
+    names of all found files, exactly as the functions ResolveDate() and
+    ResolveTime() applied to the base names of the files. The paths are split
+    into chunks, which are resolved by a pool of the worker processes, and the
+    results are generated lazily as the chunks are completed, either in the
+    order of the walk or in the order of completion. At most PENDING_FACTOR
+    chunks per worker are submitted to the pool ahead of the caller, so the
+    memory used by the pending paths and results is bounded.
+    
+    With a single worker no processes are created and all work is done in the
+    calling process.
+    
+    Signature:
+        str, int OR None, int, bool, bool, bool
+            -> generator(tuple(str, str OR None, str OR None, bool))
+    
+    Args:
+        strPath: str, path to the top directory
+        iWorkers: (optional) int > 0 OR None, number of the worker processes,
+            defaults to None, i.e. the number of the CPUs
+        iChunkSize: (optional) int > 0, number of the file names per task of a
+            worker, defaults to CHUNK_SIZE
+        bOrdered: (optional) bool, flag if the results are generated in the
+            order of the walk, otherwise - in the order of completion of the
+            chunks; defaults to True
+        bRecursive: (optional) bool, flag if the sub-directories are walked as
+            well, defaults to True
+        bUnion: (optional) bool, flag if the single pass union patterns are
+            used as by ResolveDateUnion() and ResolveTimeUnion(), defaults to
+            False
+    
+    Returns:
+        generator(tuple(str, str OR None, str OR None, bool)): records of the
+            path of a file, its resolved date stamp in ISO format 'YYYY-MM-DD'
+            or None, its resolved time stamp in ISO format 'HH:MM:SS' or None
+            and the date increment flag
+    
+    Raises:
+        TypeError: the path is not a string, or the number of the workers or
+            the chunk size is not an integer
+        ValueError: the path is not an existing directory, or the number of
+            the workers or the chunk size is not positive
+    
+    Version 0.2.0.0
+    """
+    if not isinstance(strPath, basestring):
+        strError = '{} of {} is not a string'.format(strPath, type(strPath))
+        raise TypeError(strError)
+    if not os.path.isdir(strPath):
+        strError = '{} is not a directory'.format(strPath)
+        raise ValueError(strError)
+    if iWorkers is None:
+        iWorkers = multiprocessing.cpu_count()
+    for iValue in [iWorkers, iChunkSize]:
+        if (not isinstance(iValue, (int, long))) or isinstance(iValue, bool):
+            strError = '{} of {} is not an integer'.format(iValue,
+                                                                type(iValue))
+            raise TypeError(strError)
+        if iValue < 1:
+            strError = '{} is not positive'.format(iValue)
+            raise ValueError(strError)
+    return GenerateCrawl(strPath, iWorkers, iChunkSize, bOrdered, bRecursive,
+                                                                        bUnion)
+
+def GenerateCrawl(strPath, iWorkers, iChunkSize, bOrdered, bRecursive,
+                                                                    bUnion):
+    """
+    Generator implementing the function CrawlDirectory(), the arguments are not
+    checked. The pool of the worker processes is terminated when the generator
+    is closed before its exhaustion. The chunks are fed to the pool through the
+    generator GenerateThrottled(), which allows at most PENDING_FACTOR chunks
+    per worker to be submitted, but not yet consumed.
+    
+    Signature:
+        str, int, int, bool, bool, bool
+            -> generator(tuple(str, str OR None, str OR None, bool))
+    
+    Version 0.2.0.0
+    """
+    genChunks = GenerateChunks(GeneratePaths(strPath, bRecursive), iChunkSize)
+    fResolve = functools.partial(ResolvePaths, bUnion = bUnion)
+    if iWorkers == 1:
+        for lstChunk in genChunks:
+            for tupleRecord in fResolve(lstChunk):
+                yield tupleRecord
+    else:
+        objSemaphore = threading.Semaphore(PENDING_FACTOR * iWorkers)
+        objStop = threading.Event()
+        genChunks = GenerateThrottled(genChunks, objSemaphore, objStop)
+        objPool = multiprocessing.Pool(iWorkers)
+        try:
+            if bOrdered:
+                genResults = objPool.imap(fResolve, genChunks)
+            else:
+                genResults = objPool.imap_unordered(fResolve, genChunks)
+            for lstResults in genResults:
+                objSemaphore.release()
+                for tupleRecord in lstResults:
+                    yield tupleRecord
+            objPool.close()
+        finally:
+            #+ the feeder thread of the pool may wait for the semaphore, and
+            #+ it is joined by terminate()
+            objStop.set()
+            objSemaphore.release()
+            #+ does nothing for the already finished workers
+            objPool.terminate()
+            objPool.join()
+
+def GeneratePaths(strPath, bRecursive):
+    """
+    Generator of the paths of all files in the directory, and optionally in its
+    sub-directories, in the order of os.walk().
+    
+    Signature:
+        str, bool -> generator(str)
+    
+    Version 0.2.0.0
+    """
+    for strRoot, _, lstFiles in os.walk(strPath):
+        for strFile in lstFiles:
+            yield os.path.join(strRoot, strFile)
+        if not bRecursive:
+            break
+
+def GenerateChunks(gItems, iChunkSize):
+    """
+    Generator of the consecutive lists of at most the passed number of the
+    elements of an iterable.
+    
+    Signature:
+        iterable(type A), int -> generator(list(type A))
+    
+    Version 0.2.0.0
+    """
+    iterItems = iter(gItems)
+    while True:
+        lstChunk = list(itertools.islice(iterItems, iChunkSize))
+        if not lstChunk:
+            break
+        yield lstChunk
+
+def GenerateThrottled(gItems, objSemaphore, objStop):
+    """
+    Generator of the elements of an iterable, acquiring the passed semaphore
+    before each element, thus at most as many elements ahead of the releases
+    by the consumer as the initial value of the semaphore. The generation is
+    stopped, when the passed event is set. Used to feed the tasks to a pool,
+    which consumes the tasks in a separate thread without any bound.
+    
+    Signature:
+        iterable(type A), threading.Semaphore, threading.Event
+            -> generator(type A)
+    
+    Version 0.2.0.0
+    """
+    iterItems = iter(gItems)
+    while True:
+        objSemaphore.acquire()
+        if objStop.is_set():
+            break
+        try:
+            gItem = next(iterItems)
+        except StopIteration:
+            break
+        yield gItem
+
+def ResolvePaths(lstPaths, bUnion = False):
+    """
+    Resolves the date and time stamps in the base names of the files, executed
+    by a worker process for a single chunk of the paths.
+    
+    Signature:
+        list(str), bool -> list(tuple(str, str OR None, str OR None, bool))
+    
+    Args:
+        lstPaths: list(str), paths of the files
+        bUnion: (optional) bool, flag if the single pass union patterns are
+            used, defaults to False
+    
+    Returns:
+        list(tuple(str, str OR None, str OR None, bool)): records of the path,
+            resolved date stamp, resolved time stamp and the date increment
+            flag for each path
+    
+    Version 0.2.0.0
+    """
+    lstNames = [os.path.basename(strPath) for strPath in lstPaths]
+    lstDates = ResolveDates(lstNames, bUnion = bUnion)
+    lstTimes = ResolveTimes(lstNames, bUnion = bUnion)
+    return [(strPath, strDate, strTime, bIncrementDate)
+                for strPath, strDate, (strTime, bIncrementDate)
+                                    in itertools.izip(lstPaths, lstDates,
+                                                                    lstTimes)]
@@ -27,24 +27,65 @@ Patterns:
     SHORT_DATE - year, month, day with any standard separator for the date
         stamp: '-', '_', '/' or '.' - but the year is only with two last digits,
         i.e YY instead of 20YY
-
-Compiled patterns:
+    *_CORE - the same stamp patterns without the '(.*[^0-9]|^)' prefix and
+        '([^0-9].*|$)' suffix wrappers, e.g. ISO_DATE_CORE
+    *_SEARCH - the core stamp patterns delimited by the non-digit characters
+        with the look-around assertions, to be used with the search methods,
+        e.g. ISO_DATE_SEARCH, see module Search
+    DATE_UNION - all core stamp patterns combined into a single search pattern
+        in the order of priority used by ResolveDate()
+
+Compiled patterns (compiled on the first use, see Search.LazyPattern):
     C_ISO_DATE, C_REVERSED_DATE, C_SCREWED_DATE, C_COMPACT_DATE, C_SHORT_DATE
+    C_ISO_DATE_SEARCH, C_REVERSED_DATE_SEARCH, C_SCREWED_DATE_SEARCH,
+    C_COMPACT_DATE_SEARCH, C_SHORT_DATE_SEARCH
+    C_DATE_SEARCH_PATTERNS - tuple of the compiled search versions in the order
+        of priority used by ResolveDate()
+    C_DATE_UNION
+
+Globals:
+    TABLE_FIRST_YEAR - int, the first year of the interned dates table
+    TABLE_LAST_YEAR - int, the last year of the interned dates table
+    DATE_TABLES - list(list(str OR None) OR None), the interned ISO date
+        strings per year from TABLE_FIRST_YEAR to TABLE_LAST_YEAR, built on
+        the first use of the year, see function GetDateTable()
 
 Functions:
     ResolveDate()
         str -> str OR None
+    ResolveDateTuple()
+        str -> tuple(int, int, int) OR None
+    ResolveDateUnion()
+        str -> str OR None
+    FindDates()
+        str -> generator(tuple(tuple(int, int), str))
+    ConvertDateMatch()
+        re.MatchObject -> str
+    ConvertDateMatchTuple()
+        re.MatchObject -> tuple(int, int, int)
+    ConvertDateFieldsTuple()
+        str, str, str -> tuple(int, int, int)
+    ScanCompactDate()
+        str -> bool, tuple(int, int, int) OR None
+    ResolveDates()
+        iterable(str), str, bool, bool, bool -> list(str OR None) OR
+            generator(str OR None)
+    GenerateDates()
+        iterable(str), str, bool, bool -> generator(str OR None)
+    GetDateTable()
+        int -> list(str OR None)
 """
 
-__version__ = "0.1.0.0"
-__date__ = "26-10-2018"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
 __status__ = "Production"
 
 #imports
 
-#+ standard library
+#+ package modules
 
-import re
+from .Search import MakeSearchPattern, MakeUnionPattern, SearchLast, \
+                SearchUnion, FindUnion, DIGITS_TABLE, SHAPE_TABLE, LazyPattern
 
 #patterns
 
@@ -58,55 +99,273 @@ DATE_SEPARATOR = r"((-)|(/)|(_)|(\.))"
 
 #+ ((00)|(YY))YY-M?M-D?D
 
-ISO_DATE = r"".join([r"(.*[^0-9]|^)", YEAR_PATTERN, DATE_SEPARATOR,
-                    MONTH_PATTERN, DATE_SEPARATOR, DAY_PATTERN,
-                    r"([^0-9].*|$)"])
+ISO_DATE_CORE = r"".join([YEAR_PATTERN, DATE_SEPARATOR, MONTH_PATTERN,
+                                                DATE_SEPARATOR, DAY_PATTERN])
+
+ISO_DATE = r"".join([r"(.*[^0-9]|^)", ISO_DATE_CORE, r"([^0-9].*|$)"])
 
 #+ D?D-M?M-((00)|(YY))YY
 
-REVERSED_DATE = r"".join([r"(.*[^0-9]|^)", DAY_PATTERN, DATE_SEPARATOR,
-                        MONTH_PATTERN, DATE_SEPARATOR, YEAR_PATTERN,
-                        r"([^0-9].*|$)"])
+REVERSED_DATE_CORE = r"".join([DAY_PATTERN, DATE_SEPARATOR, MONTH_PATTERN,
+                                                DATE_SEPARATOR, YEAR_PATTERN])
+
+REVERSED_DATE = r"".join([r"(.*[^0-9]|^)", REVERSED_DATE_CORE,
+                                                            r"([^0-9].*|$)"])
 
 #+ M?M-D?D-((00)|(YY))YY - only for day >= 13
 
-SCREWED_DATE = r"".join([r"(.*[^0-9]|^)" + MONTH_PATTERN + DATE_SEPARATOR +
-                    r"(?P<day>(1[3-9])|(2[0-9])|(3[0-1]))"
-                    + DATE_SEPARATOR + YEAR_PATTERN + r"([^0-9].*|$)"])
+SCREWED_DATE_CORE = r"".join([MONTH_PATTERN, DATE_SEPARATOR,
+                                r"(?P<day>(1[3-9])|(2[0-9])|(3[0-1]))",
+                                                DATE_SEPARATOR, YEAR_PATTERN])
+
+SCREWED_DATE = r"".join([r"(.*[^0-9]|^)", SCREWED_DATE_CORE,
+                                                            r"([^0-9].*|$)"])
 
 #+ YYYYMMDD
 
-COMPACT_DATE = r"".join([r"(.*[^0-9]|^)", YEAR_PATTERN,
+COMPACT_DATE_CORE = r"".join([YEAR_PATTERN,
                             r"(?P<month>(0[1-9])|(1[0-2]))",
-                                r"(?P<day>(0[1-9])|([1-2][0-9])|(3[0-1]))",
-                                    r"([^0-9].*|$)"])
+                                r"(?P<day>(0[1-9])|([1-2][0-9])|(3[0-1]))"])
+
+COMPACT_DATE = r"".join([r"(.*[^0-9]|^)", COMPACT_DATE_CORE,
+                                                            r"([^0-9].*|$)"])
 
 #+ YY-M?M-D?D
 
-SHORT_DATE = r"".join([r"(.*[^0-9]|^)(?P<year>[0-9]{2})", DATE_SEPARATOR,
-                    MONTH_PATTERN, DATE_SEPARATOR, DAY_PATTERN,
-                    r"([^0-9].*|$)"])
+SHORT_DATE_CORE = r"".join([r"(?P<year>[0-9]{2})", DATE_SEPARATOR,
+                                MONTH_PATTERN, DATE_SEPARATOR, DAY_PATTERN])
+
+SHORT_DATE = r"".join([r"(.*[^0-9]|^)", SHORT_DATE_CORE, r"([^0-9].*|$)"])
+
+#+ search versions - non-digit delimited stamps without the greedy wrappers
+
+ISO_DATE_SEARCH = MakeSearchPattern(ISO_DATE_CORE)
+
+REVERSED_DATE_SEARCH = MakeSearchPattern(REVERSED_DATE_CORE)
+
+SCREWED_DATE_SEARCH = MakeSearchPattern(SCREWED_DATE_CORE)
+
+COMPACT_DATE_SEARCH = MakeSearchPattern(COMPACT_DATE_CORE)
+
+SHORT_DATE_SEARCH = MakeSearchPattern(SHORT_DATE_CORE)
+
+#+ union of the search versions in the order used by ResolveDate()
+
+DATE_UNION = MakeUnionPattern([(ISO_DATE_CORE, "0-9"),
+                                (REVERSED_DATE_CORE, "0-9"),
+                                    (SCREWED_DATE_CORE, "0-9"),
+                                        (SHORT_DATE_CORE, "0-9"),
+                                            (COMPACT_DATE_CORE, "0-9")])
 
 #compiled patterns
 
-C_ISO_DATE = re.compile(ISO_DATE)
+C_ISO_DATE = LazyPattern(ISO_DATE)
+
+C_REVERSED_DATE = LazyPattern(REVERSED_DATE)
+
+C_SCREWED_DATE = LazyPattern(SCREWED_DATE)
+
+C_COMPACT_DATE = LazyPattern(COMPACT_DATE)
 
-C_REVERSED_DATE = re.compile(REVERSED_DATE)
+C_SHORT_DATE = LazyPattern(SHORT_DATE)
 
-C_SCREWED_DATE = re.compile(SCREWED_DATE)
+#+ search versions
 
-C_COMPACT_DATE = re.compile(COMPACT_DATE)
+C_ISO_DATE_SEARCH = LazyPattern(ISO_DATE_SEARCH)
 
-C_SHORT_DATE = re.compile(SHORT_DATE)
+C_REVERSED_DATE_SEARCH = LazyPattern(REVERSED_DATE_SEARCH)
+
+C_SCREWED_DATE_SEARCH = LazyPattern(SCREWED_DATE_SEARCH)
+
+C_COMPACT_DATE_SEARCH = LazyPattern(COMPACT_DATE_SEARCH)
+
+C_SHORT_DATE_SEARCH = LazyPattern(SHORT_DATE_SEARCH)
+
+#+ search versions in the order of priority used by ResolveDate(), which is
+#+ also the order of the alternatives of the union version
+
+C_DATE_SEARCH_PATTERNS = (C_ISO_DATE_SEARCH, C_REVERSED_DATE_SEARCH,
+                                C_SCREWED_DATE_SEARCH, C_SHORT_DATE_SEARCH,
+                                                        C_COMPACT_DATE_SEARCH)
+
+#+ union version
+
+C_DATE_UNION = LazyPattern(DATE_UNION)
+
+#globals
+
+#+ allowed values of the policy for the non-string elements of the batches
+
+NON_STRING_POLICIES = ('raise', 'skip', 'none')
+
+#+ allowed first two digits of the year of the COMPACT_DATE
+
+COMPACT_CENTURIES = ('00', '19', '20')
+
+#+ interned ISO date strings per year, which are built lazily - the years of
+#+ all date patterns are within this range
+
+TABLE_FIRST_YEAR = 1900
+
+TABLE_LAST_YEAR = 2099
+
+DATE_TABLES = [None] * (TABLE_LAST_YEAR - TABLE_FIRST_YEAR + 1)
 
 #functions
 
+def ScanCompactDate(strStamp):
+    """
+    Regular expressions free fast path of the function ResolveDateTuple() for
+    the compact 'YYYYMMDD' stamps. All other date patterns have the priority
+    over COMPACT_DATE and contain the separators, thus they cannot match if
+    the shape of the string contains neither '0-0-0' nor '0-00-0' (see
+    Search.SHAPE_TABLE). In this case the date is resolved as the last digit
+    run of exactly 8 digits with the valid year, month and day, or it is not
+    found. Otherwise, as well as for the unicode strings and the strings with
+    the new line characters, the date is not resolved by this function.
+    
+    Signature:
+        str -> bool, tuple(int, int, int) OR None
+    
+    Returns:
+        tuple(bool, tuple(int, int, int) OR None): unpacked tuple, the flag if
+            the date is resolved, and the year, month and day or None if the
+            date stamp is not found
+    
+    Version 0.2.0.0
+    """
+    if (not isinstance(strStamp, str)) or ('\n' in strStamp):
+        return False, None
+    strShape = strStamp.translate(SHAPE_TABLE)
+    if ('0-0-0' in strShape) or ('0-00-0' in strShape):
+        return False, None
+    for strRun in reversed(strStamp.translate(DIGITS_TABLE).split()):
+        if len(strRun) == 8 and strRun[:2] in COMPACT_CENTURIES:
+            iMonth = int(strRun[4:6])
+            iDay = int(strRun[6:])
+            if 0 < iMonth < 13 and 0 < iDay < 32:
+                iYear = int(strRun[:4])
+                if iYear < 100:
+                    iYear += 2000
+                return True, (iYear, iMonth, iDay)
+    return True, None
+
+def ConvertDateMatchTuple(objMatch):
+    """
+    Helper function for the conversion of a match object of any of the date
+    stamp patterns into the tuple of integers (year, month, day). The 2-digits
+    years and 00YY years are treated as 20YY.
+    
+    Signature:
+        re.MatchObject -> tuple(int, int, int)
+    
+    Version 0.2.0.0
+    """
+    return ConvertDateFieldsTuple(objMatch.group('year'),
+                            objMatch.group('month'), objMatch.group('day'))
+
+def ConvertDateFieldsTuple(strYear, strMonth, strDay):
+    """
+    Helper function for the conversion of the year, month and day fields of a
+    date stamp (as matched by any of the date stamp patterns) into the tuple of
+    integers. The 2-digits years and 00YY years are treated as 20YY.
+    
+    Signature:
+        str, str, str -> tuple(int, int, int)
+    
+    Version 0.2.0.0
+    """
+    iYear = int(strYear)
+    if iYear < 100:
+        iYear += 2000
+    return iYear, int(strMonth), int(strDay)
+
+def ConvertDateMatch(objMatch):
+    """
+    Helper function for the conversion of a match object of any of the date
+    stamp patterns into the ISO format 'YYYY-MM-DD'. The 2-digits years and
+    00YY years are treated as 20YY.
+    
+    Signature:
+        re.MatchObject -> str
+    
+    Version 0.2.0.0
+    """
+    return "{}-{:02}-{:02}".format(*ConvertDateMatchTuple(objMatch))
+
+def ResolveDateTuple(strStamp):
+    """
+    Attempts to resolve the passed date stamp with help of the defined regular
+    expression patterns in the following order:
+        ISO_DATE, REVERSED_DATE, SCREWED_DATE, SHORT_DATE, COMPACT_DATE
+    
+    The search versions of the patterns are used, with the last occurrence of
+    the stamp in the string being selected, see function Search.SearchLast().
+    The compact stamps are resolved without the regular expressions whenever
+    possible, see function ScanCompactDate().
+    
+    Signature:
+        str -> tuple(int, int, int) OR None
+    
+    Returns:
+        tuple(int, int, int): the resolved date stamp as the year, month and
+            day
+        None: value of none of the patterns is matched.
+    
+    Raises:
+        TypeError: if the passed argument is not a string.
+    
+    Version 0.2.0.0
+    """
+    if not isinstance(strStamp, basestring):
+        strError = '{} of {} is not a string'.format(strStamp, type(strStamp))
+        raise TypeError(strError)
+    bResolved, tupleResult = ScanCompactDate(strStamp)
+    if bResolved:
+        return tupleResult
+    for objPattern in C_DATE_SEARCH_PATTERNS:
+        objMatch = SearchLast(objPattern, strStamp)
+        if objMatch:
+            tupleResult = ConvertDateMatchTuple(objMatch)
+            break
+    else:
+        tupleResult = None
+    return tupleResult
+
 def ResolveDate(strStamp):
     """
     Attempts to resolve the passed date stamp with help of the defined regular
     expression patterns in the following order:
         ISO_DATE, REVERSED_DATE, SCREWED_DATE, SHORT_DATE, COMPACT_DATE
     
+    The search versions of the patterns are used, with the last occurrence of
+    the stamp in the string being selected, see function Search.SearchLast().
+    Wrapper formatting the result of the function ResolveDateTuple().
+    
+    Signature:
+        str -> str OR None
+    
+    Returns:
+        str: the resolved date stamp as a string in ISO format 'YYYY-MM-DD'
+        None: value of none of the patterns is matched.
+    
+    Raises:
+        TypeError: if the passed argument is not a string.
+    
+    Version 0.2.0.0
+    """
+    tupleResult = ResolveDateTuple(strStamp)
+    if tupleResult is None:
+        return None
+    return "{}-{:02}-{:02}".format(*tupleResult)
+
+def ResolveDateUnion(strStamp):
+    """
+    Resolves the passed date stamp exactly as the function ResolveDate(), but
+    all patterns are searched for in a single pass of the union pattern
+    C_DATE_UNION, which is faster for the strings not containing a stamp. See
+    function Search.SearchUnion().
+    
     Signature:
         str -> str OR None
     
@@ -117,22 +376,187 @@ def ResolveDate(strStamp):
     Raises:
         TypeError: if the passed argument is not a string.
     
-    Version 0.1.0.0
+    Version 0.2.0.0
     """
     if not isinstance(strStamp, basestring):
         strError = '{} of {} is not a string'.format(strStamp, type(strStamp))
         raise TypeError(strError)
-    for objPattern in [C_ISO_DATE, C_REVERSED_DATE, C_SCREWED_DATE,
-                                                C_SHORT_DATE, C_COMPACT_DATE]:
-        objMatch = objPattern.match(strStamp)
+    objMatch = SearchUnion(C_DATE_UNION, C_DATE_SEARCH_PATTERNS, strStamp)
+    if objMatch:
+        strResult = ConvertDateMatch(objMatch)
+    else:
+        strResult = None
+    return strResult
+
+def FindDates(strStamp):
+    """
+    Finds all non-overlapping date stamps in the passed string (in all its
+    lines) from the left to the right with a single pass of the union pattern
+    C_DATE_UNION, see function Search.FindUnion(). At each position the
+    patterns are tried in the same order as by the function ResolveDate():
+        ISO_DATE, REVERSED_DATE, SCREWED_DATE, SHORT_DATE, COMPACT_DATE
+    
+    Signature:
+        str -> generator(tuple(tuple(int, int), str))
+    
+    Returns:
+        generator(tuple(tuple(int, int), str)): generator of the spans of the
+            found stamps (start and end positions as a slice) and the stamps
+            as strings in ISO format 'YYYY-MM-DD'
+    
+    Raises:
+        TypeError: if the passed argument is not a string; raised by the call,
+            not during the iteration
+    
+    Version 0.2.0.0
+    """
+    if not isinstance(strStamp, basestring):
+        strError = '{} of {} is not a string'.format(strStamp, type(strStamp))
+        raise TypeError(strError)
+    return (((iStart, iEnd), ConvertDateMatch(objMatch))
+                    for iStart, iEnd, objMatch in FindUnion(C_DATE_UNION,
+                                            C_DATE_SEARCH_PATTERNS, strStamp))
+
+def GetDateTable(iYear):
+    """
+    Returns the table of the interned ISO date strings of the year, which is
+    built on the first call for the year. The string of the month and the day
+    is at the index month * 32 + day; the days up to 31 are included for all
+    months, as they are matched by the patterns.
+    
+    Signature:
+        int -> list(str OR None)
+    
+    Args:
+        iYear: int, the year between TABLE_FIRST_YEAR and TABLE_LAST_YEAR
+            inclusively
+    
+    Returns:
+        list(str OR None): the interned strings in ISO format 'YYYY-MM-DD'
+            and None for the not used indexes
+    
+    Raises:
+        IndexError: the year is outside the range of the table
+    
+    Version 0.2.0.0
+    """
+    iIndex = iYear - TABLE_FIRST_YEAR
+    if iIndex < 0:
+        raise IndexError('year {} is out of the table range'.format(iYear))
+    lstTable = DATE_TABLES[iIndex]
+    if lstTable is None:
+        lstTable = [None] * (13 * 32)
+        for iMonth in range(1, 13):
+            for iDay in range(1, 32):
+                lstTable[iMonth * 32 + iDay] = intern("{}-{:02}-{:02}".format(
+                                                        iYear, iMonth, iDay))
+        DATE_TABLES[iIndex] = lstTable
+    return lstTable
+
+def ResolveDates(gStamps, strNonString = 'raise', bUnion = False,
+                                            bLazy = False, bInterned = False):
+    """
+    Batch version of the functions ResolveDate() and ResolveDateUnion(). The
+    per-call setup (name look-ups, choice of the patterns, result formatting
+    method) is done only once for all elements of the passed iterable.
+    
+    With the bInterned flag the results are not formatted, but taken from the
+    precomputed tables of the interned strings (see function GetDateTable()),
+    thus the equal dates are the same string object, which saves the memory
+    when many results are kept, e.g. in the lists or data frames.
+    
+    The policy for the elements, which are not strings, is defined by the
+    argument strNonString:
+        'raise' - TypeError exception is raised, as by ResolveDate()
+        'skip' - the element is skipped, i.e. there is no result for it
+        'none' - None is the result, as for a not matching string
+    
+    Signature:
+        iterable(str), str, bool, bool, bool -> list(str OR None) OR
+            generator(str OR None)
+    
+    Args:
+        gStamps: iterable(str), any iterable of the date stamps
+        strNonString: (optional) str, the policy for the non-string elements,
+            one of the NON_STRING_POLICIES, defaults to 'raise'
+        bUnion: (optional) bool, flag if the single pass union pattern is used
+            as by ResolveDateUnion(), defaults to False
+        bLazy: (optional) bool, flag if a generator is returned instead of a
+            list, defaults to False
+        bInterned: (optional) bool, flag if the interned strings of the
+            precomputed tables are returned, defaults to False
+    
+    Returns:
+        list(str OR None): the resolved date stamps in ISO format 'YYYY-MM-DD'
+            or None for the not matched elements, in the order of the elements
+        generator(str OR None): the same results, if bLazy is True
+    
+    Raises:
+        ValueError: the passed policy is not one of the NON_STRING_POLICIES
+        TypeError: an element is not a string and the policy is 'raise'; for
+            the generator - raised during the iteration
+    
+    Version 0.2.0.0
+    """
+    if not (strNonString in NON_STRING_POLICIES):
+        strError = '{} is not one of the policies {}'.format(strNonString,
+                                                        NON_STRING_POLICIES)
+        raise ValueError(strError)
+    genResults = GenerateDates(gStamps, strNonString, bUnion, bInterned)
+    if not bLazy:
+        genResults = list(genResults)
+    return genResults
+
+def GenerateDates(gStamps, strNonString, bUnion, bInterned = False):
+    """
+    Generator implementing the function ResolveDates(), the non-string policy
+    is not checked.
+    
+    Signature:
+        iterable(str), str, bool, bool -> generator(str OR None)
+    
+    Version 0.2.0.0
+    """
+    #+ local aliases of the globals
+    tuplePatterns = C_DATE_SEARCH_PATTERNS
+    objUnion = C_DATE_UNION
+    fSearchLast = SearchLast
+    fSearchUnion = SearchUnion
+    typeString = basestring
+    fFormat = "{}-{:02}-{:02}".format
+    lstTables = DATE_TABLES
+    fGetTable = GetDateTable
+    iFirstYear = TABLE_FIRST_YEAR
+    bSkip = strNonString == 'skip'
+    bNone = strNonString == 'none'
+    for gStamp in gStamps:
+        if not isinstance(gStamp, typeString):
+            if bSkip:
+                continue
+            elif bNone:
+                yield None
+                continue
+            strError = '{} of {} is not a string'.format(gStamp, type(gStamp))
+            raise TypeError(strError)
+        if bUnion:
+            objMatch = fSearchUnion(objUnion, tuplePatterns, gStamp)
+        else:
+            for objPattern in tuplePatterns:
+                objMatch = fSearchLast(objPattern, gStamp)
+                if objMatch:
+                    break
         if objMatch:
             iYear = int(objMatch.group('year'))
-            iMonth = int(objMatch.group('month'))
-            iDay = int(objMatch.group('day'))
             if iYear < 100:
                 iYear += 2000
-            strResult = "{}-{:02}-{:02}".format(iYear, iMonth, iDay)
-            break
-    else:
-        strResult = None
-    return strResult
\ No newline at end of file
+            if bInterned:
+                lstTable = lstTables[iYear - iFirstYear]
+                if lstTable is None:
+                    lstTable = fGetTable(iYear)
+                yield lstTable[int(objMatch.group('month')) * 32 +
+                                                    int(objMatch.group('day'))]
+            else:
+                yield fFormat(iYear, int(objMatch.group('month')),
+                                                    int(objMatch.group('day')))
+        else:
+            yield None
@@ -0,0 +1,407 @@
+#!/usr/bin/python
+"""
+Module regex_lib.Encoded
+
+Dictionary encoded batch resolution of the date / time stamps for the low
+memory storage of the results of millions of strings, e.g. of a full archive
+of the log files. Instead of a list of the mostly repeated result strings /
+tuples, the results are stored as a compact array of the integer codes (4
+bytes per entry) plus the table of the unique results, indexed by the codes in
+the order of their first appearance.
+
+The encoded results of several chunks (e.g. returned by the parallel workers)
+are merged into a single dictionary with a single look-up per unique value of
+the merged chunk, the codes of the chunk are translated by a list indexing.
+The instances are pickled as the codes array and the table only, which keeps
+the transfer between the processes cheap.
+
+Globals:
+    CODE_TYPE - str, type code of the array of the codes
+
+Functions:
+    EncodeDates()
+        iterable(str), str, bool, EncodedResults OR None -> EncodedResults
+    EncodeTimes()
+        iterable(str), str, bool, EncodedResults OR None -> EncodedResults
+    MergeResults()
+        iterable(EncodedResults) -> EncodedResults
+
+Classes:
+    EncodedResults
+"""
+
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+
+#imports
+
+#+ standard libraries
+
+import array
+
+#+ package modules
+
+from .Date import GenerateDates, NON_STRING_POLICIES
+
+from .Time import GenerateTimes
+
+#globals
+
+CODE_TYPE = 'i'
+
+#classes
+
+class EncodedResults(object):
+    """
+    Dictionary encoded sequence of the resolution results: the array of the
+    integer codes, one per entry, and the list of the unique values, such that
+    the value of an entry is Values[Codes[index]]. The values must be hashable,
+    e.g. the strings, None or the tuples returned by ResolveTime().
+    
+    The decoded values are accessed by index or slice, or by iteration; the
+    codes and the table can be used directly, e.g. for the grouping or
+    counting of the entries by the codes.
+    
+    Usage:
+        objResults = EncodeDates(lstLines)
+        objResults.Merge(EncodeDates(lstOtherLines))
+        lstDates = objResults.Decode()
+    
+    Attributes:
+        Codes: array.array(int), the codes of the entries
+        Values: list(type A), the unique values indexed by the codes
+    
+    Methods:
+        __len__()
+            None -> int
+        __getitem__(gIndex)
+            int OR slice -> type A OR list(type A)
+        __iter__()
+            None -> generator(type A)
+        Append(gValue)
+            type A -> int
+        Extend(gValues)
+            iterable(type A) -> None
+        Merge(objOther)
+            EncodedResults -> None
+        Decode()
+            None -> list(type A)
+        GetStatistics()
+            None -> dict(str -> int OR float)
+    
+    Version 0.2.0.0
+    """
+    
+    def __init__(self):
+        """
+        Initialization, empty codes array and table.
+        
+        Signature:
+            None -> None
+        
+        Version 0.2.0.0
+        """
+        self.Codes = array.array(CODE_TYPE)
+        self.Values = []
+        self._dictCodes = {}
+    
+    def __getstate__(self):
+        """
+        Returns the state for the pickling - the codes array and the table of
+        the values only, the look-up dictionary is rebuilt when unpickled.
+        
+        Signature:
+            None -> tuple(array.array(int), list(type A))
+        
+        Version 0.2.0.0
+        """
+        return (self.Codes, self.Values)
+    
+    def __setstate__(self, tupleState):
+        """
+        Restores the pickled state and rebuilds the look-up dictionary.
+        
+        Signature:
+            tuple(array.array(int), list(type A)) -> None
+        
+        Version 0.2.0.0
+        """
+        self.Codes, self.Values = tupleState
+        self._dictCodes = dict((gValue, iCode)
+                                for iCode, gValue in enumerate(self.Values))
+    
+    def __len__(self):
+        """
+        Returns the number of the entries.
+        
+        Signature:
+            None -> int
+        
+        Version 0.2.0.0
+        """
+        return len(self.Codes)
+    
+    def __getitem__(self, gIndex):
+        """
+        Returns the decoded value of an entry, or the list of the values of a
+        slice of the entries.
+        
+        Signature:
+            int OR slice -> type A OR list(type A)
+        
+        Raises:
+            IndexError: the index is out of range
+            TypeError: the index is neither an integer nor a slice
+        
+        Version 0.2.0.0
+        """
+        lstValues = self.Values
+        if isinstance(gIndex, slice):
+            return [lstValues[iCode] for iCode in self.Codes[gIndex]]
+        return lstValues[self.Codes[gIndex]]
+    
+    def __iter__(self):
+        """
+        Generator of the decoded values of the entries in their order.
+        
+        Signature:
+            None -> generator(type A)
+        
+        Version 0.2.0.0
+        """
+        lstValues = self.Values
+        for iCode in self.Codes:
+            yield lstValues[iCode]
+    
+    def Append(self, gValue):
+        """
+        Adds a single entry and returns its code, the new value is added to
+        the table.
+        
+        Signature:
+            type A -> int
+        
+        Raises:
+            TypeError: the value is not hashable
+        
+        Version 0.2.0.0
+        """
+        iCode = self._dictCodes.get(gValue)
+        if iCode is None:
+            iCode = len(self.Values)
+            self._dictCodes[gValue] = iCode
+            self.Values.append(gValue)
+        self.Codes.append(iCode)
+        return iCode
+    
+    def Extend(self, gValues):
+        """
+        Adds the entries of any iterable of the values, e.g. the generator of
+        the resolution results, in their order.
+        
+        Signature:
+            iterable(type A) -> None
+        
+        Raises:
+            TypeError: a value is not hashable
+        
+        Version 0.2.0.0
+        """
+        dictCodes = self._dictCodes
+        lstValues = self.Values
+        fAppend = self.Codes.append
+        for gValue in gValues:
+            iCode = dictCodes.get(gValue)
+            if iCode is None:
+                iCode = len(lstValues)
+                dictCodes[gValue] = iCode
+                lstValues.append(gValue)
+            fAppend(iCode)
+    
+    def Merge(self, objOther):
+        """
+        Appends all entries of another instance, the values of its table are
+        looked up once each, and its codes are translated into the codes of
+        this table. The other instance is not modified.
+        
+        Signature:
+            EncodedResults -> None
+        
+        Raises:
+            TypeError: the argument is not an EncodedResults instance
+        
+        Version 0.2.0.0
+        """
+        if not isinstance(objOther, EncodedResults):
+            strError = '{} of {} is not an EncodedResults instance'.format(
+                                                    objOther, type(objOther))
+            raise TypeError(strError)
+        dictCodes = self._dictCodes
+        lstValues = self.Values
+        lstMap = []
+        bSame = True
+        for iOtherCode, gValue in enumerate(list(objOther.Values)):
+            iCode = dictCodes.get(gValue)
+            if iCode is None:
+                iCode = len(lstValues)
+                dictCodes[gValue] = iCode
+                lstValues.append(gValue)
+            bSame = bSame and (iCode == iOtherCode)
+            lstMap.append(iCode)
+        if bSame:
+            #+ the table of the other instance is a prefix of this table
+            self.Codes.extend(array.array(CODE_TYPE, objOther.Codes))
+        else:
+            lstCodes = [lstMap[iCode] for iCode in objOther.Codes]
+            self.Codes.extend(array.array(CODE_TYPE, lstCodes))
+    
+    def Decode(self):
+        """
+        Returns the list of the decoded values of all entries.
+        
+        Signature:
+            None -> list(type A)
+        
+        Version 0.2.0.0
+        """
+        lstValues = self.Values
+        return [lstValues[iCode] for iCode in self.Codes]
+    
+    def GetStatistics(self):
+        """
+        Returns the size statistics of the encoded results.
+        
+        Signature:
+            None -> dict(str -> int OR float)
+        
+        Returns:
+            dict(str -> int OR float): with the keys 'Entries', 'Unique'
+                (number of the values in the table), 'CodeBytes' (size of the
+                codes array data) and 'Ratio' (entries per unique value, 0.0 if
+                there are no entries)
+        
+        Version 0.2.0.0
+        """
+        iEntries = len(self.Codes)
+        iUnique = len(self.Values)
+        if iUnique:
+            fRatio = float(iEntries) / iUnique
+        else:
+            fRatio = 0.0
+        return {'Entries' : iEntries, 'Unique' : iUnique,
+                'CodeBytes' : iEntries * self.Codes.itemsize, 'Ratio' : fRatio}
+
+#functions
+
+def CheckArguments(strNonString, objResults):
+    """
+    Helper function checking the non-string policy and the passed instance to
+    be extended, and returning this instance or a new empty one if None is
+    passed.
+    
+    Signature:
+        str, EncodedResults OR None -> EncodedResults
+    
+    Raises:
+        ValueError: the passed policy is not one of the NON_STRING_POLICIES
+        TypeError: the passed instance is neither None nor EncodedResults
+    
+    Version 0.2.0.0
+    """
+    if not (strNonString in NON_STRING_POLICIES):
+        strError = '{} is not one of the policies {}'.format(strNonString,
+                                                        NON_STRING_POLICIES)
+        raise ValueError(strError)
+    if objResults is None:
+        objResults = EncodedResults()
+    elif not isinstance(objResults, EncodedResults):
+        strError = '{} of {} is not an EncodedResults instance'.format(
+                                                objResults, type(objResults))
+        raise TypeError(strError)
+    return objResults
+
+def EncodeDates(gStamps, strNonString = 'raise', bUnion = False,
+                                                            objResults = None):
+    """
+    Resolves the date stamps of all elements of any iterable with the same
+    results as the function ResolveDates() and returns them dictionary encoded.
+    
+    Signature:
+        iterable(str), str, bool, EncodedResults OR None -> EncodedResults
+    
+    Args:
+        gStamps: iterable(str), any iterable of the date stamps
+        strNonString: (optional) str, the policy for the non-string elements,
+            one of the NON_STRING_POLICIES, defaults to 'raise'
+        bUnion: (optional) bool, flag if the single pass union pattern is
+            used, defaults to False
+        objResults: (optional) EncodedResults OR None, the instance to be
+            extended with the results, defaults to None - a new one is created
+    
+    Returns:
+        EncodedResults: the encoded results, the values are str OR None
+    
+    Raises:
+        ValueError: the passed policy is not one of the NON_STRING_POLICIES
+        TypeError: an element is not a string and the policy is 'raise', or
+            the passed instance is neither None nor EncodedResults
+    
+    Version 0.2.0.0
+    """
+    objResults = CheckArguments(strNonString, objResults)
+    objResults.Extend(GenerateDates(gStamps, strNonString, bUnion))
+    return objResults
+
+def EncodeTimes(gStamps, strNonString = 'raise', bUnion = False,
+                                                            objResults = None):
+    """
+    Resolves the time stamps of all elements of any iterable with the same
+    results as the function ResolveTimes() and returns them dictionary encoded.
+    
+    Signature:
+        iterable(str), str, bool, EncodedResults OR None -> EncodedResults
+    
+    Args:
+        gStamps: iterable(str), any iterable of the time stamps
+        strNonString: (optional) str, the policy for the non-string elements,
+            one of the NON_STRING_POLICIES, defaults to 'raise'
+        bUnion: (optional) bool, flag if the single pass union pattern is
+            used, defaults to False
+        objResults: (optional) EncodedResults OR None, the instance to be
+            extended with the results, defaults to None - a new one is created
+    
+    Returns:
+        EncodedResults: the encoded results, the values are
+            tuple(str OR None, bool)
+    
+    Raises:
+        ValueError: the passed policy is not one of the NON_STRING_POLICIES
+        TypeError: an element is not a string and the policy is 'raise', or
+            the passed instance is neither None nor EncodedResults
+    
+    Version 0.2.0.0
+    """
+    objResults = CheckArguments(strNonString, objResults)
+    objResults.Extend(GenerateTimes(gStamps, strNonString, bUnion))
+    return objResults
+
+def MergeResults(gChunks):
+    """
+    Merges the encoded results of the chunks into a single new instance with
+    a common table, in the order of the chunks. The chunks are consumed one by
+    one, thus any iterable can be passed, e.g. the unordered iterator of the
+    results of a pool of workers.
+    
+    Signature:
+        iterable(EncodedResults) -> EncodedResults
+    
+    Raises:
+        TypeError: a chunk is not an EncodedResults instance
+    
+    Version 0.2.0.0
+    """
+    objResults = EncodedResults()
+    for objChunk in gChunks:
+        objResults.Merge(objChunk)
+    return objResults
@@ -0,0 +1,757 @@
+#!/usr/bin/python
+"""
+Module regex_lib.Follow
+
+Resolution of the date / time stamps in the lines of the growing log files,
+e.g. the logs appended by the instruments, which are polled periodically. The
+scanner remembers the byte offset of the partial (not yet terminated)
+trailing line in a small checkpoint file, so each poll reads and resolves only
+the newly appended data, also after the restart of the application, when the
+partial line is read again from the file. The amount of the data read by a
+single poll is limited, so the first poll of a large existing file does not
+resolve it at once, and the partial line longer than the maximum line length
+is resolved as a complete one.
+
+The rotation of the file (the path refers to another file, i.e. the device or
+the inode number is changed, or the file is removed) and its truncation (the
+size is less than the reached offset, or the beginning of the file is changed)
+are detected at each poll. The followed file is kept open between the polls,
+thus the data appended to the rotated file is read to its end first; after
+the restart of the application the rotated file is looked for in the same
+folder by its device and inode numbers. The pending partial line of the
+previous content is resolved as a complete one, and the new file (or the
+truncated one) is read from its beginning.
+
+The records are the same as of the function Scanner.ScanFile(): the line
+number (starting with 1), the byte offset of the line from the beginning of
+the file, the resolved date and time stamps and the date increment flag; the
+lines are resolved by the function Stream.ResolveBatch().
+
+Globals:
+    CHUNK_SIZE - int, default size of the read chunks in bytes
+    MAX_BYTES - int, default maximum number of the bytes read by a poll
+    MAX_LINE - int, default maximum length of the partial trailing line
+    HEAD_SIZE - int, maximum number of the first bytes of the file, which are
+        compared to detect the truncation
+    INTERVAL - float, default interval between the polls in seconds
+
+Functions:
+    FollowFile()
+        str, str OR None, int OR float, int OR None, bool, int, int, int
+            -> generator(tuple(int, int, str OR None, str OR None, bool))
+    GenerateFollow()
+        FollowScanner, int OR float, int OR None
+            -> generator(tuple(int, int, str OR None, str OR None, bool))
+
+Classes:
+    FollowScanner
+"""
+
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+
+#imports
+
+#+ standard library
+
+import os
+import errno
+import json
+import hashlib
+import time
+
+#+ package modules
+
+from .Stream import ResolveBatch
+
+#globals
+
+CHUNK_SIZE = 65536
+
+MAX_BYTES = 4194304
+
+MAX_LINE = 1048576
+
+HEAD_SIZE = 1024
+
+INTERVAL = 1.0
+
+#functions
+
+def FollowFile(strPath, strCheckpoint = None, fInterval = INTERVAL,
+                    iPolls = None, bUnion = False, iChunkSize = CHUNK_SIZE,
+                            iMaxBytes = MAX_BYTES, iMaxLine = MAX_LINE):
+    """
+    Polls the passed file with a FollowScanner and generates the records of
+    the newly appended lines lazily, sleeping for the passed interval after
+    each poll, which has reached the end of the file without the new lines.
+    The checkpoint file is saved after all records of a poll are generated,
+    thus the records of the interrupted poll are generated again after the
+    restart (at least once delivery). The file is closed when the generator is
+    exhausted or closed.
+    
+    Signature:
+        str, str OR None, int OR float, int OR None, bool, int, int, int
+            -> generator(tuple(int, int, str OR None, str OR None, bool))
+    
+    Args:
+        strPath: str, the path to the followed file
+        strCheckpoint: (optional) str OR None, the path to the checkpoint file,
+            defaults to None (no checkpoint)
+        fInterval: (optional) int >= 0 OR float >= 0, the interval between the
+            polls in seconds, defaults to INTERVAL
+        iPolls: (optional) int > 0 OR None, the number of the polls, defaults
+            to None (infinite)
+        bUnion: (optional) bool, flag if the single pass union patterns are
+            used, defaults to False
+        iChunkSize: (optional) int > 0, the size of the read chunks, defaults
+            to CHUNK_SIZE
+        iMaxBytes: (optional) int > 0, the maximum number of the bytes read by
+            a poll, defaults to MAX_BYTES
+        iMaxLine: (optional) int > 0, the maximum length of the partial
+            trailing line, defaults to MAX_LINE
+    
+    Returns:
+        generator(tuple(int, int, str OR None, str OR None, bool)): records of
+            the line number, byte offset of the line, resolved date stamp in
+            ISO format 'YYYY-MM-DD' or None, resolved time stamp in ISO format
+            'HH:MM:SS' or None and the date increment flag
+    
+    Raises:
+        TypeError: a path is not a string, the interval is not a number, or
+            the number of the polls or a size is not an integer
+        ValueError: the interval is negative, the number of the polls or a
+            size is not positive, or the checkpoint file is corrupted or
+            belongs to another file
+        IOError: the file cannot be read or the checkpoint file cannot be
+            written - raised during the iteration
+    
+    Version 0.2.0.0
+    """
+    if ((not isinstance(fInterval, (int, long, float))) or
+                                                isinstance(fInterval, bool)):
+        strError = '{} of {} is not a number'.format(fInterval,
+                                                            type(fInterval))
+        raise TypeError(strError)
+    if fInterval < 0:
+        strError = 'interval {} is negative'.format(fInterval)
+        raise ValueError(strError)
+    if not (iPolls is None):
+        if (not isinstance(iPolls, (int, long))) or isinstance(iPolls, bool):
+            strError = '{} of {} is not an integer'.format(iPolls,
+                                                                type(iPolls))
+            raise TypeError(strError)
+        if iPolls < 1:
+            strError = 'number of polls {} is not positive'.format(iPolls)
+            raise ValueError(strError)
+    objScanner = FollowScanner(strPath, strCheckpoint, bUnion, iChunkSize,
+                                                        iMaxBytes, iMaxLine)
+    return GenerateFollow(objScanner, fInterval, iPolls)
+
+def GenerateFollow(objScanner, fInterval, iPolls):
+    """
+    Generator implementing the function FollowFile(), the arguments are not
+    checked.
+    
+    Signature:
+        FollowScanner, int OR float, int OR None
+            -> generator(tuple(int, int, str OR None, str OR None, bool))
+    
+    Version 0.2.0.0
+    """
+    iPoll = 0
+    lstRecords = None
+    try:
+        while (iPolls is None) or (iPoll < iPolls):
+            #+ more data may be appended already after a poll with the new
+            #+ lines, or not read yet due to the limit
+            if iPoll and not (lstRecords or objScanner.Behind):
+                time.sleep(fInterval)
+            lstRecords = objScanner.Poll(False)
+            iPoll += 1
+            for tupleRecord in lstRecords:
+                yield tupleRecord
+            if not (objScanner.Checkpoint is None):
+                objScanner.Save()
+    finally:
+        objScanner.Close()
+
+#classes
+
+class FollowScanner(object):
+    """
+    Incremental scanner of a growing file: each poll resolves the date / time
+    stamps in the lines appended since the previous poll, with the reached
+    offset kept in the optional checkpoint file.
+    
+    The line ending characters ('\\n' and the preceding '\\r') are not passed
+    to the resolution functions; the partial trailing line is resolved only
+    when it is terminated, or longer than MaxLine bytes, or by the method
+    Flush(), or when the file is truncated or rotated. The partial line is not
+    stored in the checkpoint file, it is read again from the file after the
+    restart (thus it is lost if the file is truncated or removed before the
+    restart). The followed file is kept open between the polls
+    until the method Close() is called, so the data appended to it before its
+    rotation is not lost (on Windows the open file cannot be renamed by the
+    writer, call Close() after each poll there). The data appended before the
+    truncation is lost, since it is removed from the file. The truncation is
+    not detected if the file is truncated and grows back beyond the reached
+    offset between two polls with the same first HEAD_SIZE bytes. The
+    instances are not thread-safe.
+    
+    Usage:
+        objScanner = FollowScanner('instrument.log', 'instrument.checkpoint')
+        while True:
+            for tupleRecord in objScanner.Poll():
+                ...
+            if not objScanner.Behind:
+                time.sleep(1.0)
+    
+    Attributes:
+        Path: str, the absolute path to the followed file
+        Checkpoint: str OR None, the path to the checkpoint file
+        Union: bool, flag if the single pass union patterns are used
+        ChunkSize: int > 0, the size of the read chunks
+        MaxBytes: int > 0, the maximum number of the bytes read by a poll
+        MaxLine: int > 0, the maximum length of the partial trailing line
+        Offset: int >= 0, the byte offset of the first not resolved byte, i.e.
+            of the partial trailing line
+        Line: int >= 0, the number of the last resolved line
+        Tail: str, the partial trailing line, empty after the loading of the
+            state until the next poll (read-only property)
+        Behind: bool, flag if the last poll has stopped at the limit of the
+            read bytes, i.e. more data may be available already
+        Polls: int >= 0, number of the polls
+        Lines: int >= 0, number of the resolved lines
+        Bytes: int >= 0, number of the read bytes
+        Truncations: int >= 0, number of the detected truncations
+        Rotations: int >= 0, number of the detected rotations
+    
+    Methods:
+        Poll(bSave = True)
+            bool -> list(tuple(int, int, str OR None, str OR None, bool))
+        Flush()
+            None -> list(tuple(int, int, str OR None, str OR None, bool))
+        Close()
+            None -> None
+        ReadData(iLimit)
+            int -> list(tuple(int, int, str OR None, str OR None, bool)), int
+        FindRotated()
+            None -> file OR None
+        Restart(tupleFile)
+            tuple(int, int) OR None -> list(tuple(int, int, str OR None,
+                str OR None, bool))
+        CheckHead()
+            None -> bool
+        GetState()
+            None -> dict(str -> str OR int OR None)
+        Load()
+            None -> bool
+        Save()
+            None -> bool
+        GetStatistics()
+            None -> dict(str -> int)
+    
+    Version 0.2.0.0
+    """
+    
+    def __init__(self, strPath, strCheckpoint = None, bUnion = False,
+                            iChunkSize = CHUNK_SIZE, iMaxBytes = MAX_BYTES,
+                                                        iMaxLine = MAX_LINE):
+        """
+        Initialization. The state is loaded from the checkpoint file if it
+        exists, otherwise the file is followed from its beginning.
+        
+        Signature:
+            str, str OR None, bool, int, int, int -> None
+        
+        Args:
+            strPath: str, the path to the followed file, which may not exist
+                yet
+            strCheckpoint: (optional) str OR None, the path to the checkpoint
+                file, defaults to None (no checkpoint)
+            bUnion: (optional) bool, flag if the single pass union patterns
+                are used, defaults to False
+            iChunkSize: (optional) int > 0, the size of the read chunks,
+                defaults to CHUNK_SIZE
+            iMaxBytes: (optional) int > 0, the maximum number of the bytes
+                read by a poll, defaults to MAX_BYTES
+            iMaxLine: (optional) int > 0, the maximum length of the partial
+                trailing line, defaults to MAX_LINE
+        
+        Raises:
+            TypeError: a path is not a string, or a size is not an integer
+            ValueError: a size is not positive, or the checkpoint file is
+                corrupted or belongs to another file
+            IOError: the existing checkpoint file cannot be read
+        
+        Version 0.2.0.0
+        """
+        if not isinstance(strPath, basestring):
+            strError = '{} of {} is not a string'.format(strPath,
+                                                                type(strPath))
+            raise TypeError(strError)
+        if not ((strCheckpoint is None) or
+                                        isinstance(strCheckpoint, basestring)):
+            strError = '{} of {} is not a string'.format(strCheckpoint,
+                                                        type(strCheckpoint))
+            raise TypeError(strError)
+        for strName, iValue in [('chunk size', iChunkSize),
+                                            ('maximum of bytes', iMaxBytes),
+                                            ('maximum of line', iMaxLine)]:
+            if (not isinstance(iValue, (int, long))) or isinstance(iValue,
+                                                                        bool):
+                strError = '{} of {} is not an integer'.format(iValue,
+                                                                type(iValue))
+                raise TypeError(strError)
+            if iValue < 1:
+                strError = '{} {} is not positive'.format(strName, iValue)
+                raise ValueError(strError)
+        self.Path = os.path.abspath(strPath)
+        self.Checkpoint = strCheckpoint
+        self.Union = bUnion
+        self.ChunkSize = iChunkSize
+        self.MaxBytes = iMaxBytes
+        self.MaxLine = iMaxLine
+        self.Offset = 0
+        self.Line = 0
+        self.Behind = False
+        self.Polls = 0
+        self.Lines = 0
+        self.Bytes = 0
+        self.Truncations = 0
+        self.Rotations = 0
+        self._strTail = ''
+        #+ device and inode numbers of the followed file, None - not opened yet
+        self._tupleFile = None
+        #+ the followed file kept open between the polls, None - not opened
+        self._objFile = None
+        #+ size and hash of the first bytes of the file
+        self._iHeadSize = 0
+        self._strHead = ''
+        #+ last saved or loaded state
+        self._dictSaved = None
+        if not (strCheckpoint is None):
+            self.Load()
+    
+    @property
+    def Tail(self):
+        """
+        Returns the partial trailing line, not resolved yet.
+        
+        Signature:
+            None -> str
+        
+        Version 0.2.0.0
+        """
+        return self._strTail
+    
+    def Poll(self, bSave = True):
+        """
+        Reads the data appended to the file since the previous poll, at most
+        MaxBytes bytes, and resolves the complete lines. If the file is
+        rotated, the rest of the previous file is read first; the truncation
+        of the file is detected before reading. A missing file (e.g. rotated,
+        but not created yet) is not an error, the state is kept until it
+        appears.
+        
+        Signature:
+            bool -> list(tuple(int, int, str OR None, str OR None, bool))
+        
+        Args:
+            bSave: (optional) bool, flag if the checkpoint file (if any) is
+                saved after the poll, defaults to True
+        
+        Returns:
+            list(tuple(int, int, str OR None, str OR None, bool)): records of
+                the line number, byte offset of the line, resolved date stamp,
+                resolved time stamp and the date increment flag for each new
+                line, in the order of the lines
+        
+        Raises:
+            IOError: the file cannot be read or the checkpoint file cannot be
+                written
+        
+        Version 0.2.0.0
+        """
+        self.Polls += 1
+        lstRecords = []
+        iLimit = self.MaxBytes
+        try:
+            objStat = os.stat(self.Path)
+            tupleFile = (objStat.st_dev, objStat.st_ino)
+        except OSError as objError:
+            if objError.errno != errno.ENOENT:
+                raise
+            tupleFile = None
+        bRotated = (not (self._tupleFile is None) and
+                                                tupleFile != self._tupleFile)
+        if bRotated and (self._objFile is None):
+            #+ rotated while the file was not open, e.g. before the restart
+            self._objFile = self.FindRotated()
+        if bRotated and not (self._objFile is None):
+            #+ the rest of the rotated file first
+            lstNew, iRead = self.ReadData(iLimit)
+            lstRecords.extend(lstNew)
+            iLimit -= iRead
+            if iLimit > 0:
+                self.Rotations += 1
+                self.Close()
+                lstRecords.extend(self.Restart(None))
+        if (iLimit > 0) and not (tupleFile is None):
+            if self._objFile is None:
+                try:
+                    #+ not buffered, the buffer may hold the truncated data
+                    self._objFile = open(self.Path, 'rb', 0)
+                except IOError as objError:
+                    if objError.errno != errno.ENOENT:
+                        raise
+            if not (self._objFile is None):
+                objStat = os.fstat(self._objFile.fileno())
+                tupleFile = (objStat.st_dev, objStat.st_ino)
+                if self._tupleFile is None:
+                    self._tupleFile = tupleFile
+                elif tupleFile != self._tupleFile:
+                    #+ rotated, the previous file is not found
+                    self.Rotations += 1
+                    lstRecords.extend(self.Restart(tupleFile))
+                elif ((objStat.st_size < self.Offset + len(self._strTail)) or
+                                                    (not self.CheckHead())):
+                    self.Truncations += 1
+                    lstRecords.extend(self.Restart(tupleFile))
+                lstNew, iRead = self.ReadData(iLimit)
+                lstRecords.extend(lstNew)
+                iLimit -= iRead
+        self.Behind = iLimit <= 0
+        if bSave and not (self.Checkpoint is None):
+            self.Save()
+        return lstRecords
+    
+    def Flush(self):
+        """
+        Resolves the partial trailing line as a complete one, e.g. when the
+        writing to the file is finished without the line ending; the data
+        appended later to the same line is resolved as the next line.
+        
+        Signature:
+            None -> list(tuple(int, int, str OR None, str OR None, bool))
+        
+        Returns:
+            list(tuple(int, int, str OR None, str OR None, bool)): the record
+                of the partial trailing line, or an empty list if there is no
+                such line
+        
+        Version 0.2.0.0
+        """
+        strLine = self._strTail
+        if not strLine:
+            return []
+        self.Line += 1
+        self.Lines += 1
+        iOffset = self.Offset
+        self.Offset += len(strLine)
+        self._strTail = ''
+        if strLine.endswith('\r'):
+            strLine = strLine[:-1]
+        return ResolveBatch([(self.Line, iOffset, strLine)], self.Union)
+    
+    def Close(self):
+        """
+        Closes the followed file, if it is open; the state is kept, and the
+        file is opened again by the next poll.
+        
+        Signature:
+            None -> None
+        
+        Version 0.2.0.0
+        """
+        if not (self._objFile is None):
+            self._objFile.close()
+            self._objFile = None
+    
+    def ReadData(self, iLimit):
+        """
+        Helper method reading at most the passed number of the bytes of the
+        open file from the end of the partial trailing line, and resolving the
+        complete lines. The pieces of the partial trailing line are joined only
+        when a chunk with the line ending is read, and the partial trailing
+        line longer than MaxLine bytes is resolved by the method Flush().
+        
+        Signature:
+            int -> list(tuple(int, int, str OR None, str OR None, bool)), int
+        
+        Args:
+            iLimit: int > 0, the maximum number of the read bytes
+        
+        Returns:
+            tuple(list(tuple(int, int, str OR None, str OR None, bool)), int):
+                unpacked tuple, the records of the new complete lines and the
+                number of the read bytes, less than the limit only if the end
+                of the file is reached
+        
+        Version 0.2.0.0
+        """
+        objFile = self._objFile
+        objFile.seek(self.Offset + len(self._strTail))
+        lstRecords = []
+        lstTail = [self._strTail]
+        iTail = len(self._strTail)
+        iChunkSize = self.ChunkSize
+        iRead = 0
+        while iRead < iLimit:
+            strChunk = objFile.read(min(iChunkSize, iLimit - iRead))
+            if not strChunk:
+                break
+            iRead += len(strChunk)
+            lstTail.append(strChunk)
+            iTail += len(strChunk)
+            if strChunk.find('\n') >= 0:
+                lstLines = ''.join(lstTail).split('\n')
+                lstTail = [lstLines.pop()]
+                iTail = len(lstTail[0])
+                iLine = self.Line
+                iOffset = self.Offset
+                lstBatch = []
+                for strLine in lstLines:
+                    iLine += 1
+                    iLength = len(strLine) + 1
+                    if strLine.endswith('\r'):
+                        strLine = strLine[:-1]
+                    lstBatch.append((iLine, iOffset, strLine))
+                    iOffset += iLength
+                self.Lines += iLine - self.Line
+                self.Line = iLine
+                self.Offset = iOffset
+                lstRecords.extend(ResolveBatch(lstBatch, self.Union))
+            if iTail > self.MaxLine:
+                self._strTail = ''.join(lstTail)
+                lstRecords.extend(self.Flush())
+                lstTail = []
+                iTail = 0
+        self._strTail = ''.join(lstTail)
+        self.Bytes += iRead
+        iEnd = self.Offset + len(self._strTail)
+        if self._iHeadSize < min(iEnd, HEAD_SIZE):
+            objFile.seek(0)
+            strHead = objFile.read(min(iEnd, HEAD_SIZE))
+            self._iHeadSize = len(strHead)
+            self._strHead = hashlib.md5(strHead).hexdigest()
+        return lstRecords, iRead
+    
+    def FindRotated(self):
+        """
+        Helper method looking for the rotated file with the remembered device
+        and inode numbers in the folder of the followed file, e.g. renamed by
+        the log rotation while the scanner was not running.
+        
+        Signature:
+            None -> file OR None
+        
+        Returns:
+            file: the rotated file opened in the binary mode
+            None: the rotated file is not found
+        
+        Version 0.2.0.0
+        """
+        strFolder = os.path.dirname(self.Path)
+        try:
+            lstNames = os.listdir(strFolder)
+        except OSError:
+            return None
+        for strName in lstNames:
+            strPath = os.path.join(strFolder, strName)
+            try:
+                objStat = os.stat(strPath)
+            except OSError:
+                continue
+            if (objStat.st_dev, objStat.st_ino) == self._tupleFile:
+                try:
+                    objFile = open(strPath, 'rb', 0)
+                except IOError:
+                    return None
+                objStat = os.fstat(objFile.fileno())
+                if (objStat.st_dev, objStat.st_ino) == self._tupleFile:
+                    return objFile
+                objFile.close()
+                return None
+        return None
+    
+    def Restart(self, tupleFile):
+        """
+        Helper method resolving the partial trailing line of the previous
+        content of the file (see method Flush()) and resetting the state to
+        the beginning of the new content.
+        
+        Signature:
+            tuple(int, int) OR None -> list(tuple(int, int, str OR None,
+                str OR None, bool))
+        
+        Args:
+            tupleFile: tuple(int, int) OR None, the device and inode numbers
+                of the new content, or None if the new file is not opened yet
+        
+        Returns:
+            list(tuple(int, int, str OR None, str OR None, bool)): the record
+                of the partial trailing line, or an empty list
+        
+        Version 0.2.0.0
+        """
+        lstRecords = self.Flush()
+        self._tupleFile = tupleFile
+        self.Offset = 0
+        self.Line = 0
+        self._iHeadSize = 0
+        self._strHead = ''
+        return lstRecords
+    
+    def CheckHead(self):
+        """
+        Helper method checking that the first bytes of the open file are the
+        same as read by the previous polls.
+        
+        Signature:
+            None -> bool
+        
+        Version 0.2.0.0
+        """
+        if not self._iHeadSize:
+            return True
+        self._objFile.seek(0)
+        strHead = self._objFile.read(self._iHeadSize)
+        return hashlib.md5(strHead).hexdigest() == self._strHead
+    
+    def GetState(self):
+        """
+        Returns the state stored in the checkpoint file.
+        
+        Signature:
+            None -> dict(str -> str OR int OR None)
+        
+        Returns:
+            dict(str -> str OR int OR None): with the keys 'Path', 'Device' and
+                'Inode' (None if the file was not opened yet), 'Offset',
+                'Line', 'HeadSize' and 'Head' (MD5 hash of the first bytes)
+        
+        Version 0.2.0.0
+        """
+        if self._tupleFile is None:
+            iDevice, iInode = None, None
+        else:
+            iDevice, iInode = self._tupleFile
+        return {'Path' : self.Path, 'Device' : iDevice, 'Inode' : iInode,
+                'Offset' : self.Offset, 'Line' : self.Line,
+                'HeadSize' : self._iHeadSize, 'Head' : self._strHead}
+    
+    def Load(self):
+        """
+        Loads the state from the checkpoint file, if it exists; the open
+        followed file is closed.
+        
+        Signature:
+            None -> bool
+        
+        Returns:
+            bool: True if the state is loaded, False if the checkpoint file
+                does not exist
+        
+        Raises:
+            ValueError: the checkpoint file is corrupted or belongs to another
+                file
+            IOError: the checkpoint file cannot be read
+        
+        Version 0.2.0.0
+        """
+        try:
+            objFile = open(self.Checkpoint, 'rb')
+        except IOError as objError:
+            if objError.errno != errno.ENOENT:
+                raise
+            return False
+        with objFile:
+            dictState = json.load(objFile)
+        try:
+            strPath = dictState['Path']
+            iDevice = dictState['Device']
+            iInode = dictState['Inode']
+            iOffset = dictState['Offset']
+            iLine = dictState['Line']
+            iHeadSize = dictState['HeadSize']
+            strHead = str(dictState['Head'])
+        except (TypeError, KeyError, UnicodeError):
+            strError = 'checkpoint {} is corrupted'.format(self.Checkpoint)
+            raise ValueError(strError)
+        for gValue in [iOffset, iLine, iHeadSize]:
+            if ((not isinstance(gValue, (int, long))) or
+                                    isinstance(gValue, bool) or gValue < 0):
+                strError = 'checkpoint {} is corrupted'.format(self.Checkpoint)
+                raise ValueError(strError)
+        if strPath != self.Path:
+            strError = 'checkpoint {} belongs to {}'.format(self.Checkpoint,
+                                                                        strPath)
+            raise ValueError(strError)
+        self.Close()
+        if (iDevice is None) or (iInode is None):
+            self._tupleFile = None
+        else:
+            self._tupleFile = (iDevice, iInode)
+        self.Offset = iOffset
+        self.Line = iLine
+        #+ the partial trailing line is read again from the file
+        self._strTail = ''
+        self._iHeadSize = iHeadSize
+        self._strHead = strHead
+        self._dictSaved = self.GetState()
+        return True
+    
+    def Save(self):
+        """
+        Writes the state into the checkpoint file, if it has changed since it
+        was saved or loaded last time. The state is written into a temporary
+        file first, which then replaces the checkpoint file, so an interrupted
+        writing does not corrupt it.
+        
+        Signature:
+            None -> bool
+        
+        Returns:
+            bool: True if the checkpoint file is written, False if the state has
+                not changed
+        
+        Raises:
+            ValueError: no checkpoint file is set
+            IOError, OSError: the checkpoint file cannot be written
+        
+        Version 0.2.0.0
+        """
+        if self.Checkpoint is None:
+            raise ValueError('checkpoint file is not set')
+        dictState = self.GetState()
+        if dictState == self._dictSaved:
+            return False
+        strTemporary = self.Checkpoint + '.tmp'
+        with open(strTemporary, 'wb') as objFile:
+            json.dump(dictState, objFile, sort_keys = True)
+        if os.name == 'nt' and os.path.exists(self.Checkpoint):
+            #+ the existing file is not replaced by renaming on Windows
+            os.remove(self.Checkpoint)
+        os.rename(strTemporary, self.Checkpoint)
+        self._dictSaved = dictState
+        return True
+    
+    def GetStatistics(self):
+        """
+        Returns the statistics of the polls.
+        
+        Signature:
+            None -> dict(str -> int)
+        
+        Returns:
+            dict(str -> int): with the keys 'Polls', 'Lines', 'Bytes',
+                'Truncations' and 'Rotations'
+        
+        Version 0.2.0.0
+        """
+        return {'Polls' : self.Polls, 'Lines' : self.Lines,
+                'Bytes' : self.Bytes, 'Truncations' : self.Truncations,
+                'Rotations' : self.Rotations}
@@ -0,0 +1,541 @@
+#!/usr/bin/python
+"""
+Module regex_lib.Formats
+
+Registry of the date / time stamp formats declared with the priorities and the
+field roles, which are compiled into a single matching engine. Each format is
+either a layout - a sequence of the field roles (built from the fragments
+YEAR_PATTERN, MONTH_PATTERN, DAY_PATTERN, HOUR_PATTERN etc. of the modules Date
+and Time) and the literal separators - or a core stamp pattern with the named
+groups of the roles.
+
+All registered formats are combined into one union search pattern in the order
+of their priorities (see Search.MakeUnionPattern()), and the stamp is resolved
+with a single pass over the string (see Search.SearchUnion()) instead of a
+search per format. Thus the cost of a string without a stamp stays roughly the
+same as the formats are added, since the regular expression engine skips all
+non-digit characters at the first character class of the union pattern. All
+formats exclude the digits around the stamp, so the union pattern rejects a
+digit preceded by a digit before any alternative is tried, and only the first
+digits of the digit runs cost a try of each format.
+
+The registries created by the functions MakeDateRegistry() and
+MakeTimeRegistry() contain the built-in formats with the same results as of
+the functions ResolveDateTuple() and ResolveTimeTuple(), and the site-specific
+formats are added with the intermediate priorities, e.g. SITE_DATE_FORMATS.
+
+Patterns:
+    SHORT_YEAR_PATTERN - two digits representing year as YY, treated as 20YY
+    ORDINAL_PATTERN - exactly three digits representing the day of the year in
+        the interval of 001 to 366 inclusively
+
+Globals:
+    FIELDS - dict(str -> str), the field roles usable in the layouts and
+        their regular expression fragments
+    DIGIT_FIELDS - tuple(str), the field roles starting with a digit, one of
+        which must be the first element of a layout
+    KINDS - tuple(str), the allowed kinds of the registries
+    MAX_FORMATS - int, the maximum number of the formats in a registry, due to
+        the limit of the groups of the regular expressions
+    DATE_FORMATS - tuple(tuple(str, str, int, str)), the built-in date formats
+        as the name, core pattern, priority and excluded characters
+    TIME_FORMATS - tuple(tuple(str, str, int, str)), the built-in time formats
+    SITE_DATE_FORMATS - tuple(tuple(str, tuple(str), int, str)), the
+        site-specific date formats 'DD.MM.YY' and 'YYYY-DDD' as the name,
+        layout, priority and excluded characters, not registered by default
+
+Functions:
+    MakeFormatPattern()
+        str OR tuple(str) -> str
+    MakeDateRegistry()
+        None -> FormatRegistry
+    MakeTimeRegistry()
+        None -> FormatRegistry
+
+Classes:
+    FormatRegistry
+"""
+
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+
+#imports
+
+#+ standard library
+
+import re
+import datetime
+
+#+ package modules
+
+from .Search import MakeSearchPattern, MakeAlternatives, SearchUnionIndex
+
+from .Date import YEAR_PATTERN, MONTH_PATTERN, DAY_PATTERN, DATE_SEPARATOR, \
+            ISO_DATE_CORE, REVERSED_DATE_CORE, SCREWED_DATE_CORE, \
+                SHORT_DATE_CORE, COMPACT_DATE_CORE, ConvertDateFieldsTuple
+
+from .Time import HOUR_PATTERN, MINUTE_PATTERN, SECOND_PATTERN, \
+            AM_PM_PATTERN, TIME_CORE, SHORT_TIME_CORE, COMPACT_TIME_CORE, \
+                SHORT_COMPACT_TIME_CORE, ConvertTimeFieldsTuple
+
+#patterns
+
+SHORT_YEAR_PATTERN = r"(?P<year>[0-9]{2})"
+
+ORDINAL_PATTERN = r"".join([r"(?P<ordinal>(00[1-9])|(0[1-9][0-9])|",
+                                r"([1-2][0-9]{2})|(3[0-5][0-9])|(36[0-6]))"])
+
+#globals
+
+#+ field roles of the layouts
+
+FIELDS = {'year' : YEAR_PATTERN, 'short_year' : SHORT_YEAR_PATTERN,
+            'month' : MONTH_PATTERN, 'day' : DAY_PATTERN,
+            'ordinal' : ORDINAL_PATTERN, 'separator' : DATE_SEPARATOR,
+            'hour' : HOUR_PATTERN, 'minute' : MINUTE_PATTERN,
+            'second' : SECOND_PATTERN, 'modifier' : AM_PM_PATTERN}
+
+#+ field roles, which start with a digit, as required by the search patterns
+
+DIGIT_FIELDS = ('year', 'short_year', 'month', 'day', 'ordinal', 'hour',
+                                                            'minute', 'second')
+
+KINDS = ('date', 'time')
+
+MAX_FORMATS = 99
+
+#+ built-in formats with the priorities of the order used by ResolveDate() and
+#+ ResolveTime()
+
+DATE_FORMATS = (('ISO_DATE', ISO_DATE_CORE, 50, '0-9'),
+                ('REVERSED_DATE', REVERSED_DATE_CORE, 40, '0-9'),
+                ('SCREWED_DATE', SCREWED_DATE_CORE, 30, '0-9'),
+                ('SHORT_DATE', SHORT_DATE_CORE, 20, '0-9'),
+                ('COMPACT_DATE', COMPACT_DATE_CORE, 10, '0-9'))
+
+TIME_FORMATS = (('TIME', TIME_CORE, 40, '0-9'),
+                ('SHORT_TIME', SHORT_TIME_CORE, 30, '0-9:'),
+                ('COMPACT_TIME', COMPACT_TIME_CORE, 20, '0-9'),
+                ('SHORT_COMPACT_TIME', SHORT_COMPACT_TIME_CORE, 10, '0-9'))
+
+#+ site-specific formats, DD.MM.YY has the priority over SHORT_DATE (YY.MM.DD)
+
+SITE_DATE_FORMATS = (
+            ('DD.MM.YY', ('day', '.', 'month', '.', 'short_year'), 25, '0-9'),
+            ('YYYY-DDD', ('year', '-', 'ordinal'), 15, '0-9'))
+
+#functions
+
+def MakeFormatPattern(gLayout):
+    """
+    Builds the core stamp pattern of a format from its layout: the field roles
+    (the keys of FIELDS) are replaced by their fragments, and any other element
+    is a literal separator. The core pattern passed as a string is returned as
+    it is.
+    
+    Signature:
+        str OR tuple(str) -> str
+    
+    Args:
+        gLayout: str OR tuple(str), the core stamp pattern or the sequence of
+            the field roles and the literal separators
+    
+    Returns:
+        str: the core stamp pattern
+    
+    Raises:
+        TypeError: the layout is neither a string nor a sequence of strings
+        ValueError: the layout is empty, or it does not start with a digit
+            field role
+    
+    Version 0.2.0.0
+    """
+    if isinstance(gLayout, basestring):
+        strPattern = gLayout
+    elif isinstance(gLayout, (list, tuple)):
+        if gLayout and not (gLayout[0] in DIGIT_FIELDS):
+            strError = 'layout {} does not start with one of {}'.format(
+                                                        gLayout, DIGIT_FIELDS)
+            raise ValueError(strError)
+        lstParts = []
+        for gElement in gLayout:
+            if not isinstance(gElement, basestring):
+                strError = '{} of {} is not a string'.format(gElement,
+                                                                type(gElement))
+                raise TypeError(strError)
+            if gElement in FIELDS:
+                lstParts.append(FIELDS[gElement])
+            else:
+                lstParts.append(re.escape(gElement))
+        strPattern = r"".join(lstParts)
+    else:
+        strError = '{} of {} is not a string or tuple'.format(gLayout,
+                                                                type(gLayout))
+        raise TypeError(strError)
+    if not strPattern:
+        raise ValueError('the layout of the format is empty')
+    return strPattern
+
+def MakeDateRegistry():
+    """
+    Creates the registry of the date formats with the built-in formats of the
+    DATE_FORMATS, which resolves the stamps exactly as the function
+    ResolveDateTuple().
+    
+    Signature:
+        None -> FormatRegistry
+    
+    Version 0.2.0.0
+    """
+    objRegistry = FormatRegistry('date')
+    for strName, strCore, iPriority, strExcluded in DATE_FORMATS:
+        objRegistry.Register(strName, strCore, iPriority, strExcluded)
+    return objRegistry
+
+def MakeTimeRegistry():
+    """
+    Creates the registry of the time formats with the built-in formats of the
+    TIME_FORMATS, which resolves the stamps exactly as the function
+    ResolveTimeTuple().
+    
+    Signature:
+        None -> FormatRegistry
+    
+    Version 0.2.0.0
+    """
+    objRegistry = FormatRegistry('time')
+    for strName, strCore, iPriority, strExcluded in TIME_FORMATS:
+        objRegistry.Register(strName, strCore, iPriority, strExcluded)
+    return objRegistry
+
+#classes
+
+class FormatRegistry(object):
+    """
+    Registry of the date or time stamp formats with the priorities, compiled
+    into a single union search pattern on the first resolution after the
+    formats are changed. At each string the last occurrence of the highest
+    priority format found anywhere in the string is taken (as by the fixed
+    order of the patterns of the function ResolveDate()); the formats of the
+    same priority are tried in the order of their registration.
+    
+    The date formats must define the roles 'year', 'month' and 'day', or
+    'year' and 'ordinal' (day of the year); the time formats - 'hour' and
+    'minute', and optionally 'second' and 'modifier'. The 2-digits years and
+    00YY years are treated as 20YY, and the time stamps are converted as by the
+    function ResolveTime(), including the a.m. / p.m. modifier and the rounding
+    of the seconds. The time stamps are searched for in the upper case, thus
+    the literal separators of the time layouts are converted into the upper
+    case as well.
+    
+    The instances are not thread-safe, while they are modified.
+    
+    Usage:
+        objRegistry = MakeDateRegistry()
+        objRegistry.Register('DD.MM.YY', ('day', '.', 'month', '.',
+                                                            'short_year'), 25)
+        tupleDate = objRegistry.ResolveTuple('measured 09.05.18') # 2018-05-09
+    
+    Attributes:
+        Kind: str, the kind of the formats, one of the KINDS
+        Names: list(str), names of the formats in the order of the priorities
+            (read-only property)
+    
+    Methods:
+        Register(strName, gLayout, iPriority = 0, strExcluded = '0-9')
+            str, str OR tuple(str), int, str -> None
+        Unregister(strName)
+            str -> None
+        Compile()
+            None -> None
+        Identify(strStamp)
+            str -> tuple(str, tuple(int, ...) OR None) OR None
+        ResolveTuple(strStamp)
+            str -> tuple(int, ...) OR None
+        Resolve(strStamp)
+            str -> str OR None OR tuple(str OR None, bool)
+    
+    Version 0.2.0.0
+    """
+    
+    def __init__(self, strKind):
+        """
+        Initialization.
+        
+        Signature:
+            str -> None
+        
+        Args:
+            strKind: str, the kind of the formats, one of the KINDS
+        
+        Raises:
+            ValueError: the kind is not one of the KINDS
+        
+        Version 0.2.0.0
+        """
+        if not (strKind in KINDS):
+            strError = '{} is not one of the kinds {}'.format(strKind, KINDS)
+            raise ValueError(strError)
+        self.Kind = strKind
+        self._lstFormats = []
+        self._objUnion = None
+        self._lstPatterns = None
+        self._lstNames = None
+    
+    @property
+    def Names(self):
+        """
+        Getter for the names of the formats in the order of the priorities.
+        
+        Signature:
+            None -> list(str)
+        
+        Version 0.2.0.0
+        """
+        return [tupleFormat[1] for tupleFormat in sorted(self._lstFormats)]
+    
+    def Register(self, strName, gLayout, iPriority = 0, strExcluded = '0-9'):
+        """
+        Adds a format to the registry.
+        
+        Signature:
+            str, str OR tuple(str), int, str -> None
+        
+        Args:
+            strName: str, the unique name of the format
+            gLayout: str OR tuple(str), the core stamp pattern with the named
+                groups of the roles, which must start with a digit, or the
+                sequence of the field roles (the keys of FIELDS) and the literal
+                separators starting with a digit field role, see function
+                MakeFormatPattern()
+            iPriority: (optional) int, the priority of the format, the formats
+                with the greater values are preferred, defaults to 0
+            strExcluded: (optional) str, the content of the character class of
+                the characters not allowed around the stamp, which must include
+                all digits, defaults to '0-9'
+        
+        Raises:
+            TypeError: the name, the layout or the excluded characters are not
+                strings, or the priority is not an integer
+            ValueError: the name is already registered, there are already
+                MAX_FORMATS formats, the pattern is not valid, it does not
+                define the required roles, or the excluded characters do not
+                include all digits
+        
+        Version 0.2.0.0
+        """
+        for gValue in (strName, strExcluded):
+            if not isinstance(gValue, basestring):
+                strError = '{} of {} is not a string'.format(gValue,
+                                                                type(gValue))
+                raise TypeError(strError)
+        if (not isinstance(iPriority, (int, long))) or isinstance(iPriority,
+                                                                        bool):
+            strError = '{} of {} is not an integer'.format(iPriority,
+                                                            type(iPriority))
+            raise TypeError(strError)
+        if strName in self.Names:
+            strError = 'format {} is already registered'.format(strName)
+            raise ValueError(strError)
+        if len(self._lstFormats) >= MAX_FORMATS:
+            strError = 'there are already {} formats'.format(MAX_FORMATS)
+            raise ValueError(strError)
+        if self.Kind == 'time' and isinstance(gLayout, (list, tuple)):
+            #+ the time stamps are searched for in the upper case
+            gLayout = [gElement.upper() if isinstance(gElement, basestring)
+                            and not (gElement in FIELDS) else gElement
+                                                        for gElement in gLayout]
+        strCore = MakeFormatPattern(gLayout)
+        try:
+            objPattern = re.compile(MakeSearchPattern(strCore, strExcluded))
+        except re.error as objError:
+            strError = 'format {} is not valid: {}'.format(strName, objError)
+            raise ValueError(strError)
+        objExcluded = re.compile('[{}]'.format(strExcluded))
+        if not all(objExcluded.match(strDigit) for strDigit in '0123456789'):
+            strError = '{} does not exclude all digits'.format(strExcluded)
+            raise ValueError(strError)
+        setRoles = set(objPattern.groupindex)
+        if self.Kind == 'date':
+            bValid = ('year' in setRoles) and (('ordinal' in setRoles) or
+                                    ('month' in setRoles and 'day' in setRoles))
+        else:
+            bValid = 'hour' in setRoles and 'minute' in setRoles
+        if not bValid:
+            strError = 'format {} does not define the {} roles'.format(strName,
+                                                                    self.Kind)
+            raise ValueError(strError)
+        #+ the sort key is the negative priority and the registration number
+        if self._lstFormats:
+            iNumber = max(tupleFormat[0][1] for tupleFormat
+                                                    in self._lstFormats) + 1
+        else:
+            iNumber = 0
+        self._lstFormats.append(((- iPriority, iNumber), strName, strCore,
+                                                    strExcluded, objPattern))
+        self._objUnion = None
+    
+    def Unregister(self, strName):
+        """
+        Removes a format from the registry.
+        
+        Signature:
+            str -> None
+        
+        Args:
+            strName: str, the name of the format
+        
+        Raises:
+            ValueError: the format is not registered
+        
+        Version 0.2.0.0
+        """
+        for iIndex, tupleFormat in enumerate(self._lstFormats):
+            if tupleFormat[1] == strName:
+                del self._lstFormats[iIndex]
+                self._objUnion = None
+                break
+        else:
+            strError = 'format {} is not registered'.format(strName)
+            raise ValueError(strError)
+    
+    def Compile(self):
+        """
+        Compiles the union search pattern of the registered formats in the
+        order of their priorities, if it is not compiled yet. It is called
+        automatically by the resolution methods.
+        
+        Signature:
+            None -> None
+        
+        Raises:
+            ValueError: there are no registered formats
+        
+        Version 0.2.0.0
+        """
+        if self._objUnion is None:
+            if not self._lstFormats:
+                raise ValueError('there are no registered formats')
+            lstFormats = sorted(self._lstFormats)
+            self._lstNames = [tupleFormat[1] for tupleFormat in lstFormats]
+            self._lstPatterns = [tupleFormat[4] for tupleFormat in lstFormats]
+            #+ as Search.MakeUnionPattern() with the digit preceded by a digit
+            #+ rejected before the alternatives
+            self._objUnion = re.compile("".join([
+                r"[0-9](?<![0-9][0-9])(?<=(?:", MakeAlternatives([
+                    (tupleFormat[2], tupleFormat[3]) for tupleFormat
+                                            in lstFormats]), r")[0-9])"]))
+    
+    def Identify(self, strStamp):
+        """
+        Resolves the stamp and reports the found format.
+        
+        Signature:
+            str -> tuple(str, tuple(int, ...) OR None) OR None
+        
+        Args:
+            strStamp: str, the string to search in
+        
+        Returns:
+            tuple(str, tuple(int, int, int)): the name of the found date format
+                and the year, month and day
+            tuple(str, tuple(int, int, int, int, bool)): the name of the found
+                time format and the same tuple as returned by the function
+                ResolveTimeTuple()
+            tuple(str, None): the name of the found format, which fields are
+                not valid, e.g. the ordinal day 366 of a not leap year, or the
+                hour not compatible with the a.m. / p.m. modifier
+            None: none of the formats is found
+        
+        Raises:
+            TypeError: the passed argument is not a string
+            ValueError: there are no registered formats
+        
+        Version 0.2.0.0
+        """
+        if not isinstance(strStamp, basestring):
+            strError = '{} of {} is not a string'.format(strStamp,
+                                                                type(strStamp))
+            raise TypeError(strError)
+        self.Compile()
+        if self.Kind == 'time':
+            strStamp = strStamp.upper()
+        tupleFound = SearchUnionIndex(self._objUnion, self._lstPatterns,
+                                                                    strStamp)
+        if tupleFound is None:
+            return None
+        iIndex, objMatch = tupleFound
+        dictGroups = objMatch.groupdict()
+        strName = self._lstNames[iIndex]
+        if self.Kind == 'time':
+            tupleResult = ConvertTimeFieldsTuple(dictGroups['hour'],
+                                dictGroups['minute'], dictGroups.get('second'),
+                                                    dictGroups.get('modifier'))
+        elif dictGroups.get('ordinal') is None:
+            tupleResult = ConvertDateFieldsTuple(dictGroups['year'],
+                                        dictGroups['month'], dictGroups['day'])
+        else:
+            iYear = ConvertDateFieldsTuple(dictGroups['year'], '1', '1')[0]
+            objDate = datetime.date(iYear, 1, 1) + datetime.timedelta(
+                                                int(dictGroups['ordinal']) - 1)
+            if objDate.year == iYear:
+                tupleResult = (iYear, objDate.month, objDate.day)
+            else:
+                tupleResult = None
+        return strName, tupleResult
+    
+    def ResolveTuple(self, strStamp):
+        """
+        Resolves the stamp as the tuple of integers, see method Identify().
+        
+        Signature:
+            str -> tuple(int, ...) OR None
+        
+        Returns:
+            tuple(int, int, int): the year, month and day of the date stamp
+            tuple(int, int, int, int, bool): the time stamp as by the function
+                ResolveTimeTuple()
+            None: none of the formats is found, or its fields are not valid
+        
+        Raises:
+            TypeError: the passed argument is not a string
+            ValueError: there are no registered formats
+        
+        Version 0.2.0.0
+        """
+        tupleFound = self.Identify(strStamp)
+        if tupleFound is None:
+            return None
+        return tupleFound[1]
+    
+    def Resolve(self, strStamp):
+        """
+        Resolves the stamp in ISO format, with the same results as of the
+        functions ResolveDate() and ResolveTime() respectively.
+        
+        Signature:
+            str -> str OR None OR tuple(str OR None, bool)
+        
+        Returns:
+            str: the date stamp in ISO format 'YYYY-MM-DD'
+            None: the date stamp is not found
+            tuple(str OR None, bool): unpacked tuple of the time stamp in ISO
+                format 'HH:MM:SS' or None if it is not found, and the boolean
+                flag if the date must be incremented due to rounding up of the
+                seconds
+        
+        Raises:
+            TypeError: the passed argument is not a string
+            ValueError: there are no registered formats
+        
+        Version 0.2.0.0
+        """
+        tupleResult = self.ResolveTuple(strStamp)
+        if self.Kind == 'date':
+            if tupleResult is None:
+                return None
+            return "{}-{:02}-{:02}".format(*tupleResult)
+        if tupleResult is None:
+            return None, False
+        return "{0:02}:{1:02}:{2:02}".format(*tupleResult), tupleResult[4]
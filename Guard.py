@@ -0,0 +1,263 @@
+#!/usr/bin/python
+"""
+Module regex_lib.Guard
+
+Guarded (bounded work per call) resolution of the date / time stamps for the
+untrusted input data. All search patterns of the library are matched in the
+time linear in the length of the string (see module Search and benchmark
+BM005_ReDoS_Fuzz), thus the work per call is bounded by capping the length of
+the scanned part of the string: only the trailing window of at most the
+maximum length of a longer string is scanned. The window starts just after a
+non-digit character, so no run of the digits of a stamp is cut in half; since
+the last occurrence of a stamp wins, the result is the same as for the whole
+string unless the last stamp starts before the window.
+
+Globals:
+    MAX_LENGTH - int, default maximum length of a scanned string
+
+Functions:
+    GetWindow()
+        str, int -> str
+    ResolveDateGuarded()
+        str, int -> str OR None
+    ResolveTimeGuarded()
+        str, int -> tuple(str OR None, bool)
+    ResolveDateTimeGuarded()
+        str, int -> str OR None
+
+Classes:
+    StampGuard
+"""
+
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+
+#imports
+
+#+ package modules
+
+from .Date import ResolveDate
+
+from .Time import ResolveTime
+
+from .Stamp import ResolveDateTime
+
+#globals
+
+MAX_LENGTH = 4096
+
+#classes
+
+class StampGuard(object):
+    """
+    Callable wrapper around a stamp resolution function, which passes to the
+    wrapped function the strings not longer than MaxLength characters, and
+    only the trailing window of the longer strings (see function GetWindow()).
+    
+    Any not string argument is passed to the wrapped function directly, so its
+    TypeError exception is raised as usual.
+    
+    Usage:
+        objGuard = StampGuard(ResolveTime, 256)
+        strTime, bIncrementDate = objGuard(strUntrusted)
+    
+    Attributes:
+        Function: function, the wrapped resolution function
+        MaxLength: int > 0, the maximum length of a scanned string
+        Truncated: int >= 0, number of the strings scanned only partially due
+            to their length
+    
+    Methods:
+        __call__(strStamp)
+            str -> type A
+    
+    Version 0.2.0.0
+    """
+    
+    def __init__(self, fFunction, iMaxLength = MAX_LENGTH):
+        """
+        Initialization.
+        
+        Signature:
+            function(str) -> type A, int -> None
+        
+        Args:
+            fFunction: function(str) -> type A, the wrapped resolution function
+            iMaxLength: (optional) int > 0, the maximum length of a scanned
+                string, defaults to MAX_LENGTH
+        
+        Raises:
+            TypeError: the function is not callable, or the length is not an
+                integer
+            ValueError: the length is not positive
+        
+        Version 0.2.0.0
+        """
+        if not callable(fFunction):
+            strError = '{} of {} is not callable'.format(fFunction,
+                                                            type(fFunction))
+            raise TypeError(strError)
+        CheckLength(iMaxLength)
+        self.Function = fFunction
+        self.MaxLength = iMaxLength
+        self.Truncated = 0
+    
+    def __call__(self, strStamp):
+        """
+        Returns the result of the wrapped function for the passed string if it
+        is not longer than MaxLength characters, otherwise for its trailing
+        window.
+        
+        Signature:
+            str -> type A
+        
+        Raises:
+            TypeError: the argument is not a string, raised by the wrapped
+                function
+        
+        Version 0.2.0.0
+        """
+        if isinstance(strStamp, basestring) and len(strStamp) > self.MaxLength:
+            self.Truncated += 1
+            strStamp = GetWindow(strStamp, self.MaxLength)
+        return self.Function(strStamp)
+
+#functions
+
+def CheckLength(iMaxLength):
+    """
+    Helper function checking the maximum length of a scanned string.
+    
+    Signature:
+        int -> None
+    
+    Raises:
+        TypeError: the length is not an integer
+        ValueError: the length is not positive
+    
+    Version 0.2.0.0
+    """
+    if (not isinstance(iMaxLength, (int, long))) or isinstance(iMaxLength,
+                                                                        bool):
+        strError = '{} of {} is not an integer'.format(iMaxLength,
+                                                            type(iMaxLength))
+        raise TypeError(strError)
+    if iMaxLength < 1:
+        strError = 'maximum length {} is not positive'.format(iMaxLength)
+        raise ValueError(strError)
+
+def GetWindow(strStamp, iMaxLength):
+    """
+    Helper function returning the trailing window of at most the maximum
+    length of the string, which starts just after a non-digit character, i.e.
+    the leading digits cut from a longer run are dropped. The string not
+    longer than the maximum length is returned as it is. The arguments are not
+    checked.
+    
+    Signature:
+        str, int -> str
+    
+    Version 0.2.0.0
+    """
+    iLength = len(strStamp)
+    if iLength <= iMaxLength:
+        return strStamp
+    iStart = iLength - iMaxLength
+    while (iStart < iLength) and strStamp[iStart - 1].isdigit():
+        iStart += 1
+    return strStamp[iStart:]
+
+def ResolveDateGuarded(strStamp, iMaxLength = MAX_LENGTH):
+    """
+    Resolves the passed date stamp exactly as the function ResolveDate() if
+    the string is not longer than the maximum length, otherwise resolves only
+    its trailing window (see function GetWindow()).
+    
+    Signature:
+        str, int -> str OR None
+    
+    Args:
+        strStamp: str, the string to be resolved
+        iMaxLength: (optional) int > 0, the maximum length of a scanned string,
+            defaults to MAX_LENGTH
+    
+    Returns:
+        str: the resolved date stamp as a string in ISO format 'YYYY-MM-DD'
+        None: value of none of the patterns is matched
+    
+    Raises:
+        TypeError: the passed argument is not a string, or the length is not
+            an integer
+        ValueError: the length is not positive
+    
+    Version 0.2.0.0
+    """
+    if not isinstance(strStamp, basestring):
+        strError = '{} of {} is not a string'.format(strStamp, type(strStamp))
+        raise TypeError(strError)
+    CheckLength(iMaxLength)
+    return ResolveDate(GetWindow(strStamp, iMaxLength))
+
+def ResolveTimeGuarded(strStamp, iMaxLength = MAX_LENGTH):
+    """
+    Resolves the passed time stamp exactly as the function ResolveTime() if
+    the string is not longer than the maximum length, otherwise resolves only
+    its trailing window (see function GetWindow()).
+    
+    Signature:
+        str, int -> tuple(str OR None, bool)
+    
+    Args:
+        strStamp: str, the string to be resolved
+        iMaxLength: (optional) int > 0, the maximum length of a scanned string,
+            defaults to MAX_LENGTH
+    
+    Returns:
+        tuple(str OR None, bool): the resolved time stamp in ISO format
+            'HH:MM:SS' or None, and the date increment flag
+    
+    Raises:
+        TypeError: the passed argument is not a string, or the length is not
+            an integer
+        ValueError: the length is not positive
+    
+    Version 0.2.0.0
+    """
+    if not isinstance(strStamp, basestring):
+        strError = '{} of {} is not a string'.format(strStamp, type(strStamp))
+        raise TypeError(strError)
+    CheckLength(iMaxLength)
+    return ResolveTime(GetWindow(strStamp, iMaxLength))
+
+def ResolveDateTimeGuarded(strStamp, iMaxLength = MAX_LENGTH):
+    """
+    Resolves the passed date and time stamps exactly as the function
+    ResolveDateTime() if the string is not longer than the maximum length,
+    otherwise resolves only its trailing window (see function GetWindow()).
+    
+    Signature:
+        str, int -> str OR None
+    
+    Args:
+        strStamp: str, the string to be resolved
+        iMaxLength: (optional) int > 0, the maximum length of a scanned string,
+            defaults to MAX_LENGTH
+    
+    Returns:
+        str: the resolved stamp in ISO format 'YYYY-MM-DDTHH:MM:SS' or
+            'YYYY-MM-DD'
+        None: the date stamp is not found
+    
+    Raises:
+        TypeError: the passed argument is not a string, or the length is not
+            an integer
+        ValueError: the length is not positive
+    
+    Version 0.2.0.0
+    """
+    if not isinstance(strStamp, basestring):
+        strError = '{} of {} is not a string'.format(strStamp, type(strStamp))
+        raise TypeError(strError)
+    CheckLength(iMaxLength)
+    return ResolveDateTime(GetWindow(strStamp, iMaxLength))
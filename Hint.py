@@ -0,0 +1,357 @@
+#!/usr/bin/python
+"""
+Module regex_lib.Hint
+
+Resolution of the date / time stamps in the sorted, uniformly formatted log
+streams with the positional hint. In such streams the stamp is found by the
+same pattern at the same character offset in each line, and the successive
+values differ only slightly. The resolvers of this module remember the pattern
+and the offset of the previous found stamp, and first check an anchored match
+of this pattern at this offset. The check is accepted only if it is proven
+that the fixed order cascade of the functions ResolveDateTuple() and
+ResolveTimeTuple() would select exactly the same occurrence:
+
+    * none of the patterns of the higher priority is present in the string -
+      the pattern is searched for only if its signature (the alternative
+      fragments of the shape of the string, see module Adaptive) is present
+    * there is no later occurrence of the same pattern - all supported stamps
+      start at the first digit of a digit run, thus a later occurrence starts
+      at one of the next digit runs, and the pattern is searched for only if
+      its signature is present in the shape starting from the next digit run
+
+Otherwise, the string is resolved by the full cascade (including the regular
+expressions free fast path), and the pattern and the offset of the found stamp
+become the new hint. The strings with a new line character before the last
+one are always resolved by the full cascade, see function Search.SearchLast().
+
+Globals:
+    C_NEXT_RUN - re.RegexObject, matches a digit run and the following
+        non-digit characters of the shape of a string
+
+Classes:
+    HintResolver
+    HintDateResolver
+    HintTimeResolver
+"""
+
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+
+#imports
+
+#+ standard library
+
+import re
+
+#+ package modules
+
+from .Search import SearchLast
+
+from .Date import C_DATE_SEARCH_PATTERNS, ConvertDateMatchTuple, \
+                                                                ScanCompactDate
+
+from .Time import C_TIME_SEARCH_PATTERNS, ConvertTimeMatchTuple, \
+                                                                ScanCompactTime
+
+from .Adaptive import MakeSignature, DATE_NAMES, DATE_SIGNATURES, TIME_NAMES, \
+                                                                TIME_SIGNATURES
+
+#globals
+
+C_NEXT_RUN = re.compile(r"0+[^0]*")
+
+#classes
+
+class HintResolver(object):
+    """
+    Callable resolver checking first the anchored match of the pattern of the
+    previous found stamp at its offset, with the same result as of trying the
+    search patterns in the fixed order of priority and selecting the last
+    occurrence of the first found pattern (see function Search.SearchLast()).
+    The hint is used only if no pattern of the higher priority and no later
+    occurrence of the same pattern are present in the string, otherwise the
+    full cascade is applied and the hint is updated. The optional fast path is
+    tried only by the full cascade. The instances are not thread-safe.
+    
+    Usage:
+        objResolver = HintResolver(C_DATE_SEARCH_PATTERNS, DATE_NAMES,
+                    DATE_SIGNATURES, ConvertDateMatchTuple, False)
+        for strLine in objFile:
+            tupleDate = objResolver(strLine)
+    
+    Attributes:
+        Patterns: tuple(re.RegexObject), the search patterns in the order of
+            priority
+        Names: tuple(str), the names of the patterns
+        Signatures: tuple(tuple(str)), the signatures of the patterns
+        Function: function(re.MatchObject) -> type A, the conversion of the
+            found match
+        Upper: bool, flag if the patterns are searched for in the string
+            converted to the upper case
+        FastPath: function(str) -> bool, type A OR None; OR None, the
+            regular expressions free fast path tried by the full cascade
+        Hint: tuple(str, int) OR None, the name of the pattern and the offset
+            of the hint, None if there is no hint yet (read-only property)
+        Calls: int >= 0, number of the resolved strings
+        Hits: int >= 0, number of the strings resolved with the hint
+        Misses: int >= 0, number of the strings with the hint not accepted
+        FastPaths: int >= 0, number of the strings resolved by the fast path
+        Verifications: int >= 0, number of the verification searches
+    
+    Methods:
+        __call__(strStamp)
+            str -> type A OR None
+        CheckHint(strStamp)
+            str -> re.MatchObject OR None
+        Clear()
+            None -> None
+        GetStatistics()
+            None -> dict(str -> int OR float OR tuple(str, int) OR None)
+    
+    Version 0.2.0.0
+    """
+    
+    def __init__(self, tuplePatterns, tupleNames, tupleSignatures, fFunction,
+                                                    bUpper, fFastPath = None):
+        """
+        Initialization.
+        
+        Signature:
+            tuple(re.RegexObject), tuple(str), tuple(tuple(str)),
+                function(re.MatchObject) -> type A, bool,
+                    function(str) -> bool, type A OR None -> None
+        
+        Args:
+            tuplePatterns: tuple(re.RegexObject), the search patterns in the
+                order of priority
+            tupleNames: tuple(str), the names of the patterns
+            tupleSignatures: tuple(tuple(str)), the alternative fragments of
+                the shape of the string, at least one of which must be present
+                in the shape of any occurrence of the respective pattern
+            fFunction: function(re.MatchObject) -> type A, the conversion of
+                the found match
+            bUpper: bool, flag if the patterns are searched for in the string
+                converted to the upper case
+            fFastPath: (optional) function(str) -> bool, type A OR None, the
+                regular expressions free fast path returning the flag if the
+                string is resolved and the result, e.g. Date.ScanCompactDate(),
+                defaults to None (no fast path)
+        
+        Raises:
+            ValueError: the numbers of the patterns, names and signatures are
+                not equal
+        
+        Version 0.2.0.0
+        """
+        if not (len(tuplePatterns) == len(tupleNames) == len(tupleSignatures)):
+            strError = 'numbers of patterns {}, names {} and {}'.format(
+                                    len(tuplePatterns), len(tupleNames),
+                                    'signatures {} are not equal'.format(
+                                                        len(tupleSignatures)))
+            raise ValueError(strError)
+        self.Patterns = tuple(tuplePatterns)
+        self.Names = tuple(tupleNames)
+        self.Signatures = tuple(tupleSignatures)
+        self.Function = fFunction
+        self.Upper = bUpper
+        self.FastPath = fFastPath
+        self.Clear()
+    
+    def __call__(self, strStamp):
+        """
+        Resolves the passed string with the hint if it is accepted, otherwise
+        with the patterns tried in the order of priority, with the same result
+        in both cases.
+        
+        Signature:
+            str -> type A OR None
+        
+        Returns:
+            type A: the converted last occurrence of the first found pattern in
+                the order of priority
+            None: none of the patterns is found
+        
+        Raises:
+            TypeError: if the passed argument is not a string.
+        
+        Version 0.2.0.0
+        """
+        if not isinstance(strStamp, basestring):
+            strError = '{} of {} is not a string'.format(strStamp,
+                                                            type(strStamp))
+            raise TypeError(strError)
+        self.Calls += 1
+        if not (self._tupleHint is None):
+            objMatch = self.CheckHint(strStamp)
+            if objMatch is None:
+                self.Misses += 1
+            else:
+                self.Hits += 1
+                return self.Function(objMatch)
+        if not (self.FastPath is None):
+            bResolved, gResult = self.FastPath(strStamp)
+            if bResolved:
+                self.FastPaths += 1
+                return gResult
+        if self.Upper:
+            strStamp = strStamp.upper()
+        for iIndex, objPattern in enumerate(self.Patterns):
+            objMatch = SearchLast(objPattern, strStamp)
+            if objMatch:
+                self._tupleHint = (iIndex, objMatch.start())
+                return self.Function(objMatch)
+        return None
+    
+    def CheckHint(self, strStamp):
+        """
+        Helper method checking the anchored match of the hinted pattern at the
+        hinted offset, and verifying that neither a pattern of the higher
+        priority nor a later occurrence of the same pattern is present in the
+        string.
+        
+        Signature:
+            str -> re.MatchObject OR None
+        
+        Returns:
+            re.MatchObject: the match of the hinted pattern, which is the same
+                occurrence as selected by the patterns tried in the order of
+                priority
+            None: the hint is not accepted
+        
+        Version 0.2.0.0
+        """
+        iIndex, iOffset = self._tupleHint
+        iNewLine = strStamp.find('\n')
+        if iNewLine >= 0 and iNewLine < len(strStamp) - 1:
+            return None
+        if self.Upper:
+            strStamp = strStamp.upper()
+        objPattern = self.Patterns[iIndex]
+        objMatch = objPattern.match(strStamp, iOffset)
+        if objMatch is None:
+            return None
+        strSignature = MakeSignature(strStamp)
+        tupleSignatures = self.Signatures
+        #+ a later occurrence starts at one of the next digit runs
+        iNextRun = C_NEXT_RUN.match(strSignature, iOffset).end()
+        for strFragment in tupleSignatures[iIndex]:
+            if strSignature.find(strFragment, iNextRun) >= 0:
+                self.Verifications += 1
+                if objPattern.search(strStamp, iOffset + 1):
+                    return None
+                break
+        for iHigher in xrange(iIndex):
+            for strFragment in tupleSignatures[iHigher]:
+                if strFragment in strSignature:
+                    self.Verifications += 1
+                    if self.Patterns[iHigher].search(strStamp):
+                        return None
+                    break
+        return objMatch
+    
+    @property
+    def Hint(self):
+        """
+        The name of the pattern and the offset of the hint, None if there is
+        no hint yet.
+        
+        Signature:
+            None -> tuple(str, int) OR None
+        
+        Version 0.2.0.0
+        """
+        if self._tupleHint is None:
+            return None
+        iIndex, iOffset = self._tupleHint
+        return (self.Names[iIndex], iOffset)
+    
+    def Clear(self):
+        """
+        Forgets the hint and resets the counters.
+        
+        Signature:
+            None -> None
+        
+        Version 0.2.0.0
+        """
+        self._tupleHint = None
+        self.Calls = 0
+        self.Hits = 0
+        self.Misses = 0
+        self.FastPaths = 0
+        self.Verifications = 0
+    
+    def GetStatistics(self):
+        """
+        Returns the usage statistics of the hint.
+        
+        Signature:
+            None -> dict(str -> int OR float OR tuple(str, int) OR None)
+        
+        Returns:
+            dict(str -> int OR float OR tuple(str, int) OR None): with the
+                keys 'Calls', 'Hits', 'Misses', 'FastPaths', 'Verifications',
+                'HitRate' (fraction of the calls resolved with the hint, 0.0 if
+                there were no calls) and 'Hint' (see attribute Hint)
+        
+        Version 0.2.0.0
+        """
+        if self.Calls:
+            fHitRate = float(self.Hits) / self.Calls
+        else:
+            fHitRate = 0.0
+        return {'Calls' : self.Calls, 'Hits' : self.Hits,
+                'Misses' : self.Misses, 'FastPaths' : self.FastPaths,
+                'Verifications' : self.Verifications, 'HitRate' : fHitRate,
+                'Hint' : self.Hint}
+
+class HintDateResolver(HintResolver):
+    """
+    Positional hint version of the function ResolveDateTuple() of the module
+    Date, with exactly the same results, see class HintResolver.
+    
+    Usage:
+        objResolver = HintDateResolver()
+        tupleDate = objResolver('2018-05-09 12:30:01 INFO started')
+    
+    Version 0.2.0.0
+    """
+    
+    def __init__(self):
+        """
+        Initialization.
+        
+        Signature:
+            None -> None
+        
+        Version 0.2.0.0
+        """
+        super(HintDateResolver, self).__init__(C_DATE_SEARCH_PATTERNS,
+                        DATE_NAMES, DATE_SIGNATURES, ConvertDateMatchTuple,
+                                                        False, ScanCompactDate)
+
+class HintTimeResolver(HintResolver):
+    """
+    Positional hint version of the function ResolveTimeTuple() of the module
+    Time, with exactly the same results, see class HintResolver.
+    
+    Usage:
+        objResolver = HintTimeResolver()
+        tupleTime = objResolver('2018-05-09 12:30:01 INFO started')
+    
+    Version 0.2.0.0
+    """
+    
+    def __init__(self):
+        """
+        Initialization.
+        
+        Signature:
+            None -> None
+        
+        Version 0.2.0.0
+        """
+        super(HintTimeResolver, self).__init__(C_TIME_SEARCH_PATTERNS,
+                        TIME_NAMES, TIME_SIGNATURES, ConvertTimeMatchTuple,
+                                                        True, ScanCompactTime)
@@ -0,0 +1,503 @@
+#!/usr/bin/python
+"""
+Module regex_lib.Metrics
+
+Opt-in instrumentation of the hot path of the date / time stamps resolution:
+per compiled pattern the number of the attempts (searches over a string), the
+number of the matches, the time spent and the distributions of the lengths of
+the searched strings and of the times per attempt, as well as the numbers of
+the a.m. / p.m. modifier rejections and of the rounding rollovers.
+
+The instrumentation has no cost when it is disabled, because the resolution
+functions are not modified at all. The function Enable() replaces the helper
+functions looked up by the resolution functions as the module globals (e.g.
+SearchLast() in the modules Date, Time, Adaptive and Hint, SearchUnionGroups()
+in the module Stamp, SearchUnionIndex() in the module Formats, or
+ConvertModifier() and CorrectRounding() in the module Time) by the counting
+wrappers, and the function Disable() restores the original functions. Thus
+the counts cover the functions ResolveDate(), ResolveTime(), their tuple,
+union and batch versions, ResolveDateTime() of the module Stamp, the adaptive
+and hinted resolvers, the format registries, as well as all functions and
+classes calling them; the batch generators already started keep the
+functions found at their start.
+
+Not counted are the patterns matched directly rather than via the search
+helpers: the pre-filter C_STAMP_UNION of the module Scanner, the matches at
+the hinted positions of the module Hint, the tokenization of the module
+Tokens (also used by the module Shape), and the re-matching of the found
+alternatives at their known positions. The conversions of all these paths
+still count the a.m. / p.m. rejections and the rounding rollovers, which
+are applied by the module Time.
+
+The counters are global for the process, they are not protected by a lock,
+thus the counts of the concurrent threads may be slightly underestimated, and
+the worker processes (e.g. of the module Crawler) have their own counters.
+
+Globals:
+    LENGTH_BOUNDS - tuple(int), upper bounds (exclusive) of the buckets of the
+        histogram of the lengths of the searched strings, in characters
+    TIME_BOUNDS - tuple(int), upper bounds (exclusive) of the buckets of the
+        histogram of the times per attempt, in microseconds
+    PATTERN_MODULES - tuple(module), modules defining the names of the
+        compiled patterns used in the snapshots and reports
+    INSTRUMENTED - tuple(tuple(module, str, function)), the module, the name
+        of the instrumented function in its globals and the factory of the
+        counting wrapper
+    COUNTERS - dict(type A -> PatternCounters), counters of the patterns and
+        of the fast path functions
+    EVENTS - dict(str -> int), counts of the conversion events with the keys
+        'AM_PM_Rejections', 'Rollovers' and 'DateIncrements'
+    INSTALLED - list(tuple(module, str, function)), the replaced original
+        functions, empty if the instrumentation is disabled
+
+Functions:
+    Enable()
+        None -> None
+    Disable()
+        None -> None
+    IsEnabled()
+        None -> bool
+    Reset()
+        None -> None
+    GetSnapshot()
+        None -> dict(str -> bool OR dict)
+    FormatReport()
+        /dict(str -> bool OR dict)/ -> str
+    GetCounters()
+        type A -> PatternCounters
+    MakeSearchWrapper()
+        function -> function
+    MakeGroupsWrapper()
+        function -> function
+    MakeScanWrapper()
+        function -> function
+    MakeModifierWrapper()
+        function -> function
+    MakeRoundingWrapper()
+        function -> function
+
+Classes:
+    PatternCounters
+"""
+
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+
+#imports
+
+#+ standard library
+
+import bisect
+import functools
+import timeit
+
+#+ package modules
+
+from . import Date, Time, Adaptive, Stamp, Hint, Formats
+
+from .Search import LazyPattern
+
+#globals
+
+LENGTH_BOUNDS = (8, 16, 32, 64, 128, 256, 512, 1024)
+
+TIME_BOUNDS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+PATTERN_MODULES = (Date, Time, Stamp)
+
+COUNTERS = {}
+
+EVENTS = {'AM_PM_Rejections' : 0, 'Rollovers' : 0, 'DateIncrements' : 0}
+
+INSTALLED = []
+
+#classes
+
+class PatternCounters(object):
+    """
+    Counters of a single compiled pattern or a fast path function.
+    
+    Attributes:
+        Name: str, the name of the pattern or function
+        Attempts: int >= 0, number of the searches over a string
+        Matches: int >= 0, number of the searches with a found stamp
+        Time: float >= 0, total time of the searches in seconds
+        Lengths: list(int >= 0), histogram of the lengths of the searched
+            strings with the buckets defined by LENGTH_BOUNDS, the last bucket
+            counts the strings not shorter than the last bound
+        Times: list(int >= 0), histogram of the times per search with the
+            buckets defined by TIME_BOUNDS (microseconds)
+    
+    Methods:
+        Record(iLength, fTime, bMatched)
+            int, float, bool -> None
+        GetStatistics()
+            None -> dict(str -> str OR int OR float OR list(int))
+    
+    Version 0.2.0.0
+    """
+    
+    def __init__(self, strName):
+        """
+        Initialization.
+        
+        Signature:
+            str -> None
+        
+        Args:
+            strName: str, the name of the pattern or function
+        
+        Version 0.2.0.0
+        """
+        self.Name = strName
+        self.Attempts = 0
+        self.Matches = 0
+        self.Time = 0.0
+        self.Lengths = [0] * (len(LENGTH_BOUNDS) + 1)
+        self.Times = [0] * (len(TIME_BOUNDS) + 1)
+    
+    def Record(self, iLength, fTime, bMatched):
+        """
+        Records a single search.
+        
+        Signature:
+            int, float, bool -> None
+        
+        Args:
+            iLength: int >= 0, the length of the searched string
+            fTime: float >= 0, the time of the search in seconds
+            bMatched: bool, flag if a stamp is found
+        
+        Version 0.2.0.0
+        """
+        self.Attempts += 1
+        if bMatched:
+            self.Matches += 1
+        self.Time += fTime
+        self.Lengths[bisect.bisect_right(LENGTH_BOUNDS, iLength)] += 1
+        self.Times[bisect.bisect_right(TIME_BOUNDS, fTime * 1000000)] += 1
+    
+    def GetStatistics(self):
+        """
+        Returns the copy of the counters.
+        
+        Signature:
+            None -> dict(str -> str OR int OR float OR list(int))
+        
+        Returns:
+            dict(str -> str OR int OR float OR list(int)): with the keys
+                'Name', 'Attempts', 'Matches', 'Time' (seconds), 'Lengths' and
+                'Times' (histograms, see the attributes)
+        
+        Version 0.2.0.0
+        """
+        return {'Name' : self.Name, 'Attempts' : self.Attempts,
+                'Matches' : self.Matches, 'Time' : self.Time,
+                'Lengths' : list(self.Lengths), 'Times' : list(self.Times)}
+
+#functions
+
+def GetCounters(gKey):
+    """
+    Helper function returning the counters of the passed compiled pattern or
+    fast path function, which are created on the first call. The names of the
+    patterns are looked up in the globals of the PATTERN_MODULES, the other
+    patterns are named by the beginning of their text, and a repeated name is
+    made unique by the number of the counters.
+    
+    Signature:
+        type A -> PatternCounters
+    
+    Version 0.2.0.0
+    """
+    objCounters = COUNTERS.get(gKey)
+    if objCounters is None:
+        if isinstance(gKey, LazyPattern):
+            strName = None
+            for objModule in PATTERN_MODULES:
+                for strGlobal, gValue in vars(objModule).items():
+                    if gValue is gKey:
+                        strName = strGlobal
+                        break
+                if not (strName is None):
+                    break
+            else:
+                strName = 'pattern {!r}'.format(gKey.pattern[:40])
+        elif hasattr(gKey, 'pattern'):
+            #+ not lazy compiled pattern, e.g. of a format registry
+            strName = 'pattern {!r}'.format(gKey.pattern[:40])
+        else:
+            strName = getattr(gKey, '__name__', repr(gKey))
+        if any(objItem.Name == strName for objItem in COUNTERS.values()):
+            #+ e.g. the unions of the format registries with the same prefix
+            strName = '{} #{}'.format(strName, len(COUNTERS))
+        objCounters = PatternCounters(strName)
+        COUNTERS[gKey] = objCounters
+    return objCounters
+
+def MakeSearchWrapper(fSearch):
+    """
+    Helper function creating the counting wrapper of a search function, e.g.
+    Search.SearchLast(), Search.SearchUnion() or Search.SearchUnionIndex(),
+    which first argument is the compiled pattern, the last one - the searched
+    string, and which returns None if the pattern is not found.
+    
+    Signature:
+        function -> function
+    
+    Version 0.2.0.0
+    """
+    fTimer = timeit.default_timer
+    
+    @functools.wraps(fSearch)
+    def Wrapper(objPattern, *tupleArgs):
+        fStart = fTimer()
+        objMatch = fSearch(objPattern, *tupleArgs)
+        fTime = fTimer() - fStart
+        GetCounters(objPattern).Record(len(tupleArgs[-1]), fTime,
+                                                        not (objMatch is None))
+        return objMatch
+
+    return Wrapper
+
+def MakeGroupsWrapper(fSearch):
+    """
+    Helper function creating the counting wrapper of the function
+    Search.SearchUnionGroups(), which returns the result of each group of the
+    grouped union pattern; a search is a match if any group is found.
+    
+    Signature:
+        function -> function
+    
+    Version 0.2.0.0
+    """
+    fTimer = timeit.default_timer
+    
+    @functools.wraps(fSearch)
+    def Wrapper(objPattern, tupleCaptures, strStamp):
+        fStart = fTimer()
+        lstResult = fSearch(objPattern, tupleCaptures, strStamp)
+        fTime = fTimer() - fStart
+        GetCounters(objPattern).Record(len(strStamp), fTime,
+                        any(not (gItem is None) for gItem in lstResult))
+        return lstResult
+
+    return Wrapper
+
+def MakeScanWrapper(fScan):
+    """
+    Helper function creating the counting wrapper of a regular expressions
+    free fast path function, e.g. Date.ScanCompactDate(), counted under the
+    name of the function. Each call is an attempt, and each call resolving a
+    stamp is a match.
+    
+    Signature:
+        function -> function
+    
+    Version 0.2.0.0
+    """
+    fTimer = timeit.default_timer
+    
+    @functools.wraps(fScan)
+    def Wrapper(strStamp):
+        fStart = fTimer()
+        bResolved, tupleResult = fScan(strStamp)
+        fTime = fTimer() - fStart
+        GetCounters(fScan).Record(len(strStamp), fTime,
+                                    bResolved and not (tupleResult is None))
+        return bResolved, tupleResult
+
+    return Wrapper
+
+def MakeModifierWrapper(fConvert):
+    """
+    Helper function creating the counting wrapper of the function
+    Time.ConvertModifier(), which counts the hours rejected as incompatible
+    with the a.m. / p.m. modifier, i.e. the rejections of ConvertAM_PM().
+    
+    Signature:
+        function -> function
+    
+    Version 0.2.0.0
+    """
+    
+    @functools.wraps(fConvert)
+    def Wrapper(iHour, gModifier):
+        gResult = fConvert(iHour, gModifier)
+        if gResult is None:
+            EVENTS['AM_PM_Rejections'] += 1
+        return gResult
+
+    return Wrapper
+
+def MakeRoundingWrapper(fCorrect):
+    """
+    Helper function creating the counting wrapper of the function
+    Time.CorrectRounding(), which counts the seconds rolled over into the
+    minutes and the resulting increments of the date.
+    
+    Signature:
+        function -> function
+    
+    Version 0.2.0.0
+    """
+    
+    @functools.wraps(fCorrect)
+    def Wrapper(iHour, iMinute, iSecond):
+        tupleResult = fCorrect(iHour, iMinute, iSecond)
+        if iSecond == 60:
+            EVENTS['Rollovers'] += 1
+            if tupleResult[3]:
+                EVENTS['DateIncrements'] += 1
+        return tupleResult
+
+    return Wrapper
+
+#+ instrumented functions and the factories of their wrappers
+
+INSTRUMENTED = ((Date, 'SearchLast', MakeSearchWrapper),
+                (Date, 'SearchUnion', MakeSearchWrapper),
+                (Date, 'ScanCompactDate', MakeScanWrapper),
+                (Time, 'SearchLast', MakeSearchWrapper),
+                (Time, 'SearchUnion', MakeSearchWrapper),
+                (Time, 'ScanCompactTime', MakeScanWrapper),
+                (Time, 'ConvertModifier', MakeModifierWrapper),
+                (Time, 'CorrectRounding', MakeRoundingWrapper),
+                (Adaptive, 'SearchLast', MakeSearchWrapper),
+                (Hint, 'SearchLast', MakeSearchWrapper),
+                (Stamp, 'SearchUnionGroups', MakeGroupsWrapper),
+                (Formats, 'SearchUnionIndex', MakeSearchWrapper))
+
+def Enable():
+    """
+    Enables the instrumentation by replacing the INSTRUMENTED functions in the
+    globals of their modules by the counting wrappers. The counters are not
+    reset. Calling it again does nothing.
+    
+    Signature:
+        None -> None
+    
+    Version 0.2.0.0
+    """
+    if not INSTALLED:
+        for objModule, strName, fFactory in INSTRUMENTED:
+            fOriginal = getattr(objModule, strName)
+            INSTALLED.append((objModule, strName, fOriginal))
+            setattr(objModule, strName, fFactory(fOriginal))
+
+def Disable():
+    """
+    Disables the instrumentation by restoring the original functions. The
+    counters are kept. Calling it again does nothing.
+    
+    Signature:
+        None -> None
+    
+    Version 0.2.0.0
+    """
+    while INSTALLED:
+        objModule, strName, fOriginal = INSTALLED.pop()
+        setattr(objModule, strName, fOriginal)
+
+def IsEnabled():
+    """
+    Checks if the instrumentation is enabled.
+    
+    Signature:
+        None -> bool
+    
+    Version 0.2.0.0
+    """
+    return bool(INSTALLED)
+
+def Reset():
+    """
+    Resets all counters to zero.
+    
+    Signature:
+        None -> None
+    
+    Version 0.2.0.0
+    """
+    COUNTERS.clear()
+    for strKey in EVENTS:
+        EVENTS[strKey] = 0
+
+def GetSnapshot():
+    """
+    Returns the copy of the current counters, which is not affected by the
+    further counting or reset.
+    
+    Signature:
+        None -> dict(str -> bool OR dict)
+    
+    Returns:
+        dict(str -> bool OR dict): with the keys 'Enabled' (bool), 'Patterns'
+            (dict of the names of the patterns and fast path functions to
+            their statistics, see method PatternCounters.GetStatistics()) and
+            'Events' (copy of EVENTS)
+    
+    Version 0.2.0.0
+    """
+    dictPatterns = {}
+    for objCounters in COUNTERS.values():
+        dictPatterns[objCounters.Name] = objCounters.GetStatistics()
+    return {'Enabled' : IsEnabled(), 'Patterns' : dictPatterns,
+                                                    'Events' : dict(EVENTS)}
+
+def FormatReport(dictSnapshot = None):
+    """
+    Formats the snapshot of the counters as a human readable text report: a
+    table of the patterns sorted by the time spent in the descending order,
+    the non-empty buckets of their histograms and the event counts.
+    
+    Signature:
+        /dict(str -> bool OR dict)/ -> str
+    
+    Args:
+        dictSnapshot: (optional) dict(str -> bool OR dict), a snapshot as
+            returned by the function GetSnapshot(), defaults to None - the
+            current counters are reported
+    
+    Returns:
+        str: the report
+    
+    Version 0.2.0.0
+    """
+    if dictSnapshot is None:
+        dictSnapshot = GetSnapshot()
+    lstLines = ['{:<32} {:>10} {:>10} {:>10} {:>10}'.format('pattern',
+                                'attempts', 'matches', 'time, ms', 'mean, us')]
+    lstStatistics = sorted(dictSnapshot['Patterns'].values(),
+            key = lambda dictItem: (- dictItem['Time'], dictItem['Name']))
+    for dictItem in lstStatistics:
+        if dictItem['Attempts']:
+            fMean = dictItem['Time'] * 1000000 / dictItem['Attempts']
+        else:
+            fMean = 0.0
+        lstLines.append('{:<32} {:>10} {:>10} {:>10.3f} {:>10.2f}'.format(
+                    dictItem['Name'], dictItem['Attempts'],
+                    dictItem['Matches'], dictItem['Time'] * 1000, fMean))
+    for dictItem in lstStatistics:
+        lstLines.append('')
+        lstLines.append(dictItem['Name'])
+        for strTitle, tupleBounds, strKey in (('lengths', LENGTH_BOUNDS,
+                        'Lengths'), ('times, us', TIME_BOUNDS, 'Times')):
+            lstBuckets = []
+            for iIndex, iCount in enumerate(dictItem[strKey]):
+                if iCount:
+                    if iIndex < len(tupleBounds):
+                        strBucket = '<{}'.format(tupleBounds[iIndex])
+                    else:
+                        strBucket = '>={}'.format(tupleBounds[-1])
+                    lstBuckets.append('{}: {}'.format(strBucket, iCount))
+            lstLines.append('    {}: {}'.format(strTitle,
+                                                    ', '.join(lstBuckets)))
+    dictEvents = dictSnapshot['Events']
+    lstLines.append('')
+    lstLines.append('a.m. / p.m. rejections: {}'.format(
+                                                dictEvents['AM_PM_Rejections']))
+    lstLines.append('rounding rollovers: {}'.format(dictEvents['Rollovers']))
+    lstLines.append('date increments: {}'.format(dictEvents['DateIncrements']))
+    return '\n'.join(lstLines)
@@ -0,0 +1,363 @@
+#!/usr/bin/python
+"""
+Module regex_lib.Scanner
+
+Streaming resolution of the date / time stamps in the lines of (large) text
+files, e.g. instrument logs, with the constant memory consumption regardless of
+the file size.
+
+Patterns:
+    STAMP_UNION - all date and time core stamp patterns combined into a single
+        search pattern, which is found in a line if and only if at least one of
+        the date or time stamps is found in the same line
+
+Compiled patterns (compiled on the first use, see Search.LazyPattern):
+    C_STAMP_UNION
+
+Globals:
+    CHUNK_SIZE - int, default size of the read chunks in bytes
+
+Functions:
+    ScanFile()
+        str OR file, bool, int -> generator(tuple(int, int, str OR None,
+            str OR None, bool))
+    GenerateRecords()
+        str OR file, bool, int -> generator(tuple(int, int, str OR None,
+            str OR None, bool))
+    GenerateLines()
+        file, int -> generator(tuple(int, int, str))
+    ScanMapped()
+        str OR file, bool, int -> generator(tuple(int, int, str OR None,
+            str OR None, bool))
+    GenerateMappedRecords()
+        str OR file, bool, int -> generator(tuple(int, int, str OR None,
+            str OR None, bool))
+    CountLines()
+        mmap.mmap, int, int, int -> int
+"""
+
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+
+#imports
+
+#+ standard library
+
+import os
+import mmap
+
+#+ package modules
+
+from .Search import MakeUnionPattern, LazyPattern
+
+from .Date import ResolveDate, ResolveDateUnion, ISO_DATE_CORE, \
+                    REVERSED_DATE_CORE, SCREWED_DATE_CORE, SHORT_DATE_CORE, \
+                                                            COMPACT_DATE_CORE
+
+from .Time import ResolveTime, ResolveTimeUnion, TIME_CORE, SHORT_TIME_CORE, \
+                                COMPACT_TIME_CORE, SHORT_COMPACT_TIME_CORE
+
+#patterns
+
+#+ the optional AM / PM modifier never prevents the match of a time stamp, thus
+#+ the lower case modifiers do not matter
+
+STAMP_UNION = MakeUnionPattern([(ISO_DATE_CORE, "0-9"),
+                                (REVERSED_DATE_CORE, "0-9"),
+                                (SCREWED_DATE_CORE, "0-9"),
+                                (SHORT_DATE_CORE, "0-9"),
+                                (COMPACT_DATE_CORE, "0-9"),
+                                (TIME_CORE, "0-9"), (SHORT_TIME_CORE, "0-9:"),
+                                (COMPACT_TIME_CORE, "0-9"),
+                                (SHORT_COMPACT_TIME_CORE, "0-9")])
+
+#compiled patterns
+
+C_STAMP_UNION = LazyPattern(STAMP_UNION)
+
+#globals
+
+CHUNK_SIZE = 1048576
+
+#functions
+
+def ScanFile(gSource, bUnion = False, iChunkSize = CHUNK_SIZE):
+    """
+    Reads the passed file in chunks and resolves the date and time stamps in
+    each line with the functions ResolveDate() and ResolveTime(). The records
+    are generated lazily, one per line, including the lines without stamps.
+    
+    The line numbers start with 1. The byte offset is the position of the first
+    character of the line counted from the point where the reading has started,
+    i.e. from the beginning of the file for a path, or from the current
+    position of a file object (in the characters for a file opened in the text
+    mode with decoding). The line ending characters ('\\n' and the preceding
+    '\\r') are not passed to the resolution functions.
+    
+    A file opened by its path is closed when the generator is exhausted or
+    closed; a passed file object is not closed.
+    
+    Signature:
+        str OR file, bool, int -> generator(tuple(int, int, str OR None,
+            str OR None, bool))
+    
+    Args:
+        gSource: str OR file, the path to a file or any object with the method
+            read(), e.g. a file opened in the binary mode
+        bUnion: (optional) bool, flag if the single pass union patterns are
+            used as by ResolveDateUnion() and ResolveTimeUnion(), defaults to
+            False
+        iChunkSize: (optional) int > 0, the size of the read chunks, defaults
+            to CHUNK_SIZE
+    
+    Returns:
+        generator(tuple(int, int, str OR None, str OR None, bool)): records of
+            the line number, byte offset of the line, resolved date stamp in
+            ISO format 'YYYY-MM-DD' or None, resolved time stamp in ISO format
+            'HH:MM:SS' or None and the date increment flag
+    
+    Raises:
+        TypeError: the source is neither a string nor an object with the method
+            read(), or the chunk size is not an integer
+        ValueError: the chunk size is not positive
+        IOError: the file cannot be opened or read - raised during the
+            iteration
+    
+    Version 0.2.0.0
+    """
+    bFile = callable(getattr(gSource, 'read', None))
+    if not (isinstance(gSource, basestring) or bFile):
+        strError = '{} of {} is neither a path nor a file'.format(gSource,
+                                                                type(gSource))
+        raise TypeError(strError)
+    if (not isinstance(iChunkSize, (int, long))) or isinstance(iChunkSize,
+                                                                        bool):
+        strError = '{} of {} is not an integer'.format(iChunkSize,
+                                                            type(iChunkSize))
+        raise TypeError(strError)
+    if iChunkSize < 1:
+        strError = 'chunk size {} is not positive'.format(iChunkSize)
+        raise ValueError(strError)
+    return GenerateRecords(gSource, bUnion, iChunkSize)
+
+def GenerateRecords(gSource, bUnion, iChunkSize):
+    """
+    Generator implementing the function ScanFile(), the arguments are not
+    checked.
+    
+    Signature:
+        str OR file, bool, int -> generator(tuple(int, int, str OR None,
+            str OR None, bool))
+    
+    Version 0.2.0.0
+    """
+    if bUnion:
+        fDate = ResolveDateUnion
+        fTime = ResolveTimeUnion
+    else:
+        fDate = ResolveDate
+        fTime = ResolveTime
+    if isinstance(gSource, basestring):
+        objFile = open(gSource, 'rb')
+    else:
+        objFile = gSource
+    try:
+        for iLine, iOffset, strLine in GenerateLines(objFile, iChunkSize):
+            strTime, bIncrementDate = fTime(strLine)
+            yield iLine, iOffset, fDate(strLine), strTime, bIncrementDate
+    finally:
+        if not (objFile is gSource):
+            objFile.close()
+
+def GenerateLines(objFile, iChunkSize):
+    """
+    Generator of the lines of a file read in chunks of the passed size. Only
+    the last, incomplete line of a chunk is kept in memory between the chunks,
+    as a list of its pieces, which are joined only when a chunk with the line
+    ending is read, so a long line is not copied again with each chunk. The
+    line ending characters ('\\n' and the preceding '\\r') are removed. The
+    last line of the file is generated only if it is not empty.
+    
+    Signature:
+        file, int -> generator(tuple(int, int, str))
+    
+    Args:
+        objFile: file, any object with the method read(int)
+        iChunkSize: int > 0, the size of the read chunks
+    
+    Returns:
+        generator(tuple(int, int, str)): the line number (starting with 1), the
+            offset of the line from the initial position and the line itself
+    
+    Version 0.2.0.0
+    """
+    iLine = 0
+    iOffset = 0
+    strEmpty = objFile.read(0)
+    lstTail = []
+    fRead = objFile.read
+    while True:
+        strChunk = fRead(iChunkSize)
+        if not strChunk:
+            break
+        lstTail.append(strChunk)
+        if strChunk.find('\n') < 0:
+            continue
+        lstLines = strEmpty.join(lstTail).split('\n')
+        lstTail = [lstLines.pop()]
+        for strLine in lstLines:
+            iLine += 1
+            iLength = len(strLine) + 1
+            if strLine.endswith('\r'):
+                strLine = strLine[:-1]
+            yield iLine, iOffset, strLine
+            iOffset += iLength
+    strTail = strEmpty.join(lstTail)
+    if strTail:
+        if strTail.endswith('\r'):
+            strTail = strTail[:-1]
+        yield iLine + 1, iOffset, strTail
+
+def ScanMapped(gSource, bUnion = False, iChunkSize = CHUNK_SIZE):
+    """
+    Maps the passed file into memory and searches the mapped buffer directly
+    for the date and time stamps with the combined pattern C_STAMP_UNION. Only
+    the lines containing a stamp are copied out of the buffer and resolved with
+    the functions ResolveDate() and ResolveTime(); the rest of the file is only
+    scanned for the new line characters in blocks of the passed size in order
+    to count the lines.
+    
+    The records are the same as generated by the function ScanFile() for the
+    same file, but only for the lines with at least one resolved stamp. The
+    byte offsets are always counted from the beginning of the file, regardless
+    of the current position of a passed file object.
+    
+    A file opened by its path is closed when the generator is exhausted or
+    closed; a passed file object is not closed.
+    
+    Signature:
+        str OR file, bool, int -> generator(tuple(int, int, str OR None,
+            str OR None, bool))
+    
+    Args:
+        gSource: str OR file, the path to a file or a file object with the
+            method fileno(), opened for reading
+        bUnion: (optional) bool, flag if the single pass union patterns are
+            used as by ResolveDateUnion() and ResolveTimeUnion(), defaults to
+            False
+        iChunkSize: (optional) int > 0, the size of the blocks used to count
+            the lines, defaults to CHUNK_SIZE
+    
+    Returns:
+        generator(tuple(int, int, str OR None, str OR None, bool)): records of
+            the line number, byte offset of the line, resolved date stamp in
+            ISO format 'YYYY-MM-DD' or None, resolved time stamp in ISO format
+            'HH:MM:SS' or None and the date increment flag
+    
+    Raises:
+        TypeError: the source is neither a string nor an object with the method
+            fileno(), or the chunk size is not an integer
+        ValueError: the chunk size is not positive
+        IOError: the file cannot be opened - raised during the iteration
+    
+    Version 0.2.0.0
+    """
+    bFile = callable(getattr(gSource, 'fileno', None))
+    if not (isinstance(gSource, basestring) or bFile):
+        strError = '{} of {} is neither a path nor a file'.format(gSource,
+                                                                type(gSource))
+        raise TypeError(strError)
+    if (not isinstance(iChunkSize, (int, long))) or isinstance(iChunkSize,
+                                                                        bool):
+        strError = '{} of {} is not an integer'.format(iChunkSize,
+                                                            type(iChunkSize))
+        raise TypeError(strError)
+    if iChunkSize < 1:
+        strError = 'chunk size {} is not positive'.format(iChunkSize)
+        raise ValueError(strError)
+    return GenerateMappedRecords(gSource, bUnion, iChunkSize)
+
+def GenerateMappedRecords(gSource, bUnion, iChunkSize):
+    """
+    Generator implementing the function ScanMapped(), the arguments are not
+    checked.
+    
+    Signature:
+        str OR file, bool, int -> generator(tuple(int, int, str OR None,
+            str OR None, bool))
+    
+    Version 0.2.0.0
+    """
+    if bUnion:
+        fDate = ResolveDateUnion
+        fTime = ResolveTimeUnion
+    else:
+        fDate = ResolveDate
+        fTime = ResolveTime
+    if isinstance(gSource, basestring):
+        objFile = open(gSource, 'rb')
+    else:
+        objFile = gSource
+    objMap = None
+    try:
+        iFile = objFile.fileno()
+        if os.fstat(iFile).st_size:
+            #+ an empty file cannot be mapped
+            objMap = mmap.mmap(iFile, 0, access = mmap.ACCESS_READ)
+            fSearch = C_STAMP_UNION.search
+            fFind = objMap.find
+            iSize = len(objMap)
+            iLine = 1
+            iCounted = 0
+            objMatch = fSearch(objMap)
+            while objMatch:
+                iPosition = objMatch.start()
+                #+ iCounted is always the start of a line
+                iStart = objMap.rfind('\n', iCounted, iPosition) + 1
+                if iStart > iCounted:
+                    iLine += CountLines(objMap, iCounted, iStart, iChunkSize)
+                    iCounted = iStart
+                else:
+                    iStart = iCounted
+                iEnd = fFind('\n', iPosition)
+                if iEnd < 0:
+                    iEnd = iSize
+                strLine = objMap[iStart:iEnd]
+                if strLine.endswith('\r'):
+                    strLine = strLine[:-1]
+                strDate = fDate(strLine)
+                strTime, bIncrementDate = fTime(strLine)
+                if not ((strDate is None) and (strTime is None)):
+                    yield iLine, iStart, strDate, strTime, bIncrementDate
+                objMatch = fSearch(objMap, iEnd + 1)
+    finally:
+        if not (objMap is None):
+            objMap.close()
+        if not (objFile is gSource):
+            objFile.close()
+
+def CountLines(objMap, iStart, iEnd, iChunkSize):
+    """
+    Counts the new line characters in the passed range of a mapped buffer,
+    which is copied in blocks of at most the passed size.
+    
+    Signature:
+        mmap.mmap, int, int, int -> int
+    
+    Args:
+        objMap: mmap.mmap, the mapped buffer
+        iStart: int >= 0, the start of the range (inclusive)
+        iEnd: int >= 0, the end of the range (exclusive)
+        iChunkSize: int > 0, the maximum size of the copied blocks
+    
+    Returns:
+        int >= 0: the number of the new line characters
+    
+    Version 0.2.0.0
+    """
+    iResult = 0
+    for iPosition in xrange(iStart, iEnd, iChunkSize):
+        iResult += objMap[iPosition : min(iPosition + iChunkSize,
+                                                            iEnd)].count('\n')
+    return iResult
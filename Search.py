@@ -0,0 +1,558 @@
+#!/usr/bin/python
+"""
+Module regex_lib.Search
+
+Helper functions for the linear time search of the date / time stamps, which
+are delimited by the non-digit characters (or the string boundaries), without
+the greedy '(.*[^0-9]|^)' prefix and '([^0-9].*|$)' suffix wrappers.
+
+All supported stamps start with a digit, therefore the search pattern starts
+with a single digit character class, which allows the regular expression engine
+to skip quickly all non-digit characters. The rest of the conditions is placed
+into a (fixed width) look-behind assertion re-examining this digit: it is not
+preceded by a digit (or other excluded character), and the core stamp pattern
+matches starting from it and is not followed by a digit. Thus each search match
+spans only the first digit of the stamp, and all (overlapping) occurrences of
+the stamp are found by a single left-to-right pass of the method finditer() -
+the named groups are still captured within the look-around assertions.
+
+The wrapped (legacy) patterns are used with the method match(), and the greedy
+'.*' prefix selects the right-most (last) position in the string where the
+stamp can start. The function SearchLast() reproduces this behaviour exactly,
+including the fact that the '.' does not match a new line character, i.e. the
+stamp may start not further than right after the first new line character.
+
+The union pattern combines several core patterns as the alternatives in the
+priority order, so all of them are searched for in a single pass. Each search
+match of the union pattern reports only the highest priority alternative
+matching at that position, which is sufficient to find the last occurrence of
+the highest priority pattern found anywhere in the string, see function
+SearchUnion(). The alternatives can be also split into several groups (e.g.
+date and time stamps), and each search match of the grouped union pattern
+reports the highest priority alternative of each group matching at that
+position, thus the same single pass finds the last occurrence of the highest
+priority alternative for each group, see functions MakeUnionGroupsPattern() and
+SearchUnionGroups().
+
+The same single left-to-right pass of the union pattern also finds all
+occurrences of the stamps: the stamp ends with the last matched group of the
+search pattern of the found alternative (captured within the look-ahead
+assertion), and the occurrences overlapping the preceding found stamp are
+skipped, see function FindUnion().
+
+The digit runs and the shape of a byte string are obtained with the method
+translate() and the translation tables DIGITS_TABLE and SHAPE_TABLE, which
+allows the compact (digits only) stamps to be found without the regular
+expressions, see functions ScanCompactDate() and ScanCompactTime() of the
+modules Date and Time.
+
+The compiled patterns of the library are the instances of the class
+LazyPattern, which compiles the regular expression only on its first use, thus
+the import of the modules does not pay the compilation cost of all patterns;
+and the function WarmUp() compiles all of them up front.
+
+Globals:
+    DIGITS_TABLE - str, translation table keeping the digits and replacing all
+        other characters by spaces, i.e. the method split() of the translated
+        string returns the digit runs
+    SHAPE_TABLE - str, translation table replacing the digits by '0', the date
+        separators ('-', '/', '_' and '.') by '-', keeping ':' and replacing
+        all other characters by spaces
+    LAZY_PATTERNS - list(LazyPattern), all created lazily compiled patterns
+
+Functions:
+    MakeSearchPattern()
+        str, str -> str
+    MakeUnionPattern()
+        list(tuple(str, str)) -> str
+    SearchLast()
+        re.RegexObject, str -> re.MatchObject OR None
+    SearchUnion()
+        re.RegexObject, list(re.RegexObject), str -> re.MatchObject OR None
+    SearchUnionIndex()
+        re.RegexObject, list(re.RegexObject), str
+            -> tuple(int, re.MatchObject) OR None
+    FindUnion()
+        re.RegexObject, list(re.RegexObject), str
+            -> generator(tuple(int, int, re.MatchObject))
+    MakeAlternatives()
+        list(tuple(str, str)) -> str
+    MakeUnionGroupsPattern()
+        list(list(tuple(str, str))) -> str, tuple(tuple(int, int))
+    SearchUnionGroups()
+        re.RegexObject, tuple(tuple(int, int)), str
+            -> list(tuple(int, int) OR None)
+    WarmUp()
+        None -> int
+
+Classes:
+    LazyPattern
+"""
+
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+
+#imports
+
+#+ standard library
+
+import collections
+import itertools
+import re
+
+#globals
+
+#+ opening of any capturing (named or not) group in a pattern
+
+C_CAPTURING_GROUP = re.compile(r"\((\?P<[A-Za-z_][A-Za-z0-9_]*>)?(?!\?)")
+
+#+ translation tables of the byte strings
+
+DIGITS_TABLE = ''.join(chr(iCode) if chr(iCode) in '0123456789' else ' '
+                                                    for iCode in range(256))
+
+SHAPE_TABLE = ''.join('0' if chr(iCode) in '0123456789' else
+                        '-' if chr(iCode) in '-/_.' else
+                        ':' if chr(iCode) == ':' else ' '
+                                                    for iCode in range(256))
+
+#+ all created lazily compiled patterns, see function WarmUp()
+
+LAZY_PATTERNS = []
+
+#classes
+
+class LazyPattern(object):
+    """
+    Regular expression pattern compiled only on its first use. Any attribute
+    of the compiled pattern object (e.g. the methods match(), search() and
+    finditer(), or the attribute groupindex) is available as the attribute of
+    the instance. It is looked up in the compiled pattern only once, and then
+    it is stored as the attribute of the instance, so the further look-ups
+    have no overhead.
+    
+    Usage:
+        C_PATTERN = LazyPattern(r"[0-9]+") # not compiled yet
+        objMatch = C_PATTERN.match(strStamp) # compiled here
+    
+    Attributes:
+        pattern: str, the regular expression pattern
+        flags: int, the compilation flags
+        Compiled: re.RegexObject OR None, the compiled pattern or None if it
+            is not compiled yet
+    
+    Methods:
+        Compile()
+            None -> re.RegexObject
+    
+    Version 0.2.0.0
+    """
+    
+    def __init__(self, strPattern, iFlags = 0):
+        """
+        Initialization. The instance is registered in LAZY_PATTERNS.
+        
+        Signature:
+            str, int -> None
+        
+        Args:
+            strPattern: str, the regular expression pattern
+            iFlags: (optional) int, the compilation flags, defaults to 0
+        
+        Version 0.2.0.0
+        """
+        self.pattern = strPattern
+        self.flags = iFlags
+        self.Compiled = None
+        LAZY_PATTERNS.append(self)
+    
+    def Compile(self):
+        """
+        Compiles the pattern, if it is not compiled yet.
+        
+        Signature:
+            None -> re.RegexObject
+        
+        Returns:
+            re.RegexObject: the compiled pattern
+        
+        Version 0.2.0.0
+        """
+        if self.Compiled is None:
+            self.Compiled = re.compile(self.pattern, self.flags)
+        return self.Compiled
+    
+    def __getattr__(self, strName):
+        """
+        Looks up the attribute not found in the instance in the compiled
+        pattern, which is compiled on the first call, and stores it as the
+        attribute of the instance.
+        
+        Signature:
+            str -> type A
+        
+        Raises:
+            AttributeError: the compiled pattern has no such attribute, or it
+                is a special attribute
+        
+        Version 0.2.0.0
+        """
+        if strName.startswith('__'):
+            raise AttributeError(strName)
+        gValue = getattr(self.Compile(), strName)
+        setattr(self, strName, gValue)
+        return gValue
+
+#functions
+
+def WarmUp():
+    """
+    Compiles all not yet compiled lazily compiled patterns of the imported
+    modules, so the compilation cost is paid up front, e.g. at the start of a
+    service or before the worker processes are forked.
+    
+    Signature:
+        None -> int
+    
+    Returns:
+        int: number of the patterns compiled by this call
+    
+    Version 0.2.0.0
+    """
+    iCompiled = 0
+    for objPattern in LAZY_PATTERNS:
+        if objPattern.Compiled is None:
+            objPattern.Compile()
+            iCompiled += 1
+    return iCompiled
+
+def MakeSearchPattern(strCore, strExcluded = "0-9"):
+    """
+    Wraps the core stamp pattern into the look-around assertions requiring
+    that the stamp is neither preceded nor followed by a character from the
+    excluded set (as the content of a character class, e.g. '0-9' or '0-9:'),
+    which is equivalent to the legacy prefix '(.*[^0-9]|^)' and suffix
+    '([^0-9].*|$)' wrappers. The core pattern must start with a digit. The
+    search match spans only the first digit of the stamp, thus the overlapping
+    occurrences are also found.
+    
+    Signature:
+        str, str -> str
+    
+    Args:
+        strCore: str, the stamp regular expression pattern without the prefix
+            and suffix wrappers
+        strExcluded: (optional) str, the content of the character class of the
+            characters not allowed around the stamp, defaults to '0-9'
+    
+    Returns:
+        str: the search pattern
+    
+    Version 0.2.0.0
+    """
+    return "".join([r"[0-9](?<=(?<![", strExcluded, r"])(?=", strCore,
+                                            r"(?![", strExcluded, r"]))[0-9])"])
+
+def MakeUnionPattern(lstAlternatives):
+    """
+    Combines the core stamp patterns into a single search pattern, see function
+    MakeSearchPattern(). The alternatives are tried in the passed order, each
+    with its own excluded characters set around the stamp. All groups of the
+    core patterns are made non-capturing, and each alternative is placed into a
+    capturing group, so the index of the last matched group is the index of the
+    alternative in the list plus 1.
+    
+    Signature:
+        list(tuple(str, str)) -> str
+    
+    Args:
+        lstAlternatives: list(tuple(str, str)), pairs of the core stamp pattern
+            and the content of the character class of the characters not
+            allowed around the stamp, e.g. (ISO_DATE_CORE, '0-9')
+    
+    Returns:
+        str: the union search pattern
+    
+    Version 0.2.0.0
+    """
+    return "".join([r"[0-9](?<=(?:", MakeAlternatives(lstAlternatives),
+                                                                r")[0-9])"])
+
+def MakeAlternatives(lstAlternatives):
+    """
+    Helper function for MakeUnionPattern() and MakeUnionGroupsPattern(), which
+    combines the core stamp patterns into the alternatives of the look-around
+    assertions with the capturing group per alternative.
+    
+    Signature:
+        list(tuple(str, str)) -> str
+    
+    Version 0.2.0.0
+    """
+    lstParts = []
+    for strCore, strExcluded in lstAlternatives:
+        lstParts.append("".join([r"(?<![", strExcluded, r"])(?=(",
+                                C_CAPTURING_GROUP.sub("(?:", strCore),
+                                        r")(?![", strExcluded, r"]))"]))
+    return "|".join(lstParts)
+
+def SearchLast(objPattern, strStamp):
+    """
+    Finds the right-most occurrence of the search pattern (see function
+    MakeSearchPattern()) in the passed string, which is the same as selected
+    by the legacy pattern with the greedy '(.*[^0-9]|^)' prefix using the
+    method match(). The occurrence must start not further than right after the
+    first new line character, since '.' does not match it.
+    
+    Signature:
+        re.RegexObject, str -> re.MatchObject OR None
+    
+    Args:
+        objPattern: re.RegexObject, compiled search pattern
+        strStamp: str, the string to search in
+    
+    Returns:
+        re.MatchObject: the last found occurrence
+        None: the pattern is not found
+    
+    Version 0.2.0.0
+    """
+    iLimit = strStamp.find('\n')
+    if iLimit < 0:
+        iLimit = len(strStamp)
+        objLast = None
+    else:
+        #+ a stamp cannot contain a new line character, thus the occurrence
+        #+ right after the first one is the last possible one; otherwise only
+        #+ the first line is searched in
+        iLimit += 1
+        objLast = objPattern.match(strStamp, iLimit)
+    if objLast is None:
+        #+ the most often case of no occurrences at all is resolved by a single
+        #+ search, otherwise the rest of the occurrences is exhausted at C
+        #+ level keeping only the last one
+        objLast = objPattern.search(strStamp, 0, iLimit)
+        if not (objLast is None):
+            dequeLast = collections.deque(objPattern.finditer(strStamp,
+                                                objLast.start() + 1, iLimit), 1)
+            if dequeLast:
+                objLast = dequeLast[0]
+    return objLast
+
+def SearchUnion(objUnion, lstPatterns, strStamp):
+    """
+    Finds the same occurrence of a stamp as the function SearchLast() applied
+    to the search patterns in the passed order until the first one is found,
+    but with a single pass of the union pattern (see MakeUnionPattern()) over
+    the string. The search pattern of the found alternative is applied again
+    only at the position of its last occurrence in order to obtain the named
+    groups.
+    
+    Signature:
+        re.RegexObject, list(re.RegexObject), str -> re.MatchObject OR None
+    
+    Args:
+        objUnion: re.RegexObject, compiled union pattern
+        lstPatterns: list(re.RegexObject), compiled search patterns of the same
+            alternatives in the same order as in the union pattern
+        strStamp: str, the string to search in
+    
+    Returns:
+        re.MatchObject: the last occurrence of the highest priority pattern,
+            as a match object of this pattern
+        None: none of the patterns is found
+    
+    Version 0.2.0.0
+    """
+    tupleFound = SearchUnionIndex(objUnion, lstPatterns, strStamp)
+    if tupleFound is None:
+        return None
+    return tupleFound[1]
+
+def SearchUnionIndex(objUnion, lstPatterns, strStamp):
+    """
+    Finds the same occurrence of a stamp as the function SearchUnion() and
+    reports the index of the found alternative, which identifies it even if
+    several alternatives have the same (thus the same cached compiled) search
+    pattern.
+    
+    Signature:
+        re.RegexObject, list(re.RegexObject), str
+            -> tuple(int, re.MatchObject) OR None
+    
+    Args:
+        objUnion: re.RegexObject, compiled union pattern
+        lstPatterns: list(re.RegexObject), compiled search patterns of the same
+            alternatives in the same order as in the union pattern
+        strStamp: str, the string to search in
+    
+    Returns:
+        tuple(int, re.MatchObject): the index of the highest priority found
+            alternative (starting with 0) and its last occurrence, as a match
+            object of its search pattern
+        None: none of the patterns is found
+    
+    Version 0.2.0.0
+    """
+    iLimit = strStamp.find('\n')
+    if iLimit < 0:
+        iLimit = len(strStamp)
+        objLast = None
+    else:
+        iLimit += 1
+        objLast = objUnion.match(strStamp, iLimit)
+    objMatch = objUnion.search(strStamp, 0, iLimit)
+    if objMatch is None:
+        #+ the most often case of no occurrences at all
+        iterMatches = []
+    else:
+        iterMatches = itertools.chain([objMatch], objUnion.finditer(strStamp,
+                                                objMatch.start() + 1, iLimit))
+    if not (objLast is None):
+        iterMatches = itertools.chain(iterMatches, [objLast])
+    iBest = len(lstPatterns) + 1
+    iStart = None
+    for objMatch in iterMatches:
+        iIndex = objMatch.lastindex
+        if iIndex <= iBest:
+            iBest = iIndex
+            iStart = objMatch.start()
+    if iStart is None:
+        return None
+    return iBest - 1, lstPatterns[iBest - 1].match(strStamp, iStart)
+
+def FindUnion(objUnion, lstPatterns, strStamp):
+    """
+    Generator of all non-overlapping occurrences of the stamps in the passed
+    string from the left to the right, found with a single pass of the union
+    pattern (see MakeUnionPattern()) over the entire string, including all its
+    lines. At each position the highest priority alternative matching there
+    is taken; an occurrence starting within the preceding found stamp is
+    skipped. The search pattern of the found alternative is applied again at
+    the position of each occurrence in order to obtain the named groups.
+    
+    Signature:
+        re.RegexObject, list(re.RegexObject), str
+            -> generator(tuple(int, int, re.MatchObject))
+    
+    Args:
+        objUnion: re.RegexObject, compiled union pattern
+        lstPatterns: list(re.RegexObject), compiled search patterns of the same
+            alternatives in the same order as in the union pattern
+        strStamp: str, the string to search in
+    
+    Yields:
+        tuple(int, int, re.MatchObject): the start and the end positions of
+            the stamp (as a slice, the end of the last matched group) and the
+            match object of the search pattern of the found alternative at the
+            start position
+    
+    Version 0.2.0.0
+    """
+    iEnd = 0
+    for objMatch in objUnion.finditer(strStamp):
+        iStart = objMatch.start()
+        if iStart >= iEnd:
+            objMatch = lstPatterns[objMatch.lastindex - 1].match(strStamp,
+                                                                    iStart)
+            #+ end of the last matched group, i.e. without the optional
+            #+ separator of an absent field (e.g. a.m. / p.m. modifier)
+            iEnd = max(tupleSpan[1] for tupleSpan in objMatch.regs[1:])
+            yield iStart, iEnd, objMatch
+
+def MakeUnionGroupsPattern(lstGroups):
+    """
+    Combines several groups of the core stamp patterns into a single search
+    pattern. Each search match reports the highest priority (first in the
+    group) alternative of each group matching at this position. For the two
+    groups A and B the pattern is equivalent to the alternatives 'AB?|B'. The
+    capturing groups are the alternatives of all groups copied for each branch,
+    and their mapping onto the groups and the alternatives is returned as well.
+    
+    Signature:
+        list(list(tuple(str, str))) -> str, tuple(tuple(int, int))
+    
+    Args:
+        lstGroups: list(list(tuple(str, str))), groups of pairs of the core
+            stamp pattern and the content of the character class of the
+            characters not allowed around the stamp, in the priority order
+    
+    Returns:
+        tuple(str, tuple(tuple(int, int))): unpacked tuple of the grouped union
+            search pattern and the group index and the alternative index within
+            the group (both starting with 0) for each capturing group in order
+    
+    Version 0.2.0.0
+    """
+    lstGroupPatterns = []
+    for lstAlternatives in lstGroups:
+        lstGroupPatterns.append("".join(["(?:", MakeAlternatives(
+                                                    lstAlternatives), ")"]))
+    lstBranches = []
+    lstCaptures = []
+    for iFirst in range(len(lstGroups)):
+        lstBranches.append("".join([lstGroupPatterns[iFirst]] +
+                                        ["".join([strGroup, "?"])
+                                for strGroup in lstGroupPatterns[iFirst + 1:]]))
+        for iGroup in range(iFirst, len(lstGroups)):
+            for iIndex in range(len(lstGroups[iGroup])):
+                lstCaptures.append((iGroup, iIndex))
+    strPattern = "".join([r"[0-9](?<=(?:", "|".join(lstBranches), r")[0-9])"])
+    return strPattern, tuple(lstCaptures)
+
+def SearchUnionGroups(objUnion, tupleCaptures, strStamp):
+    """
+    Finds the last occurrence of the highest priority alternative of each group
+    of the grouped union pattern (see MakeUnionGroupsPattern()) with a single
+    pass over the string. For each group the result is the same as of the
+    function SearchUnion() with the union of only the alternatives of this
+    group.
+    
+    Signature:
+        re.RegexObject, tuple(tuple(int, int)), str
+            -> list(tuple(int, int) OR None)
+    
+    Args:
+        objUnion: re.RegexObject, compiled grouped union pattern
+        tupleCaptures: tuple(tuple(int, int)), the group index and the
+            alternative index within the group of each capturing group, as
+            returned by MakeUnionGroupsPattern()
+        strStamp: str, the string to search in
+    
+    Returns:
+        list(tuple(int, int) OR None): for each group the index of the found
+            alternative within the group and the position of its last
+            occurrence, or None if no alternative of the group is found
+    
+    Version 0.2.0.0
+    """
+    iLimit = strStamp.find('\n')
+    if iLimit < 0:
+        iLimit = len(strStamp)
+        objLast = None
+    else:
+        iLimit += 1
+        objLast = objUnion.match(strStamp, iLimit)
+    lstResult = [None] * (tupleCaptures[-1][0] + 1)
+    objMatch = objUnion.search(strStamp, 0, iLimit)
+    if objMatch is None:
+        if objLast is None:
+            #+ the most often case of no occurrences at all
+            return lstResult
+        iterMatches = [objLast]
+    else:
+        iterMatches = itertools.chain([objMatch], objUnion.finditer(strStamp,
+                                                objMatch.start() + 1, iLimit))
+        if not (objLast is None):
+            iterMatches = itertools.chain(iterMatches, [objLast])
+    for objMatch in iterMatches:
+        iStart = objMatch.start()
+        for tupleCapture, gCapture in itertools.izip(tupleCaptures,
+                                                            objMatch.groups()):
+            if not (gCapture is None):
+                iGroup, iIndex = tupleCapture
+                tupleBest = lstResult[iGroup]
+                if (tupleBest is None) or iIndex <= tupleBest[0]:
+                    lstResult[iGroup] = (iIndex, iStart)
+    return lstResult
@@ -0,0 +1,439 @@
+#!/usr/bin/python
+"""
+Module regex_lib.Shape
+
+Resolution of the date and time stamps in the strings of the repeated layouts,
+e.g. the names of the files created by the same instrument, like
+'MSC########_########_####_*.xml', which differ only by their digits. The
+shape of a string is the string with all digits replaced by '0' (thus of the
+same length), and all strings of the same shape have the same tokens (see
+module Tokens) except for the values of the digit runs. Therefore the date and
+time stamp grammars can be matched against the shape only once, giving the
+ordered list of the candidate placements of the stamps: the pattern and the
+positions of the fields, in exactly the same order of priority and occurrence
+as used by the function ResolveDateTimeTuple(). A string of the known shape is
+resolved by slicing its fields at the remembered positions and checking their
+values against the allowed values of the fields; the first candidate passing
+the range checks is the stamp, and if none passes the stamp is not found.
+
+The candidate placements are cached per shape with the least recently used
+eviction; the shapes with too many candidates (e.g. long sequences of short
+digit runs and separators) are not planned at all, and such strings are
+resolved by the regular expression patterns instead.
+
+Globals:
+    MASK_TABLE - str, translation table of the byte strings replacing the
+        digits by '0'
+    UNICODE_MASK_TABLE - dict(int -> int), the same for the unicode strings
+    FIELD_LENGTHS - dict(frozenset(str) -> frozenset(int)), the allowed
+        lengths of the fields
+    MAX_CANDIDATES - int, default maximum number of the candidate placements
+        of a shape
+
+Functions:
+    MakeShape()
+        str -> str
+    MakePlan()
+        str, int -> tuple(tuple(tuple(tuple(int, int, frozenset(str))),
+            tuple(tuple(int, int) OR None), str OR None)) x2 OR None
+    ApplyPlan()
+        tuple(tuple(tuple(tuple(int, int, frozenset(str))),
+            tuple(tuple(int, int) OR None), str OR None)), str
+                -> tuple(tuple(tuple(int, int) OR None), str OR None) OR None
+
+Classes:
+    ShapeCache
+"""
+
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+
+#imports
+
+#+ package modules
+
+from .Date import ConvertDateFieldsTuple
+
+from .Time import ConvertTimeFieldsTuple
+
+from .Stamp import ResolveDateTimeTuple, IncrementDate
+
+from .Cache import StampCache
+
+from .Tokens import Tokenize, MatchModifier, DATE_SEPARATORS, \
+            FRACTION_SEPARATORS, DATE_GRAMMAR, YEARS, SHORT_YEARS, MONTHS, \
+            DAYS, SCREWED_DAYS, HOURS, MINUTES, SECONDS, COMPACT_MONTHS, \
+            COMPACT_DAYS, COMPACT_HOURS, COMPACT_MINUTES, COMPACT_SECONDS
+
+#globals
+
+MASK_TABLE = ''.join('0' if chr(iCode) in '0123456789' else chr(iCode)
+                                                    for iCode in range(256))
+
+UNICODE_MASK_TABLE = dict((iCode, ord('0')) for iCode in range(ord('0'),
+                                                                ord('9') + 1))
+
+FIELD_LENGTHS = dict((setValues, frozenset(len(strItem)
+                                                for strItem in setValues))
+                    for setValues in (YEARS, SHORT_YEARS, MONTHS, DAYS,
+                            SCREWED_DAYS, HOURS, MINUTES, SECONDS,
+                            COMPACT_MONTHS, COMPACT_DAYS, COMPACT_HOURS,
+                                            COMPACT_MINUTES, COMPACT_SECONDS))
+
+MAX_CANDIDATES = 64
+
+#functions
+
+def MakeShape(strStamp):
+    """
+    Returns the shape of the passed string, i.e. the string of the same length
+    with all digits replaced by '0'.
+    
+    Signature:
+        str -> str
+    
+    Version 0.2.0.0
+    """
+    if isinstance(strStamp, unicode):
+        return strStamp.translate(UNICODE_MASK_TABLE)
+    return strStamp.translate(MASK_TABLE)
+
+def MakePlan(strShape, iMaxCandidates = MAX_CANDIDATES):
+    """
+    Matches the date and time stamp grammars against the tokens of the passed
+    shape, see functions MatchDate() and MatchTime() of the module Tokens, but
+    with only the structural conditions (the separators, the number of digits
+    of the fields and the a.m. / p.m. modifier) applied. The found placements
+    are listed in the order, in which they are checked by those functions, each
+    as a tuple of:
+        the range checks - tuple of the start and end positions of a field and
+            its allowed values
+        the positions of the fields - the start and end positions of the
+            year, month and day, or of the hour, minute and second (None if
+            absent, including the fractional part if present)
+        the found a.m. / p.m. modifier in the upper case or None
+    
+    Signature:
+        str, int -> tuple(tuple(tuple(tuple(int, int, frozenset(str))),
+            tuple(tuple(int, int) OR None), str OR None)) x2 OR None
+    
+    Args:
+        strShape: str, the shape of the strings, see function MakeShape()
+        iMaxCandidates: (optional) int > 0, the maximum number of the
+            candidate placements, defaults to MAX_CANDIDATES
+    
+    Returns:
+        tuple(tuple(...), tuple(...)): unpacked tuple of the date and the time
+            candidate placements
+        None: there are more candidate placements than the maximum number
+    
+    Version 0.2.0.0
+    """
+    lstTokens, iLast = Tokenize(strShape)
+    iTokens = len(lstTokens)
+    lstSpans = []
+    iEnd = 0
+    for tupleToken in lstTokens:
+        iStart = iEnd
+        iEnd += len(''.join(tupleToken))
+        lstSpans.append((iStart, iEnd))
+    lstRuns = [iIndex for iIndex in xrange(min(iLast, iTokens - 1), -1, -1)
+                                                    if lstTokens[iIndex][0]]
+    lstDate = []
+    lstTime = []
+    #+ ISO_DATE, REVERSED_DATE, SCREWED_DATE and SHORT_DATE
+    lstFields = [(lstSpans[iIndex], lstSpans[iIndex + 2],
+                                                    lstSpans[iIndex + 4])
+                    for iIndex in lstRuns
+                        if (iIndex + 4 < iTokens and
+                            lstTokens[iIndex + 1][1] in DATE_SEPARATORS and
+                            lstTokens[iIndex + 3][1] in DATE_SEPARATORS and
+                                lstTokens[iIndex + 2][0] and
+                                                    lstTokens[iIndex + 4][0])]
+    for setFirst, setSecond, setThird, tuplePositions in DATE_GRAMMAR:
+        setFirstLengths = FIELD_LENGTHS[setFirst]
+        setSecondLengths = FIELD_LENGTHS[setSecond]
+        setThirdLengths = FIELD_LENGTHS[setThird]
+        for tupleFields in lstFields:
+            tupleFirst, tupleSecond, tupleThird = tupleFields
+            if ((tupleFirst[1] - tupleFirst[0]) in setFirstLengths and
+                    (tupleSecond[1] - tupleSecond[0]) in setSecondLengths and
+                        (tupleThird[1] - tupleThird[0]) in setThirdLengths):
+                lstDate.append(((tupleFirst + (setFirst, ),
+                                    tupleSecond + (setSecond, ),
+                                        tupleThird + (setThird, )),
+                                    (tupleFields[tuplePositions[0]],
+                                        tupleFields[tuplePositions[1]],
+                                            tupleFields[tuplePositions[2]]),
+                                                                        None))
+        if len(lstDate) > iMaxCandidates:
+            return None
+    #+ COMPACT_DATE
+    for iIndex in lstRuns:
+        iStart, iEnd = lstSpans[iIndex]
+        if iEnd - iStart == 8:
+            lstDate.append((((iStart, iStart + 4, YEARS),
+                                (iStart + 4, iStart + 6, COMPACT_MONTHS),
+                                (iStart + 6, iEnd, COMPACT_DAYS)),
+                                ((iStart, iStart + 4), (iStart + 4, iStart + 6),
+                                                    (iStart + 6, iEnd)), None))
+    #+ H?H:M?M:S?S
+    for iIndex in lstRuns:
+        if (iIndex + 4 < iTokens and lstTokens[iIndex + 1][1] == ':' and
+                                    lstTokens[iIndex + 3][1] == ':' and
+                                    lstTokens[iIndex + 2][0] and
+                                                    lstTokens[iIndex + 4][0]):
+            tupleHour = lstSpans[iIndex]
+            tupleMinute = lstSpans[iIndex + 2]
+            tupleSecond = lstSpans[iIndex + 4]
+            if ((tupleHour[1] - tupleHour[0]) in FIELD_LENGTHS[HOURS] and
+                (tupleMinute[1] - tupleMinute[0]) in FIELD_LENGTHS[MINUTES] and
+                (tupleSecond[1] - tupleSecond[0]) in FIELD_LENGTHS[SECONDS]):
+                tupleChecks = (tupleHour + (HOURS, ),
+                        tupleMinute + (MINUTES, ), tupleSecond + (SECONDS, ))
+                iNext = iIndex + 5
+                if (iNext + 1 < iTokens and
+                        lstTokens[iNext][1] in FRACTION_SEPARATORS and
+                                                    lstTokens[iNext + 1][0]):
+                    tupleSecond = (tupleSecond[0], lstSpans[iNext + 1][1])
+                    iNext += 2
+                _, strModifier = MatchModifier(lstTokens, iNext, False)
+                lstTime.append((tupleChecks,
+                            (tupleHour, tupleMinute, tupleSecond), strModifier))
+    #+ H?H:M?M, not preceded by ':'
+    for iIndex in lstRuns:
+        if (iIndex + 2 < iTokens and lstTokens[iIndex + 1][1] == ':' and
+                    (iIndex == 0 or lstTokens[iIndex - 1][1] != ':') and
+                                                    lstTokens[iIndex + 2][0]):
+            tupleHour = lstSpans[iIndex]
+            tupleMinute = lstSpans[iIndex + 2]
+            bMatched, strModifier = MatchModifier(lstTokens, iIndex + 3, True)
+            if (bMatched and
+                (tupleHour[1] - tupleHour[0]) in FIELD_LENGTHS[HOURS] and
+                (tupleMinute[1] - tupleMinute[0]) in FIELD_LENGTHS[MINUTES]):
+                lstTime.append(((tupleHour + (HOURS, ),
+                                    tupleMinute + (MINUTES, )),
+                                (tupleHour, tupleMinute, None), strModifier))
+    #+ HHMMSS and HHMM
+    for iLength in (6, 4):
+        for iIndex in lstRuns:
+            iStart, iEnd = lstSpans[iIndex]
+            if iEnd - iStart == iLength:
+                tupleFields = ((iStart, iStart + 2), (iStart + 2, iStart + 4))
+                tupleChecks = ((iStart, iStart + 2, COMPACT_HOURS),
+                                    (iStart + 2, iStart + 4, COMPACT_MINUTES))
+                if iLength == 6:
+                    tupleFields += ((iStart + 4, iEnd), )
+                    tupleChecks += ((iStart + 4, iEnd, COMPACT_SECONDS), )
+                else:
+                    tupleFields += (None, )
+                lstTime.append((tupleChecks, tupleFields, None))
+    if len(lstDate) + len(lstTime) > iMaxCandidates:
+        return None
+    return tuple(lstDate), tuple(lstTime)
+
+def ApplyPlan(tupleCandidates, strStamp):
+    """
+    Finds the first candidate placement, which fields of the passed string all
+    have the allowed values.
+    
+    Signature:
+        tuple(tuple(tuple(tuple(int, int, frozenset(str))),
+            tuple(tuple(int, int) OR None), str OR None)), str
+                -> tuple(tuple(tuple(int, int) OR None), str OR None) OR None
+    
+    Args:
+        tupleCandidates: tuple(...), the date or time candidate placements,
+            see function MakePlan()
+        strStamp: str, the string of the planned shape
+    
+    Returns:
+        tuple(tuple(tuple(int, int) OR None), str OR None): unpacked tuple, the
+            positions of the fields and the modifier of the found placement
+        None: none of the candidate placements passes the range checks
+    
+    Version 0.2.0.0
+    """
+    for tupleChecks, tupleFields, strModifier in tupleCandidates:
+        for iStart, iEnd, setValues in tupleChecks:
+            if not (strStamp[iStart:iEnd] in setValues):
+                break
+        else:
+            return tupleFields, strModifier
+    return None
+
+#classes
+
+class ShapeCache(object):
+    """
+    Callable resolver of both the date and the time stamps with the same
+    results as of the function ResolveDateTimeTuple() of the module Stamp,
+    which remembers the candidate placements of the stamps (the pattern and
+    the positions of the fields, see function MakePlan()) for at most MaxSize
+    most recently used shapes of the strings. A string of a remembered shape
+    is resolved by slicing of the fields and the range checks of their values
+    only. The shapes with more than MaxCandidates candidate placements are
+    remembered as not planned, and such strings are resolved by the function
+    ResolveDateTimeTuple() as the fallback.
+    
+    Any not string argument is passed to the function ResolveDateTimeTuple()
+    directly, so its TypeError exception is raised as usual. The instances are
+    not thread-safe.
+    
+    Usage:
+        objCache = ShapeCache(256)
+        tupleResult = objCache('MSC00000001_20170502_1448_PROGRAMMING_PASS.xml')
+    
+    Attributes:
+        MaxSize: int > 0, the maximum number of the remembered shapes
+        MaxCandidates: int > 0, the maximum number of the candidate placements
+            of a shape
+        Fallbacks: int >= 0, number of the calls resolved by the fallback
+            function
+    
+    Methods:
+        __call__(strStamp)
+            str -> tuple(int, int, int, int OR None, int OR None, int OR None,
+                                                    int OR None, bool) OR None
+        Clear()
+            None -> None
+        GetStatistics()
+            None -> dict(str -> int OR float)
+    
+    Version 0.2.0.0
+    """
+    
+    def __init__(self, iMaxSize = 1024, iMaxCandidates = MAX_CANDIDATES):
+        """
+        Initialization.
+        
+        Signature:
+            int, int -> None
+        
+        Args:
+            iMaxSize: (optional) int > 0, the maximum number of the remembered
+                shapes, defaults to 1024
+            iMaxCandidates: (optional) int > 0, the maximum number of the
+                candidate placements of a shape, defaults to MAX_CANDIDATES
+        
+        Raises:
+            TypeError: any of the arguments is not an integer
+            ValueError: any of the arguments is not positive
+        
+        Version 0.2.0.0
+        """
+        if ((not isinstance(iMaxCandidates, (int, long))) or
+                                            isinstance(iMaxCandidates, bool)):
+            strError = '{} of {} is not an integer'.format(iMaxCandidates,
+                                                        type(iMaxCandidates))
+            raise TypeError(strError)
+        if iMaxCandidates < 1:
+            strError = 'candidates number {} is not positive'.format(
+                                                                iMaxCandidates)
+            raise ValueError(strError)
+        self.MaxCandidates = iMaxCandidates
+        self._objPlans = StampCache(
+                    lambda strShape : MakePlan(strShape, iMaxCandidates),
+                                                                    iMaxSize)
+        self.MaxSize = iMaxSize
+        self.Fallbacks = 0
+    
+    def __len__(self):
+        """
+        Returns the current number of the remembered shapes.
+        
+        Signature:
+            None -> int
+        
+        Version 0.2.0.0
+        """
+        return len(self._objPlans)
+    
+    def __call__(self, strStamp):
+        """
+        Resolves both the date and the time stamps in the passed string exactly
+        as the function ResolveDateTimeTuple() of the module Stamp, but using
+        the remembered candidate placements of the stamps for the shape of the
+        string.
+        
+        Signature:
+            str -> tuple(int, int, int, int OR None, int OR None, int OR None,
+                                                    int OR None, bool) OR None
+        
+        Returns:
+            tuple(int, int, int, int, int, int, int, bool): the year, month,
+                day, hour, minute, rounded second, microseconds and the boolean
+                flag if the date has been incremented due to rounding up of the
+                seconds
+            tuple(int, int, int, None, None, None, None, bool): the time stamp
+                is not found, the flag is False
+            None: the date stamp is not found
+        
+        Raises:
+            TypeError: if the passed argument is not a string.
+        
+        Version 0.2.0.0
+        """
+        if not isinstance(strStamp, basestring):
+            return ResolveDateTimeTuple(strStamp)
+        tuplePlan = self._objPlans(MakeShape(strStamp))
+        if tuplePlan is None:
+            self.Fallbacks += 1
+            return ResolveDateTimeTuple(strStamp)
+        tupleFound = ApplyPlan(tuplePlan[0], strStamp)
+        if tupleFound is None:
+            return None
+        (iStart, iEnd), (iStart2, iEnd2), (iStart3, iEnd3) = tupleFound[0]
+        iYear, iMonth, iDay = ConvertDateFieldsTuple(strStamp[iStart:iEnd],
+                            strStamp[iStart2:iEnd2], strStamp[iStart3:iEnd3])
+        tupleFound = ApplyPlan(tuplePlan[1], strStamp)
+        if not (tupleFound is None):
+            (iStart, iEnd), (iStart2, iEnd2), tupleSecond = tupleFound[0]
+            if tupleSecond is None:
+                strSecond = None
+            else:
+                strSecond = strStamp[tupleSecond[0]:tupleSecond[1]]
+            tupleFound = ConvertTimeFieldsTuple(strStamp[iStart:iEnd],
+                        strStamp[iStart2:iEnd2], strSecond, tupleFound[1])
+        if tupleFound is None:
+            return iYear, iMonth, iDay, None, None, None, None, False
+        iHour, iMinute, iSecond, iMicrosecond, bIncrementDate = tupleFound
+        if bIncrementDate:
+            iYear, iMonth, iDay = IncrementDate(iYear, iMonth, iDay)
+        return (iYear, iMonth, iDay, iHour, iMinute, iSecond, iMicrosecond,
+                                                                bIncrementDate)
+    
+    def Clear(self):
+        """
+        Removes all remembered shapes and resets the counters.
+        
+        Signature:
+            None -> None
+        
+        Version 0.2.0.0
+        """
+        self._objPlans.Clear()
+        self.Fallbacks = 0
+    
+    def GetStatistics(self):
+        """
+        Returns the cache usage statistics.
+        
+        Signature:
+            None -> dict(str -> int OR float)
+        
+        Returns:
+            dict(str -> int OR float): with the keys 'Hits' (number of the
+                calls with a remembered shape), 'Misses' (number of the calls
+                with a new shape), 'Evictions', 'Size' (current number of the
+                remembered shapes), 'MaxSize', 'HitRate' (fraction of the calls
+                with a remembered shape, 0.0 if there were no calls),
+                'Fallbacks' (number of the calls resolved by the function
+                ResolveDateTimeTuple())
+        
+        Version 0.2.0.0
+        """
+        dictResult = self._objPlans.GetStatistics()
+        dictResult['Fallbacks'] = self.Fallbacks
+        return dictResult
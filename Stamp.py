@@ -0,0 +1,197 @@
+#!/usr/bin/python
+"""
+Module regex_lib.Stamp
+
+Combined resolution of the date and time stamps in a single pass over the
+string, with the date increment due to the rounding of the seconds applied to
+the date.
+
+Patterns:
+    DATETIME_UNION - all date and time core stamp patterns combined into a
+        single grouped union search pattern: the date patterns group in the
+        order of priority used by ResolveDate() and the time patterns group in
+        the order of priority used by ResolveTime(), see module Search
+
+Compiled patterns (compiled on the first use, see Search.LazyPattern):
+    C_DATETIME_UNION
+
+Globals:
+    DATETIME_CAPTURES - tuple(tuple(int, int)), the group index (0 - date, 1 -
+        time) and the alternative index within the group for each capturing
+        group of the union pattern
+
+Functions:
+    ResolveDateTime()
+        str -> str OR None
+    ResolveDateTimeTuple()
+        str -> tuple(int, int, int, int OR None, int OR None, int OR None,
+                                                    int OR None, bool) OR None
+    IncrementDate()
+        int, int, int -> int, int, int
+"""
+
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+
+#imports
+
+#+ standard library
+
+import calendar
+
+#+ package modules
+
+from .Search import MakeUnionGroupsPattern, SearchUnionGroups, LazyPattern
+
+from .Date import ISO_DATE_CORE, REVERSED_DATE_CORE, SCREWED_DATE_CORE, \
+                SHORT_DATE_CORE, COMPACT_DATE_CORE, C_DATE_SEARCH_PATTERNS, \
+                                                        ConvertDateMatchTuple
+
+from .Time import TIME_CORE, SHORT_TIME_CORE, COMPACT_TIME_CORE, \
+                SHORT_COMPACT_TIME_CORE, C_TIME_SEARCH_PATTERNS, \
+                                                        ConvertTimeMatchTuple
+
+#patterns
+
+#+ the optional AM / PM modifier never prevents the match of a time stamp, thus
+#+ the union pattern can be applied to the not converted to the upper case
+#+ string
+
+DATETIME_UNION, DATETIME_CAPTURES = MakeUnionGroupsPattern([
+                                    [(ISO_DATE_CORE, "0-9"),
+                                    (REVERSED_DATE_CORE, "0-9"),
+                                    (SCREWED_DATE_CORE, "0-9"),
+                                    (SHORT_DATE_CORE, "0-9"),
+                                    (COMPACT_DATE_CORE, "0-9")],
+                                    [(TIME_CORE, "0-9"),
+                                    (SHORT_TIME_CORE, "0-9:"),
+                                    (COMPACT_TIME_CORE, "0-9"),
+                                    (SHORT_COMPACT_TIME_CORE, "0-9")]])
+
+#compiled patterns
+
+C_DATETIME_UNION = LazyPattern(DATETIME_UNION)
+
+#functions
+
+def IncrementDate(iYear, iMonth, iDay):
+    """
+    Helper function incrementing the date by 1 day, including the month and
+    year rollover. A day beyond the end of the month (e.g. 31st of April, which
+    is accepted by the date patterns) is treated as the last day of the month.
+    
+    Signature:
+        int, int, int -> int, int, int
+    
+    Returns:
+        tuple(int, int, int): unpacked tuple of the year, month and day of the
+            next day
+    
+    Version 0.2.0.0
+    """
+    if iDay < calendar.monthrange(iYear, iMonth)[1]:
+        iDay += 1
+    else:
+        iDay = 1
+        if iMonth < 12:
+            iMonth += 1
+        else:
+            iMonth = 1
+            iYear += 1
+    return iYear, iMonth, iDay
+
+def ResolveDateTimeTuple(strStamp):
+    """
+    Resolves both the date and the time stamps in the passed string with a
+    single pass of the union pattern C_DATETIME_UNION into the tuple of the
+    integer fields of the combined ISO timestamp. The date increment due to
+    the rounding up of the seconds is applied to the date, including the month
+    and year rollover, and it is indicated by the last element of the tuple.
+    
+    The date and time are found and converted exactly as by the functions
+    ResolveDateTuple() and ResolveTimeTuple(), but the upper case conversion
+    required for the a.m. / p.m. modifier is applied only to the part of the
+    string starting with the found time stamp.
+    
+    Signature:
+        str -> tuple(int, int, int, int OR None, int OR None, int OR None,
+                                                    int OR None, bool) OR None
+    
+    Returns:
+        tuple(int, int, int, int, int, int, int, bool): the year, month, day,
+            hour, minute, rounded second, microseconds and the boolean flag if
+            the date has been incremented due to rounding up of the seconds
+        tuple(int, int, int, None, None, None, None, bool): the time stamp is
+            not found, the flag is False
+        None: the date stamp is not found
+    
+    Raises:
+        TypeError: if the passed argument is not a string.
+    
+    Version 0.2.0.0
+    """
+    if not isinstance(strStamp, basestring):
+        strError = '{} of {} is not a string'.format(strStamp, type(strStamp))
+        raise TypeError(strError)
+    tupleDate, tupleTime = SearchUnionGroups(C_DATETIME_UNION,
+                                                DATETIME_CAPTURES, strStamp)
+    if tupleDate is None:
+        return None
+    iIndex, iStart = tupleDate
+    iYear, iMonth, iDay = ConvertDateMatchTuple(
+                        C_DATE_SEARCH_PATTERNS[iIndex].match(strStamp, iStart))
+    if tupleTime is None:
+        return iYear, iMonth, iDay, None, None, None, None, False
+    iIndex, iStart = tupleTime
+    objPattern = C_TIME_SEARCH_PATTERNS[iIndex]
+    if 'modifier' in objPattern.groupindex:
+        #+ the preceding character is kept for the look-behind assertion
+        iOffset = min(iStart, 1)
+        objMatch = objPattern.match(strStamp[iStart - iOffset:].upper(),
+                                                                    iOffset)
+    else:
+        objMatch = objPattern.match(strStamp, iStart)
+    tupleResult = ConvertTimeMatchTuple(objMatch)
+    if tupleResult is None:
+        return iYear, iMonth, iDay, None, None, None, None, False
+    iHour, iMinute, iSecond, iMicrosecond, bIncrementDate = tupleResult
+    if bIncrementDate:
+        iYear, iMonth, iDay = IncrementDate(iYear, iMonth, iDay)
+    return (iYear, iMonth, iDay, iHour, iMinute, iSecond, iMicrosecond,
+                                                                bIncrementDate)
+
+def ResolveDateTime(strStamp):
+    """
+    Resolves both the date and the time stamps in the passed string with a
+    single pass of the union pattern C_DATETIME_UNION, and combines them into
+    a single ISO timestamp 'YYYY-MM-DDTHH:MM:SS'. The date increment due to
+    the rounding up of the seconds is applied to the date, including the month
+    and year rollover.
+    
+    The date and time are found and converted exactly as by the functions
+    ResolveDate() and ResolveTime(), but the upper case conversion required for
+    the a.m. / p.m. modifier is applied only to the part of the string starting
+    with the found time stamp. Wrapper formatting the result of the function
+    ResolveDateTimeTuple().
+    
+    Signature:
+        str -> str OR None
+    
+    Returns:
+        str: the resolved date and time stamps in ISO format
+            'YYYY-MM-DDTHH:MM:SS', or only the date stamp 'YYYY-MM-DD' if the
+            time stamp is not found
+        None: the date stamp is not found
+    
+    Raises:
+        TypeError: if the passed argument is not a string.
+    
+    Version 0.2.0.0
+    """
+    tupleResult = ResolveDateTimeTuple(strStamp)
+    if tupleResult is None:
+        return None
+    if tupleResult[3] is None:
+        return "{0}-{1:02}-{2:02}".format(*tupleResult)
+    return "{0}-{1:02}-{2:02}T{3:02}:{4:02}:{5:02}".format(*tupleResult)
@@ -0,0 +1,481 @@
+#!/usr/bin/python
+"""
+Module regex_lib.Stream
+
+Resolution of the date / time stamps in the lines of a stream of data, e.g.
+the instrument logs received over TCP, without stalling the event loop of the
+receiving application by the large bursts of data.
+
+The class StreamResolver is fed with the received chunks of data (of any
+size, not aligned with the lines) from the event loop callbacks, e.g. the
+method handle_read() of an asyncore.dispatcher. The complete lines are grouped
+into batches, and each full batch is either resolved immediately or submitted
+to an executor - any object with the method apply_async() of the pools of the
+module multiprocessing, e.g. multiprocessing.Pool (worker processes) or
+multiprocessing.pool.ThreadPool - so the event loop only splits the lines.
+The records of the resolved batches are collected in the order of the lines,
+without blocking, at any time. The number of the submitted but not collected
+batches is limited: when the limit is reached, the resolver is paused, and the
+event loop should stop reading from the socket (e.g. the method readable() of
+the dispatcher returns False) until the records are collected, so the TCP flow
+control slows down the sender (backpressure).
+
+The function ResolveStream() is the blocking (generator) version for a socket
+or a file object, which waits for the oldest submitted batch instead of
+reading more data while the resolver is paused.
+
+The records are the same as of the function Scanner.ScanFile(): the line
+number (starting with 1), the byte offset of the line from the beginning of
+the stream, the resolved date and time stamps and the date increment flag.
+
+Globals:
+    BATCH_SIZE - int, default number of the lines per batch
+    MAX_PENDING - int, default maximum number of the submitted but not
+        collected batches
+    CHUNK_SIZE - int, default size of the received / read chunks in bytes
+
+Functions:
+    ResolveBatch()
+        list(tuple(int, int, str)), bool -> list(tuple(int, int, str OR None,
+            str OR None, bool))
+    SubmitBatch()
+        type A OR None, list(tuple(int, int, str)), bool
+            -> tuple(type B OR None, list(tuple(int, int, str OR None,
+                str OR None, bool)) OR None)
+    ResolveStream()
+        socket OR file, type A OR None, int, int, int, bool
+            -> generator(tuple(int, int, str OR None, str OR None, bool))
+    GenerateStream()
+        socket OR file, StreamResolver, int
+            -> generator(tuple(int, int, str OR None, str OR None, bool))
+
+Classes:
+    StreamResolver
+"""
+
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+
+#imports
+
+#+ standard library
+
+import collections
+import itertools
+
+#+ package modules
+
+from .Date import ResolveDates
+
+from .Time import ResolveTimes
+
+#globals
+
+BATCH_SIZE = 256
+
+MAX_PENDING = 4
+
+CHUNK_SIZE = 65536
+
+#functions
+
+def ResolveBatch(lstLines, bUnion = False):
+    """
+    Resolves the date and time stamps in a batch of the lines, executed by the
+    executor (e.g. a worker process) or directly.
+    
+    Signature:
+        list(tuple(int, int, str)), bool -> list(tuple(int, int, str OR None,
+            str OR None, bool))
+    
+    Args:
+        lstLines: list(tuple(int, int, str)), the line numbers, offsets and
+            the lines themselves
+        bUnion: (optional) bool, flag if the single pass union patterns are
+            used, defaults to False
+    
+    Returns:
+        list(tuple(int, int, str OR None, str OR None, bool)): records of the
+            line number, byte offset of the line, resolved date stamp, resolved
+            time stamp and the date increment flag for each line
+    
+    Version 0.2.0.0
+    """
+    lstStrings = [strLine for _, _, strLine in lstLines]
+    lstDates = ResolveDates(lstStrings, bUnion = bUnion)
+    lstTimes = ResolveTimes(lstStrings, bUnion = bUnion)
+    return [(iLine, iOffset, strDate, strTime, bIncrementDate)
+                for (iLine, iOffset, _), strDate, (strTime, bIncrementDate)
+                                    in itertools.izip(lstLines, lstDates,
+                                                                    lstTimes)]
+
+def SubmitBatch(objExecutor, lstBatch, bUnion):
+    """
+    Resolves the batch of the lines directly (no executor) or submits it to
+    the executor.
+    
+    Signature:
+        type A OR None, list(tuple(int, int, str)), bool
+            -> tuple(type B OR None, list(tuple(int, int, str OR None,
+                str OR None, bool)) OR None)
+    
+    Returns:
+        tuple(None, list(tuple(int, int, str OR None, str OR None, bool))): the
+            records of the directly resolved batch
+        tuple(type B, None): the asynchronous result returned by the method
+            apply_async() of the executor
+    
+    Version 0.2.0.0
+    """
+    if objExecutor is None:
+        return None, ResolveBatch(lstBatch, bUnion)
+    return objExecutor.apply_async(ResolveBatch, (lstBatch, bUnion)), None
+
+def ResolveStream(gSource, objExecutor = None, iBatchSize = BATCH_SIZE,
+                    iMaxPending = MAX_PENDING, iChunkSize = CHUNK_SIZE,
+                                                            bUnion = False):
+    """
+    Receives / reads the data from the passed socket or file object in chunks
+    until its end, and resolves the date and time stamps in its lines with a
+    StreamResolver. The records are generated lazily in the order of the
+    lines, as soon as their batches are resolved. While the resolver is paused
+    the oldest submitted batch is waited for instead of reading more data.
+    
+    The source is not closed.
+    
+    Signature:
+        socket OR file, type A OR None, int, int, int, bool
+            -> generator(tuple(int, int, str OR None, str OR None, bool))
+    
+    Args:
+        gSource: socket OR file, any object with the method recv(int) (e.g. a
+            connected socket in the blocking mode) or read(int) (e.g. a file
+            opened in the binary mode); the empty chunk indicates the end
+        objExecutor: (optional) type A OR None, the executor of the batches,
+            see StreamResolver, defaults to None (resolved directly)
+        iBatchSize: (optional) int > 0, the number of the lines per batch,
+            defaults to BATCH_SIZE
+        iMaxPending: (optional) int > 0, the maximum number of the submitted
+            but not collected batches, defaults to MAX_PENDING
+        iChunkSize: (optional) int > 0, the size of the received / read
+            chunks, defaults to CHUNK_SIZE
+        bUnion: (optional) bool, flag if the single pass union patterns are
+            used, defaults to False
+    
+    Returns:
+        generator(tuple(int, int, str OR None, str OR None, bool)): records of
+            the line number, byte offset of the line, resolved date stamp in
+            ISO format 'YYYY-MM-DD' or None, resolved time stamp in ISO format
+            'HH:MM:SS' or None and the date increment flag
+    
+    Raises:
+        TypeError: the source has neither the method recv() nor read(), the
+            executor has no method apply_async(), or a size is not an integer
+        ValueError: a size is not positive
+        socket.error, IOError: the data cannot be received / read - raised
+            during the iteration
+    
+    Version 0.2.0.0
+    """
+    if not (callable(getattr(gSource, 'recv', None)) or
+                                    callable(getattr(gSource, 'read', None))):
+        strError = '{} of {} is neither a socket nor a file'.format(gSource,
+                                                                type(gSource))
+        raise TypeError(strError)
+    if (not isinstance(iChunkSize, (int, long))) or isinstance(iChunkSize,
+                                                                        bool):
+        strError = '{} of {} is not an integer'.format(iChunkSize,
+                                                            type(iChunkSize))
+        raise TypeError(strError)
+    if iChunkSize < 1:
+        strError = 'chunk size {} is not positive'.format(iChunkSize)
+        raise ValueError(strError)
+    objResolver = StreamResolver(objExecutor, iBatchSize, iMaxPending, bUnion)
+    return GenerateStream(gSource, objResolver, iChunkSize)
+
+def GenerateStream(gSource, objResolver, iChunkSize):
+    """
+    Generator implementing the function ResolveStream(), the arguments are not
+    checked.
+    
+    Signature:
+        socket OR file, StreamResolver, int
+            -> generator(tuple(int, int, str OR None, str OR None, bool))
+    
+    Version 0.2.0.0
+    """
+    fReceive = getattr(gSource, 'recv', None)
+    if not callable(fReceive):
+        fReceive = gSource.read
+    while True:
+        if objResolver.Paused:
+            lstRecords = objResolver.GetRecords(True)
+        else:
+            strChunk = fReceive(iChunkSize)
+            if not strChunk:
+                break
+            objResolver.Feed(strChunk)
+            lstRecords = objResolver.GetRecords()
+        for tupleRecord in lstRecords:
+            yield tupleRecord
+    objResolver.Close()
+    while not objResolver.Finished:
+        for tupleRecord in objResolver.GetRecords(True):
+            yield tupleRecord
+
+#classes
+
+class StreamResolver(object):
+    """
+    Incremental resolver of the date / time stamps in the lines of a stream of
+    data fed in chunks, with the batches of the lines resolved directly or
+    submitted to an executor, and with the limited number of the submitted but
+    not collected batches (backpressure).
+    
+    The line ending characters ('\\n' and the preceding '\\r') are not passed
+    to the resolution functions; the last, not terminated line is resolved
+    only after the method Close() is called, if it is not empty. The instances
+    are not thread-safe: all methods must be called from the same thread, e.g.
+    the thread of the event loop.
+    
+    Usage:
+        objResolver = StreamResolver(multiprocessing.Pool(2))
+        #+ event loop callbacks
+        objResolver.Feed(strReceivedData)
+        bReadMore = not objResolver.Paused
+        for tupleRecord in objResolver.GetRecords():
+            ...
+    
+    Attributes:
+        Executor: type A OR None, the executor of the batches or None
+        BatchSize: int > 0, the number of the lines per batch
+        MaxPending: int > 0, the maximum number of the submitted but not
+            collected batches
+        Union: bool, flag if the single pass union patterns are used
+        Lines: int >= 0, number of the split lines
+        Batches: int >= 0, number of the submitted batches
+        Pending: int >= 0, number of the submitted but not collected batches
+            (read-only property)
+        Paused: bool, flag if the limit of the pending batches is reached,
+            i.e. no data should be fed until the records are collected
+            (read-only property)
+        Closed: bool, flag if the end of the stream is indicated
+        Finished: bool, flag if the stream is closed and all records are
+            collected (read-only property)
+    
+    Methods:
+        Feed(strData)
+            str -> None
+        Close()
+            None -> None
+        GetRecords(bWait = False)
+            bool -> list(tuple(int, int, str OR None, str OR None, bool))
+    
+    Version 0.2.0.0
+    """
+    
+    def __init__(self, objExecutor = None, iBatchSize = BATCH_SIZE,
+                                    iMaxPending = MAX_PENDING, bUnion = False):
+        """
+        Initialization.
+        
+        Signature:
+            type A OR None, int, int, bool -> None
+        
+        Args:
+            objExecutor: (optional) type A OR None, any object with the method
+                apply_async(function, tuple) returning an object with the
+                methods ready() and get(), e.g. multiprocessing.Pool or
+                multiprocessing.pool.ThreadPool, defaults to None - the batches
+                are resolved directly by the method Feed()
+            iBatchSize: (optional) int > 0, the number of the lines per batch,
+                defaults to BATCH_SIZE
+            iMaxPending: (optional) int > 0, the maximum number of the
+                submitted but not collected batches, defaults to MAX_PENDING
+            bUnion: (optional) bool, flag if the single pass union patterns
+                are used, defaults to False
+        
+        Raises:
+            TypeError: the executor has no method apply_async(), or a size is
+                not an integer
+            ValueError: a size is not positive
+        
+        Version 0.2.0.0
+        """
+        if not ((objExecutor is None) or
+                        callable(getattr(objExecutor, 'apply_async', None))):
+            strError = '{} of {} is not an executor'.format(objExecutor,
+                                                            type(objExecutor))
+            raise TypeError(strError)
+        for iValue in [iBatchSize, iMaxPending]:
+            if (not isinstance(iValue, (int, long))) or isinstance(iValue,
+                                                                        bool):
+                strError = '{} of {} is not an integer'.format(iValue,
+                                                                type(iValue))
+                raise TypeError(strError)
+            if iValue < 1:
+                strError = '{} is not positive'.format(iValue)
+                raise ValueError(strError)
+        self.Executor = objExecutor
+        self.BatchSize = iBatchSize
+        self.MaxPending = iMaxPending
+        self.Union = bUnion
+        self.Lines = 0
+        self.Batches = 0
+        self.Closed = False
+        self._iOffset = 0
+        self._strTail = None
+        self._lstBatch = []
+        #+ pairs of the asynchronous result (None if resolved directly) and
+        #+ the records (None if not collected yet)
+        self._dequePending = collections.deque()
+    
+    @property
+    def Pending(self):
+        """
+        Returns the number of the submitted but not collected batches.
+        
+        Signature:
+            None -> int
+        
+        Version 0.2.0.0
+        """
+        return len(self._dequePending)
+    
+    @property
+    def Paused(self):
+        """
+        Returns True if the limit of the submitted but not collected batches is
+        reached, i.e. no data should be fed until the records are collected.
+        
+        Signature:
+            None -> bool
+        
+        Version 0.2.0.0
+        """
+        return len(self._dequePending) >= self.MaxPending
+    
+    @property
+    def Finished(self):
+        """
+        Returns True if the end of the stream is indicated and all records are
+        collected.
+        
+        Signature:
+            None -> bool
+        
+        Version 0.2.0.0
+        """
+        return self.Closed and not self._dequePending
+    
+    def Feed(self, strData):
+        """
+        Splits the passed chunk of the data (continuing the not terminated
+        line of the previous chunk) into the lines, and submits each full batch
+        of the lines. The data may be fed while the resolver is paused, but
+        the number of the pending batches is not limited then.
+        
+        Signature:
+            str -> None
+        
+        Raises:
+            TypeError: the data is not a string
+            ValueError: the stream is already closed
+        
+        Version 0.2.0.0
+        """
+        if not isinstance(strData, basestring):
+            strError = '{} of {} is not a string'.format(strData,
+                                                                type(strData))
+            raise TypeError(strError)
+        if self.Closed:
+            raise ValueError('the stream is closed')
+        if self._strTail is None:
+            lstLines = strData.split('\n')
+        else:
+            lstLines = (self._strTail + strData).split('\n')
+        self._strTail = lstLines.pop()
+        iOffset = self._iOffset
+        iLine = self.Lines
+        lstBatch = self._lstBatch
+        iBatchSize = self.BatchSize
+        for strLine in lstLines:
+            iLine += 1
+            iLength = len(strLine) + 1
+            if strLine.endswith('\r'):
+                strLine = strLine[:-1]
+            lstBatch.append((iLine, iOffset, strLine))
+            iOffset += iLength
+            if len(lstBatch) >= iBatchSize:
+                self.Batches += 1
+                self._dequePending.append(SubmitBatch(self.Executor, lstBatch,
+                                                                self.Union))
+                lstBatch = []
+        self._iOffset = iOffset
+        self.Lines = iLine
+        self._lstBatch = lstBatch
+    
+    def Close(self):
+        """
+        Indicates the end of the stream: the last, not terminated line (if not
+        empty) and the last, not full batch are submitted. Calling it again
+        does nothing.
+        
+        Signature:
+            None -> None
+        
+        Version 0.2.0.0
+        """
+        if self.Closed:
+            return
+        self.Closed = True
+        if self._strTail:
+            strLine = self._strTail
+            if strLine.endswith('\r'):
+                strLine = strLine[:-1]
+            self.Lines += 1
+            self._lstBatch.append((self.Lines, self._iOffset, strLine))
+        self._strTail = None
+        if self._lstBatch:
+            self.Batches += 1
+            self._dequePending.append(SubmitBatch(self.Executor,
+                                                self._lstBatch, self.Union))
+            self._lstBatch = []
+    
+    def GetRecords(self, bWait = False):
+        """
+        Collects the records of the resolved batches in the order of the lines,
+        up to the first not yet resolved batch. With the flag set, the oldest
+        pending batch is waited for, if there is any.
+        
+        Signature:
+            bool -> list(tuple(int, int, str OR None, str OR None, bool))
+        
+        Args:
+            bWait: (optional) bool, flag if the oldest pending batch is waited
+                for, defaults to False
+        
+        Returns:
+            list(tuple(int, int, str OR None, str OR None, bool)): records of
+                the line number, byte offset of the line, resolved date stamp,
+                resolved time stamp and the date increment flag, possibly
+                empty
+        
+        Raises:
+            Exception: any exception raised by the executor for the batch
+        
+        Version 0.2.0.0
+        """
+        lstRecords = []
+        dequePending = self._dequePending
+        while dequePending:
+            objResult, lstBatchRecords = dequePending[0]
+            if lstBatchRecords is None:
+                if not (bWait or objResult.ready()):
+                    break
+                lstBatchRecords = objResult.get()
+            dequePending.popleft()
+            lstRecords.extend(lstBatchRecords)
+            bWait = False
+        return lstRecords
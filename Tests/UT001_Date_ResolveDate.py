@@ -1,15 +1,16 @@
 #usr/bin/python
 """
-Set of unit tests for regex_lib.Date.py module, function ResolveDate()
+Set of unit tests for regex_lib.Date.py module, functions ResolveDate(),
+ResolveDateUnion(), ResolveDateTuple() and ScanCompactDate()
 
-Version 0.1.20180509
+Version 0.2.0.0
 """
 
 __author__ = "Anton Azarov"
 __copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
 __license__ = "GPL"
-__version__ = "0.1.20180509"
-__date__ = "09-05-2018"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
 __status__ = "Production"
 __maintainer__ = "a.azarov@diagnoptics.com"
 
@@ -20,13 +21,15 @@ __maintainer__ = "a.azarov@diagnoptics.com"
 import unittest
 import sys
 import os
+import random
 
 #+ tested module and class / function
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
                                                                 '../../..')))
 
-from regex_lib.Date import ResolveDate
+from regex_lib.Date import ResolveDate, ResolveDateUnion, ResolveDateTuple, \
+                                                    ScanCompactDate, FindDates
 
 #+ test cases
 
@@ -43,6 +46,7 @@ class Test_ResolveDate(unittest.TestCase):
         
         Version 0.1.20180509
         """
+        cls.TestFunction = staticmethod(ResolveDate)
         cls.ExceptionCases = [1, None, 1.0, [1], (1, 2), {1 : 2}, True]
         cls.NonMatchingCases = ['120180509', #too long for compact date
                                 '0180509', #too short for compact date
@@ -113,7 +117,7 @@ class Test_ResolveDate(unittest.TestCase):
         Version 0.1.20180509
         """
         for gCase in self.ExceptionCases:
-            self.assertRaises(TypeError, ResolveDate, gCase)
+            self.assertRaises(TypeError, self.TestFunction, gCase)
     
     def test_NotMatches(self):
         """
@@ -123,7 +127,7 @@ class Test_ResolveDate(unittest.TestCase):
         Version 0.1.20180509
         """
         for strCase in self.NonMatchingCases:
-            strTest = ResolveDate(strCase)
+            strTest = self.TestFunction(strCase)
             self.assertIsNone(strTest, msg = 'Case: {} - {} != None'.format(
                                                             strCase, strTest))
     
@@ -135,16 +139,211 @@ class Test_ResolveDate(unittest.TestCase):
         Version 0.1.20180509
         """
         for strCase, strResult in self.MatchingCases:
-            strTest = ResolveDate(strCase)
+            strTest = self.TestFunction(strCase)
             self.assertEqual(strTest, strResult,
                              msg = 'Case: {} - {} != {}'.format(strCase,
                                                             strTest, strResult))
 
+class Test_ResolveDateUnion(Test_ResolveDate):
+    """
+    Unit tests for the regex_lib.Date.ResolveDateUnion() function, which must
+    give the same results as ResolveDate() for the same test cases.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        super(Test_ResolveDateUnion, cls).setUpClass()
+        cls.TestFunction = staticmethod(ResolveDateUnion)
+
+class Test_ResolveDateTuple(Test_ResolveDate):
+    """
+    Unit tests for the regex_lib.Date.ResolveDateTuple() function, which must
+    give the same results as ResolveDate() as the tuples of integers for the
+    same test cases.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        super(Test_ResolveDateTuple, cls).setUpClass()
+        cls.TestFunction = staticmethod(ResolveDateTuple)
+    
+    def test_Matches(self):
+        """
+        Tested function should return the proper year, month and day for the
+        matching strings. Uses MatchingCases attribute as the set of cases.
+        
+        Version 0.2.0.0
+        """
+        for strCase, strResult in self.MatchingCases:
+            tupleTest = self.TestFunction(strCase)
+            tupleResult = tuple(int(strItem)
+                                        for strItem in strResult.split('-'))
+            self.assertEqual(tupleTest, tupleResult,
+                             msg = 'Case: {} - {} != {}'.format(strCase,
+                                                        tupleTest, tupleResult))
+            for iItem in tupleTest:
+                self.assertIsInstance(iItem, int)
+
+class Test_ScanCompactDate(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Date.ScanCompactDate() function.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        cls.ResolvedCases = [('20180509', (2018, 5, 9)),
+                ("MSC00000001_20170502_1448_PROGRAMMING_PASS.xml",
+                                                            (2017, 5, 2)),
+                ('IMG_20180509_143000.jpg', (2018, 5, 9)),
+                ('00180509 19991231', (1999, 12, 31)), #last one
+                ('19991231 20181509', (1999, 12, 31)), #last valid one
+                ('2018-05 20180509', (2018, 5, 9)), #not a separated date
+                ('120180509', None), ('18180509', None), ('no stamp', None),
+                ('', None)]
+        cls.NotResolvedCases = ['2018-05-09', '9_5.2018', '08_05.09',
+                                '20180509 9-15/2018', 'a\n20180509',
+                                u'20180509']
+    
+    def test_Resolved(self):
+        """
+        Tested function should resolve the strings without the separated date
+        stamps, giving the same result as ResolveDateTuple().
+        
+        Version 0.2.0.0
+        """
+        for strCase, gResult in self.ResolvedCases:
+            self.assertEqual(ScanCompactDate(strCase), (True, gResult))
+            self.assertEqual(ResolveDateTuple(strCase), gResult)
+    
+    def test_NotResolved(self):
+        """
+        Tested function should not resolve the strings possibly containing a
+        separated date stamp, the unicode strings and the strings with a new
+        line character.
+        
+        Version 0.2.0.0
+        """
+        for strCase in self.NotResolvedCases:
+            self.assertEqual(ScanCompactDate(strCase), (False, None))
+    
+    def test_SameAsUnion(self):
+        """
+        Whenever resolved, the results of the tested function should be the
+        same as of ResolveDateUnion(), which does not use it, on the random
+        digit-heavy strings.
+        
+        Version 0.2.0.0
+        """
+        objRandom = random.Random(20181018)
+        lstPieces = ['20180509', '00181231', '19991301', '20180230', '123456',
+                            '_', '.', '-', ':', ' ', 'x', '1', '12', '2018']
+        for _ in range(20000):
+            strCase = ''.join(objRandom.choice(lstPieces)
+                                    for _ in range(objRandom.randint(0, 8)))
+            bResolved, gResult = ScanCompactDate(strCase)
+            if bResolved:
+                strResult = ResolveDateUnion(strCase)
+                if gResult is None:
+                    self.assertIsNone(strResult, msg = repr(strCase))
+                else:
+                    self.assertEqual('{}-{:02}-{:02}'.format(*gResult),
+                                                strResult, msg = repr(strCase))
+
+class Test_FindDates(Test_ResolveDate):
+    """
+    Unit tests for the regex_lib.Date.FindDates() function.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        super(Test_FindDates, cls).setUpClass()
+        cls.TestFunction = staticmethod(FindDates)
+        cls.MultipleCases = [
+            ('from 2018-05-09 to 09.05.2018, 20180510\n18/05/11 end',
+                [((5, 15), '2018-05-09'), ((19, 29), '2018-05-09'),
+                    ((31, 39), '2018-05-10'), ((40, 48), '2018-05-11')]),
+            ('2018-05-092018-05-10', []), #not delimited by non-digits
+            ('2018-05-09-2018-05-10', [((0, 10), '2018-05-09'),
+                                                    ((11, 21), '2018-05-10')]),
+            (u'1.13.2018 \u00e9 2018_13_09', [((0, 9), '2018-01-13')]),
+            ('', [])]
+    
+    def test_NotMatches(self):
+        """
+        Tested function should find nothing in the strings not matching any
+        pattern. Uses NonMatchingCases attribute as the set of cases.
+        
+        Version 0.2.0.0
+        """
+        for strCase in self.NonMatchingCases:
+            self.assertEqual(list(self.TestFunction(strCase)), [],
+                                                            msg = strCase)
+    
+    def test_Matches(self):
+        """
+        Tested function should find at least one stamp in the matching
+        strings; each found stamp should be resolved by ResolveDate() into the
+        same value, and the spans should not overlap. Uses MatchingCases
+        attribute as the set of cases.
+        
+        Version 0.2.0.0
+        """
+        for strCase, _ in self.MatchingCases:
+            lstTest = list(self.TestFunction(strCase))
+            self.assertGreater(len(lstTest), 0, msg = strCase)
+            iEnd = 0
+            for (iStart, iStop), strResult in lstTest:
+                self.assertGreaterEqual(iStart, iEnd, msg = strCase)
+                self.assertEqual(ResolveDate(strCase[iStart : iStop]),
+                                                    strResult, msg = strCase)
+                iEnd = iStop
+    
+    def test_Multiple(self):
+        """
+        Tested function should find all non-overlapping stamps from the left
+        to the right with their spans. Uses MultipleCases attribute as the set
+        of cases.
+        
+        Version 0.2.0.0
+        """
+        for strCase, lstResult in self.MultipleCases:
+            self.assertEqual(list(self.TestFunction(strCase)), lstResult,
+                                                            msg = strCase)
+
 #+ test suites
 
 TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_ResolveDate)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_ResolveDateUnion)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_ResolveDateTuple)
+TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_ScanCompactDate)
+TestSuite5 = unittest.TestLoader().loadTestsFromTestCase(Test_FindDates)
 TestSuite = unittest.TestSuite()
-TestSuite.addTests([TestSuite1])
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4,
+                                                                TestSuite5])
 
 #execution entry point
 
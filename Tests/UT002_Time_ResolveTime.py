@@ -1,15 +1,16 @@
 #usr/bin/python
 """
-Set of unit tests for regex_lib.Time.py module, function ResolveTime()
+Set of unit tests for regex_lib.Time.py module, functions ResolveTime(),
+ResolveTimeUnion(), ResolveTimeTuple() and ScanCompactTime()
 
-Version 0.1.20180509
+Version 0.2.0.0
 """
 
 __author__ = "Anton Azarov"
 __copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
 __license__ = "GPL"
-__version__ = "0.1.20180509"
-__date__ = "09-05-2018"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
 __status__ = "Production"
 __maintainer__ = "a.azarov@diagnoptics.com"
 
@@ -20,13 +21,15 @@ __maintainer__ = "a.azarov@diagnoptics.com"
 import unittest
 import sys
 import os
+import random
 
 #+ tested module and class / function
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
                                                                 '../../..')))
 
-from regex_lib.Time import ResolveTime
+from regex_lib.Time import ResolveTime, ResolveTimeUnion, ResolveTimeTuple, \
+                                                    ScanCompactTime, FindTimes
 
 #+ test cases
 
@@ -43,6 +46,7 @@ class Test_ResolveTime(unittest.TestCase):
         
         Version 0.1.20180509
         """
+        cls.TestFunction = staticmethod(ResolveTime)
         cls.ExceptionCases = [1, None, 1.0, [1], (1, 2), {1 : 2}, True]
         cls.NonMatchingCases = ['144', #too short for any compact time
                                 '14444', #neither short compact nor compact
@@ -104,7 +108,7 @@ class Test_ResolveTime(unittest.TestCase):
         Version 0.1.20180509
         """
         for gCase in self.ExceptionCases:
-            self.assertRaises(TypeError, ResolveTime, gCase)
+            self.assertRaises(TypeError, self.TestFunction, gCase)
     
     def test_NotMatches(self):
         """
@@ -114,7 +118,7 @@ class Test_ResolveTime(unittest.TestCase):
         Version 0.1.20180509
         """
         for strCase in self.NonMatchingCases:
-            strTest, _ = ResolveTime(strCase)
+            strTest, _ = self.TestFunction(strCase)
             self.assertIsNone(strTest, msg = 'Case: {} - {} != None'.format(
                                                             strCase, strTest))
     
@@ -126,7 +130,7 @@ class Test_ResolveTime(unittest.TestCase):
         Version 0.1.20180509
         """
         for strCase, strResult in self.MatchingCases:
-            strTest, _ = ResolveTime(strCase)
+            strTest, _ = self.TestFunction(strCase)
             self.assertEqual(strTest, strResult,
                              msg = 'Case: {} - {} != {}'.format(strCase,
                                                             strTest, strResult))
@@ -139,16 +143,274 @@ class Test_ResolveTime(unittest.TestCase):
         Version 0.1.20180509
         """
         for strCase, strResult in self.DateIncrement:
-            _, strTest = ResolveTime(strCase)
+            _, strTest = self.TestFunction(strCase)
             self.assertEqual(strTest, strResult,
                              msg = 'Case: {} - {} != {}'.format(strCase,
                                                             strTest, strResult))
 
+class Test_ResolveTimeUnion(Test_ResolveTime):
+    """
+    Unit tests for the regex_lib.Time.ResolveTimeUnion() function, which must
+    give the same results as ResolveTime() for the same test cases.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        super(Test_ResolveTimeUnion, cls).setUpClass()
+        cls.TestFunction = staticmethod(ResolveTimeUnion)
+
+class Test_ResolveTimeTuple(Test_ResolveTime):
+    """
+    Unit tests for the regex_lib.Time.ResolveTimeTuple() function, which must
+    give the same results as ResolveTime() as the tuples of integers for the
+    same test cases.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        super(Test_ResolveTimeTuple, cls).setUpClass()
+        cls.TestFunction = staticmethod(ResolveTimeTuple)
+        cls.MicrosecondCases = [('12:30:01', 0), ('12:30:01.5', 0),
+                                ('12:30:01,25 pm', 250000), ('12:30', 0),
+                                ('23:59:59.1234567', 123456), ('123001', 0),
+                                ('23:59:59.5', 0), ('12:00:30.4', 400000),
+                                ('12:00:30.6', 0), ('23:59:59.75', 0)]
+    
+    def test_NotMatches(self):
+        """
+        Tested function should return None for the non-matching strings. Uses
+        NonMatchingCases attribute as the set of cases.
+        
+        Version 0.2.0.0
+        """
+        for strCase in self.NonMatchingCases:
+            tupleTest = self.TestFunction(strCase)
+            self.assertIsNone(tupleTest, msg = 'Case: {} - {} != None'.format(
+                                                        strCase, tupleTest))
+    
+    def test_Matches(self):
+        """
+        Tested function should return the proper hour, minute and second for
+        the matching strings. Uses MatchingCases attribute as the set of cases.
+        
+        Version 0.2.0.0
+        """
+        for strCase, strResult in self.MatchingCases:
+            tupleTest = self.TestFunction(strCase)
+            tupleResult = tuple(int(strItem)
+                                        for strItem in strResult.split(':'))
+            self.assertEqual(tupleTest[:3], tupleResult,
+                             msg = 'Case: {} - {} != {}'.format(strCase,
+                                                        tupleTest, tupleResult))
+            self.assertEqual(len(tupleTest), 5)
+    
+    def test_DateIncrement(self):
+        """
+        Tested function should properly treat date increment due to the seconds
+        roundining. Uses DateIncrement attribute as the set of cases.
+        
+        Version 0.2.0.0
+        """
+        for strCase, bResult in self.DateIncrement:
+            bTest = self.TestFunction(strCase)[4]
+            self.assertEqual(bTest, bResult,
+                             msg = 'Case: {} - {} != {}'.format(strCase,
+                                                            bTest, bResult))
+    
+    def test_Microseconds(self):
+        """
+        Tested function should return the fractional part of the seconds as
+        the microseconds, truncated to 6 digits, if the seconds are rounded
+        down, and 0 if they are rounded up, i.e. the exact or the rounded up
+        instant.
+        
+        Version 0.2.0.0
+        """
+        for strCase, iResult in self.MicrosecondCases:
+            self.assertEqual(self.TestFunction(strCase)[3], iResult,
+                                                                msg = strCase)
+        self.assertEqual(self.TestFunction('23:59:59.5'), (0, 0, 0, 0, True))
+        self.assertEqual(self.TestFunction('23:59:59.75'), (0, 0, 0, 0, True))
+        self.assertEqual(self.TestFunction('12:00:30.6'),
+                                                        (12, 0, 31, 0, False))
+        self.assertEqual(self.TestFunction('12:00:30.4'),
+                                                    (12, 0, 30, 400000, False))
+
+class Test_ScanCompactTime(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Time.ScanCompactTime() function.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        cls.ResolvedCases = [('1448', (14, 48, 0, 0, False)),
+                ('144801', (14, 48, 1, 0, False)),
+                ("MSC00000001_20170502_1448_PROGRAMMING_PASS.xml",
+                                                    (14, 48, 0, 0, False)),
+                ('IMG_20180509_143000.jpg', (14, 30, 0, 0, False)),
+                ('120000 1448 2359', (12, 0, 0, 0, False)), #HHMMSS first
+                ('235959 240000', (23, 59, 59, 0, False)), #last valid one
+                ('2018-05-09', (20, 18, 0, 0, False)), #year is also HHMM
+                ('2460', None), ('12345', None), ('no stamp', None),
+                ('', None)]
+        cls.NotResolvedCases = ['12:30', '1:2:3', '20180509 1:30 PM',
+                                'a\n1448', u'1448']
+    
+    def test_Resolved(self):
+        """
+        Tested function should resolve the strings without the ':' separated
+        time stamps, giving the same result as ResolveTimeTuple().
+        
+        Version 0.2.0.0
+        """
+        for strCase, gResult in self.ResolvedCases:
+            self.assertEqual(ScanCompactTime(strCase), (True, gResult))
+            self.assertEqual(ResolveTimeTuple(strCase), gResult)
+    
+    def test_NotResolved(self):
+        """
+        Tested function should not resolve the strings possibly containing a
+        ':' separated time stamp, the unicode strings and the strings with a
+        new line character.
+        
+        Version 0.2.0.0
+        """
+        for strCase in self.NotResolvedCases:
+            self.assertEqual(ScanCompactTime(strCase), (False, None))
+    
+    def test_SameAsUnion(self):
+        """
+        Whenever resolved, the results of the tested function should be the
+        same as of ResolveTimeUnion(), which does not use it, on the random
+        digit-heavy strings.
+        
+        Version 0.2.0.0
+        """
+        objRandom = random.Random(20181018)
+        lstPieces = ['123456', '235959', '2359', '2400', '0960', '20180509',
+                            '_', '.', '-', ':', ' ', 'x', '1', '12', ' PM']
+        for _ in range(20000):
+            strCase = ''.join(objRandom.choice(lstPieces)
+                                    for _ in range(objRandom.randint(0, 8)))
+            bResolved, gResult = ScanCompactTime(strCase)
+            if bResolved:
+                strResult, bIncrementDate = ResolveTimeUnion(strCase)
+                self.assertFalse(bIncrementDate)
+                if gResult is None:
+                    self.assertIsNone(strResult, msg = repr(strCase))
+                else:
+                    self.assertEqual('{:02}:{:02}:{:02}'.format(*gResult[:3]),
+                                                strResult, msg = repr(strCase))
+
+class Test_FindTimes(Test_ResolveTime):
+    """
+    Unit tests for the regex_lib.Time.FindTimes() function.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        super(Test_FindTimes, cls).setUpClass()
+        cls.TestFunction = staticmethod(FindTimes)
+        cls.MultipleCases = [
+            ('from 12:30:01 to 1:15 pm, 13:30 PM\n235959.5 and 23:59:59.5',
+                [((5, 13), '12:30:01', False), ((17, 24), '13:15:00', False),
+                    ((26, 34), None, False), ((35, 41), '23:59:59', False),
+                                        ((48, 58), '00:00:00', True)]),
+            ('12:3012:31', []), #not delimited by non-digits
+            ('12:30-12:31', [((0, 5), '12:30:00', False),
+                                            ((6, 11), '12:31:00', False)]),
+            ('12:30 a.m.', [((0, 10), '00:30:00', False)]),
+            ('', [])]
+    
+    def test_NotMatches(self):
+        """
+        Tested function should find no resolved stamp in the strings not
+        matching any pattern. Uses NonMatchingCases attribute as the set of
+        cases.
+        
+        Version 0.2.0.0
+        """
+        for strCase in self.NonMatchingCases:
+            for _, strResult, bIncrementDate in self.TestFunction(strCase):
+                self.assertIsNone(strResult, msg = strCase)
+                self.assertFalse(bIncrementDate, msg = strCase)
+    
+    def test_Matches(self):
+        """
+        Tested function should find at least one stamp in the matching
+        strings; each found stamp should be resolved by ResolveTime() into the
+        same value, and the spans should not overlap. Uses MatchingCases
+        attribute as the set of cases.
+        
+        Version 0.2.0.0
+        """
+        for strCase, _ in self.MatchingCases:
+            lstTest = list(self.TestFunction(strCase))
+            self.assertGreater(len(lstTest), 0, msg = strCase)
+            iEnd = 0
+            for (iStart, iStop), strResult, bIncrementDate in lstTest:
+                self.assertGreaterEqual(iStart, iEnd, msg = strCase)
+                self.assertEqual(ResolveTime(strCase[iStart : iStop]),
+                                    (strResult, bIncrementDate), msg = strCase)
+                iEnd = iStop
+    
+    def test_DateIncrement(self):
+        """
+        Tested function should indicate the date increment of the found stamp.
+        Uses DateIncrement attribute as the set of cases.
+        
+        Version 0.2.0.0
+        """
+        for strCase, bResult in self.DateIncrement:
+            self.assertEqual(list(self.TestFunction(strCase))[-1][2], bResult,
+                                                            msg = strCase)
+    
+    def test_Multiple(self):
+        """
+        Tested function should find all non-overlapping stamps from the left
+        to the right with their spans. Uses MultipleCases attribute as the set
+        of cases.
+        
+        Version 0.2.0.0
+        """
+        for strCase, lstResult in self.MultipleCases:
+            self.assertEqual(list(self.TestFunction(strCase)), lstResult,
+                                                            msg = strCase)
+
 #+ test suites
 
 TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_ResolveTime)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_ResolveTimeUnion)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_ResolveTimeTuple)
+TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_ScanCompactTime)
+TestSuite5 = unittest.TestLoader().loadTestsFromTestCase(Test_FindTimes)
 TestSuite = unittest.TestSuite()
-TestSuite.addTests([TestSuite1])
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4,
+                                                                TestSuite5])
 
 #execution entry point
 
@@ -0,0 +1,167 @@
+#usr/bin/python
+"""
+Set of unit tests for regex_lib.Search.py module, function SearchLast(), with
+the search patterns defined in the modules regex_lib.Date and regex_lib.Time,
+as well as class LazyPattern and function WarmUp()
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import unittest
+import sys
+import os
+import re
+
+#+ tested module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Search import SearchLast, LazyPattern, WarmUp, LAZY_PATTERNS
+
+import regex_lib.Date as Date
+
+import regex_lib.Time as Time
+
+#+ test cases
+
+class Test_SearchLast(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Search.SearchLast() function. The found match
+    must be the same as for the legacy wrapped patterns with the match() method.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        cls.Patterns = [(Date.C_ISO_DATE, Date.C_ISO_DATE_SEARCH),
+                        (Date.C_REVERSED_DATE, Date.C_REVERSED_DATE_SEARCH),
+                        (Date.C_SCREWED_DATE, Date.C_SCREWED_DATE_SEARCH),
+                        (Date.C_COMPACT_DATE, Date.C_COMPACT_DATE_SEARCH),
+                        (Date.C_SHORT_DATE, Date.C_SHORT_DATE_SEARCH),
+                        (Time.C_TIME_PATTERN, Time.C_TIME_SEARCH),
+                        (Time.C_SHORT_TIME_PATTERN, Time.C_SHORT_TIME_SEARCH),
+                        (Time.C_COMPACT_TIME_PATTERN,
+                                                Time.C_COMPACT_TIME_SEARCH),
+                        (Time.C_SHORT_COMPACT_TIME_PATTERN,
+                                            Time.C_SHORT_COMPACT_TIME_SEARCH)]
+        cls.Cases = ['', 'no stamps at all', '20180509', '2018-05-09',
+                    '18-05-09-05-09', #overlapping short dates
+                    '2018-05-09 and 2017-04-08', #last one wins
+                    '1 9_5.2018date 10-15-2017', #reversed and screwed
+                    '12:30:01 then 13:40:02.5 PM', #last time
+                    '12:30 13:40 14:50', #overlapping short times
+                    '1:2:3:4:5', '12:50 A.M.', '23:59:59.5',
+                    '144801 1448 0930', '2018050912', '120180509',
+                    '2018-05-09\n2017-04-08', #new line right before stamp
+                    'a\n2017-04-08', 'a 2018-05-09 b\nc 2017-04-08',
+                    '2018-05-09\n\n2017-04-08', '\n12:30', 'x\n\n12:30',
+                    u'unicode 2018-05-09 12:30:01',
+                    "MSC00000001_20170502_1448_PROGRAMMING_PASS.xml",
+                    ]
+    
+    def test_SameAsLegacy(self):
+        """
+        The found match must have the same named groups values and the same
+        span of the stamp as the legacy pattern match.
+        
+        Version 0.2.0.0
+        """
+        for objLegacy, objSearch in self.Patterns:
+            for strCase in self.Cases:
+                for strTest in [strCase, strCase.upper()]:
+                    objOld = objLegacy.match(strTest)
+                    objNew = SearchLast(objSearch, strTest)
+                    if objOld is None:
+                        self.assertIsNone(objNew, msg = 'Case: {} - {}'.format(
+                                            repr(strTest), objSearch.pattern))
+                    else:
+                        self.assertIsNotNone(objNew,
+                                        msg = 'Case: {} - {}'.format(
+                                            repr(strTest), objSearch.pattern))
+                        dictOld = objOld.groupdict()
+                        self.assertEqual(dictOld, objNew.groupdict())
+                        iStart = min(objOld.start(strName)
+                                            for strName in dictOld
+                                                if dictOld[strName] is not None)
+                        self.assertEqual(iStart, objNew.start())
+
+class Test_LazyPattern(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Search.LazyPattern class and WarmUp()
+    function.
+    
+    Version 0.2.0.0
+    """
+    
+    def test_Lazy(self):
+        """
+        The pattern should be compiled only on the first use, and then it
+        should behave as the compiled pattern.
+        
+        Version 0.2.0.0
+        """
+        objPattern = LazyPattern(r"(?P<digits>[0-9]+)", re.IGNORECASE)
+        self.assertIn(objPattern, LAZY_PATTERNS)
+        self.assertIsNone(objPattern.Compiled)
+        self.assertEqual(objPattern.pattern, r"(?P<digits>[0-9]+)")
+        self.assertEqual(objPattern.flags, re.IGNORECASE)
+        self.assertIsNone(objPattern.Compiled)
+        objMatch = objPattern.match('123a')
+        self.assertIsNotNone(objPattern.Compiled)
+        self.assertEqual(objMatch.group('digits'), '123')
+        self.assertEqual(objPattern.groupindex, {'digits' : 1})
+        self.assertEqual(objPattern.findall('1a22b'), ['1', '22'])
+        self.assertEqual([objItem.start() for objItem in
+                                objPattern.finditer('1a22b')], [0, 2])
+        self.assertIs(objPattern.Compile(), objPattern.Compiled)
+        self.assertRaises(AttributeError, getattr, objPattern, 'not_defined')
+        self.assertRaises(AttributeError, getattr, objPattern, '__missing__')
+    
+    def test_WarmUp(self):
+        """
+        The function WarmUp() should compile all not compiled patterns,
+        including the patterns of the imported modules.
+        
+        Version 0.2.0.0
+        """
+        objPattern = LazyPattern(r"[0-9]")
+        WarmUp()
+        self.assertIsNotNone(objPattern.Compiled)
+        for objItem in LAZY_PATTERNS:
+            self.assertIsNotNone(objItem.Compiled)
+        self.assertEqual(WarmUp(), 0)
+        self.assertIsNotNone(Date.C_ISO_DATE.Compiled)
+        self.assertIsNotNone(Time.C_TIME_UNION.Compiled)
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_SearchLast)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_LazyPattern)
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2])
+
+#execution entry point
+
+if __name__ == "__main__":
+    sys.stdout.write("Preparing regex_lib.Search.SearchLast() tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
+    sys.stdout.flush()
@@ -0,0 +1,151 @@
+#usr/bin/python
+"""
+Set of unit tests for regex_lib.Date.py module, function ResolveDates()
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import unittest
+import sys
+import os
+import types
+
+#+ tested module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Date import ResolveDate, ResolveDates, GetDateTable
+
+#+ test cases
+
+class Test_ResolveDates(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Date.ResolveDates() function.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        cls.Cases = ['20180509',
+                        'MSC00000001_20170502_1448_PROGRAMMING_PASS.xml',
+                        '2018-05-09', '1 9_5.2018date', '9-15/2018',
+                        '1 18_05.09 1', '2018-055-09', 'no date at all', '',
+                        u'unicode 2018/05/09', '2018-05-09\n2017-04-08']
+        cls.Mixed = ['20180509 1448', 1, None, '2018-05-09 12:30', 1.0]
+    
+    def test_SameAsScalar(self):
+        """
+        Tested function should return the same results as the scalar function
+        ResolveDate() for each element, with and without the union pattern, as a
+        list or as a generator.
+        
+        Version 0.2.0.0
+        """
+        lstExpected = [ResolveDate(strCase) for strCase in self.Cases]
+        self.assertEqual(ResolveDates(self.Cases), lstExpected)
+        self.assertEqual(ResolveDates(iter(self.Cases), bUnion = True),
+                                                                lstExpected)
+        genTest = ResolveDates(self.Cases, bLazy = True)
+        self.assertIsInstance(genTest, types.GeneratorType)
+        self.assertEqual(list(genTest), lstExpected)
+        self.assertEqual(ResolveDates([]), [])
+    
+    def test_NonStringPolicy(self):
+        """
+        Tested function should raise TypeError for the non-string elements by
+        default, skip them or return None for them depending on the
+        policy, and raise ValueError for an unknown policy.
+        
+        Version 0.2.0.0
+        """
+        self.assertRaises(TypeError, ResolveDates, self.Mixed)
+        self.assertRaises(TypeError, ResolveDates, self.Mixed, 'raise', True)
+        genTest = ResolveDates(self.Mixed, bLazy = True)
+        self.assertEqual(next(genTest), ResolveDate(self.Mixed[0]))
+        self.assertRaises(TypeError, next, genTest)
+        lstStrings = [self.Mixed[0], self.Mixed[3]]
+        lstExpected = [ResolveDate(strCase) for strCase in lstStrings]
+        self.assertEqual(ResolveDates(self.Mixed, 'skip'), lstExpected)
+        self.assertEqual(ResolveDates(self.Mixed, 'none'),
+                                    [lstExpected[0], None, None,
+                                                    lstExpected[1], None])
+        for gCase in ['ignore', None, 1]:
+            self.assertRaises(ValueError, ResolveDates, self.Cases, gCase)
+    
+    def test_Interned(self):
+        """
+        Tested function should return the same results as the interned strings
+        of the tables with the flag bInterned, including the policies.
+        
+        Version 0.2.0.0
+        """
+        lstExpected = ResolveDates(self.Cases)
+        for bUnion in [False, True]:
+            lstResults = ResolveDates(self.Cases, bUnion = bUnion,
+                                                            bInterned = True)
+            self.assertEqual(lstResults, lstExpected)
+            for strResult, strCase in zip(lstResults, self.Cases):
+                if not (strResult is None):
+                    self.assertIs(strResult, ResolveDates([strCase],
+                                                        bInterned = True)[0])
+        lstResults = ResolveDates(['2018-05-09', '09.05.2018', '18/5/9'],
+                                                            bInterned = True)
+        self.assertIs(lstResults[0], lstResults[1])
+        self.assertIs(lstResults[0], lstResults[2])
+        self.assertIs(lstResults[0], GetDateTable(2018)[5 * 32 + 9])
+        self.assertEqual(list(ResolveDates(self.Mixed, 'none', bLazy = True,
+                bInterned = True)), ResolveDates(self.Mixed, 'none'))
+        self.assertRaises(TypeError, ResolveDates, self.Mixed,
+                                                            bInterned = True)
+    
+    def test_GetDateTable(self):
+        """
+        The table should contain the ISO strings of all months and days up to
+        31 of the year, and it should be built only once.
+        
+        Version 0.2.0.0
+        """
+        for iYear in [1900, 2018, 2099]:
+            lstTable = GetDateTable(iYear)
+            self.assertIs(GetDateTable(iYear), lstTable)
+            for iMonth in range(1, 13):
+                for iDay in range(1, 32):
+                    self.assertEqual(lstTable[iMonth * 32 + iDay],
+                            '{}-{:02}-{:02}'.format(iYear, iMonth, iDay))
+            self.assertIsNone(lstTable[0])
+            self.assertIsNone(lstTable[32])
+        self.assertEqual(GetDateTable(2000)[2 * 32 + 30], '2000-02-30')
+        self.assertRaises(IndexError, GetDateTable, 1899)
+        self.assertRaises(IndexError, GetDateTable, 2100)
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_ResolveDates)
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1])
+
+#execution entry point
+
+if __name__ == "__main__":
+    sys.stdout.write("Preparing regex_lib.Date.ResolveDates() tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
+    sys.stdout.flush()
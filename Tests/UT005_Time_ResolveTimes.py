@@ -0,0 +1,152 @@
+#usr/bin/python
+"""
+Set of unit tests for regex_lib.Time.py module, function ResolveTimes()
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import unittest
+import sys
+import os
+import types
+
+#+ tested module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Time import ResolveTime, ResolveTimes, GetTimeTable
+
+#+ test cases
+
+class Test_ResolveTimes(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Time.ResolveTimes() function.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        cls.Cases = ['1448',
+                        'MSC00000001_20170502_1448_PROGRAMMING_PASS.xml',
+                        '144801', '12:50 A.M.', '23:59:59.5', '10:50:03.4pm',
+                        '12:14:60', '14:50AM', 'no time at all', '',
+                        u'unicode 12:30', '12:30\n13:40']
+        cls.Mixed = ['20180509 1448', 1, None, '2018-05-09 12:30', 1.0]
+    
+    def test_SameAsScalar(self):
+        """
+        Tested function should return the same results as the scalar function
+        ResolveTime() for each element, with and without the union pattern, as a
+        list or as a generator.
+        
+        Version 0.2.0.0
+        """
+        lstExpected = [ResolveTime(strCase) for strCase in self.Cases]
+        self.assertEqual(ResolveTimes(self.Cases), lstExpected)
+        self.assertEqual(ResolveTimes(iter(self.Cases), bUnion = True),
+                                                                lstExpected)
+        genTest = ResolveTimes(self.Cases, bLazy = True)
+        self.assertIsInstance(genTest, types.GeneratorType)
+        self.assertEqual(list(genTest), lstExpected)
+        self.assertEqual(ResolveTimes([]), [])
+    
+    def test_NonStringPolicy(self):
+        """
+        Tested function should raise TypeError for the non-string elements by
+        default, skip them or return (None, False) for them depending on the
+        policy, and raise ValueError for an unknown policy.
+        
+        Version 0.2.0.0
+        """
+        self.assertRaises(TypeError, ResolveTimes, self.Mixed)
+        self.assertRaises(TypeError, ResolveTimes, self.Mixed, 'raise', True)
+        genTest = ResolveTimes(self.Mixed, bLazy = True)
+        self.assertEqual(next(genTest), ResolveTime(self.Mixed[0]))
+        self.assertRaises(TypeError, next, genTest)
+        lstStrings = [self.Mixed[0], self.Mixed[3]]
+        lstExpected = [ResolveTime(strCase) for strCase in lstStrings]
+        self.assertEqual(ResolveTimes(self.Mixed, 'skip'), lstExpected)
+        self.assertEqual(ResolveTimes(self.Mixed, 'none'),
+                            [lstExpected[0], (None, False), (None, False),
+                                            lstExpected[1], (None, False)])
+        for gCase in ['ignore', None, 1]:
+            self.assertRaises(ValueError, ResolveTimes, self.Cases, gCase)
+    
+    def test_Interned(self):
+        """
+        Tested function should return the same results as the interned tuples
+        of the tables with the flag bInterned, including the policies.
+        
+        Version 0.2.0.0
+        """
+        lstExpected = ResolveTimes(self.Cases)
+        for bUnion in [False, True]:
+            lstResults = ResolveTimes(self.Cases, bUnion = bUnion,
+                                                            bInterned = True)
+            self.assertEqual(lstResults, lstExpected)
+            for tupleResult, strCase in zip(lstResults, self.Cases):
+                if not (tupleResult[0] is None):
+                    self.assertIs(tupleResult, ResolveTimes([strCase],
+                                                        bInterned = True)[0])
+        lstResults = ResolveTimes(['14:50:00', '2:50 p.m.', '1450',
+                                '23:59:59.5', '00:00:00'], bInterned = True)
+        self.assertIs(lstResults[0], lstResults[1])
+        self.assertIs(lstResults[0], lstResults[2])
+        self.assertIs(lstResults[0], GetTimeTable(14)[50 * 60])
+        self.assertEqual(lstResults[3], ('00:00:00', True))
+        self.assertIs(lstResults[3][0], lstResults[4][0])
+        self.assertEqual(list(ResolveTimes(self.Mixed, 'none', bLazy = True,
+                bInterned = True)), ResolveTimes(self.Mixed, 'none'))
+        self.assertRaises(TypeError, ResolveTimes, self.Mixed,
+                                                            bInterned = True)
+    
+    def test_GetTimeTable(self):
+        """
+        The table should contain the results of all minutes and seconds of the
+        hour, and it should be built only once.
+        
+        Version 0.2.0.0
+        """
+        for iHour in range(24):
+            lstTable = GetTimeTable(iHour)
+            self.assertIs(GetTimeTable(iHour), lstTable)
+            self.assertEqual(len(lstTable), 3600)
+            for iMinute in range(60):
+                for iSecond in range(60):
+                    self.assertEqual(lstTable[iMinute * 60 + iSecond],
+                        ('{:02}:{:02}:{:02}'.format(iHour, iMinute, iSecond),
+                                                                    False))
+        self.assertRaises(IndexError, GetTimeTable, -1)
+        self.assertRaises(IndexError, GetTimeTable, 24)
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_ResolveTimes)
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1])
+
+#execution entry point
+
+if __name__ == "__main__":
+    sys.stdout.write("Preparing regex_lib.Time.ResolveTimes() tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
+    sys.stdout.flush()
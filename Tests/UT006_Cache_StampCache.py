@@ -0,0 +1,211 @@
+#usr/bin/python
+"""
+Set of unit tests for regex_lib.Cache.py module, class StampCache
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import unittest
+import sys
+import os
+
+#+ tested module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Cache import StampCache
+
+from regex_lib.Date import ResolveDate
+
+from regex_lib.Time import ResolveTime
+
+#+ helper classes
+
+class CountingFunction(object):
+    """
+    Callable wrapper counting the calls of the wrapped function.
+    
+    Version 0.2.0.0
+    """
+    
+    def __init__(self, fFunction):
+        """
+        Initialization.
+        
+        Version 0.2.0.0
+        """
+        self.Function = fFunction
+        self.Calls = 0
+    
+    def __call__(self, gArgument):
+        """
+        Counts the call and calls the wrapped function.
+        
+        Version 0.2.0.0
+        """
+        self.Calls += 1
+        return self.Function(gArgument)
+
+#+ test cases
+
+class Test_StampCache(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Cache.StampCache class.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        cls.ExceptionCases = [1, None, 1.0, [1], (1, 2), {1 : 2}, True]
+        cls.Cases = ['20180509', '2018-05-09 12:30:01', 'no stamp',
+                    "MSC00000001_20170502_1448_PROGRAMMING_PASS.xml",
+                    '1 9_15.2018date', '23:59:59.5', '12:50 A.M.', '']
+    
+    def test_Init(self):
+        """
+        Initialization should check the function and the size.
+        
+        Version 0.2.0.0
+        """
+        self.assertRaises(TypeError, StampCache, 1)
+        for gCase in [1.0, '1', None, True]:
+            self.assertRaises(TypeError, StampCache, ResolveDate, gCase)
+        for iCase in [0, -1]:
+            self.assertRaises(ValueError, StampCache, ResolveDate, iCase)
+        objCache = StampCache(ResolveDate)
+        self.assertEqual(objCache.MaxSize, 1024)
+        self.assertEqual(len(objCache), 0)
+    
+    def test_Exception(self):
+        """
+        The TypeError exception should be raised for the non-string arguments,
+        and it should be neither cached nor counted.
+        
+        Version 0.2.0.0
+        """
+        for fFunction in [ResolveDate, ResolveTime]:
+            objCache = StampCache(fFunction)
+            for gCase in self.ExceptionCases:
+                self.assertRaises(TypeError, objCache, gCase)
+                self.assertRaises(TypeError, objCache, gCase)
+            self.assertEqual(len(objCache), 0)
+            self.assertEqual(objCache.Hits, 0)
+            self.assertEqual(objCache.Misses, 0)
+    
+    def test_NotCachedException(self):
+        """
+        An exception raised by the wrapped function for a string should not be
+        cached.
+        
+        Version 0.2.0.0
+        """
+        def Failing(strStamp):
+            raise RuntimeError(strStamp)
+        objCache = StampCache(Failing)
+        self.assertRaises(RuntimeError, objCache, 'a')
+        self.assertRaises(RuntimeError, objCache, 'a')
+        self.assertEqual(len(objCache), 0)
+        self.assertEqual(objCache.Hits, 0)
+    
+    def test_Results(self):
+        """
+        The cached results should be the same as of the wrapped function, and
+        the wrapped function should be called only once per string.
+        
+        Version 0.2.0.0
+        """
+        for fFunction in [ResolveDate, ResolveTime]:
+            objCounter = CountingFunction(fFunction)
+            objCache = StampCache(objCounter, 100)
+            for _ in range(3):
+                for strCase in self.Cases:
+                    self.assertEqual(objCache(strCase), fFunction(strCase))
+            self.assertEqual(objCounter.Calls, len(self.Cases))
+            self.assertEqual(objCache.Misses, len(self.Cases))
+            self.assertEqual(objCache.Hits, 2 * len(self.Cases))
+            self.assertEqual(objCache.Evictions, 0)
+    
+    def test_Eviction(self):
+        """
+        The least recently used results should be evicted first.
+        
+        Version 0.2.0.0
+        """
+        objCounter = CountingFunction(ResolveDate)
+        objCache = StampCache(objCounter, 2)
+        objCache('a')
+        objCache('b')
+        objCache('a') # 'b' is now the least recently used
+        objCache('c') # 'b' is evicted
+        self.assertEqual(len(objCache), 2)
+        self.assertEqual(objCache.Evictions, 1)
+        self.assertEqual(objCounter.Calls, 3)
+        objCache('a')
+        objCache('c')
+        self.assertEqual(objCounter.Calls, 3)
+        objCache('b') # 'a' is evicted
+        self.assertEqual(objCounter.Calls, 4)
+        self.assertEqual(objCache.Evictions, 2)
+        objCache('a')
+        self.assertEqual(objCounter.Calls, 5)
+        objCache = StampCache(ResolveDate, 1)
+        for strCase in self.Cases:
+            objCache(strCase)
+            self.assertEqual(len(objCache), 1)
+        self.assertEqual(objCache.Evictions, len(self.Cases) - 1)
+    
+    def test_Statistics(self):
+        """
+        The statistics should reflect the counters, and Clear() should empty
+        the cache and reset the counters.
+        
+        Version 0.2.0.0
+        """
+        objCache = StampCache(ResolveDate, 3)
+        dictTest = objCache.GetStatistics()
+        self.assertEqual(dictTest, {'Hits' : 0, 'Misses' : 0, 'Evictions' : 0,
+                                    'Size' : 0, 'MaxSize' : 3, 'HitRate' : 0.0})
+        for strCase in ['a', 'b', 'a', 'c', 'd', 'a']:
+            objCache(strCase)
+        dictTest = objCache.GetStatistics()
+        self.assertEqual(dictTest['Hits'], 2)
+        self.assertEqual(dictTest['Misses'], 4)
+        self.assertEqual(dictTest['Evictions'], 1)
+        self.assertEqual(dictTest['Size'], 3)
+        self.assertAlmostEqual(dictTest['HitRate'], 2.0 / 6)
+        objCache.Clear()
+        self.assertEqual(objCache.GetStatistics()['Size'], 0)
+        self.assertEqual(objCache.Hits + objCache.Misses, 0)
+        self.assertEqual(objCache('20180509'), '2018-05-09')
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_StampCache)
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1])
+
+#execution entry point
+
+if __name__ == "__main__":
+    sys.stdout.write("Preparing regex_lib.Cache.StampCache tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
+    sys.stdout.flush()
@@ -0,0 +1,164 @@
+#usr/bin/python
+"""
+Set of unit tests for regex_lib.Scanner.py module, function ScanFile()
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import unittest
+import sys
+import os
+import types
+import tempfile
+import StringIO
+
+#+ tested module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Scanner import ScanFile
+
+from regex_lib.Date import ResolveDate
+
+from regex_lib.Time import ResolveTime
+
+#+ test cases
+
+class Test_ScanFile(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Scanner.ScanFile() function.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        cls.Lines = ['MSC00000001_20170502_1448_PROGRAMMING_PASS.xml',
+                        '2018-05-09 23:59:59.5 end of day', '',
+                        'no stamps at all', '1 9_15.2018date 12:50 A.M.',
+                        '2018/5_9 23:34:00']
+        cls.Content = '\n'.join(cls.Lines[:3]) + '\r\n' + '\n'.join(
+                                                                cls.Lines[3:])
+        cls.Expected = []
+        iOffset = 0
+        for iIndex, strLine in enumerate(cls.Lines):
+            strTime, bIncrementDate = ResolveTime(strLine)
+            cls.Expected.append((iIndex + 1, iOffset, ResolveDate(strLine),
+                                                    strTime, bIncrementDate))
+            iOffset += len(strLine) + 1
+            if iIndex == 2:
+                iOffset += 1 # '\r\n' line ending
+        cls.ExceptionCases = [1, None, 1.0, ['path'], ('path', ), {1 : 2}]
+    
+    def test_FileObject(self):
+        """
+        Tested function should generate the records for all lines of a file
+        object, for any chunk size, with and without the union patterns.
+        
+        Version 0.2.0.0
+        """
+        genTest = ScanFile(StringIO.StringIO(self.Content))
+        self.assertIsInstance(genTest, types.GeneratorType)
+        self.assertEqual(list(genTest), self.Expected)
+        for iChunkSize in [1, 2, 3, 7, 16, 1000]:
+            objFile = StringIO.StringIO(self.Content)
+            lstTest = list(ScanFile(objFile, iChunkSize = iChunkSize))
+            self.assertEqual(lstTest, self.Expected)
+            self.assertFalse(objFile.closed)
+            objFile = StringIO.StringIO(self.Content)
+            lstTest = list(ScanFile(objFile, True, iChunkSize))
+            self.assertEqual(lstTest, self.Expected)
+        lstTest = list(ScanFile(StringIO.StringIO(self.Content + '\n')))
+        self.assertEqual(lstTest, self.Expected)
+        self.assertEqual(list(ScanFile(StringIO.StringIO(''))), [])
+    
+    def test_LongLine(self):
+        """
+        Tested function should resolve a line much longer than the chunk size,
+        with the stamp at its end and the line ending in a separate chunk.
+        
+        Version 0.2.0.0
+        """
+        strLong = 'x' * 100000 + ' 2018-05-09 12:30'
+        strContent = 'first\r\n' + strLong + '\r\nlast'
+        lstExpected = [(1, 0, None, None, False),
+                        (2, 7, '2018-05-09', '12:30:00', False),
+                        (3, 7 + len(strLong) + 2, None, None, False)]
+        for iChunkSize in [1, 64, len(strLong) + 8, 1048576]:
+            objFile = StringIO.StringIO(strContent)
+            lstTest = list(ScanFile(objFile, iChunkSize = iChunkSize))
+            self.assertEqual(lstTest, lstExpected)
+    
+    def test_Path(self):
+        """
+        Tested function should open, read and close the file by its path, and
+        the offsets should be the byte positions of the lines in the file.
+        
+        Version 0.2.0.0
+        """
+        iHandle, strPath = tempfile.mkstemp()
+        try:
+            os.write(iHandle, self.Content)
+            os.close(iHandle)
+            lstTest = list(ScanFile(strPath, iChunkSize = 5))
+            self.assertEqual(lstTest, self.Expected)
+            with open(strPath, 'rb') as objFile:
+                for tupleRecord in lstTest:
+                    objFile.seek(tupleRecord[1])
+                    strLine = objFile.readline().rstrip('\r\n')
+                    self.assertEqual(strLine,
+                                                self.Lines[tupleRecord[0] - 1])
+            genTest = ScanFile(strPath)
+            next(genTest)
+            genTest.close()
+        finally:
+            os.remove(strPath)
+        genTest = ScanFile(strPath)
+        self.assertRaises(IOError, next, genTest)
+    
+    def test_Exception(self):
+        """
+        Tested function should raise TypeError for a source, which is neither
+        a path nor a file, or for a non-integer chunk size, and ValueError for
+        a non-positive chunk size.
+        
+        Version 0.2.0.0
+        """
+        for gCase in self.ExceptionCases:
+            self.assertRaises(TypeError, ScanFile, gCase)
+        objFile = StringIO.StringIO(self.Content)
+        for gCase in [1.0, '1', None, True]:
+            self.assertRaises(TypeError, ScanFile, objFile, False, gCase)
+        for iCase in [0, -1]:
+            self.assertRaises(ValueError, ScanFile, objFile, False, iCase)
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_ScanFile)
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1])
+
+#execution entry point
+
+if __name__ == "__main__":
+    sys.stdout.write("Preparing regex_lib.Scanner.ScanFile() tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
+    sys.stdout.flush()
@@ -0,0 +1,145 @@
+#usr/bin/python
+"""
+Set of unit tests for regex_lib.Scanner.py module, function ScanMapped()
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import unittest
+import sys
+import os
+import types
+import tempfile
+import random
+
+#+ tested module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Scanner import ScanMapped, ScanFile
+
+#+ helper functions
+
+def WriteTemporary(strContent):
+    """
+    Writes the passed content into a new temporary file and returns its path.
+    
+    Version 0.2.0.0
+    """
+    iHandle, strPath = tempfile.mkstemp()
+    os.write(iHandle, strContent)
+    os.close(iHandle)
+    return strPath
+
+#+ test cases
+
+class Test_ScanMapped(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Scanner.ScanMapped() function.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        cls.Content = '\n'.join([
+                        'MSC00000001_20170502_1448_PROGRAMMING_PASS.xml',
+                        'no stamps at all', '', 'still nothing\r',
+                        '2018-05-09 23:59:59.5 end of day\r',
+                        'value 123', '12:50\nam', '1 9_15.2018date 12:50 a.m.',
+                        'last line 2018/5_9'])
+        cls.ExceptionCases = [1, None, 1.0, ['path'], ('path', ), {1 : 2}]
+    
+    def test_SameAsScanFile(self):
+        """
+        Tested function should generate the same records as ScanFile() for the
+        lines with at least one resolved stamp, for any block size, with and
+        without the union patterns, for a path and for a file object.
+        
+        Version 0.2.0.0
+        """
+        objRandom = random.Random(20181018)
+        strAlphabet = '0123456789-_/.: aApPmMx\r\n'
+        lstContents = [self.Content, self.Content + '\n', '\n' + self.Content]
+        for _ in range(100):
+            lstContents.append(''.join(objRandom.choice(strAlphabet)
+                                for _ in range(objRandom.randint(1, 200))))
+        for strContent in lstContents:
+            strPath = WriteTemporary(strContent)
+            try:
+                lstExpected = [tupleRecord for tupleRecord in ScanFile(strPath)
+                                if not ((tupleRecord[2] is None) and
+                                                    (tupleRecord[3] is None))]
+                genTest = ScanMapped(strPath)
+                self.assertIsInstance(genTest, types.GeneratorType)
+                self.assertEqual(list(genTest), lstExpected)
+                for iChunkSize in [1, 3, 16]:
+                    lstTest = list(ScanMapped(strPath, True, iChunkSize))
+                    self.assertEqual(lstTest, lstExpected)
+                with open(strPath, 'rb') as objFile:
+                    objFile.seek(5)
+                    self.assertEqual(list(ScanMapped(objFile)), lstExpected)
+                    self.assertFalse(objFile.closed)
+            finally:
+                os.remove(strPath)
+    
+    def test_EmptyFile(self):
+        """
+        Tested function should generate nothing for an empty file and raise
+        IOError during the iteration for a missing file.
+        
+        Version 0.2.0.0
+        """
+        strPath = WriteTemporary('')
+        try:
+            self.assertEqual(list(ScanMapped(strPath)), [])
+        finally:
+            os.remove(strPath)
+        genTest = ScanMapped(strPath)
+        self.assertRaises(IOError, next, genTest)
+    
+    def test_Exception(self):
+        """
+        Tested function should raise TypeError for a source, which is neither
+        a path nor a file, or for a non-integer chunk size, and ValueError for
+        a non-positive chunk size.
+        
+        Version 0.2.0.0
+        """
+        for gCase in self.ExceptionCases:
+            self.assertRaises(TypeError, ScanMapped, gCase)
+        for gCase in [1.0, '1', None, True]:
+            self.assertRaises(TypeError, ScanMapped, 'path', False, gCase)
+        for iCase in [0, -1]:
+            self.assertRaises(ValueError, ScanMapped, 'path', False, iCase)
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_ScanMapped)
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1])
+
+#execution entry point
+
+if __name__ == "__main__":
+    sys.stdout.write("Preparing regex_lib.Scanner.ScanMapped() tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
+    sys.stdout.flush()
@@ -0,0 +1,234 @@
+#usr/bin/python
+"""
+Set of unit tests for regex_lib.Stamp.py module, functions ResolveDateTime(),
+ResolveDateTimeTuple() and IncrementDate()
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import unittest
+import sys
+import os
+import random
+import datetime
+
+#+ tested module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Stamp import ResolveDateTime, ResolveDateTimeTuple, \
+                                                                IncrementDate
+
+from regex_lib.Date import ResolveDate
+
+from regex_lib.Time import ResolveTime, ResolveTimeTuple
+
+#+ test cases
+
+class Test_ResolveDateTime(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Stamp.ResolveDateTime() function.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        cls.ExceptionCases = [1, None, 1.0, [1], (1, 2), {1 : 2}, True]
+        cls.Cases = [
+            ("MSC00000001_20170502_1448_PROGRAMMING_PASS.xml",
+                                                        '2017-05-02T14:48:00'),
+            ('2018-05-09 10:50:03.4pm', '2018-05-09T22:50:03'),
+            ('12:50 a.m. 9_15.2018', '2018-09-15T00:50:00'),
+            ('09.05.1999', '1999-05-09'), ('1448', None), ('', None),
+            ('2018-05-09', '2018-05-09T20:18:00'), #year is also HHMM
+            ('2018-05-09 14:50AM', '2018-05-09'), #wrong modifier
+            ('0019.2_3', '2019-02-03T00:19:00'), #same position as the date
+            ('2018-05-09 23:59:59.5', '2018-05-10T00:00:00'),
+            ('2018-05-31 23:59:59.5', '2018-06-01T00:00:00'),
+            ('2018-12-31 23:59:59,5', '2019-01-01T00:00:00'),
+            ('2016-02-28 23:59:59.5', '2016-02-29T00:00:00'),
+            ('2018-02-28 23:59:59.5', '2018-03-01T00:00:00'),
+            ('2018-04-31 23:59:59.5', '2018-05-01T00:00:00'),
+            ('11:59:59.5 P.M. 31.12.2018', '2019-01-01T00:00:00'),
+            (u'unicode 2018/05/09 12:30', u'2018-05-09T12:30:00')]
+    
+    def test_Exception(self):
+        """
+        The TypeError exception should be raised for the non-string arguments.
+        
+        Version 0.2.0.0
+        """
+        for gCase in self.ExceptionCases:
+            self.assertRaises(TypeError, ResolveDateTime, gCase)
+    
+    def test_Cases(self):
+        """
+        Tested function should return the combined ISO timestamp with the date
+        increment applied, only the date if there is no time stamp, and None if
+        there is no date stamp.
+        
+        Version 0.2.0.0
+        """
+        for strCase, gResult in self.Cases:
+            self.assertEqual(ResolveDateTime(strCase), gResult,
+                                            msg = 'Case: {}'.format(strCase))
+    
+    def test_SameAsSeparate(self):
+        """
+        Tested function should find the same date and time stamps as the
+        functions ResolveDate() and ResolveTime() applied separately, on the
+        random strings.
+        
+        Version 0.2.0.0
+        """
+        objRandom = random.Random(20181018)
+        strAlphabet = '01234567890123456789-_/.:, aApPmM\nx'
+        for _ in range(20000):
+            strCase = ''.join(objRandom.choice(strAlphabet)
+                                    for _ in range(objRandom.randint(0, 30)))
+            strDate = ResolveDate(strCase)
+            strTime, bIncrementDate = ResolveTime(strCase)
+            strTest = ResolveDateTime(strCase)
+            if strDate is None:
+                self.assertIsNone(strTest, msg = repr(strCase))
+            elif strTime is None:
+                self.assertEqual(strTest, strDate, msg = repr(strCase))
+            else:
+                if bIncrementDate:
+                    strDate = '{}-{:02}-{:02}'.format(*IncrementDate(
+                                            *map(int, strDate.split('-'))))
+                self.assertEqual(strTest, 'T'.join([strDate, strTime]),
+                                                        msg = repr(strCase))
+
+class Test_ResolveDateTimeTuple(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Stamp.ResolveDateTimeTuple() function.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        cls.ExceptionCases = [1, None, 1.0, [1], (1, 2), {1 : 2}, True]
+        cls.Cases = [
+            ("MSC00000001_20170502_1448_PROGRAMMING_PASS.xml",
+                                        (2017, 5, 2, 14, 48, 0, 0, False)),
+            ('2018-05-09 10:50:03.4pm', (2018, 5, 9, 22, 50, 3, 400000, False)),
+            ('09.05.1999', (1999, 5, 9, None, None, None, None, False)),
+            ('1448', None), ('', None),
+            ('2018-05-09 14:50AM', (2018, 5, 9, None, None, None, None, False)),
+            ('2018-12-31 23:59:59,5', (2019, 1, 1, 0, 0, 0, 0, True))]
+    
+    def test_Exception(self):
+        """
+        The TypeError exception should be raised for the non-string arguments.
+        
+        Version 0.2.0.0
+        """
+        for gCase in self.ExceptionCases:
+            self.assertRaises(TypeError, ResolveDateTimeTuple, gCase)
+    
+    def test_Cases(self):
+        """
+        Tested function should return the tuple of the date and time fields
+        with the date increment applied, the time fields set to None if there
+        is no time stamp, and None if there is no date stamp.
+        
+        Version 0.2.0.0
+        """
+        for strCase, gResult in self.Cases:
+            self.assertEqual(ResolveDateTimeTuple(strCase), gResult,
+                                            msg = 'Case: {}'.format(strCase))
+    
+    def test_SameAsString(self):
+        """
+        Tested function should give the same results as ResolveDateTime() and
+        the same microseconds as ResolveTimeTuple(), on the random strings.
+        
+        Version 0.2.0.0
+        """
+        objRandom = random.Random(20181018)
+        strAlphabet = '01234567890123456789-_/.:, aApPmM\nx'
+        for _ in range(20000):
+            strCase = ''.join(objRandom.choice(strAlphabet)
+                                    for _ in range(objRandom.randint(0, 30)))
+            strTest = ResolveDateTime(strCase)
+            tupleTest = ResolveDateTimeTuple(strCase)
+            if strTest is None:
+                self.assertIsNone(tupleTest, msg = repr(strCase))
+            elif len(strTest) == 10:
+                self.assertEqual(tupleTest[3:], (None, None, None, None, False),
+                                                        msg = repr(strCase))
+                self.assertEqual('{}-{:02}-{:02}'.format(*tupleTest[:3]),
+                                                strTest, msg = repr(strCase))
+            else:
+                strFormat = '{}-{:02}-{:02}T{:02}:{:02}:{:02}'
+                self.assertEqual(strFormat.format(*tupleTest[:6]), strTest,
+                                                        msg = repr(strCase))
+                self.assertEqual(tupleTest[6:], ResolveTimeTuple(strCase)[3:],
+                                                        msg = repr(strCase))
+
+class Test_IncrementDate(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Stamp.IncrementDate() function.
+    
+    Version 0.2.0.0
+    """
+    
+    def test_Increment(self):
+        """
+        Tested function should return the next day for all valid dates within
+        several years, including the leap years, and the first day of the next
+        month for a day beyond the end of the month.
+        
+        Version 0.2.0.0
+        """
+        objDate = datetime.date(1999, 1, 1)
+        objDelta = datetime.timedelta(days = 1)
+        while objDate.year < 2005:
+            objNext = objDate + objDelta
+            self.assertEqual(IncrementDate(objDate.year, objDate.month,
+                                                                objDate.day),
+                                    (objNext.year, objNext.month, objNext.day))
+            objDate = objNext
+        self.assertEqual(IncrementDate(2018, 2, 31), (2018, 3, 1))
+        self.assertEqual(IncrementDate(2018, 4, 31), (2018, 5, 1))
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_ResolveDateTime)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_ResolveDateTimeTuple)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_IncrementDate)
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3])
+
+#execution entry point
+
+if __name__ == "__main__":
+    sys.stdout.write("Preparing regex_lib.Stamp.ResolveDateTime() tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
+    sys.stdout.flush()
@@ -0,0 +1,186 @@
+#usr/bin/python
+"""
+Set of unit tests for regex_lib.Crawler.py module, functions CrawlDirectory()
+and GenerateThrottled()
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import unittest
+import sys
+import os
+import types
+import tempfile
+import shutil
+import time
+import threading
+
+#+ tested module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Crawler import CrawlDirectory, GenerateThrottled
+
+from regex_lib.Date import ResolveDate
+
+from regex_lib.Time import ResolveTime
+
+#+ test cases
+
+class Test_CrawlDirectory(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Crawler.CrawlDirectory() function.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once: a temporary directory
+        tree with the files.
+        
+        Version 0.2.0.0
+        """
+        cls.Names = ['MSC00000001_20170502_1448_PROGRAMMING_PASS.xml',
+                        'run_2018-05-09_23:59:59.5.log', 'no stamps.txt',
+                        'report_1 9_15.2018_12.50 A.M..pdf', '144801.csv']
+        cls.Top = tempfile.mkdtemp()
+        cls.Paths = []
+        for iIndex in range(30):
+            strFolder = os.path.join(cls.Top, 'folder{}'.format(iIndex % 3))
+            if not os.path.isdir(strFolder):
+                os.mkdir(strFolder)
+            strName = '{}_{}'.format(iIndex,
+                                        cls.Names[iIndex % len(cls.Names)])
+            strPath = os.path.join(strFolder, strName)
+            open(strPath, 'w').close()
+            cls.Paths.append(strPath)
+        strPath = os.path.join(cls.Top, 'top 2018-05-09.txt')
+        open(strPath, 'w').close()
+        cls.Paths.append(strPath)
+        cls.Expected = {}
+        for strPath in cls.Paths:
+            strName = os.path.basename(strPath)
+            cls.Expected[strPath] = (strPath, ResolveDate(strName)) + tuple(
+                                                        ResolveTime(strName))
+        cls.ExceptionCases = [1, None, 1.0, ['path'], ('path', ), {1 : 2}]
+    
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Clean-up after the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        shutil.rmtree(cls.Top)
+    
+    def test_Results(self):
+        """
+        Tested function should generate a record for each file with the same
+        stamps as the functions ResolveDate() and ResolveTime() applied to the
+        base name of the file, for any number of workers, chunk size and order.
+        
+        Version 0.2.0.0
+        """
+        genTest = CrawlDirectory(self.Top, 1)
+        self.assertIsInstance(genTest, types.GeneratorType)
+        lstOrdered = list(genTest)
+        self.assertEqual(sorted(lstOrdered), sorted(self.Expected.values()))
+        for iWorkers, iChunkSize in [(1, 1), (2, 4), (3, 100)]:
+            lstTest = list(CrawlDirectory(self.Top, iWorkers, iChunkSize))
+            self.assertEqual(lstTest, lstOrdered)
+            lstTest = list(CrawlDirectory(self.Top, iWorkers, iChunkSize,
+                                                    bOrdered = False))
+            self.assertEqual(sorted(lstTest), sorted(lstOrdered))
+            lstTest = list(CrawlDirectory(self.Top, iWorkers, iChunkSize,
+                                                    bUnion = True))
+            self.assertEqual(lstTest, lstOrdered)
+        lstTest = list(CrawlDirectory(self.Top, 2, 5, bRecursive = False))
+        self.assertEqual(lstTest, [self.Expected[self.Paths[-1]]])
+        genTest = CrawlDirectory(self.Top, 2, 2)
+        next(genTest)
+        genTest.close()
+    
+    def test_Exception(self):
+        """
+        Tested function should raise TypeError for a non-string path or the
+        non-integer number of the workers or chunk size, and ValueError for a
+        not existing directory or not positive numbers.
+        
+        Version 0.2.0.0
+        """
+        for gCase in self.ExceptionCases:
+            self.assertRaises(TypeError, CrawlDirectory, gCase)
+        self.assertRaises(ValueError, CrawlDirectory,
+                                        os.path.join(self.Top, 'missing'))
+        self.assertRaises(ValueError, CrawlDirectory, self.Paths[0])
+        for gCase in [1.0, '1', True]:
+            self.assertRaises(TypeError, CrawlDirectory, self.Top, gCase)
+            self.assertRaises(TypeError, CrawlDirectory, self.Top, 1, gCase)
+        for iCase in [0, -1]:
+            self.assertRaises(ValueError, CrawlDirectory, self.Top, iCase)
+            self.assertRaises(ValueError, CrawlDirectory, self.Top, 1, iCase)
+
+class Test_GenerateThrottled(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Crawler.GenerateThrottled() function.
+    
+    Version 0.2.0.0
+    """
+    def test_Bound(self):
+        """
+        Tested function should generate an element only after acquiring the
+        semaphore, and stop when the event is set.
+        
+        Version 0.2.0.0
+        """
+        self.assertEqual(list(GenerateThrottled(range(5),
+                            threading.Semaphore(10), threading.Event())),
+                                                                range(5))
+        objSemaphore = threading.Semaphore(3)
+        objStop = threading.Event()
+        lstTest = []
+        objThread = threading.Thread(target = lstTest.extend,
+                    args = (GenerateThrottled(range(100), objSemaphore,
+                                                                objStop), ))
+        objThread.start()
+        time.sleep(0.2)
+        self.assertEqual(lstTest, [0, 1, 2])
+        objSemaphore.release()
+        objSemaphore.release()
+        time.sleep(0.2)
+        self.assertEqual(lstTest, [0, 1, 2, 3, 4])
+        objStop.set()
+        objSemaphore.release()
+        objThread.join(5.0)
+        self.assertFalse(objThread.is_alive())
+        self.assertEqual(lstTest, [0, 1, 2, 3, 4])
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_CrawlDirectory)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(
+                                                        Test_GenerateThrottled)
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2])
+
+#execution entry point
+
+if __name__ == "__main__":
+    sys.stdout.write("Preparing regex_lib.Crawler tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
+    sys.stdout.flush()
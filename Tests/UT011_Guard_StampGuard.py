@@ -0,0 +1,214 @@
+#usr/bin/python
+"""
+Set of unit tests for regex_lib.Guard.py module, class StampGuard and functions
+GetWindow(), ResolveDateGuarded(), ResolveTimeGuarded() and
+ResolveDateTimeGuarded()
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import unittest
+import sys
+import os
+
+#+ tested module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Guard import StampGuard, GetWindow, ResolveDateGuarded, \
+                        ResolveTimeGuarded, ResolveDateTimeGuarded, MAX_LENGTH
+
+from regex_lib.Date import ResolveDate
+
+from regex_lib.Time import ResolveTime
+
+from regex_lib.Stamp import ResolveDateTime
+
+#+ test cases
+
+class Test_StampGuard(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Guard.StampGuard class.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        cls.ExceptionCases = [1, None, 1.0, [1], (1, 2), {1 : 2}, True]
+        cls.Cases = ['20180509', '2018-05-09 12:30:01', 'no stamp',
+                    "MSC00000001_20170502_1448_PROGRAMMING_PASS.xml",
+                    '1 9_15.2018date', '23:59:59.5', '12:50 A.M.', '']
+    
+    def test_Init(self):
+        """
+        Initialization should check the function and the length.
+        
+        Version 0.2.0.0
+        """
+        self.assertRaises(TypeError, StampGuard, 1)
+        for gCase in [1.0, '1', None, True]:
+            self.assertRaises(TypeError, StampGuard, ResolveDate, gCase)
+        for iCase in [0, -1]:
+            self.assertRaises(ValueError, StampGuard, ResolveDate, iCase)
+        objGuard = StampGuard(ResolveDate)
+        self.assertEqual(objGuard.MaxLength, MAX_LENGTH)
+        self.assertEqual(objGuard.Truncated, 0)
+    
+    def test_Exception(self):
+        """
+        The TypeError exception should be raised for the non-string arguments.
+        
+        Version 0.2.0.0
+        """
+        for fFunction in [ResolveDate, ResolveTime]:
+            objGuard = StampGuard(fFunction, 1)
+            for gCase in self.ExceptionCases:
+                self.assertRaises(TypeError, objGuard, gCase)
+            self.assertEqual(objGuard.Truncated, 0)
+    
+    def test_Results(self):
+        """
+        The results for the strings not longer than the maximum length should
+        be the same as of the wrapped function, and only the trailing window
+        of the longer strings should be resolved.
+        
+        Version 0.2.0.0
+        """
+        for fFunction in [ResolveDate, ResolveTime, ResolveDateTime]:
+            objGuard = StampGuard(fFunction, 20)
+            iTruncated = 0
+            for strCase in self.Cases:
+                if len(strCase) > 20:
+                    self.assertEqual(objGuard(strCase),
+                                        fFunction(GetWindow(strCase, 20)))
+                    iTruncated += 1
+                else:
+                    self.assertEqual(objGuard(strCase), fFunction(strCase))
+            self.assertEqual(objGuard.Truncated, iTruncated)
+            self.assertEqual(objGuard('1' * 20), fFunction('1' * 20))
+            self.assertEqual(objGuard('1' * 21), fFunction(''))
+            #+ long line with the stamp at the end
+            strCase = 'x' * 5000 + ' 2018-05-09 12:30:01'
+            self.assertEqual(StampGuard(fFunction)(strCase),
+                                                        fFunction(strCase))
+        self.assertEqual(StampGuard(ResolveDate)('x' * 5000 + ' 2018-05-09'),
+                                                                '2018-05-09')
+
+class Test_GetWindow(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Guard.GetWindow() function.
+    
+    Version 0.2.0.0
+    """
+    
+    def test_Results(self):
+        """
+        The not longer strings should be returned as they are, the window of
+        the longer string should start just after a non-digit character.
+        
+        Version 0.2.0.0
+        """
+        for strCase in ['', '2018-05-09', '12345']:
+            self.assertIs(GetWindow(strCase, 10), strCase)
+        self.assertEqual(GetWindow('x2018-05-09', 10), '2018-05-09')
+        self.assertEqual(GetWindow('log 2018-05-09', 9), '05-09')
+        self.assertEqual(GetWindow('12345abc', 5), 'bc')
+        self.assertEqual(GetWindow('abc 123456', 5), '')
+        self.assertEqual(GetWindow(u'\xe9' * 10 + u'12:30', 5), u'12:30')
+
+class Test_ResolveGuarded(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Guard.ResolveDateGuarded(),
+    ResolveTimeGuarded() and ResolveDateTimeGuarded() functions.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        cls.ExceptionCases = [1, None, 1.0, [1], (1, 2), {1 : 2}, True]
+        cls.Cases = ['20180509', '2018-05-09 12:30:01', 'no stamp',
+                    "MSC00000001_20170502_1448_PROGRAMMING_PASS.xml",
+                    '1 9_15.2018date', '23:59:59.5', '12:50 A.M.', '']
+        cls.Functions = [(ResolveDateGuarded, ResolveDate, None),
+                        (ResolveTimeGuarded, ResolveTime, (None, False)),
+                        (ResolveDateTimeGuarded, ResolveDateTime, None)]
+    
+    def test_Exception(self):
+        """
+        The TypeError exception should be raised for the non-string stamps and
+        the not integer lengths, and ValueError - for the not positive lengths.
+        
+        Version 0.2.0.0
+        """
+        for fFunction, _, _ in self.Functions:
+            for gCase in self.ExceptionCases:
+                self.assertRaises(TypeError, fFunction, gCase)
+            for gCase in [1.0, '1', None, True]:
+                self.assertRaises(TypeError, fFunction, '20180509', gCase)
+            for iCase in [0, -1]:
+                self.assertRaises(ValueError, fFunction, '20180509', iCase)
+    
+    def test_Results(self):
+        """
+        The results for the strings not longer than the maximum length should
+        be the same as of the not guarded function, and only the trailing
+        window of the longer strings should be resolved.
+        
+        Version 0.2.0.0
+        """
+        for fFunction, fReference, gFallback in self.Functions:
+            for strCase in self.Cases:
+                self.assertEqual(fFunction(strCase), fReference(strCase))
+                self.assertEqual(fFunction(strCase, 10),
+                                        fReference(GetWindow(strCase, 10)))
+            strCase = '2018-05-09 12:30:01'.rjust(MAX_LENGTH)
+            self.assertEqual(fFunction(strCase), fReference(strCase))
+            self.assertEqual(fFunction(strCase + ' '), fReference(strCase))
+            #+ long line with the stamp at the end, the last occurrence wins
+            strCase = '2017-01-01 01:00 ' + 'x' * 5000 + ' 2018-05-09 12:30:01'
+            self.assertNotEqual(fReference(strCase), gFallback)
+            self.assertEqual(fFunction(strCase), fReference(strCase))
+            #+ the stamp before the window is not found
+            strCase = '2018-05-09 12:30:01 ' + 'x' * 5000
+            self.assertEqual(fFunction(strCase), gFallback)
+        self.assertEqual(ResolveDateGuarded('x' * 5000 + ' 2018-05-09'),
+                                                                '2018-05-09')
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_StampGuard)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_GetWindow)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_ResolveGuarded)
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3])
+
+#execution entry point
+
+if __name__ == "__main__":
+    sys.stdout.write("Preparing regex_lib.Guard tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
+    sys.stdout.flush()
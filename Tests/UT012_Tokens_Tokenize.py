@@ -0,0 +1,208 @@
+#usr/bin/python
+"""
+Set of unit tests for regex_lib.Tokens.py module, functions Tokenize(),
+MatchModifier(), ResolveDateTokens(), ResolveTimeTokens() and
+ResolveDateTimeTokens()
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import unittest
+import sys
+import os
+import random
+
+#+ tested module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Tokens import Tokenize, MatchModifier, ResolveDateTokens, \
+                                    ResolveTimeTokens, ResolveDateTimeTokens
+
+from regex_lib.Date import ResolveDateTuple
+
+from regex_lib.Time import ResolveTimeTuple
+
+from regex_lib.Stamp import ResolveDateTimeTuple
+
+#+ test cases
+
+class Test_Tokenize(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Tokens.Tokenize() and MatchModifier()
+    functions.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        cls.ExceptionCases = [1, None, 1.0, [1], (1, 2), {1 : 2}, True]
+    
+    def test_Exception(self):
+        """
+        The TypeError exception should be raised for the non-string arguments.
+        
+        Version 0.2.0.0
+        """
+        for gCase in self.ExceptionCases:
+            self.assertRaises(TypeError, Tokenize, gCase)
+    
+    def test_Tokens(self):
+        """
+        The string should be split into the digit runs, separators, a.m. /
+        p.m. markers following the digits and the runs of other characters,
+        which together restore the string.
+        
+        Version 0.2.0.0
+        """
+        lstTokens, iLast = Tokenize('IMG_2018-05-09 12:30 p.m.Camera')
+        self.assertEqual([''.join(tupleToken) for tupleToken in lstTokens],
+                            ['IMG', '_', '2018', '-', '05', '-', '09', ' ',
+                            '12', ':', '30', ' ', 'p.m.', 'Camera'])
+        self.assertEqual(iLast, len(lstTokens) - 1)
+        self.assertEqual([iIndex for iIndex, tupleToken in enumerate(lstTokens)
+                                    if tupleToken[0]], [2, 4, 6, 8, 10])
+        self.assertEqual(lstTokens[12], ('', '', 'p.m.', ''))
+        self.assertEqual(lstTokens[9], ('', ':', '', ''))
+        lstTokens, iLast = Tokenize('Camera PM')
+        self.assertEqual(lstTokens, [])
+        self.assertEqual(iLast, -1)
+        lstTokens, _ = Tokenize('AMPM 1 PM')
+        self.assertEqual([''.join(tupleToken) for tupleToken in lstTokens],
+                                                ['AMPM ', '1', ' ', 'PM'])
+    
+    def test_NewLine(self):
+        """
+        The string should be tokenized only up to the second new line
+        character, and a stamp may start not further than right after the
+        first one.
+        
+        Version 0.2.0.0
+        """
+        lstTokens, iLast = Tokenize('a 1\n2 b\n3 c')
+        self.assertEqual([''.join(tupleToken) for tupleToken in lstTokens],
+                                        ['a ', '1', '\n', '2', ' ', 'b'])
+        self.assertEqual(iLast, 3)
+        lstTokens, iLast = Tokenize('\n\n')
+        self.assertEqual(lstTokens, [])
+    
+    def test_MatchModifier(self):
+        """
+        The modifier should be found only if it is not followed by a character
+        not allowed after the stamp, unless it ends with a dot.
+        
+        Version 0.2.0.0
+        """
+        for strCase, bColon, tupleResult in [('1:30', True, (True, None)),
+                    ('1:30 PM', True, (True, 'PM')),
+                    ('1:30p.m.', True, (True, 'P.M.')),
+                    ('1:30PM:', True, (True, None)),
+                    ('1:30PM:', False, (True, 'PM')),
+                    ('1:30 a.m.:', True, (True, 'A.M.')),
+                    ('1:30 PM5', False, (True, None)),
+                    ('1:30  PM', True, (True, None)),
+                    ('1:30:', True, (False, None)),
+                    ('1:30.', True, (True, None))]:
+            lstTokens, _ = Tokenize(strCase)
+            self.assertEqual(MatchModifier(lstTokens, 3, bColon), tupleResult,
+                                                            msg = strCase)
+
+class Test_ResolveTokens(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Tokens.ResolveDateTokens(),
+    ResolveTimeTokens() and ResolveDateTimeTokens() functions.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        cls.ExceptionCases = [1, None, 1.0, [1], (1, 2), {1 : 2}, True]
+        cls.Functions = [(ResolveDateTokens, ResolveDateTuple),
+                            (ResolveTimeTokens, ResolveTimeTuple),
+                            (ResolveDateTimeTokens, ResolveDateTimeTuple)]
+        cls.Cases = ['20180509', '2018-05-09 12:30:01', 'no stamp', '',
+                    "MSC00000001_20170502_1448_PROGRAMMING_PASS.xml",
+                    '1 9_15.2018date', '23:59:59.5', '12:50 A.M.',
+                    '2018-12-31 11:59:59,7 p.m.', '13:30 PM', '13:30 PM5',
+                    '12:30 P.M.5', '1:30PM:', '1:2:3:4', '09.05.18 1:2',
+                    'a 2018-05-09\n12:30 20180510\n2018-05-11 1:30',
+                    u'2018/05/09 7:05 am', '2018-05-09 0:30 AM']
+    
+    def test_Exception(self):
+        """
+        The TypeError exception should be raised for the non-string arguments.
+        
+        Version 0.2.0.0
+        """
+        for fFunction, _ in self.Functions:
+            for gCase in self.ExceptionCases:
+                self.assertRaises(TypeError, fFunction, gCase)
+    
+    def test_Results(self):
+        """
+        The results should be the same as of the functions using the regular
+        expression patterns.
+        
+        Version 0.2.0.0
+        """
+        for fFunction, fReference in self.Functions:
+            for strCase in self.Cases:
+                self.assertEqual(fFunction(strCase), fReference(strCase),
+                                                        msg = repr(strCase))
+    
+    def test_Random(self):
+        """
+        The results should be the same as of the functions using the regular
+        expression patterns on the random strings made of the stamps pieces.
+        
+        Version 0.2.0.0
+        """
+        objRandom = random.Random(20181018)
+        lstPieces = ['20180509', '19991231', '123456', '2359', '2018', '12',
+                        '5', '31', '13', '00', '-', '/', '_', '.', ',', ':',
+                        ' ', 'x', '\n', 'a.m.', ' PM', 'p.m', 'PM.',
+                        '23:59:59.6', '11:59:59.5 PM', '12:30']
+        for _ in range(5000):
+            strCase = ''.join(objRandom.choice(lstPieces)
+                                    for _ in range(objRandom.randint(0, 9)))
+            for fFunction, fReference in self.Functions:
+                self.assertEqual(fFunction(strCase), fReference(strCase),
+                                                        msg = repr(strCase))
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_Tokenize)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_ResolveTokens)
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2])
+
+#execution entry point
+
+if __name__ == "__main__":
+    sys.stdout.write("Preparing regex_lib.Tokens tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
+    sys.stdout.flush()
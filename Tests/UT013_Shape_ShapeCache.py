@@ -0,0 +1,226 @@
+#usr/bin/python
+"""
+Set of unit tests for regex_lib.Shape.py module, functions MakeShape(),
+MakePlan(), ApplyPlan() and class ShapeCache
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import unittest
+import sys
+import os
+import random
+
+#+ tested module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Shape import MakeShape, MakePlan, ApplyPlan, ShapeCache
+
+from regex_lib.Stamp import ResolveDateTimeTuple
+
+#+ test cases
+
+class Test_MakePlan(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Shape.MakeShape(), MakePlan() and
+    ApplyPlan() functions.
+    
+    Version 0.2.0.0
+    """
+    
+    def test_MakeShape(self):
+        """
+        All digits should be replaced by '0', and all other characters should
+        be kept.
+        
+        Version 0.2.0.0
+        """
+        self.assertEqual(MakeShape('MSC00000001_20170502_1448_PASS.xml'),
+                                        'MSC00000000_00000000_0000_PASS.xml')
+        self.assertEqual(MakeShape(u'2018/05/09 7:05 am'),
+                                                    u'0000/00/00 0:00 am')
+        self.assertEqual(MakeShape(''), '')
+    
+    def test_MakePlan(self):
+        """
+        The candidate placements should be listed in the order of priority and
+        from the right to the left, with the positions of the fields.
+        
+        Version 0.2.0.0
+        """
+        tupleDate, tupleTime = MakePlan('MSC00000000_00000000_0000_PASS.xml')
+        #+ only the 8 digits runs can be COMPACT_DATE, from the right
+        self.assertEqual([tupleFields for _, tupleFields, _ in tupleDate],
+                                [((12, 16), (16, 18), (18, 20)),
+                                ((3, 7), (7, 9), (9, 11))])
+        #+ only the 4 digits run can be SHORT_COMPACT_TIME_PATTERN
+        self.assertEqual([tupleFields for _, tupleFields, _ in tupleTime],
+                                                [((21, 23), (23, 25), None)])
+        tupleDate, tupleTime = MakePlan('0000-00-00 00:00:00.000 p.m.')
+        self.assertEqual(tupleDate[0][1], ((0, 4), (5, 7), (8, 10)))
+        self.assertEqual(tupleTime[0][1], ((11, 13), (14, 16), (17, 23)))
+        self.assertEqual(tupleTime[0][2], 'P.M.')
+        self.assertEqual(MakePlan('no stamp'), ((), ()))
+        self.assertIsNone(MakePlan('0:0:0:0:0:0:0', 3))
+    
+    def test_ApplyPlan(self):
+        """
+        The first candidate placement passing the range checks should be
+        found.
+        
+        Version 0.2.0.0
+        """
+        tupleDate, _ = MakePlan('0000-00-00_0000-00-00')
+        self.assertEqual(ApplyPlan(tupleDate, '2018-05-09_2018-05-10')[0],
+                                                ((11, 15), (16, 18), (19, 21)))
+        self.assertEqual(ApplyPlan(tupleDate, '2018-05-09_2018-13-10')[0],
+                                                    ((0, 4), (5, 7), (8, 10)))
+        self.assertIsNone(ApplyPlan(tupleDate, '2018-13-32_2018-13-32'))
+
+class Test_ShapeCache(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Shape.ShapeCache class.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        cls.ExceptionCases = [1, None, 1.0, [1], (1, 2), {1 : 2}, True]
+        cls.Cases = ['20180509', '2018-05-09 12:30:01', 'no stamp', '',
+                    "MSC00000001_20170502_1448_PROGRAMMING_PASS.xml",
+                    "MSC00000002_20171302_2548_PROGRAMMING_PASS.xml",
+                    "MSC20170503_20171302_1448_PROGRAMMING_PASS.xml",
+                    '1 9_15.2018date', '23:59:59.5', '12:50 A.M.',
+                    '2018-12-31 11:59:59,7 p.m.', '2018-12-31 23:59:59,7 p.m.',
+                    '13:30 PM', '09.05.18 1:2', '09.13.18 1:2',
+                    'a 2018-05-09\n12:30 20180510\n2018-05-11 1:30',
+                    u'2018/05/09 7:05 am', '2018-05-09 0:30 AM']
+    
+    def test_Init(self):
+        """
+        Initialization should check the size and the number of the candidate
+        placements.
+        
+        Version 0.2.0.0
+        """
+        for gCase in [1.0, '1', None, True]:
+            self.assertRaises(TypeError, ShapeCache, gCase)
+            self.assertRaises(TypeError, ShapeCache, 10, gCase)
+        for iCase in [0, -1]:
+            self.assertRaises(ValueError, ShapeCache, iCase)
+            self.assertRaises(ValueError, ShapeCache, 10, iCase)
+        objCache = ShapeCache()
+        self.assertEqual(objCache.MaxSize, 1024)
+        self.assertEqual(len(objCache), 0)
+    
+    def test_Exception(self):
+        """
+        The TypeError exception should be raised for the non-string arguments.
+        
+        Version 0.2.0.0
+        """
+        objCache = ShapeCache()
+        for gCase in self.ExceptionCases:
+            self.assertRaises(TypeError, objCache, gCase)
+        self.assertEqual(len(objCache), 0)
+    
+    def test_Results(self):
+        """
+        The results should be the same as of the function
+        ResolveDateTimeTuple() for the new and the remembered shapes.
+        
+        Version 0.2.0.0
+        """
+        objCache = ShapeCache(100)
+        for _ in range(2):
+            for strCase in self.Cases:
+                self.assertEqual(objCache(strCase),
+                                ResolveDateTimeTuple(strCase), msg = strCase)
+        #+ 4 cases have the same shape as a preceding case
+        self.assertEqual(objCache.GetStatistics()['Hits'],
+                                                        len(self.Cases) + 4)
+    
+    def test_Random(self):
+        """
+        The results should be the same as of the function
+        ResolveDateTimeTuple() on the random strings of the same shapes.
+        
+        Version 0.2.0.0
+        """
+        objRandom = random.Random(20181018)
+        lstPieces = ['20180509', '19991231', '123456', '2359', '2018', '12',
+                        '5', '31', '13', '00', '-', '/', '_', '.', ',', ':',
+                        ' ', 'x', '\n', 'a.m.', ' PM', 'p.m', 'PM.',
+                        '23:59:59.6', '11:59:59.5 PM', '12:30']
+        objCache = ShapeCache(50, 4)
+        for _ in range(1000):
+            strCase = ''.join(objRandom.choice(lstPieces)
+                                    for _ in range(objRandom.randint(0, 9)))
+            for _ in range(5):
+                strCase = ''.join(str(objRandom.randint(0, 9))
+                                    if strChar.isdigit() else strChar
+                                                    for strChar in strCase)
+                self.assertEqual(objCache(strCase),
+                        ResolveDateTimeTuple(strCase), msg = repr(strCase))
+        self.assertGreater(objCache.Fallbacks, 0)
+    
+    def test_Statistics(self):
+        """
+        The statistics should reflect the counters, and Clear() should empty
+        the cache and reset the counters.
+        
+        Version 0.2.0.0
+        """
+        objCache = ShapeCache(2, 3)
+        self.assertEqual(objCache.GetStatistics(), {'Hits' : 0, 'Misses' : 0,
+                            'Evictions' : 0, 'Size' : 0, 'MaxSize' : 2,
+                                            'HitRate' : 0.0, 'Fallbacks' : 0})
+        for strCase in ['20180509', '20170101', '1:2:3:4:5:6:7', '20170101',
+                                            '2018-05-09', '7:6:5:4:3:2:1']:
+            objCache(strCase)
+        dictTest = objCache.GetStatistics()
+        self.assertEqual(dictTest['Hits'], 2)
+        self.assertEqual(dictTest['Misses'], 4)
+        self.assertEqual(dictTest['Evictions'], 2)
+        self.assertEqual(dictTest['Size'], 2)
+        self.assertEqual(dictTest['Fallbacks'], 2)
+        self.assertAlmostEqual(dictTest['HitRate'], 2.0 / 6)
+        objCache.Clear()
+        self.assertEqual(len(objCache), 0)
+        self.assertEqual(objCache.GetStatistics()['Fallbacks'], 0)
+        self.assertEqual(objCache('20180509'),
+                                    (2018, 5, 9, None, None, None, None, False))
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_MakePlan)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_ShapeCache)
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2])
+
+#execution entry point
+
+if __name__ == "__main__":
+    sys.stdout.write("Preparing regex_lib.Shape tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
+    sys.stdout.flush()
@@ -0,0 +1,179 @@
+#usr/bin/python
+"""
+Set of unit tests for regex_lib.Adaptive.py module, classes AdaptiveResolver,
+AdaptiveDateResolver and AdaptiveTimeResolver
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import unittest
+import sys
+import os
+import random
+
+#+ tested module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Adaptive import AdaptiveResolver, AdaptiveDateResolver, \
+                AdaptiveTimeResolver, DATE_NAMES, DATE_SIGNATURES, TIME_NAMES
+
+from regex_lib.Date import ResolveDateTuple, C_DATE_SEARCH_PATTERNS, \
+                                                        ConvertDateMatchTuple
+
+from regex_lib.Time import ResolveTimeTuple
+
+#+ test cases
+
+class Test_AdaptiveResolver(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Adaptive.AdaptiveDateResolver and
+    AdaptiveTimeResolver classes.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        cls.ExceptionCases = [1, None, 1.0, [1], (1, 2), {1 : 2}, True]
+        cls.Resolvers = [(AdaptiveDateResolver, ResolveDateTuple),
+                            (AdaptiveTimeResolver, ResolveTimeTuple)]
+        cls.Cases = ['20180509', '2018-05-09 12:30:01', 'no stamp', '',
+                    "MSC00000001_20170502_1448_PROGRAMMING_PASS.xml",
+                    '1 9_15.2018date', '23:59:59.5', '12:50 A.M.',
+                    '2018-12-31 11:59:59,7 p.m.', '13:30 PM', '09.05.18 1:2',
+                    '5-13-2018 9-5-2018', '18.05.09 2018.05.10',
+                    'a 2018-05-09\n12:30 20180510\n2018-05-11 1:30',
+                    u'2018/05/09 7:05 am', u'\xe9 18-5-9 5:13']
+    
+    def test_Init(self):
+        """
+        Initialization should check the numbers of the patterns, names and
+        signatures.
+        
+        Version 0.2.0.0
+        """
+        self.assertRaises(ValueError, AdaptiveResolver,
+                                    C_DATE_SEARCH_PATTERNS, DATE_NAMES[:-1],
+                            DATE_SIGNATURES, ConvertDateMatchTuple, False)
+        objResolver = AdaptiveDateResolver()
+        self.assertEqual(objResolver.GetOrdering(), list(DATE_NAMES))
+        self.assertEqual(AdaptiveTimeResolver().GetOrdering(),
+                                                            list(TIME_NAMES))
+        self.assertEqual(objResolver.Counts, dict((strName, 0)
+                                                for strName in DATE_NAMES))
+    
+    def test_Exception(self):
+        """
+        The TypeError exception should be raised for the non-string arguments.
+        
+        Version 0.2.0.0
+        """
+        for cResolver, _ in self.Resolvers:
+            objResolver = cResolver()
+            for gCase in self.ExceptionCases:
+                self.assertRaises(TypeError, objResolver, gCase)
+    
+    def test_Results(self):
+        """
+        The results should be the same as of the fixed order functions for any
+        ordering of the patterns.
+        
+        Version 0.2.0.0
+        """
+        for cResolver, fReference in self.Resolvers:
+            objResolver = cResolver()
+            for lstOrder in [None, [4, 3, 2, 1, 0], [3, 0, 4, 1, 2]]:
+                if not (lstOrder is None):
+                    objResolver._lstOrder = [iIndex for iIndex in lstOrder
+                                        if iIndex < len(objResolver.Names)]
+                for strCase in self.Cases:
+                    self.assertEqual(objResolver(strCase),
+                                        fReference(strCase), msg = strCase)
+    
+    def test_Random(self):
+        """
+        The results should be the same as of the fixed order functions on the
+        random streams of the strings, while the ordering is adapted.
+        
+        Version 0.2.0.0
+        """
+        objRandom = random.Random(20181018)
+        lstPieces = ['20180509', '19991231', '123456', '2359', '2018', '12',
+                        '5', '31', '13', '00', '-', '/', '_', '.', ',', ':',
+                        ' ', 'x', '\n', 'a.m.', ' PM', 'p.m', 'PM.',
+                        '23:59:59.6', '11:59:59.5 PM', '12:30', '09.05.18',
+                        '5-13-2018']
+        for cResolver, fReference in self.Resolvers:
+            objResolver = cResolver()
+            for _ in range(3000):
+                strCase = ''.join(objRandom.choice(lstPieces)
+                                    for _ in range(objRandom.randint(0, 9)))
+                self.assertEqual(objResolver(strCase), fReference(strCase),
+                                                        msg = repr(strCase))
+            self.assertGreater(objResolver.Overrides, 0)
+    
+    def test_Ordering(self):
+        """
+        The dominant pattern of the stream should be tried first, and a higher
+        priority pattern found by the verification should override it.
+        
+        Version 0.2.0.0
+        """
+        objResolver = AdaptiveDateResolver()
+        for iIndex in range(3):
+            objResolver('18.05.0{}'.format(iIndex + 1))
+        self.assertEqual(objResolver.GetOrdering()[0], 'SHORT_DATE')
+        self.assertEqual(objResolver.Counts['SHORT_DATE'], 3)
+        self.assertEqual(objResolver('18.05.09 2018.05.10'), (2018, 5, 10))
+        self.assertEqual(objResolver.Overrides, 1)
+        self.assertEqual(objResolver.Counts['ISO_DATE'], 1)
+        self.assertEqual(objResolver('18.05.09 10.05.2018'), (2018, 5, 10))
+        self.assertEqual(objResolver.Counts['REVERSED_DATE'], 1)
+        objResolver('20180509')
+        dictTest = objResolver.GetStatistics()
+        self.assertEqual(dictTest['Calls'], 6)
+        self.assertEqual(dictTest['FastPaths'], 1)
+        self.assertEqual(dictTest['Overrides'], 2)
+        self.assertEqual(dictTest['Ordering'][0], 'SHORT_DATE')
+        self.assertAlmostEqual(dictTest['Resolved'], 5.0 / 6)
+        objResolver.Clear()
+        self.assertEqual(objResolver.GetOrdering(), list(DATE_NAMES))
+        self.assertEqual(objResolver.GetStatistics()['Calls'], 0)
+        objResolver = AdaptiveTimeResolver()
+        for _ in range(2):
+            objResolver('1:30 PM')
+        self.assertEqual(objResolver.GetOrdering()[0], 'SHORT_TIME')
+        self.assertEqual(objResolver('1:30 PM 12:10:05'), (12, 10, 5, 0, False))
+        self.assertEqual(objResolver.GetOrdering()[0], 'SHORT_TIME')
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_AdaptiveResolver)
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1])
+
+#execution entry point
+
+if __name__ == "__main__":
+    sys.stdout.write("Preparing regex_lib.Adaptive tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
+    sys.stdout.flush()
@@ -0,0 +1,382 @@
+#usr/bin/python
+"""
+Set of unit tests for regex_lib.Columns.py module, functions DateToDays(),
+ResolveDateColumn(), ResolveTimeColumn(), ResolveDateTimeColumns(),
+ResolveDateArray() and ResolveTimeArray()
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import unittest
+import sys
+import os
+import array
+import datetime
+
+#+ tested module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Columns import DateToDays, ResolveDateColumn, \
+        ResolveTimeColumn, ResolveDateTimeColumns, ResolveDateArray, \
+                                                ResolveTimeArray, numpy
+
+from regex_lib.Date import ResolveDateTuple
+
+from regex_lib.Time import ResolveTimeTuple
+
+from regex_lib.Stamp import ResolveDateTimeTuple
+
+#globals
+
+EPOCH = datetime.date(1970, 1, 1)
+
+CASES = ['20180509', '2018-05-09 12:30:01', 'no stamp', '',
+            "MSC00000001_20170502_1448_PROGRAMMING_PASS.xml",
+            '1 9_15.2018date', '23:59:59.5', '12:50 A.M.', '18.04.31',
+            '2018-12-31 23:59:59,7 p.m.', '2018-12-31 11:59:59,7 p.m.',
+            u'2018/05/09 7:05 am', '13:30 PM', '2000-02-30', '1900-02-29',
+            '2018-04-31', '2018-02-29 12:00', '2000-02-29', '2018-04-30']
+
+#+ cases of all branches shared by the array and the NumPy paths: resolved,
+#+ not matched, impossible calendar date and non-string element
+
+BRANCH_CASES = ['2018-05-09 12:30', 'no stamp', '2018-04-31 12:30', None,
+                                                    '2018-02-29', '12:30']
+
+#helper functions
+
+def ExpectedDays(tupleDate):
+    """
+    Days since the epoch of the date via the standard library, or None for
+    the impossible calendar date (the day beyond the end of the month).
+    
+    Version 0.2.0.0
+    """
+    try:
+        return (datetime.date(*tupleDate[:3]) - EPOCH).days
+    except ValueError:
+        return None
+
+#+ test cases
+
+class Test_DateToDays(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Columns.DateToDays() function.
+    
+    Version 0.2.0.0
+    """
+    
+    def test_Results(self):
+        """
+        The results should be the same as of the standard library for all
+        months of the supported years and a few distant dates.
+        
+        Version 0.2.0.0
+        """
+        for iYear in range(1899, 2101):
+            for iMonth in range(1, 13):
+                for iDay in (1, 28):
+                    self.assertEqual(DateToDays(iYear, iMonth, iDay),
+                        (datetime.date(iYear, iMonth, iDay) - EPOCH).days)
+        self.assertEqual(DateToDays(1970, 1, 1), 0)
+        self.assertEqual(DateToDays(1, 1, 1),
+                                    (datetime.date(1, 1, 1) - EPOCH).days)
+        self.assertEqual(DateToDays(9999, 12, 31),
+                                    (datetime.date(9999, 12, 31) - EPOCH).days)
+        #+ the day beyond the end of the month is counted into the next month
+        self.assertEqual(DateToDays(2018, 4, 31), DateToDays(2018, 5, 1))
+
+class Test_ResolveDateColumn(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Columns.ResolveDateColumn() function.
+    
+    Version 0.2.0.0
+    """
+    
+    def test_Results(self):
+        """
+        The days and the mask should correspond to the results of the function
+        ResolveDateTuple(), the impossible calendar dates should be masked.
+        
+        Version 0.2.0.0
+        """
+        arrDays, arrMask = ResolveDateColumn(CASES)
+        self.assertIsInstance(arrDays, array.array)
+        self.assertEqual(arrDays.typecode, 'i')
+        self.assertIsInstance(arrMask, array.array)
+        self.assertEqual(arrMask.typecode, 'B')
+        self.assertEqual(len(arrDays), len(CASES))
+        self.assertEqual(len(arrMask), len(CASES))
+        for iIndex, strCase in enumerate(CASES):
+            tupleDate = ResolveDateTuple(strCase)
+            if (tupleDate is None) or (ExpectedDays(tupleDate) is None):
+                self.assertEqual(arrMask[iIndex], 1, msg = strCase)
+                self.assertEqual(arrDays[iIndex], 0, msg = strCase)
+            else:
+                self.assertEqual(arrMask[iIndex], 0, msg = strCase)
+                self.assertEqual(arrDays[iIndex], ExpectedDays(tupleDate),
+                                                                msg = strCase)
+        self.assertEqual(ResolveDateColumn([]), (array.array('i'),
+                                                            array.array('B')))
+        self.assertEqual(ResolveDateColumn(iter(['2018-05-09'])),
+                            (array.array('i', [17660]), array.array('B', [0])))
+        #+ 31st of April and 29th of February of a common year are masked
+        self.assertEqual(ResolveDateTuple('2018-04-31'), (2018, 4, 31))
+        self.assertEqual(ResolveDateColumn(['2018-04-31', '2018-04-30',
+                                            '2018-02-29', '2016-02-29']),
+                            (array.array('i', [0, 17651, 0, 16860]),
+                                            array.array('B', [1, 0, 1, 0])))
+    
+    def test_ArrayPath(self):
+        """
+        The default array buffers of all branches shared with the NumPy
+        functions ResolveDateArray() and ResolveTimeArray() should hold the
+        values and the mask, which these functions convert, with the item
+        sizes of the NumPy int32 and uint8 types.
+        
+        Version 0.2.0.0
+        """
+        arrDays, arrMask = ResolveDateColumn(BRANCH_CASES,
+                                                    strNonString = 'none')
+        self.assertEqual(arrDays.itemsize, 4)
+        self.assertEqual(arrMask.itemsize, 1)
+        self.assertEqual(list(arrDays), [17660, 0, 0, 0, 0, 0])
+        self.assertEqual(list(arrMask), [0, 1, 1, 1, 1, 1])
+        arrSeconds, arrMask = ResolveTimeColumn(BRANCH_CASES,
+                                                    strNonString = 'none')
+        self.assertEqual(arrSeconds.itemsize, 4)
+        self.assertEqual(arrMask.itemsize, 1)
+        self.assertEqual(list(arrSeconds), [45000, 0, 45000, 0, 73080, 45000])
+        self.assertEqual(list(arrMask), [0, 1, 0, 1, 0, 0])
+        self.assertRaises(TypeError, ResolveDateColumn, BRANCH_CASES)
+        self.assertRaises(TypeError, ResolveTimeColumn, BRANCH_CASES)
+        self.assertRaises(ValueError, ResolveDateColumn, BRANCH_CASES,
+                                                    strNonString = 'skip')
+    
+    def test_Buffers(self):
+        """
+        The passed buffers should be filled in place and returned, the longer
+        buffers are filled only partially, the shorter ones are rejected.
+        
+        Version 0.2.0.0
+        """
+        arrDays = array.array('l', [-1]) * 5
+        lstMask = [-1] * 5
+        gResult = ResolveDateColumn(['2018-05-09', 'no stamp', '1970-01-02'],
+                                                            arrDays, lstMask)
+        self.assertIs(gResult[0], arrDays)
+        self.assertIs(gResult[1], lstMask)
+        self.assertEqual(list(arrDays), [17660, 0, 1, -1, -1])
+        self.assertEqual(lstMask, [0, 1, 0, -1, -1])
+        self.assertRaises(ValueError, ResolveDateColumn, CASES,
+                                                        array.array('i', [0]))
+        self.assertRaises(ValueError, ResolveDateColumn, CASES, None, [0])
+    
+    def test_Policies(self):
+        """
+        The non-string elements should be rejected or masked depending on the
+        policy; an unknown policy should be rejected.
+        
+        Version 0.2.0.0
+        """
+        lstCases = ['2018-05-09', None, 1, '2018-05-10']
+        self.assertRaises(TypeError, ResolveDateColumn, lstCases)
+        arrDays, arrMask = ResolveDateColumn(lstCases, strNonString = 'none')
+        self.assertEqual(list(arrDays), [17660, 0, 0, 17661])
+        self.assertEqual(list(arrMask), [0, 1, 1, 0])
+        for strPolicy in ['skip', 'RAISE', None, 1]:
+            self.assertRaises(ValueError, ResolveDateColumn, lstCases,
+                                                    strNonString = strPolicy)
+
+class Test_ResolveTimeColumn(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Columns.ResolveTimeColumn() and
+    ResolveDateTimeColumns() functions.
+    
+    Version 0.2.0.0
+    """
+    
+    def test_ResolveTimeColumn(self):
+        """
+        The seconds and the mask should correspond to the results of the
+        function ResolveTimeTuple().
+        
+        Version 0.2.0.0
+        """
+        arrSeconds, arrMask = ResolveTimeColumn(CASES)
+        self.assertEqual(arrSeconds.typecode, 'i')
+        for iIndex, strCase in enumerate(CASES):
+            tupleTime = ResolveTimeTuple(strCase)
+            if tupleTime is None:
+                self.assertEqual(arrMask[iIndex], 1, msg = strCase)
+                self.assertEqual(arrSeconds[iIndex], 0, msg = strCase)
+            else:
+                self.assertEqual(arrMask[iIndex], 0, msg = strCase)
+                self.assertEqual(arrSeconds[iIndex], tupleTime[0] * 3600 +
+                            tupleTime[1] * 60 + tupleTime[2], msg = strCase)
+        self.assertRaises(TypeError, ResolveTimeColumn, ['12:30', None])
+        self.assertEqual(list(ResolveTimeColumn(['12:30', None],
+                                strNonString = 'none')[1]), [0, 1])
+    
+    def test_ResolveDateTimeColumns(self):
+        """
+        The days, seconds and masks should correspond to the results of the
+        function ResolveDateTimeTuple(), with the date incremented.
+        
+        Version 0.2.0.0
+        """
+        arrDays, arrSeconds, arrDateMask, arrTimeMask = (
+                                                ResolveDateTimeColumns(CASES))
+        for iIndex, strCase in enumerate(CASES):
+            tupleResult = ResolveDateTimeTuple(strCase)
+            if tupleResult is None:
+                self.assertEqual(arrDateMask[iIndex], 1, msg = strCase)
+                self.assertEqual(arrTimeMask[iIndex], 1, msg = strCase)
+                continue
+            if ExpectedDays(tupleResult) is None:
+                self.assertEqual(arrDateMask[iIndex], 1, msg = strCase)
+                self.assertEqual(arrDays[iIndex], 0, msg = strCase)
+                self.assertEqual(arrTimeMask[iIndex], 1, msg = strCase)
+                self.assertEqual(arrSeconds[iIndex], 0, msg = strCase)
+                continue
+            self.assertEqual(arrDateMask[iIndex], 0, msg = strCase)
+            self.assertEqual(arrDays[iIndex], ExpectedDays(tupleResult),
+                                                                msg = strCase)
+            if tupleResult[3] is None:
+                self.assertEqual(arrTimeMask[iIndex], 1, msg = strCase)
+            else:
+                self.assertEqual(arrTimeMask[iIndex], 0, msg = strCase)
+                self.assertEqual(arrSeconds[iIndex], tupleResult[3] * 3600 +
+                        tupleResult[4] * 60 + tupleResult[5], msg = strCase)
+        #+ 2018-12-31 11:59:59,7 p.m. -> 2019-01-01 00:00:00
+        self.assertEqual(arrDays[10], 17897)
+        self.assertEqual(arrSeconds[10], 0)
+        #+ rounding up at the end of the tables -> 2100-01-01 00:00:00
+        arrDays, arrSeconds, arrDateMask, arrTimeMask = (
+                ResolveDateTimeColumns(['log 2099-12-31 23:59:59.7',
+                                                    '2099-12-31 12:00:00']))
+        self.assertEqual(list(arrDays), [DateToDays(2100, 1, 1),
+                                                DateToDays(2099, 12, 31)])
+        self.assertEqual(arrDays[0], (datetime.date(2100, 1, 1) - EPOCH).days)
+        self.assertEqual(list(arrSeconds), [0, 43200])
+        self.assertEqual(list(arrDateMask), [0, 0])
+        self.assertEqual(list(arrTimeMask), [0, 0])
+        self.assertRaises(ValueError, ResolveDateTimeColumns, CASES, None,
+                                                                None, [0] * 3)
+        #+ impossible calendar dates are masked, unless rounded up
+        arrDays, arrSeconds, arrDateMask, arrTimeMask = (
+                ResolveDateTimeColumns(['2018-04-31 12:00',
+                            '2018-02-29 1:00', '2018-04-31 23:59:59.5']))
+        self.assertEqual(list(arrDays), [0, 0, DateToDays(2018, 5, 1)])
+        self.assertEqual(list(arrSeconds), [0, 0, 0])
+        self.assertEqual(list(arrDateMask), [1, 1, 0])
+        self.assertEqual(list(arrTimeMask), [1, 1, 0])
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class Test_NumPy(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Columns.ResolveDateArray() and
+    ResolveTimeArray() functions, as well as of the NumPy buffers.
+    
+    Version 0.2.0.0
+    """
+    
+    def test_ResolveDateArray(self):
+        """
+        The dates should be the datetime64[D] values with NaT for the not
+        matched entries.
+        
+        Version 0.2.0.0
+        """
+        arrDates, arrMask = ResolveDateArray(['2018-05-09', 'no stamp'])
+        self.assertEqual(str(arrDates.dtype), 'datetime64[D]')
+        self.assertEqual(arrDates[0], numpy.datetime64('2018-05-09'))
+        self.assertTrue(numpy.isnat(arrDates[1]))
+        self.assertEqual(arrMask.tolist(), [False, True])
+    
+    def test_Equivalence(self):
+        """
+        The NumPy results should be the same as of the array buffers for all
+        branches: resolved, not matched, impossible calendar date and
+        non-string element.
+        
+        Version 0.2.0.0
+        """
+        arrDays, arrMask = ResolveDateColumn(BRANCH_CASES,
+                                                    strNonString = 'none')
+        arrDates, arrNumPyMask = ResolveDateArray(BRANCH_CASES,
+                                                    strNonString = 'none')
+        self.assertEqual(arrNumPyMask.tolist(), [bool(iMask)
+                                                        for iMask in arrMask])
+        for iIndex, iDays in enumerate(arrDays):
+            if arrMask[iIndex]:
+                self.assertTrue(numpy.isnat(arrDates[iIndex]))
+            else:
+                self.assertEqual(arrDates[iIndex], numpy.datetime64(iDays,
+                                                                        'D'))
+        arrSeconds, arrMask = ResolveTimeColumn(BRANCH_CASES,
+                                                    strNonString = 'none')
+        arrNumPySeconds, arrNumPyMask = ResolveTimeArray(BRANCH_CASES,
+                                                    strNonString = 'none')
+        self.assertEqual(arrNumPySeconds.tolist(), list(arrSeconds))
+        self.assertEqual(arrNumPyMask.tolist(), [bool(iMask)
+                                                        for iMask in arrMask])
+        self.assertRaises(TypeError, ResolveDateArray, BRANCH_CASES)
+        self.assertRaises(TypeError, ResolveTimeArray, BRANCH_CASES)
+        self.assertRaises(ValueError, ResolveDateArray, BRANCH_CASES, 'skip')
+    
+    def test_ResolveTimeArray(self):
+        """
+        The seconds should be the int32 values with the boolean mask.
+        
+        Version 0.2.0.0
+        """
+        arrSeconds, arrMask = ResolveTimeArray(['12:30', 'no stamp'])
+        self.assertEqual(arrSeconds.dtype, numpy.int32)
+        self.assertEqual(arrSeconds.tolist(), [45000, 0])
+        self.assertEqual(arrMask.tolist(), [False, True])
+    
+    def test_Buffers(self):
+        """
+        The preallocated NumPy arrays should be filled in place.
+        
+        Version 0.2.0.0
+        """
+        arrDays = numpy.zeros(3, dtype = numpy.int32)
+        arrMask = numpy.zeros(3, dtype = bool)
+        ResolveDateColumn(['2018-05-09', 'x', '1970-01-02'], arrDays, arrMask)
+        self.assertEqual(arrDays.tolist(), [17660, 0, 1])
+        self.assertEqual(arrMask.tolist(), [False, True, False])
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_DateToDays)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_ResolveDateColumn)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_ResolveTimeColumn)
+TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_NumPy)
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4])
+
+#execution entry point
+
+if __name__ == "__main__":
+    sys.stdout.write("Preparing regex_lib.Columns tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
+    sys.stdout.flush()
@@ -0,0 +1,362 @@
+#usr/bin/python
+"""
+Set of unit tests for regex_lib.Stream.py module, class StreamResolver and
+function ResolveStream()
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import unittest
+import sys
+import os
+import io
+import socket
+import threading
+import asyncore
+import multiprocessing.pool
+
+#+ tested module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Stream import StreamResolver, ResolveStream
+
+from regex_lib.Scanner import ScanFile
+
+#globals
+
+LINES = ['2018-05-09 12:30:01 start', 'no stamp', '',
+            'MSC00000001_20170502_1448_PROGRAMMING_PASS.xml\r',
+            '1 9_15.2018date 23:59:59.5', '12:50 A.M.', '18.05.09 1:2']
+
+#+ test data: the lines repeated, with the last line not terminated
+
+DATA = '\n'.join(LINES * 40) + '\n2018-05-10 7:05 pm'
+
+#helper classes
+
+class LoopbackServer(threading.Thread):
+    """
+    Thread accepting a single connection on the loopback interface, sending
+    the data in small pieces and closing the connection.
+    
+    Version 0.2.0.0
+    """
+    
+    def __init__(self, strData, iPiece = 100):
+        """
+        Initialization, the listening socket is bound to a free port.
+        
+        Version 0.2.0.0
+        """
+        super(LoopbackServer, self).__init__()
+        self.daemon = True
+        self.Data = strData
+        self.Piece = iPiece
+        self.Socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.Socket.bind(('127.0.0.1', 0))
+        self.Socket.listen(1)
+        self.Address = self.Socket.getsockname()
+    
+    def run(self):
+        """
+        Sends the data to the first accepted connection.
+        
+        Version 0.2.0.0
+        """
+        objConnection, _ = self.Socket.accept()
+        try:
+            for iStart in range(0, len(self.Data), self.Piece):
+                objConnection.sendall(self.Data[iStart : iStart + self.Piece])
+        finally:
+            objConnection.close()
+            self.Socket.close()
+
+class ResolvingDispatcher(asyncore.dispatcher):
+    """
+    Event loop client feeding the received data into a StreamResolver and
+    reading only while the resolver is not paused.
+    
+    Version 0.2.0.0
+    """
+    
+    def __init__(self, tupleAddress, objResolver, dictMap):
+        """
+        Initialization, connects to the passed address.
+        
+        Version 0.2.0.0
+        """
+        asyncore.dispatcher.__init__(self, map = dictMap)
+        self.Resolver = objResolver
+        self.Records = []
+        self.MaxPending = 0
+        self.create_socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.connect(tupleAddress)
+    
+    def readable(self):
+        """
+        Reads only while the resolver is not paused; collects the records.
+        
+        Version 0.2.0.0
+        """
+        self.MaxPending = max(self.MaxPending, self.Resolver.Pending)
+        self.Records.extend(self.Resolver.GetRecords())
+        return not self.Resolver.Paused
+    
+    def writable(self):
+        """
+        Nothing to send.
+        
+        Version 0.2.0.0
+        """
+        return False
+    
+    def handle_connect(self):
+        """
+        Nothing to do.
+        
+        Version 0.2.0.0
+        """
+        pass
+    
+    def handle_read(self):
+        """
+        Feeds the received data into the resolver.
+        
+        Version 0.2.0.0
+        """
+        strData = self.recv(64)
+        if strData:
+            self.Resolver.Feed(strData)
+    
+    def handle_close(self):
+        """
+        Closes the stream and the connection.
+        
+        Version 0.2.0.0
+        """
+        self.Resolver.Close()
+        self.close()
+
+#+ test cases
+
+class Test_StreamResolver(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Stream.StreamResolver class.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        cls.Expected = list(ScanFile(io.BytesIO(DATA)))
+    
+    def test_Init(self):
+        """
+        Initialization should check the executor and the sizes.
+        
+        Version 0.2.0.0
+        """
+        self.assertRaises(TypeError, StreamResolver, 1)
+        for gCase in [1.0, '1', None, True]:
+            self.assertRaises(TypeError, StreamResolver, None, gCase)
+            self.assertRaises(TypeError, StreamResolver, None, 10, gCase)
+        for iCase in [0, -1]:
+            self.assertRaises(ValueError, StreamResolver, None, iCase)
+            self.assertRaises(ValueError, StreamResolver, None, 10, iCase)
+        objResolver = StreamResolver()
+        self.assertIsNone(objResolver.Executor)
+        self.assertEqual(objResolver.Pending, 0)
+        self.assertFalse(objResolver.Paused)
+        self.assertFalse(objResolver.Finished)
+    
+    def test_Feed(self):
+        """
+        The records should be the same as of ScanFile() for any split of the
+        data into the chunks; the fed data is checked.
+        
+        Version 0.2.0.0
+        """
+        for iPiece in [1, 7, 64, len(DATA)]:
+            objResolver = StreamResolver(iBatchSize = 10, iMaxPending = 1000)
+            lstRecords = []
+            for iStart in range(0, len(DATA), iPiece):
+                objResolver.Feed(DATA[iStart : iStart + iPiece])
+                lstRecords.extend(objResolver.GetRecords())
+            objResolver.Close()
+            lstRecords.extend(objResolver.GetRecords())
+            self.assertTrue(objResolver.Finished)
+            self.assertEqual(lstRecords, self.Expected, msg = iPiece)
+            self.assertEqual(objResolver.Lines, len(self.Expected))
+        self.assertRaises(TypeError, objResolver.Feed, 1)
+        self.assertRaises(ValueError, objResolver.Feed, 'data')
+        objResolver.Close()
+    
+    def test_Backpressure(self):
+        """
+        The resolver should be paused when the limit of the not collected
+        batches is reached, and resumed after the collection.
+        
+        Version 0.2.0.0
+        """
+        objResolver = StreamResolver(iBatchSize = 2, iMaxPending = 3)
+        objResolver.Feed('a\nb\nc\nd\n')
+        self.assertEqual(objResolver.Pending, 2)
+        self.assertFalse(objResolver.Paused)
+        objResolver.Feed('e\nf\ng')
+        self.assertEqual(objResolver.Pending, 3)
+        self.assertTrue(objResolver.Paused)
+        self.assertEqual(len(objResolver.GetRecords()), 6)
+        self.assertFalse(objResolver.Paused)
+        objResolver.Close()
+        self.assertEqual(objResolver.Pending, 1)
+        self.assertEqual(objResolver.GetRecords(), [(7, 12, None, None, False)])
+        self.assertTrue(objResolver.Finished)
+    
+    def test_Executor(self):
+        """
+        The batches submitted to an executor should give the same records in
+        the same order.
+        
+        Version 0.2.0.0
+        """
+        objPool = multiprocessing.pool.ThreadPool(2)
+        try:
+            objResolver = StreamResolver(objPool, 16, 3)
+            lstRecords = []
+            for iStart in range(0, len(DATA), 100):
+                while objResolver.Paused:
+                    lstRecords.extend(objResolver.GetRecords(True))
+                objResolver.Feed(DATA[iStart : iStart + 100])
+                self.assertLessEqual(objResolver.Pending, 4)
+                lstRecords.extend(objResolver.GetRecords())
+            objResolver.Close()
+            while not objResolver.Finished:
+                lstRecords.extend(objResolver.GetRecords(True))
+            self.assertEqual(lstRecords, self.Expected)
+        finally:
+            objPool.terminate()
+            objPool.join()
+
+class Test_ResolveStream(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Stream.ResolveStream() function and the
+    event loop usage over the loopback interface.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        cls.Expected = list(ScanFile(io.BytesIO(DATA)))
+    
+    def test_Exception(self):
+        """
+        The TypeError or ValueError exceptions should be raised for the
+        improper arguments by the call.
+        
+        Version 0.2.0.0
+        """
+        for gCase in [1, None, 'data', [1]]:
+            self.assertRaises(TypeError, ResolveStream, gCase)
+        objFile = io.BytesIO(DATA)
+        self.assertRaises(TypeError, ResolveStream, objFile, 1)
+        self.assertRaises(TypeError, ResolveStream, objFile, iChunkSize = 1.0)
+        self.assertRaises(ValueError, ResolveStream, objFile, iChunkSize = 0)
+        self.assertRaises(ValueError, ResolveStream, objFile, iBatchSize = 0)
+    
+    def test_File(self):
+        """
+        The records of a file object should be the same as of ScanFile().
+        
+        Version 0.2.0.0
+        """
+        self.assertEqual(list(ResolveStream(io.BytesIO(DATA), None, 5, 2,
+                                                        50)), self.Expected)
+        self.assertEqual(list(ResolveStream(io.BytesIO(''))), [])
+    
+    def test_Socket(self):
+        """
+        The records of the data received over the loopback interface should
+        be the same as of ScanFile(), with and without an executor.
+        
+        Version 0.2.0.0
+        """
+        objPool = multiprocessing.pool.ThreadPool(2)
+        try:
+            for objExecutor in [None, objPool]:
+                objServer = LoopbackServer(DATA)
+                objServer.start()
+                objSocket = socket.create_connection(objServer.Address)
+                try:
+                    lstRecords = list(ResolveStream(objSocket, objExecutor, 8,
+                                                                    2, 256))
+                finally:
+                    objSocket.close()
+                objServer.join(5)
+                self.assertEqual(lstRecords, self.Expected)
+        finally:
+            objPool.terminate()
+            objPool.join()
+    
+    def test_EventLoop(self):
+        """
+        The event loop client should receive and resolve all data over the
+        loopback interface, never exceeding the limit of the pending batches.
+        
+        Version 0.2.0.0
+        """
+        objPool = multiprocessing.pool.ThreadPool(2)
+        try:
+            objServer = LoopbackServer(DATA, 1000)
+            objServer.start()
+            dictMap = {}
+            objResolver = StreamResolver(objPool, 4, 2)
+            objClient = ResolvingDispatcher(objServer.Address, objResolver,
+                                                                    dictMap)
+            while dictMap:
+                asyncore.loop(0.01, map = dictMap, count = 1)
+            while not objResolver.Finished:
+                objClient.Records.extend(objResolver.GetRecords(True))
+            objServer.join(5)
+            self.assertEqual(objClient.Records, self.Expected)
+            self.assertLessEqual(objClient.MaxPending, 2 + 64 // 4 + 1)
+        finally:
+            objPool.terminate()
+            objPool.join()
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_StreamResolver)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_ResolveStream)
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2])
+
+#execution entry point
+
+if __name__ == "__main__":
+    sys.stdout.write("Preparing regex_lib.Stream tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
+    sys.stdout.flush()
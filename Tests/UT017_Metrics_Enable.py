@@ -0,0 +1,328 @@
+#usr/bin/python
+"""
+Set of unit tests for regex_lib.Metrics.py module, functions Enable(),
+Disable(), IsEnabled(), Reset(), GetSnapshot() and FormatReport(), and class
+PatternCounters
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import unittest
+import sys
+import os
+
+#+ tested module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+import regex_lib.Search as Search
+
+import regex_lib.Date as Date
+
+import regex_lib.Time as Time
+
+from regex_lib.Metrics import Enable, Disable, IsEnabled, Reset, GetSnapshot, \
+                FormatReport, PatternCounters, INSTRUMENTED, LENGTH_BOUNDS, \
+                                                                    TIME_BOUNDS
+
+from regex_lib.Adaptive import AdaptiveDateResolver
+
+from regex_lib.Stamp import ResolveDateTime
+
+from regex_lib.Hint import HintDateResolver
+
+from regex_lib.Formats import MakeDateRegistry
+
+#globals
+
+CASES = ['20180509', '2018-05-09 12:30:01', 'no stamp', '',
+            "MSC00000001_20170502_1448_PROGRAMMING_PASS.xml",
+            '1 9_15.2018date', '23:59:59.5', '12:50 A.M.', '18.04.31',
+            '2018-12-31 23:59:59,7 p.m.', u'2018/05/09 7:05 am', '13:30 PM']
+
+#+ test cases
+
+class Test_Enable(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Metrics.Enable(), Disable() and IsEnabled()
+    functions.
+    
+    Version 0.2.0.0
+    """
+    
+    def setUp(self):
+        """
+        Disables the instrumentation and resets the counters.
+        
+        Version 0.2.0.0
+        """
+        Disable()
+        Reset()
+    
+    def tearDown(self):
+        """
+        Disables the instrumentation.
+        
+        Version 0.2.0.0
+        """
+        Disable()
+    
+    def test_Install(self):
+        """
+        Enabling should replace the instrumented functions by the wrappers
+        only once, disabling should restore the original functions.
+        
+        Version 0.2.0.0
+        """
+        lstOriginals = [getattr(objModule, strName)
+                            for objModule, strName, _ in INSTRUMENTED]
+        self.assertIs(Date.SearchLast, Search.SearchLast)
+        self.assertFalse(IsEnabled())
+        Enable()
+        self.assertTrue(IsEnabled())
+        lstWrappers = [getattr(objModule, strName)
+                            for objModule, strName, _ in INSTRUMENTED]
+        for fOriginal, fWrapper in zip(lstOriginals, lstWrappers):
+            self.assertIsNot(fOriginal, fWrapper)
+            self.assertEqual(fOriginal.__name__, fWrapper.__name__)
+        Enable()
+        for (objModule, strName, _), fWrapper in zip(INSTRUMENTED,
+                                                                lstWrappers):
+            self.assertIs(getattr(objModule, strName), fWrapper)
+        Disable()
+        self.assertFalse(IsEnabled())
+        for (objModule, strName, _), fOriginal in zip(INSTRUMENTED,
+                                                                lstOriginals):
+            self.assertIs(getattr(objModule, strName), fOriginal)
+        Disable()
+        self.assertIs(Date.SearchLast, Search.SearchLast)
+    
+    def test_Results(self):
+        """
+        The results of the resolution functions should not be changed by the
+        instrumentation.
+        
+        Version 0.2.0.0
+        """
+        lstFunctions = [Date.ResolveDate, Date.ResolveDateUnion,
+                            Time.ResolveTime, Time.ResolveTimeUnion,
+                            Date.ResolveDateTuple, Time.ResolveTimeTuple]
+        lstExpected = [[fFunction(strCase) for strCase in CASES]
+                                            for fFunction in lstFunctions]
+        lstExpected.append(Date.ResolveDates(CASES))
+        lstExpected.append(Time.ResolveTimes(CASES, bUnion = True))
+        Enable()
+        lstResults = [[fFunction(strCase) for strCase in CASES]
+                                            for fFunction in lstFunctions]
+        lstResults.append(Date.ResolveDates(CASES))
+        lstResults.append(Time.ResolveTimes(CASES, bUnion = True))
+        self.assertEqual(lstResults, lstExpected)
+        self.assertRaises(TypeError, Date.ResolveDate, 1)
+        self.assertRaises(TypeError, Time.ResolveTime, None)
+
+class Test_Counters(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Metrics.Reset(), GetSnapshot() and
+    FormatReport() functions and class PatternCounters.
+    
+    Version 0.2.0.0
+    """
+    
+    def setUp(self):
+        """
+        Enables the instrumentation with the reset counters.
+        
+        Version 0.2.0.0
+        """
+        Reset()
+        Enable()
+    
+    def tearDown(self):
+        """
+        Disables the instrumentation and resets the counters.
+        
+        Version 0.2.0.0
+        """
+        Disable()
+        Reset()
+    
+    def test_Patterns(self):
+        """
+        Each search should be counted as an attempt of the pattern, and the
+        found stamps as the matches, together with the fast paths.
+        
+        Version 0.2.0.0
+        """
+        Date.ResolveDate('2018-05-09')
+        Date.ResolveDate('2018-13-40')
+        Date.ResolveDate('no stamp')
+        dictPatterns = GetSnapshot()['Patterns']
+        self.assertEqual(dictPatterns['ScanCompactDate']['Attempts'], 3)
+        self.assertEqual(dictPatterns['ScanCompactDate']['Matches'], 0)
+        self.assertEqual(dictPatterns['C_ISO_DATE_SEARCH']['Attempts'], 2)
+        self.assertEqual(dictPatterns['C_ISO_DATE_SEARCH']['Matches'], 1)
+        for strName in ['C_REVERSED_DATE_SEARCH', 'C_SCREWED_DATE_SEARCH',
+                            'C_SHORT_DATE_SEARCH', 'C_COMPACT_DATE_SEARCH']:
+            self.assertEqual(dictPatterns[strName]['Attempts'], 1)
+            self.assertEqual(dictPatterns[strName]['Matches'], 0)
+        dictItem = dictPatterns['C_ISO_DATE_SEARCH']
+        self.assertEqual(dictItem['Name'], 'C_ISO_DATE_SEARCH')
+        self.assertEqual(dictItem['Lengths'],
+                            [0, 2] + [0] * (len(LENGTH_BOUNDS) - 1))
+        self.assertEqual(sum(dictItem['Times']), 2)
+        self.assertGreater(dictItem['Time'], 0)
+        Date.ResolveDateUnion('20180509')
+        Time.ResolveTimes(['12:30', 'no stamp'])
+        AdaptiveDateResolver()('2018-05-09')
+        dictPatterns = GetSnapshot()['Patterns']
+        self.assertEqual(dictPatterns['C_DATE_UNION']['Matches'], 1)
+        self.assertEqual(dictPatterns['C_TIME_SEARCH']['Attempts'], 2)
+        self.assertEqual(dictPatterns['C_SHORT_TIME_SEARCH']['Matches'], 1)
+        self.assertEqual(dictPatterns['C_ISO_DATE_SEARCH']['Attempts'], 3)
+    
+    def test_Modules(self):
+        """
+        The searches of the modules Stamp, Hint and Formats should be counted,
+        as well as the rollovers of ResolveDateTime().
+        
+        Version 0.2.0.0
+        """
+        for _ in range(10):
+            ResolveDateTime('2018-12-31 23:59:59.7')
+        ResolveDateTime('no stamp')
+        dictSnapshot = GetSnapshot()
+        dictItem = dictSnapshot['Patterns']['C_DATETIME_UNION']
+        self.assertEqual(dictItem['Attempts'], 11)
+        self.assertEqual(dictItem['Matches'], 10)
+        self.assertGreater(dictItem['Time'], 0)
+        self.assertEqual(dictSnapshot['Events']['Rollovers'], 10)
+        self.assertEqual(dictSnapshot['Events']['DateIncrements'], 10)
+        Reset()
+        objResolver = HintDateResolver()
+        objResolver('2018-05-09')
+        objResolver('no stamp')
+        dictPatterns = GetSnapshot()['Patterns']
+        self.assertGreater(dictPatterns['C_ISO_DATE_SEARCH']['Attempts'], 0)
+        self.assertGreater(dictPatterns['C_ISO_DATE_SEARCH']['Matches'], 0)
+        Reset()
+        lstRegistries = [MakeDateRegistry(), MakeDateRegistry()]
+        lstRegistries[1].Register('DD.MM.YY', ('day', '.', 'month', '.',
+                                                        'short_year'), 25)
+        for objRegistry in lstRegistries:
+            self.assertEqual(objRegistry.ResolveTuple('at 2018-05-09'),
+                                                                (2018, 5, 9))
+        dictPatterns = GetSnapshot()['Patterns']
+        self.assertEqual(len(dictPatterns), 2)
+        for dictItem in dictPatterns.values():
+            self.assertTrue(dictItem['Name'].startswith('pattern'))
+            self.assertEqual(dictItem['Attempts'], 1)
+            self.assertEqual(dictItem['Matches'], 1)
+    
+    def test_Events(self):
+        """
+        The a.m. / p.m. rejections, the rounding rollovers and the date
+        increments should be counted.
+        
+        Version 0.2.0.0
+        """
+        Time.ResolveTime('13:30 PM')
+        Time.ResolveTime('10:59:59.7')
+        Time.ResolveTime('23:59:59.5')
+        Time.ResolveTime('12:30 p.m.')
+        self.assertEqual(GetSnapshot()['Events'], {'AM_PM_Rejections' : 1,
+                                        'Rollovers' : 2, 'DateIncrements' : 1})
+    
+    def test_Snapshot(self):
+        """
+        The snapshot should be a copy not affected by the further counting or
+        reset, nothing should be counted while disabled.
+        
+        Version 0.2.0.0
+        """
+        Date.ResolveDate('2018-05-09')
+        dictSnapshot = GetSnapshot()
+        self.assertTrue(dictSnapshot['Enabled'])
+        Date.ResolveDate('2018-05-09')
+        self.assertEqual(
+            dictSnapshot['Patterns']['C_ISO_DATE_SEARCH']['Attempts'], 1)
+        Disable()
+        Date.ResolveDate('2018-05-09')
+        dictCurrent = GetSnapshot()
+        self.assertFalse(dictCurrent['Enabled'])
+        self.assertEqual(
+            dictCurrent['Patterns']['C_ISO_DATE_SEARCH']['Attempts'], 2)
+        Reset()
+        self.assertEqual(GetSnapshot(), {'Enabled' : False, 'Patterns' : {},
+                'Events' : {'AM_PM_Rejections' : 0, 'Rollovers' : 0,
+                                                        'DateIncrements' : 0}})
+        self.assertEqual(
+            dictSnapshot['Patterns']['C_ISO_DATE_SEARCH']['Attempts'], 1)
+    
+    def test_FormatReport(self):
+        """
+        The report should list the counted patterns and the events.
+        
+        Version 0.2.0.0
+        """
+        strEmpty = FormatReport()
+        self.assertIn('a.m. / p.m. rejections: 0', strEmpty)
+        Time.ResolveTime('12:30')
+        dictSnapshot = GetSnapshot()
+        Reset()
+        strReport = FormatReport(dictSnapshot)
+        self.assertIsInstance(strReport, str)
+        for strName in ['ScanCompactTime', 'C_TIME_SEARCH',
+                                                        'C_SHORT_TIME_SEARCH']:
+            self.assertIn(strName, strReport)
+        self.assertIn('lengths: <8: 1', strReport)
+        self.assertNotIn('C_TIME_SEARCH', FormatReport())
+    
+    def test_PatternCounters(self):
+        """
+        The histograms should count the values into the buckets of the bounds.
+        
+        Version 0.2.0.0
+        """
+        objCounters = PatternCounters('test')
+        objCounters.Record(0, 0.0, False)
+        objCounters.Record(LENGTH_BOUNDS[0], TIME_BOUNDS[0] * 1.0E-6, True)
+        objCounters.Record(LENGTH_BOUNDS[-1], 1.0, True)
+        dictItem = objCounters.GetStatistics()
+        self.assertEqual(dictItem['Attempts'], 3)
+        self.assertEqual(dictItem['Matches'], 2)
+        self.assertAlmostEqual(dictItem['Time'], 1.000001)
+        self.assertEqual(dictItem['Lengths'][0], 1)
+        self.assertEqual(dictItem['Lengths'][1], 1)
+        self.assertEqual(dictItem['Lengths'][-1], 1)
+        self.assertEqual(dictItem['Times'][0], 1)
+        self.assertEqual(dictItem['Times'][-1], 1)
+        dictItem['Lengths'][0] = 10
+        self.assertEqual(objCounters.Lengths[0], 1)
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_Enable)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_Counters)
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2])
+
+#execution entry point
+
+if __name__ == "__main__":
+    sys.stdout.write("Preparing regex_lib.Metrics tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
+    sys.stdout.flush()
@@ -0,0 +1,222 @@
+#usr/bin/python
+"""
+Set of unit tests for regex_lib.Formats.py module, class FormatRegistry and
+functions MakeFormatPattern(), MakeDateRegistry() and MakeTimeRegistry()
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import unittest
+import sys
+import os
+
+#+ tested module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Formats import FormatRegistry, MakeFormatPattern, \
+        MakeDateRegistry, MakeTimeRegistry, SITE_DATE_FORMATS, MAX_FORMATS, \
+                                                    DAY_PATTERN, MONTH_PATTERN
+
+from regex_lib.Date import ResolveDate, ResolveDateTuple
+
+from regex_lib.Time import ResolveTime, ResolveTimeTuple
+
+#globals
+
+CASES = ['20180509', '2018-05-09 12:30:01', 'no stamp', '',
+            "MSC00000001_20170502_1448_PROGRAMMING_PASS.xml",
+            '1 9_15.2018date', '23:59:59.5', '12:50 A.M.', '18.04.31',
+            '2018-12-31 23:59:59,7 p.m.', '2018-12-31 11:59:59,7 p.m.',
+            u'2018/05/09 7:05 am', '13:30 PM', '05/13/2018', '11.05.18 1230',
+            '2018-05-09\n2017-04-08', '1_2_3_4_5_6_7_8_9', '123456789']
+
+#+ test cases
+
+class Test_MakeFormatPattern(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Formats.MakeFormatPattern() function.
+    
+    Version 0.2.0.0
+    """
+    
+    def test_Layout(self):
+        """
+        The field roles should be replaced by the fragments and the other
+        elements escaped; the core patterns are returned as they are.
+        
+        Version 0.2.0.0
+        """
+        self.assertEqual(MakeFormatPattern(('day', '.', 'month')),
+                                    DAY_PATTERN + r'\.' + MONTH_PATTERN)
+        self.assertEqual(MakeFormatPattern(['day', '#+', 'month']),
+                                    DAY_PATTERN + r'\#\+' + MONTH_PATTERN)
+        self.assertEqual(MakeFormatPattern(r'[0-9]+'), r'[0-9]+')
+    
+    def test_Exceptions(self):
+        """
+        Not valid layouts should be rejected.
+        
+        Version 0.2.0.0
+        """
+        for gLayout in [None, 1, {'day' : 1}, ('day', 1)]:
+            self.assertRaises(TypeError, MakeFormatPattern, gLayout)
+        for gLayout in ['', (), ('.', 'day'), ('separator', 'day'),
+                                                                ('modifier', )]:
+            self.assertRaises(ValueError, MakeFormatPattern, gLayout)
+
+class Test_FormatRegistry(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Formats.FormatRegistry class.
+    
+    Version 0.2.0.0
+    """
+    
+    def test_BuiltIn(self):
+        """
+        The registries of the built-in formats should resolve the stamps as
+        the functions ResolveDate() and ResolveTime().
+        
+        Version 0.2.0.0
+        """
+        objDates = MakeDateRegistry()
+        objTimes = MakeTimeRegistry()
+        self.assertEqual(objDates.Names, ['ISO_DATE', 'REVERSED_DATE',
+                            'SCREWED_DATE', 'SHORT_DATE', 'COMPACT_DATE'])
+        self.assertEqual(objTimes.Names, ['TIME', 'SHORT_TIME',
+                                        'COMPACT_TIME', 'SHORT_COMPACT_TIME'])
+        for strCase in CASES:
+            self.assertEqual(objDates.ResolveTuple(strCase),
+                                    ResolveDateTuple(strCase), msg = strCase)
+            self.assertEqual(objDates.Resolve(strCase), ResolveDate(strCase),
+                                                                msg = strCase)
+            self.assertEqual(objTimes.ResolveTuple(strCase),
+                                    ResolveTimeTuple(strCase), msg = strCase)
+            self.assertEqual(objTimes.Resolve(strCase), ResolveTime(strCase),
+                                                                msg = strCase)
+        self.assertEqual(objDates.Identify('05/13/2018'),
+                                            ('SCREWED_DATE', (2018, 5, 13)))
+        self.assertEqual(objTimes.Identify('13:30 PM'), ('SHORT_TIME', None))
+        self.assertIsNone(objTimes.Identify('no stamp'))
+        for objRegistry in [objDates, objTimes]:
+            for gStamp in [None, 1, ['2018-05-09']]:
+                self.assertRaises(TypeError, objRegistry.Resolve, gStamp)
+    
+    def test_SiteFormats(self):
+        """
+        The site-specific formats should be resolved with their priorities.
+        
+        Version 0.2.0.0
+        """
+        objDates = MakeDateRegistry()
+        self.assertEqual(objDates.Resolve('measured 09.05.18'), '2009-05-18')
+        for strName, gLayout, iPriority, strExcluded in SITE_DATE_FORMATS:
+            objDates.Register(strName, gLayout, iPriority, strExcluded)
+        self.assertEqual(objDates.Names, ['ISO_DATE', 'REVERSED_DATE',
+                            'SCREWED_DATE', 'DD.MM.YY', 'SHORT_DATE',
+                                                'YYYY-DDD', 'COMPACT_DATE'])
+        self.assertEqual(objDates.Identify('measured 09.05.18'),
+                                                ('DD.MM.YY', (2018, 5, 9)))
+        self.assertEqual(objDates.Resolve('18.04.31'), '2031-04-18')
+        self.assertEqual(objDates.Resolve('18.04.31'), '2031-04-18')
+        self.assertEqual(objDates.Identify('build 2018-123'),
+                                                ('YYYY-DDD', (2018, 5, 3)))
+        self.assertEqual(objDates.Resolve('2016-366'), '2016-12-31')
+        self.assertEqual(objDates.Resolve('2017-001'), '2017-01-01')
+        self.assertEqual(objDates.Identify('2017-366'), ('YYYY-DDD', None))
+        self.assertIsNone(objDates.Resolve('2017-367'))
+        self.assertIsNone(objDates.Resolve('2017-1234'))
+        self.assertEqual(objDates.Resolve('2018-05-09 2018-123'), '2018-05-09')
+        self.assertEqual(objDates.Resolve('20180509 2018-123'), '2018-05-03')
+        objDates.Unregister('DD.MM.YY')
+        self.assertEqual(objDates.Resolve('measured 09.05.18'), '2009-05-18')
+        self.assertRaises(ValueError, objDates.Unregister, 'DD.MM.YY')
+    
+    def test_Register(self):
+        """
+        The formats of the same priority should be tried in the order of the
+        registration, the not valid formats should be rejected.
+        
+        Version 0.2.0.0
+        """
+        objDates = FormatRegistry('date')
+        self.assertRaises(ValueError, objDates.Resolve, '2018-05-09')
+        objDates.Register('A', ('year', '#', 'month', '#', 'day'))
+        objDates.Register('B', ('day', '#', 'month', '#', 'year'))
+        self.assertEqual(objDates.Resolve('2018#05#09 09#05#2017'),
+                                                                '2018-05-09')
+        objDates.Register('C', ('day', '#', 'month', '#', 'year'), 1)
+        self.assertEqual(objDates.Resolve('2018#05#09 08#05#2017'),
+                                                                '2017-05-08')
+        self.assertEqual(objDates.Names, ['C', 'A', 'B'])
+        self.assertRaises(ValueError, objDates.Register, 'A', ('year', 'day'))
+        self.assertRaises(ValueError, objDates.Register, 'D', ('year', 'day'))
+        self.assertRaises(ValueError, objDates.Register, 'D', r'[0-9](')
+        self.assertRaises(ValueError, objDates.Register, 'D',
+                                    ('year', 'month', 'day', 'day'))
+        self.assertRaises(ValueError, objDates.Register, 'D',
+                                    ('year', 'month', 'day'), 0, '-')
+        self.assertRaises(TypeError, objDates.Register, 1,
+                                    ('year', 'month', 'day'))
+        self.assertRaises(TypeError, objDates.Register, 'D',
+                                    ('year', 'month', 'day'), 1.0)
+        self.assertRaises(TypeError, objDates.Register, 'D',
+                                    ('year', 'month', 'day'), True)
+        self.assertRaises(TypeError, objDates.Register, 'D',
+                                    ('year', 'month', 'day'), 0, None)
+        self.assertEqual(objDates.Names, ['C', 'A', 'B'])
+        self.assertRaises(ValueError, FormatRegistry, 'stamp')
+        objTimes = FormatRegistry('time')
+        self.assertRaises(ValueError, objTimes.Register, 'D',
+                                                    ('year', 'month', 'day'))
+        objTimes.Register('H', ('hour', 'h', 'minute', 'modifier'))
+        self.assertEqual(objTimes.Resolve('at 14h30'), ('14:30:00', False))
+        self.assertEqual(objTimes.Resolve('at 2h30 pm'), ('14:30:00', False))
+        self.assertEqual(objTimes.Resolve('at 14:30'), (None, False))
+        objDates = FormatRegistry('date')
+        for iIndex in range(MAX_FORMATS):
+            objDates.Register(str(iIndex), ('year', '#', 'ordinal'))
+        self.assertRaises(ValueError, objDates.Register, 'X',
+                                                    ('year', '#', 'ordinal'))
+        self.assertEqual(objDates.Resolve('2018#003'), '2018-01-03')
+        self.assertEqual(objDates.Identify('2018#003'), ('0', (2018, 1, 3)))
+        #+ the same compiled search pattern of several formats
+        objDates = FormatRegistry('date')
+        objDates.Register('A', ('day', '#', 'month', '#', 'year'))
+        objDates.Register('B', ('year', '#', 'month', '#', 'day'))
+        objDates.Register('C', ('year', '#', 'month', '#', 'day'), 1)
+        self.assertEqual(objDates.Identify('09#05#2018 2018#05#10'),
+                                                    ('C', (2018, 5, 10)))
+        objDates.Unregister('C')
+        self.assertEqual(objDates.Identify('09#05#2018 2018#05#10'),
+                                                    ('A', (2018, 5, 9)))
+        self.assertEqual(objDates.Identify('2018#05#10'), ('B', (2018, 5, 10)))
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_MakeFormatPattern)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_FormatRegistry)
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2])
+
+#execution entry point
+
+if __name__ == "__main__":
+    sys.stdout.write("Preparing regex_lib.Formats tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
+    sys.stdout.flush()
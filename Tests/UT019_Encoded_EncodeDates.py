@@ -0,0 +1,244 @@
+#usr/bin/python
+"""
+Set of unit tests for regex_lib.Encoded.py module, class EncodedResults and
+functions EncodeDates(), EncodeTimes() and MergeResults()
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import unittest
+import sys
+import os
+import array
+import pickle
+
+#+ tested module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Encoded import EncodedResults, EncodeDates, EncodeTimes, \
+                                                    MergeResults, CODE_TYPE
+
+from regex_lib.Date import ResolveDates
+
+from regex_lib.Time import ResolveTimes
+
+#globals
+
+CASES = ['20180509', '2018-05-09 12:30:01', 'no stamp', '',
+            "MSC00000001_20170502_1448_PROGRAMMING_PASS.xml",
+            '1 9_15.2018date', '23:59:59.5', '12:50 A.M.', '18.04.31',
+            '2018-12-31 23:59:59,7 p.m.', u'2018/05/09 7:05 am',
+            '13:30 PM', '2018-05-09', 'no stamp', '12:30:01']
+
+#+ test cases
+
+class Test_EncodedResults(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Encoded.EncodedResults class.
+    
+    Version 0.2.0.0
+    """
+    
+    def test_Extend(self):
+        """
+        The codes should be assigned in the order of the first appearance of
+        the values, the decoded values should be the passed ones.
+        
+        Version 0.2.0.0
+        """
+        objResults = EncodedResults()
+        self.assertEqual(len(objResults), 0)
+        self.assertEqual(objResults.Decode(), [])
+        lstValues = ['a', None, 'b', 'a', None, ('c', False), 'b']
+        objResults.Extend(iter(lstValues))
+        self.assertIsInstance(objResults.Codes, array.array)
+        self.assertEqual(objResults.Codes.typecode, CODE_TYPE)
+        self.assertEqual(list(objResults.Codes), [0, 1, 2, 0, 1, 3, 2])
+        self.assertEqual(objResults.Values, ['a', None, 'b', ('c', False)])
+        self.assertEqual(len(objResults), 7)
+        self.assertEqual(objResults.Decode(), lstValues)
+        self.assertEqual(list(objResults), lstValues)
+        self.assertEqual(objResults[5], ('c', False))
+        self.assertEqual(objResults[-1], 'b')
+        self.assertEqual(objResults[1:4], [None, 'b', 'a'])
+        self.assertRaises(IndexError, objResults.__getitem__, 7)
+        self.assertEqual(objResults.Append('a'), 0)
+        self.assertEqual(objResults.Append('d'), 4)
+        self.assertEqual(objResults.Decode(), lstValues + ['a', 'd'])
+        self.assertRaises(TypeError, objResults.Append, ['a'])
+    
+    def test_Merge(self):
+        """
+        The merged results should be the concatenation of the decoded values,
+        with the single common table; the merged instance is not modified.
+        
+        Version 0.2.0.0
+        """
+        objFirst = EncodedResults()
+        objFirst.Extend(['a', 'b', 'a'])
+        objSecond = EncodedResults()
+        objSecond.Extend(['c', 'a', 'c', None])
+        objFirst.Merge(objSecond)
+        self.assertEqual(objFirst.Decode(),
+                                    ['a', 'b', 'a', 'c', 'a', 'c', None])
+        self.assertEqual(objFirst.Values, ['a', 'b', 'c', None])
+        self.assertEqual(list(objFirst.Codes), [0, 1, 0, 2, 0, 2, 3])
+        self.assertEqual(objSecond.Decode(), ['c', 'a', 'c', None])
+        #+ the table of the merged instance is a prefix of the table
+        objThird = EncodedResults()
+        objThird.Extend(['b', 'a'])
+        objThird.Merge(objFirst)
+        self.assertEqual(objThird.Decode(),
+                        ['b', 'a', 'a', 'b', 'a', 'c', 'a', 'c', None])
+        objFirst.Merge(objFirst)
+        self.assertEqual(objFirst.Decode(), ['a', 'b', 'a', 'c', 'a', 'c',
+                                    None, 'a', 'b', 'a', 'c', 'a', 'c', None])
+        objFirst.Merge(EncodedResults())
+        self.assertEqual(len(objFirst), 14)
+        for gOther in [None, ['a'], objFirst.Codes]:
+            self.assertRaises(TypeError, objFirst.Merge, gOther)
+    
+    def test_Pickle(self):
+        """
+        The unpickled instance should have the same codes and values, and its
+        look-up dictionary should be rebuilt.
+        
+        Version 0.2.0.0
+        """
+        objResults = EncodedResults()
+        objResults.Extend(['a', None, ('b', True), 'a'])
+        for iProtocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            objCopy = pickle.loads(pickle.dumps(objResults, iProtocol))
+            self.assertEqual(objCopy.Codes, objResults.Codes)
+            self.assertEqual(objCopy.Values, objResults.Values)
+            self.assertEqual(objCopy.Append(('b', True)), 2)
+            self.assertEqual(objCopy.Append('c'), 3)
+    
+    def test_GetStatistics(self):
+        """
+        The statistics should reflect the numbers of the entries and of the
+        unique values.
+        
+        Version 0.2.0.0
+        """
+        objResults = EncodedResults()
+        self.assertEqual(objResults.GetStatistics(), {'Entries' : 0,
+                                'Unique' : 0, 'CodeBytes' : 0, 'Ratio' : 0.0})
+        objResults.Extend(['a', 'b', 'a', 'a'])
+        dictStatistics = objResults.GetStatistics()
+        self.assertEqual(dictStatistics['Entries'], 4)
+        self.assertEqual(dictStatistics['Unique'], 2)
+        self.assertEqual(dictStatistics['CodeBytes'],
+                                                4 * objResults.Codes.itemsize)
+        self.assertAlmostEqual(dictStatistics['Ratio'], 2.0)
+
+class Test_EncodeDates(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Encoded.EncodeDates(), EncodeTimes() and
+    MergeResults() functions.
+    
+    Version 0.2.0.0
+    """
+    
+    def test_EncodeDates(self):
+        """
+        The decoded results should be the same as of the function
+        ResolveDates() for all policies and both engines.
+        
+        Version 0.2.0.0
+        """
+        lstCases = CASES + [None, 20180509]
+        for bUnion in [False, True]:
+            objResults = EncodeDates(CASES, bUnion = bUnion)
+            self.assertEqual(objResults.Decode(), ResolveDates(CASES))
+            self.assertEqual(len(objResults.Values),
+                                            len(set(ResolveDates(CASES))))
+            for strPolicy in ['skip', 'none']:
+                objResults = EncodeDates(iter(lstCases), strPolicy, bUnion)
+                self.assertEqual(objResults.Decode(),
+                                    ResolveDates(lstCases, strPolicy, bUnion))
+        self.assertRaises(TypeError, EncodeDates, lstCases)
+        for strPolicy in ['RAISE', None, 1]:
+            self.assertRaises(ValueError, EncodeDates, CASES, strPolicy)
+    
+    def test_EncodeTimes(self):
+        """
+        The decoded results should be the same as of the function
+        ResolveTimes() for all policies and both engines.
+        
+        Version 0.2.0.0
+        """
+        lstCases = CASES + [None, 1448]
+        for bUnion in [False, True]:
+            objResults = EncodeTimes(CASES, bUnion = bUnion)
+            self.assertEqual(objResults.Decode(), ResolveTimes(CASES))
+            for strPolicy in ['skip', 'none']:
+                objResults = EncodeTimes(iter(lstCases), strPolicy, bUnion)
+                self.assertEqual(objResults.Decode(),
+                                    ResolveTimes(lstCases, strPolicy, bUnion))
+        self.assertRaises(TypeError, EncodeTimes, lstCases)
+        self.assertRaises(ValueError, EncodeTimes, CASES, 'RAISE')
+    
+    def test_Extension(self):
+        """
+        The passed instance should be extended in place and returned.
+        
+        Version 0.2.0.0
+        """
+        objResults = EncodeDates(CASES[:5])
+        self.assertIs(EncodeDates(CASES[5:], objResults = objResults),
+                                                                    objResults)
+        self.assertEqual(objResults.Decode(), ResolveDates(CASES))
+        self.assertRaises(TypeError, EncodeDates, CASES, 'raise', False,
+                                                                    ['a'])
+        self.assertRaises(TypeError, EncodeTimes, CASES, 'raise', False,
+                                                                    ['a'])
+    
+    def test_MergeResults(self):
+        """
+        The merged chunks should give the same results as the whole sequence,
+        with the single common table of the unique results.
+        
+        Version 0.2.0.0
+        """
+        lstChunks = [CASES[iStart : iStart + 4]
+                                    for iStart in range(0, len(CASES), 4)]
+        objResults = MergeResults(EncodeDates(lstChunk)
+                                                    for lstChunk in lstChunks)
+        self.assertEqual(objResults.Decode(), ResolveDates(CASES))
+        self.assertEqual(sorted(objResults.Values),
+                                        sorted(set(ResolveDates(CASES))))
+        objResults = MergeResults(iter([EncodeTimes(lstChunk)
+                                                for lstChunk in lstChunks]))
+        self.assertEqual(objResults.Decode(), ResolveTimes(CASES))
+        self.assertEqual(MergeResults([]).Decode(), [])
+        self.assertRaises(TypeError, MergeResults, [CASES])
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_EncodedResults)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_EncodeDates)
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2])
+
+#execution entry point
+
+if __name__ == "__main__":
+    sys.stdout.write("Preparing regex_lib.Encoded tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
+    sys.stdout.flush()
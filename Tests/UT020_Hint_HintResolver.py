@@ -0,0 +1,223 @@
+#usr/bin/python
+"""
+Set of unit tests for regex_lib.Hint.py module, classes HintResolver,
+HintDateResolver and HintTimeResolver
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import unittest
+import sys
+import os
+import random
+
+#+ tested module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Hint import HintResolver, HintDateResolver, HintTimeResolver
+
+from regex_lib.Adaptive import DATE_NAMES, DATE_SIGNATURES
+
+from regex_lib.Date import ResolveDateTuple, C_DATE_SEARCH_PATTERNS, \
+                                                        ConvertDateMatchTuple
+
+from regex_lib.Time import ResolveTimeTuple
+
+#+ test cases
+
+class Test_HintResolver(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Hint.HintDateResolver and HintTimeResolver
+    classes.
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        cls.ExceptionCases = [1, None, 1.0, [1], (1, 2), {1 : 2}, True]
+        cls.Resolvers = [(HintDateResolver, ResolveDateTuple),
+                            (HintTimeResolver, ResolveTimeTuple)]
+        cls.Cases = ['20180509', '2018-05-09 12:30:01', 'no stamp', '',
+                    "MSC00000001_20170502_1448_PROGRAMMING_PASS.xml",
+                    '1 9_15.2018date', '23:59:59.5', '12:50 A.M.',
+                    '2018-12-31 11:59:59,7 p.m.', '13:30 PM', '09.05.18 1:2',
+                    '5-13-2018 9-5-2018', '18.05.09 2018.05.10',
+                    'a 2018-05-09\n12:30 20180510\n2018-05-11 1:30',
+                    u'2018/05/09 7:05 am', u'\xe9 18-5-9 5:13']
+    
+    def test_Init(self):
+        """
+        Initialization should check the numbers of the patterns, names and
+        signatures; there should be no hint initially.
+        
+        Version 0.2.0.0
+        """
+        self.assertRaises(ValueError, HintResolver, C_DATE_SEARCH_PATTERNS,
+                                            DATE_NAMES, DATE_SIGNATURES[:-1],
+                                                ConvertDateMatchTuple, False)
+        for cResolver, _ in self.Resolvers:
+            objResolver = cResolver()
+            self.assertIsNone(objResolver.Hint)
+            self.assertEqual(objResolver.GetStatistics(), {'Calls' : 0,
+                        'Hits' : 0, 'Misses' : 0, 'FastPaths' : 0,
+                        'Verifications' : 0, 'HitRate' : 0.0, 'Hint' : None})
+    
+    def test_Exception(self):
+        """
+        The TypeError exception should be raised for the non-string arguments.
+        
+        Version 0.2.0.0
+        """
+        for cResolver, _ in self.Resolvers:
+            objResolver = cResolver()
+            objResolver('2018-05-09 12:30:01')
+            for gCase in self.ExceptionCases:
+                self.assertRaises(TypeError, objResolver, gCase)
+    
+    def test_Results(self):
+        """
+        The results should be the same as of the fixed order functions for any
+        preceding hint.
+        
+        Version 0.2.0.0
+        """
+        for cResolver, fReference in self.Resolvers:
+            for strFirst in self.Cases:
+                objResolver = cResolver()
+                objResolver(strFirst)
+                for strCase in self.Cases:
+                    self.assertEqual(objResolver(strCase),
+                                        fReference(strCase), msg = strCase)
+    
+    def test_Verification(self):
+        """
+        The hint should not be used if a pattern of the higher priority or a
+        later occurrence of the same pattern is present, or if there is a new
+        line character before the last one.
+        
+        Version 0.2.0.0
+        """
+        objResolver = HintDateResolver()
+        self.assertEqual(objResolver('2018-05-09 INFO'), (2018, 5, 9))
+        self.assertEqual(objResolver.Hint, ('ISO_DATE', 0))
+        self.assertEqual(objResolver('2018-05-10 INFO 1.5.2 10.0.0.1'),
+                                                                (2018, 5, 10))
+        self.assertEqual(objResolver.Hits, 1)
+        self.assertEqual(objResolver('2018-05-10 until 2018-05-11'),
+                                                                (2018, 5, 11))
+        self.assertEqual(objResolver.Hint, ('ISO_DATE', 17))
+        self.assertEqual(objResolver.Misses, 1)
+        self.assertEqual(objResolver('2018-05-10 2018-05-11\nx'),
+                                                                (2018, 5, 11))
+        self.assertEqual(objResolver.Misses, 2)
+        self.assertEqual(objResolver('2018-05-10 2018-05-12\n'),
+                                                                (2018, 5, 12))
+        self.assertEqual(objResolver.Hits, 2)
+        objResolver = HintDateResolver()
+        self.assertEqual(objResolver('x 20180509 y'), (2018, 5, 9))
+        self.assertEqual(objResolver.Hint, None)
+        self.assertEqual(objResolver.FastPaths, 1)
+        self.assertEqual(objResolver('x 20180509 y 1.2.3'), (2018, 5, 9))
+        self.assertEqual(objResolver.Hint, ('COMPACT_DATE', 2))
+        self.assertEqual(objResolver('x 20180510 y 5-13-2018'),
+                                                                (2018, 5, 13))
+        self.assertEqual(objResolver.Hint, ('SCREWED_DATE', 13))
+        objResolver = HintTimeResolver()
+        self.assertEqual(objResolver('12:30:01 x'), (12, 30, 1, 0, False))
+        self.assertEqual(objResolver('12:30:02:05:07 x'), (2, 5, 7, 0, False))
+        self.assertEqual(objResolver.Hint, ('TIME', 6))
+        self.assertEqual(objResolver('12:30:03 x'), (12, 30, 3, 0, False))
+        self.assertEqual(objResolver.Hits, 0)
+        self.assertEqual(objResolver('12:30:04 PM x 1:15'),
+                                                        (12, 30, 4, 0, False))
+        self.assertEqual(objResolver.Hits, 1)
+        iVerifications = objResolver.Verifications
+        self.assertEqual(objResolver('12:30:05 x 99:99:99'),
+                                                        (12, 30, 5, 0, False))
+        self.assertEqual(objResolver.Hits, 2)
+        self.assertEqual(objResolver.Verifications, iVerifications + 1)
+    
+    def test_Random(self):
+        """
+        The results should be the same as of the fixed order functions on the
+        random streams of the strings with the stamps mostly at the same
+        offset, and the hint should be used.
+        
+        Version 0.2.0.0
+        """
+        objRandom = random.Random(20181018)
+        lstPieces = ['20180509', '19991231', '123456', '2359', '2018', '12',
+                        '5', '31', '13', '00', '-', '/', '_', '.', ',', ':',
+                        ' ', 'x', '\n', 'a.m.', ' PM', 'p.m', 'PM.',
+                        '23:59:59.6', '11:59:59.5 PM', '12:30', '09.05.18',
+                        '5-13-2018']
+        lstPrefixes = ['2018-05-09 12:30:01', '[2018-05-10 23:59:59.7 pm]',
+                                '09.05.18 1430', '20180509_123001', '']
+        for cResolver, fReference in self.Resolvers:
+            objResolver = cResolver()
+            for _ in range(3000):
+                if objRandom.random() < 0.2:
+                    strPrefix = objRandom.choice(lstPrefixes)
+                else:
+                    strPrefix = lstPrefixes[0]
+                strCase = strPrefix + ''.join(objRandom.choice(lstPieces)
+                                    for _ in range(objRandom.randint(0, 6)))
+                self.assertEqual(objResolver(strCase), fReference(strCase),
+                                                        msg = repr(strCase))
+            dictStatistics = objResolver.GetStatistics()
+            self.assertEqual(dictStatistics['Calls'], 3000)
+            self.assertGreater(dictStatistics['Hits'], 500)
+            self.assertGreater(dictStatistics['Misses'], 0)
+            self.assertAlmostEqual(dictStatistics['HitRate'],
+                                            dictStatistics['Hits'] / 3000.0)
+    
+    def test_Clear(self):
+        """
+        The hint and the counters should be reset.
+        
+        Version 0.2.0.0
+        """
+        objResolver = HintTimeResolver()
+        for strCase in ['12:30:01 x', '12:30:02 y', 'none']:
+            objResolver(strCase)
+        dictStatistics = objResolver.GetStatistics()
+        self.assertEqual(dictStatistics['Hint'], ('TIME', 0))
+        self.assertEqual(dictStatistics['Hits'], 1)
+        self.assertEqual(dictStatistics['Misses'], 1)
+        objResolver.Clear()
+        self.assertIsNone(objResolver.Hint)
+        self.assertEqual(objResolver.Calls, 0)
+        self.assertEqual(objResolver.Hits, 0)
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_HintResolver)
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1])
+
+#execution entry point
+
+if __name__ == "__main__":
+    sys.stdout.write("Preparing regex_lib.Hint tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
+    sys.stdout.flush()
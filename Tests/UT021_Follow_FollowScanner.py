@@ -0,0 +1,433 @@
+#usr/bin/python
+"""
+Set of unit tests for regex_lib.Follow.py module, class FollowScanner and
+function FollowFile()
+
+Version 0.2.0.0
+"""
+
+__author__ = "Anton Azarov"
+__copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
+__license__ = "GPL"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+__maintainer__ = "a.azarov@diagnoptics.com"
+
+#imports
+
+#+ standard libraries
+
+import unittest
+import sys
+import os
+import types
+import shutil
+import tempfile
+import StringIO
+
+#+ tested module and class / function
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__),
+                                                                '../../..')))
+
+from regex_lib.Follow import FollowScanner, FollowFile
+
+from regex_lib.Scanner import ScanFile
+
+#globals
+
+LINES = ['2018-05-09 12:30:01 start', 'no stamp', '',
+            'MSC00000001_20170502_1448_PROGRAMMING_PASS.xml\r',
+            '1 9_15.2018date 23:59:59.5', '12:50 A.M.', '18.05.09 1:2']
+
+#+ test data: the lines repeated, with the last line not terminated
+
+DATA = '\n'.join(LINES * 5) + '\n2018-05-10 7:05 pm'
+
+#+ test cases
+
+class Test_FollowScanner(unittest.TestCase):
+    """
+    Unit tests for the regex_lib.Follow.FollowScanner class and the function
+    FollowFile().
+    
+    Version 0.2.0.0
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 0.2.0.0
+        """
+        cls.ExceptionCases = [1, None, 1.0, ['path'], ('path', ), {1 : 2}]
+        cls.Expected = list(ScanFile(StringIO.StringIO(DATA)))
+    
+    def setUp(self):
+        """
+        Preparation for each test case: a temporary folder with the followed
+        file and the checkpoint file paths.
+        
+        Version 0.2.0.0
+        """
+        self.Folder = tempfile.mkdtemp()
+        self.Path = os.path.join(self.Folder, 'instrument.log')
+        self.Checkpoint = os.path.join(self.Folder, 'instrument.checkpoint')
+    
+    def tearDown(self):
+        """
+        Clean-up after each test case.
+        
+        Version 0.2.0.0
+        """
+        shutil.rmtree(self.Folder)
+    
+    def Append(self, strData):
+        """
+        Helper method appending the data to the followed file.
+        
+        Version 0.2.0.0
+        """
+        with open(self.Path, 'ab') as objFile:
+            objFile.write(strData)
+    
+    def test_Exception(self):
+        """
+        TypeError should be raised for the non-string paths, non-integer chunk
+        size, maximum of bytes or of line or number of polls and non-numeric
+        interval; ValueError for the non-positive chunk size, maximum of bytes
+        or of line or number of polls, and the negative interval.
+        
+        Version 0.2.0.0
+        """
+        for gCase in self.ExceptionCases:
+            self.assertRaises(TypeError, FollowScanner, gCase)
+            if not (gCase is None):
+                self.assertRaises(TypeError, FollowScanner, self.Path, gCase)
+        for gCase in [1.0, '1', None, True]:
+            self.assertRaises(TypeError, FollowScanner, self.Path, None,
+                                                                False, gCase)
+            self.assertRaises(TypeError, FollowFile, self.Path,
+                                                        iChunkSize = gCase)
+            self.assertRaises(TypeError, FollowScanner, self.Path, None,
+                                                        False, 1, gCase)
+            self.assertRaises(TypeError, FollowFile, self.Path,
+                                                        iMaxBytes = gCase)
+            self.assertRaises(TypeError, FollowScanner, self.Path, None,
+                                                        False, 1, 1, gCase)
+            self.assertRaises(TypeError, FollowFile, self.Path,
+                                                        iMaxLine = gCase)
+            if not (gCase is None):
+                self.assertRaises(TypeError, FollowFile, self.Path, None, 0,
+                                                                        gCase)
+        for gCase in ['1', None, True, [1]]:
+            self.assertRaises(TypeError, FollowFile, self.Path, None, gCase)
+        for iCase in [0, -1]:
+            self.assertRaises(ValueError, FollowScanner, self.Path, None,
+                                                                False, iCase)
+            self.assertRaises(ValueError, FollowFile, self.Path, None, 0,
+                                                                        iCase)
+            self.assertRaises(ValueError, FollowFile, self.Path,
+                                                        iChunkSize = iCase)
+            self.assertRaises(ValueError, FollowScanner, self.Path, None,
+                                                        False, 1, iCase)
+            self.assertRaises(ValueError, FollowFile, self.Path,
+                                                        iMaxBytes = iCase)
+            self.assertRaises(ValueError, FollowScanner, self.Path, None,
+                                                        False, 1, 1, iCase)
+            self.assertRaises(ValueError, FollowFile, self.Path,
+                                                        iMaxLine = iCase)
+        self.assertRaises(ValueError, FollowFile, self.Path, None, -0.1)
+        self.assertRaises(ValueError, FollowScanner(self.Path).Save)
+    
+    def test_Append(self):
+        """
+        The polls should resolve only the appended complete lines, with the
+        same records as of the function ScanFile() for the whole file, for any
+        chunk size and with the union patterns.
+        
+        Version 0.2.0.0
+        """
+        for iChunkSize, bUnion in [(65536, False), (1, False), (7, True),
+                                                                (100, True)]:
+            if os.path.exists(self.Path):
+                os.remove(self.Path)
+            objScanner = FollowScanner(self.Path, None, bUnion, iChunkSize)
+            self.assertEqual(objScanner.Poll(), [])
+            lstTest = []
+            for iStart in range(0, len(DATA), 13):
+                self.Append(DATA[iStart : iStart + 13])
+                lstRecords = objScanner.Poll()
+                self.assertIsInstance(lstRecords, list)
+                lstTest.extend(lstRecords)
+                self.assertEqual(objScanner.Offset + len(objScanner.Tail),
+                                                    min(iStart + 13, len(DATA)))
+            self.assertEqual(lstTest, self.Expected[:-1])
+            self.assertEqual(objScanner.Tail, '2018-05-10 7:05 pm')
+            self.assertEqual(objScanner.Poll(), [])
+            self.Append('\r\n')
+            self.assertEqual(objScanner.Poll(), self.Expected[-1:])
+            self.assertEqual(objScanner.Tail, '')
+            self.assertEqual(objScanner.Line, len(self.Expected))
+            dictStatistics = objScanner.GetStatistics()
+            self.assertEqual(dictStatistics['Lines'], len(self.Expected))
+            self.assertEqual(dictStatistics['Bytes'], len(DATA) + 2)
+            self.assertEqual(dictStatistics['Truncations'], 0)
+            self.assertEqual(dictStatistics['Rotations'], 0)
+    
+    def test_Checkpoint(self):
+        """
+        The reached offset should be kept in the checkpoint file, and a new
+        scanner should continue from it, reading the partial trailing line
+        again from the file. A corrupted checkpoint file or a checkpoint of
+        another file should be rejected.
+        
+        Version 0.2.0.0
+        """
+        iSplit = len(DATA) // 2
+        self.Append(DATA[:iSplit])
+        objScanner = FollowScanner(self.Path, self.Checkpoint)
+        lstTest = objScanner.Poll()
+        self.assertTrue(os.path.isfile(self.Checkpoint))
+        self.assertFalse(objScanner.Save())
+        strTail = objScanner.Tail
+        self.assertTrue(strTail)
+        self.Append(DATA[iSplit:] + '\n')
+        objScanner = FollowScanner(self.Path, self.Checkpoint)
+        self.assertEqual(objScanner.Tail, '')
+        self.assertEqual(objScanner.Offset, iSplit - len(strTail))
+        self.assertEqual(objScanner.Line, len(lstTest))
+        lstTest.extend(objScanner.Poll())
+        self.assertEqual(lstTest, self.Expected)
+        self.assertEqual(objScanner.Bytes, len(DATA) + 1 - iSplit +
+                                                                len(strTail))
+        objScanner = FollowScanner(self.Path, self.Checkpoint)
+        self.assertEqual(objScanner.Poll(), [])
+        self.assertEqual(objScanner.Offset, len(DATA) + 1)
+        #+ no saving
+        self.Append('2018-05-11 8:00\n')
+        self.assertEqual(len(objScanner.Poll(False)), 1)
+        objScanner = FollowScanner(self.Path, self.Checkpoint)
+        self.assertEqual(len(objScanner.Poll()), 1)
+        #+ errors
+        strOther = os.path.join(self.Folder, 'other.log')
+        self.assertRaises(ValueError, FollowScanner, strOther, self.Checkpoint)
+        with open(self.Checkpoint, 'wb') as objFile:
+            objFile.write('{"Path" : 1')
+        self.assertRaises(ValueError, FollowScanner, self.Path,
+                                                                self.Checkpoint)
+        with open(self.Checkpoint, 'wb') as objFile:
+            objFile.write('{"Path" : "x"}')
+        self.assertRaises(ValueError, FollowScanner, self.Path,
+                                                                self.Checkpoint)
+    
+    def test_Truncation(self):
+        """
+        The truncated file should be read from its beginning, the partial line
+        of the previous content should be resolved as a complete one.
+        
+        Version 0.2.0.0
+        """
+        self.Append(DATA)
+        objScanner = FollowScanner(self.Path, self.Checkpoint)
+        self.assertEqual(objScanner.Poll(), self.Expected[:-1])
+        with open(self.Path, 'wb') as objFile:
+            objFile.write('2018-05-11 8:00\nx')
+        lstTest = objScanner.Poll()
+        self.assertEqual(lstTest[0], self.Expected[-1])
+        self.assertEqual(lstTest[1:], [(1, 0, '2018-05-11', '08:00:00',
+                                                                        False)])
+        self.assertEqual(objScanner.Truncations, 1)
+        self.assertEqual(objScanner.Tail, 'x')
+        #+ truncated and grown back beyond the reached offset
+        with open(self.Path, 'wb') as objFile:
+            objFile.write(DATA)
+        objScanner = FollowScanner(self.Path, self.Checkpoint)
+        self.assertEqual(objScanner.Poll(), self.Expected[:-1])
+        self.assertEqual(objScanner.Truncations, 1)
+    
+    def test_Rotation(self):
+        """
+        The rotated file should be detected and read to its end, the new file
+        should be read from its beginning, and the missing file should not be
+        an error.
+        
+        Version 0.2.0.0
+        """
+        self.Append(DATA)
+        objScanner = FollowScanner(self.Path, self.Checkpoint)
+        self.assertEqual(objScanner.Poll(), self.Expected[:-1])
+        os.rename(self.Path, self.Path + '.1')
+        self.assertEqual(objScanner.Poll(), self.Expected[-1:])
+        self.assertEqual(objScanner.Offset, 0)
+        self.assertEqual(objScanner.Rotations, 1)
+        self.assertEqual(objScanner.Poll(), [])
+        self.Append(DATA + '\n')
+        objScanner = FollowScanner(self.Path, self.Checkpoint)
+        self.assertEqual(objScanner.Poll(), self.Expected)
+        self.assertEqual(objScanner.Rotations, 0)
+        self.assertEqual(objScanner.Truncations, 0)
+        self.assertEqual(objScanner.Line, len(self.Expected))
+    
+    def test_AppendRotation(self):
+        """
+        The data appended to the file between the last poll and its rotation
+        should be read before the new file, also after the restart from the
+        checkpoint.
+        
+        Version 0.2.0.0
+        """
+        iSplit = DATA.index('\n', len(DATA) // 2) + 1
+        lstHead = list(ScanFile(StringIO.StringIO(DATA[:iSplit])))
+        for bRestart in [False, True]:
+            for strPath in [self.Path, self.Path + '.1', self.Checkpoint]:
+                if os.path.exists(strPath):
+                    os.remove(strPath)
+            self.Append(DATA[:iSplit])
+            objScanner = FollowScanner(self.Path, self.Checkpoint)
+            self.assertEqual(objScanner.Poll(), lstHead)
+            if bRestart:
+                objScanner.Close()
+            self.Append(DATA[iSplit:])
+            os.rename(self.Path, self.Path + '.1')
+            self.Append(DATA + '\n')
+            if bRestart:
+                objScanner = FollowScanner(self.Path, self.Checkpoint)
+            lstTest = objScanner.Poll()
+            self.assertEqual(lstTest[:len(self.Expected) - len(lstHead)],
+                                                self.Expected[len(lstHead):])
+            self.assertEqual(lstTest[len(self.Expected) - len(lstHead):],
+                                                                self.Expected)
+            self.assertEqual(objScanner.Rotations, 1)
+            self.assertEqual(objScanner.Truncations, 0)
+            self.assertEqual(objScanner.Offset, len(DATA) + 1)
+            objScanner.Close()
+        #+ rotated file is removed before the restart
+        os.remove(self.Path + '.1')
+        self.Append('2018-05-11 8:00\n')
+        os.rename(self.Path, self.Path + '.1')
+        self.Append(DATA + '\n')
+        objScanner = FollowScanner(self.Path, self.Checkpoint)
+        os.remove(self.Path + '.1')
+        self.assertEqual(objScanner.Poll(), self.Expected)
+        self.assertEqual(objScanner.Rotations, 1)
+    
+    def test_Limit(self):
+        """
+        A poll should read at most the maximum of bytes and set the flag
+        Behind, the following polls should continue, also with the rotation.
+        
+        Version 0.2.0.0
+        """
+        self.Append(DATA)
+        objScanner = FollowScanner(self.Path, None, False, 7, 40)
+        lstTest = []
+        iPolls = 0
+        while True:
+            iBytes = objScanner.Bytes
+            lstTest.extend(objScanner.Poll())
+            iPolls += 1
+            self.assertLessEqual(objScanner.Bytes - iBytes, 40)
+            if not objScanner.Behind:
+                break
+        self.assertEqual(lstTest, self.Expected[:-1])
+        self.assertEqual(iPolls, len(DATA) // 40 + 1)
+        self.Append('\n' + DATA)
+        os.rename(self.Path, self.Path + '.1')
+        self.Append(DATA + '\n')
+        lstTest = []
+        while True:
+            lstTest.extend(objScanner.Poll())
+            if not objScanner.Behind:
+                break
+        lstRotated = list(ScanFile(StringIO.StringIO(DATA + '\n' + DATA)))
+        self.assertEqual(lstTest, lstRotated[len(self.Expected) - 1:] +
+                                                                self.Expected)
+        self.assertEqual(objScanner.Rotations, 1)
+        objScanner.Close()
+        self.assertEqual(list(FollowFile(self.Path, None, 0, 1,
+                                    iMaxBytes = 40)), self.Expected[:3])
+    
+    def test_MaxLine(self):
+        """
+        The partial trailing line should not be stored in the checkpoint file,
+        and it should be resolved as a complete one when it is longer than the
+        maximum length.
+        
+        Version 0.2.0.0
+        """
+        self.Append('x' * 5000)
+        objScanner = FollowScanner(self.Path, self.Checkpoint)
+        self.assertEqual(objScanner.Poll(), [])
+        self.assertEqual(len(objScanner.Tail), 5000)
+        self.assertLess(os.path.getsize(self.Checkpoint), 300)
+        self.Append('x' * 5000)
+        self.assertEqual(objScanner.Poll(), [])
+        self.assertFalse(objScanner.Save())
+        os.remove(self.Checkpoint)
+        objScanner = FollowScanner(self.Path, self.Checkpoint, False, 1000,
+                                                                65536, 2500)
+        lstTest = objScanner.Poll()
+        self.assertEqual(lstTest, [(iLine, (iLine - 1) * 3000, None, None,
+                                            False) for iLine in range(1, 4)])
+        self.assertEqual(objScanner.Tail, 'x' * 1000)
+        self.Append(' 2018-05-09\n')
+        self.assertEqual(objScanner.Poll(), [(4, 9000, '2018-05-09', '20:18:00',
+                                                                    False)])
+    
+    def test_Flush(self):
+        """
+        The partial trailing line should be resolved by the method Flush(),
+        and the data appended later should be resolved as the next line.
+        
+        Version 0.2.0.0
+        """
+        self.Append(DATA)
+        objScanner = FollowScanner(self.Path)
+        objScanner.Poll()
+        self.assertEqual(objScanner.Flush(), self.Expected[-1:])
+        self.assertEqual(objScanner.Flush(), [])
+        self.assertEqual(objScanner.Offset, len(DATA))
+        self.Append(' 12:00\n')
+        self.assertEqual(objScanner.Poll(), [(len(self.Expected) + 1,
+                                    len(DATA), None, '12:00:00', False)])
+    
+    def test_FollowFile(self):
+        """
+        The function should generate the records of the limited number of the
+        polls and save the checkpoint after each poll.
+        
+        Version 0.2.0.0
+        """
+        self.Append(DATA + '\n')
+        genTest = FollowFile(self.Path, self.Checkpoint, 0, 3)
+        self.assertIsInstance(genTest, types.GeneratorType)
+        self.assertEqual(list(genTest), self.Expected)
+        self.assertEqual(list(FollowFile(self.Path, self.Checkpoint, 0, 2)),
+                                                                            [])
+        #+ interrupted poll is repeated
+        self.Append(DATA + '\n')
+        genTest = FollowFile(self.Path, self.Checkpoint, 0)
+        next(genTest)
+        genTest.close()
+        self.assertEqual(len(list(FollowFile(self.Path, self.Checkpoint, 0,
+                                                    1))), len(self.Expected))
+        #+ no sleeping while behind the limit
+        iPolls = (2 * len(DATA) + 1) // 40 + 1
+        genTest = FollowFile(self.Path, None, 1000, iPolls, iMaxBytes = 40)
+        self.assertEqual(list(genTest), list(ScanFile(self.Path)))
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_FollowScanner)
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1])
+
+#execution entry point
+
+if __name__ == "__main__":
+    sys.stdout.write("Preparing regex_lib.Follow tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
+    sys.stdout.flush()
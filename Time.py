@@ -24,29 +24,74 @@ Patterns:
         as 'HHMMDD' - exactly 6 digits
     SHORT_COMPACT_TIME_PATTERN - hours and minutes without separators, i.e as
         'HHMM' - exactly 4 digits
+    *_CORE - the same stamp patterns without the '(.*[^0-9]|^)' prefix and
+        '([^0-9].*|$)' suffix wrappers, e.g. TIME_CORE
+    *_SEARCH - the core stamp patterns delimited by the non-digit characters
+        with the look-around assertions, to be used with the search methods,
+        e.g. TIME_SEARCH, see module Search
+    TIME_UNION - all core stamp patterns combined into a single search pattern
+        in the order of priority used by ResolveTime()
 
-Compiled patterns:
+Compiled patterns (compiled on the first use, see Search.LazyPattern):
     C_SHORT_TIME_PATTERN, C_TIME_PATTERN, C_COMPACT_TIME_PATTERN,
     C_SHORT_COMPACT_TIME_PATTERN
+    C_SHORT_TIME_SEARCH, C_TIME_SEARCH, C_COMPACT_TIME_SEARCH,
+    C_SHORT_COMPACT_TIME_SEARCH
+    C_TIME_SEARCH_PATTERNS - tuple of the compiled search versions in the order
+        of priority used by ResolveTime()
+    C_TIME_UNION
+
+Globals:
+    TIME_TABLES - list(list(tuple(str, bool)) OR None), the interned results
+        of the ISO time strings with the not set date increment flag per hour,
+        built on the first use of the hour, see function GetTimeTable()
+    TIME_NEXT_DAY - tuple(str, bool), the interned result ('00:00:00', True)
+        of the seconds rounded up to the next day
 
 Functions:
     ResolveTime()
         str -> str OR None, bool
+    ResolveTimeTuple()
+        str -> tuple(int, int, int, int, bool) OR None
+    ResolveTimeUnion()
+        str -> str OR None, bool
+    FindTimes()
+        str -> generator(tuple(tuple(int, int), str OR None, bool))
     ConvertAM_PM()
         re.MatchObject -> int OR None
+    ConvertModifier()
+        int, str OR None -> int OR None
     CorrectRounding()
         int, int, int -> int, int, int, bool
+    ConvertTimeMatch()
+        re.MatchObject -> str OR None, bool
+    ConvertTimeMatchTuple()
+        re.MatchObject -> tuple(int, int, int, int, bool) OR None
+    ConvertTimeFieldsTuple()
+        str, str, str OR None, str OR None
+            -> tuple(int, int, int, int, bool) OR None
+    ScanCompactTime()
+        str -> bool, tuple(int, int, int, int, bool) OR None
+    ResolveTimes()
+        iterable(str), str, bool, bool, bool
+            -> list(tuple(str OR None, bool)) OR
+                generator(tuple(str OR None, bool))
+    GenerateTimes()
+        iterable(str), str, bool, bool -> generator(tuple(str OR None, bool))
+    GetTimeTable()
+        int -> list(tuple(str, bool))
 """
 
-__version__ = "0.1.0.0"
-__date__ = "26-10-2018"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
 __status__ = "Production"
 
 #imports
 
-#+ standard library
+#+ package modules
 
-import re
+from .Search import MakeSearchPattern, MakeUnionPattern, SearchLast, \
+                SearchUnion, FindUnion, DIGITS_TABLE, SHAPE_TABLE, LazyPattern
 
 #patterns
 
@@ -60,42 +105,141 @@ AM_PM_PATTERN = r" ?(?P<modifier>(A|P)\.?M\.?)?"
 
 #+ H?H:M?M
 
-SHORT_TIME_PATTERN = r"".join([r"(.*[^0-9:]|^)", HOUR_PATTERN, ":",
-                                MINUTE_PATTERN, AM_PM_PATTERN ,
-                                r"([^0-9:].*|$)"])
+SHORT_TIME_CORE = r"".join([HOUR_PATTERN, ":", MINUTE_PATTERN, AM_PM_PATTERN])
+
+SHORT_TIME_PATTERN = r"".join([r"(.*[^0-9:]|^)", SHORT_TIME_CORE,
+                                                            r"([^0-9:].*|$)"])
 
 #+ H?H:M?M:S?S
 
-TIME_PATTERN = r"".join([r"(.*[^0-9]|^)", HOUR_PATTERN, ":", MINUTE_PATTERN,
-                        ":", SECOND_PATTERN, AM_PM_PATTERN, r"([^0-9].*|$)"])
+TIME_CORE = r"".join([HOUR_PATTERN, ":", MINUTE_PATTERN, ":", SECOND_PATTERN,
+                                                                AM_PM_PATTERN])
+
+TIME_PATTERN = r"".join([r"(.*[^0-9]|^)", TIME_CORE, r"([^0-9].*|$)"])
 
 #+ HHMM
 
-SHORT_COMPACT_TIME_PATTERN = "".join([r"(.*[^0-9]|^)",
-                                r"(?P<hour>([0-1][0-9])|(2[0-3]))",
-                                r"(?P<minute>[0-5][0-9])",
-                                r"([^0-9].*|$)"])
+SHORT_COMPACT_TIME_CORE = "".join([r"(?P<hour>([0-1][0-9])|(2[0-3]))",
+                                                r"(?P<minute>[0-5][0-9])"])
+
+SHORT_COMPACT_TIME_PATTERN = "".join([r"(.*[^0-9]|^)", SHORT_COMPACT_TIME_CORE,
+                                                            r"([^0-9].*|$)"])
 
 #+ HHMMSS
 
-COMPACT_TIME_PATTERN = "".join([r"(.*[^0-9]|^)",
-                                r"(?P<hour>([0-1][0-9])|(2[0-3]))",
+COMPACT_TIME_CORE = "".join([r"(?P<hour>([0-1][0-9])|(2[0-3]))",
                                 r"(?P<minute>[0-5][0-9])",
-                                r"(?P<second>[0-5][0-9])",
-                                r"([^0-9].*|$)"])
+                                r"(?P<second>[0-5][0-9])"])
+
+COMPACT_TIME_PATTERN = "".join([r"(.*[^0-9]|^)", COMPACT_TIME_CORE,
+                                                            r"([^0-9].*|$)"])
+
+#+ search versions - stamps delimited by the non-digit characters without the
+#+ greedy wrappers; the column is also excluded for SHORT_TIME_PATTERN
+
+SHORT_TIME_SEARCH = MakeSearchPattern(SHORT_TIME_CORE, "0-9:")
+
+TIME_SEARCH = MakeSearchPattern(TIME_CORE)
+
+SHORT_COMPACT_TIME_SEARCH = MakeSearchPattern(SHORT_COMPACT_TIME_CORE)
+
+COMPACT_TIME_SEARCH = MakeSearchPattern(COMPACT_TIME_CORE)
+
+#+ union of the search versions in the order used by ResolveTime()
+
+TIME_UNION = MakeUnionPattern([(TIME_CORE, "0-9"), (SHORT_TIME_CORE, "0-9:"),
+                                    (COMPACT_TIME_CORE, "0-9"),
+                                        (SHORT_COMPACT_TIME_CORE, "0-9")])
 
 #compiled patterns
 
-C_SHORT_TIME_PATTERN = re.compile(SHORT_TIME_PATTERN)
+C_SHORT_TIME_PATTERN = LazyPattern(SHORT_TIME_PATTERN)
+
+C_TIME_PATTERN = LazyPattern(TIME_PATTERN)
+
+C_COMPACT_TIME_PATTERN = LazyPattern(COMPACT_TIME_PATTERN)
+
+C_SHORT_COMPACT_TIME_PATTERN = LazyPattern(SHORT_COMPACT_TIME_PATTERN)
+
+#+ search versions
+
+C_SHORT_TIME_SEARCH = LazyPattern(SHORT_TIME_SEARCH)
+
+C_TIME_SEARCH = LazyPattern(TIME_SEARCH)
+
+C_COMPACT_TIME_SEARCH = LazyPattern(COMPACT_TIME_SEARCH)
+
+C_SHORT_COMPACT_TIME_SEARCH = LazyPattern(SHORT_COMPACT_TIME_SEARCH)
+
+#+ search versions in the order of priority used by ResolveTime(), which is
+#+ also the order of the alternatives of the union version
 
-C_TIME_PATTERN = re.compile(TIME_PATTERN)
+C_TIME_SEARCH_PATTERNS = (C_TIME_SEARCH, C_SHORT_TIME_SEARCH,
+                            C_COMPACT_TIME_SEARCH, C_SHORT_COMPACT_TIME_SEARCH)
 
-C_COMPACT_TIME_PATTERN = re.compile(COMPACT_TIME_PATTERN)
+#+ union version
 
-C_SHORT_COMPACT_TIME_PATTERN = re.compile(SHORT_COMPACT_TIME_PATTERN)
+C_TIME_UNION = LazyPattern(TIME_UNION)
+
+#globals
+
+#+ allowed values of the policy for the non-string elements of the batches
+
+NON_STRING_POLICIES = ('raise', 'skip', 'none')
+
+#+ interned results ('HH:MM:SS', False) per hour, which are built lazily
+
+TIME_TABLES = [None] * 24
+
+#+ interned result of the seconds rounded up to the next day
+
+TIME_NEXT_DAY = (intern('00:00:00'), True)
 
 #functions
 
+def ScanCompactTime(strStamp):
+    """
+    Regular expressions free fast path of the function ResolveTimeTuple() for
+    the compact 'HHMMSS' and 'HHMM' stamps. The patterns TIME_PATTERN and
+    SHORT_TIME_PATTERN have the priority and contain the ':' separator, thus
+    they cannot match if the shape of the string does not contain '0:0' (see
+    Search.SHAPE_TABLE). In this case the time is resolved as the last digit
+    run of exactly 6 digits with the valid hour, minute and second, otherwise
+    as the last run of exactly 4 digits with the valid hour and minute, or it
+    is not found. Otherwise, as well as for the unicode strings and the
+    strings with the new line characters, the time is not resolved by this
+    function.
+    
+    Signature:
+        str -> bool, tuple(int, int, int, int, bool) OR None
+    
+    Returns:
+        tuple(bool, tuple(int, int, int, int, bool) OR None): unpacked tuple,
+            the flag if the time is resolved, and the same tuple as returned
+            by ResolveTimeTuple() or None if the time stamp is not found
+    
+    Version 0.2.0.0
+    """
+    if (not isinstance(strStamp, str)) or ('\n' in strStamp):
+        return False, None
+    if '0:0' in strStamp.translate(SHAPE_TABLE):
+        return False, None
+    lstRuns = strStamp.translate(DIGITS_TABLE).split()
+    for strRun in reversed(lstRuns):
+        if len(strRun) == 6:
+            iHour = int(strRun[:2])
+            iMinute = int(strRun[2:4])
+            iSecond = int(strRun[4:])
+            if iHour < 24 and iMinute < 60 and iSecond < 60:
+                return True, (iHour, iMinute, iSecond, 0, False)
+    for strRun in reversed(lstRuns):
+        if len(strRun) == 4:
+            iHour = int(strRun[:2])
+            iMinute = int(strRun[2:])
+            if iHour < 24 and iMinute < 60:
+                return True, (iHour, iMinute, 0, 0, False)
+    return True, None
+
 def ConvertAM_PM(objMatch):
     """
     Helper function for the conversion of the a.m. / p.m. time representation
@@ -118,10 +262,32 @@ def ConvertAM_PM(objMatch):
         int: hour in 24-h clock, if the representation was correct
         None: otherwise
     
-    Version 0.1.0.0
+    Version 0.2.0.0
+    """
+    return ConvertModifier(int(objMatch.group('hour')),
+                                                objMatch.group('modifier'))
+
+def ConvertModifier(iHour, gModifier):
+    """
+    Helper function for the conversion of the hour of the a.m. / p.m. time
+    representation (12-hours clock) into 24-hours representation according to
+    the NIST rules, see function ConvertAM_PM(). The hour is returned as it is
+    if the modifier is None.
+    
+    Signature:
+        int, str OR None -> int OR None
+    
+    Args:
+        iHour: int, hour as found in the time stamp
+        gModifier: str OR None, the a.m. / p.m. modifier as found in the time
+            stamp in the upper case, e.g. 'P.M.', or None if it is absent
+    
+    Returns:
+        int: hour in 24-h clock, if the representation was correct
+        None: otherwise
+    
+    Version 0.2.0.0
     """
-    iHour = int(objMatch.group('hour'))
-    gModifier = objMatch.group('modifier')
     if not (gModifier is None):
         if iHour == 0 or iHour > 12:
             gResult = None # hours are 1 to 12 inclusively with am / pm mod.
@@ -177,6 +343,164 @@ def CorrectRounding(iHour, iMinute, iSecond):
                 bIncrementDate = True
     return _iHour, _iMinute, _iSecond, bIncrementDate
 
+def ConvertTimeMatchTuple(objMatch):
+    """
+    Helper function for the conversion of a match object of any of the time
+    stamp patterns into the tuple of the hour, minute, second, microsecond
+    and the date increment flag. The absent seconds are treated as 0, the
+    fractional seconds are rounded, and the a.m. / p.m. modifier is applied if
+    the pattern defines it. The microseconds are the fractional part of the
+    seconds, truncated to 6 digits, if the seconds are rounded down, and 0 if
+    they are rounded up, so the tuple always describes a valid instant: the
+    exact one or the rounded up one.
+    
+    See also helper functions:
+        ConvertAM_PM()
+        CorrectRounding()
+    
+    Signature:
+        re.MatchObject -> tuple(int, int, int, int, bool) OR None
+    
+    Returns:
+        tuple(int, int, int, int, bool): the hour, minute and rounded second,
+            the microseconds and the boolean flag if the date must be
+            incremented due to rounding up of the seconds
+        None: if the hour is not compatible with the a.m. / p.m. modifier
+    
+    Version 0.2.0.0
+    """
+    dictGroups = objMatch.groupdict()
+    return ConvertTimeFieldsTuple(dictGroups['hour'], dictGroups['minute'],
+                        dictGroups.get('second'), dictGroups.get('modifier'))
+
+def ConvertTimeFieldsTuple(strHour, strMinute, strSecond, gModifier):
+    """
+    Helper function for the conversion of the fields of a time stamp (as
+    matched by any of the time stamp patterns) into the tuple of the hour,
+    minute, second, microsecond and the date increment flag, exactly as by the
+    function ConvertTimeMatchTuple().
+    
+    Signature:
+        str, str, str OR None, str OR None
+            -> tuple(int, int, int, int, bool) OR None
+    
+    Args:
+        strHour: str, the hour field
+        strMinute: str, the minute field
+        strSecond: str OR None, the second field, possibly with the fractional
+            part after '.' or ',', or None if it is absent
+        gModifier: str OR None, the a.m. / p.m. modifier in the upper case or
+            None if it is absent
+    
+    Returns:
+        tuple(int, int, int, int, bool): the hour, minute and rounded second,
+            the microseconds and the boolean flag if the date must be
+            incremented due to rounding up of the seconds
+        None: if the hour is not compatible with the a.m. / p.m. modifier
+    
+    Version 0.2.0.0
+    """
+    iHour = ConvertModifier(int(strHour), gModifier)
+    if iHour is None:
+        return None
+    iMinute = int(strMinute)
+    if not (strSecond is None):
+        strSecond = strSecond.replace(',', '.')
+        fSecond = float(strSecond)
+        iSecond = int(round(fSecond))
+        iPoint = strSecond.find('.')
+        if iPoint < 0 or iSecond > int(fSecond):
+            #+ the fraction is not kept with the rounded up second
+            iMicrosecond = 0
+        else:
+            iMicrosecond = int(strSecond[iPoint + 1 : iPoint + 7].ljust(6,
+                                                                        '0'))
+    else:
+        iSecond = 0
+        iMicrosecond = 0
+    iHour, iMinute, iSecond, bIncrementDate = CorrectRounding(iHour, iMinute,
+                                                                    iSecond)
+    return iHour, iMinute, iSecond, iMicrosecond, bIncrementDate
+
+def ConvertTimeMatch(objMatch):
+    """
+    Helper function for the conversion of a match object of any of the time
+    stamp patterns into the ISO format 'HH:MM:SS'. The absent seconds are
+    treated as 0, the fractional seconds are rounded, and the a.m. / p.m.
+    modifier is applied if the pattern defines it. Wrapper formatting the
+    result of the function ConvertTimeMatchTuple().
+    
+    Signature:
+        re.MatchObject -> str OR None, bool
+    
+    Returns:
+        tuple(str, bool): unpacked tuple, the time stamp as a string in ISO
+            format 'HH:MM:SS' and the boolean flag if the date must be
+            incremented due to rounding up of the seconds
+        tuple(None, bool): unpacked tuple, if the hour is not compatible with
+            the a.m. / p.m. modifier
+    
+    Version 0.2.0.0
+    """
+    tupleResult = ConvertTimeMatchTuple(objMatch)
+    if tupleResult is None:
+        return None, False
+    return "{0:02}:{1:02}:{2:02}".format(*tupleResult), tupleResult[4]
+
+def ResolveTimeTuple(strStamp):
+    """
+    Attempts to resolve the passed time stamp with help of the defined regular
+    expression patterns in the following order:
+        TIME_PATTERN, SHORT_TIME_PATTERN, COMPACT_TIME_PATTERN,
+            SHORT_COMPACT_TIME_PATTERN
+    
+    Note that the floating point representation of the seconds is rounded to an
+    integer, which may cause swinging over zero of the seconds (60 -> 00) and
+    incrementing of the minutes; and so on including the hours. The fractional
+    part of the seconds is returned as the microseconds if the seconds are
+    rounded down, and 0 if they are rounded up, thus the tuple is either the
+    exact or the rounded up instant.
+    
+    The search versions of the patterns are used, with the last occurrence of
+    the stamp in the string being selected, see function Search.SearchLast().
+    The compact stamps are resolved without the regular expressions whenever
+    possible, see function ScanCompactTime().
+    
+    See also helper function:
+        ConvertTimeMatchTuple()
+    
+    Signature:
+        str -> tuple(int, int, int, int, bool) OR None
+    
+    Returns:
+        tuple(int, int, int, int, bool): the resolved time stamp as the hour,
+            minute, rounded second and microseconds, and the boolean flag if
+            the date must be incremented due to rounding up of the seconds,
+            i.e. 23:59:59.5 -> (0, 0, 0, 0, True) and 12:00:30.4 ->
+            (12, 0, 30, 400000, False)
+        None: if none of the patterns is matched
+    
+    Raises:
+        TypeError: if the passed argument is not a string.
+    
+    Version 0.2.0.0
+    """
+    if not isinstance(strStamp, basestring):
+        strError = '{} of {} is not a string'.format(strStamp, type(strStamp))
+        raise TypeError(strError)
+    bResolved, tupleResult = ScanCompactTime(strStamp)
+    if bResolved:
+        return tupleResult
+    _strStamp = strStamp.upper()
+    for objPattern in C_TIME_SEARCH_PATTERNS:
+        objMatch = SearchLast(objPattern, _strStamp)
+        if objMatch:
+            tupleResult = ConvertTimeMatchTuple(objMatch)
+            break
+    else:
+        tupleResult = None
+    return tupleResult
+
 def ResolveTime(strStamp):
     """
     Attempts to resolve the passed time stamp with help of the defined regular
@@ -188,9 +512,14 @@ def ResolveTime(strStamp):
     integer, which may cause swinging over zero of the seconds (60 -> 00) and
     incrementing of the minutes; and so on including the hours.
     
+    The search versions of the patterns are used, with the last occurrence of
+    the stamp in the string being selected, see function Search.SearchLast().
+    Wrapper formatting the result of the function ResolveTimeTuple().
+    
     See also helper functions:
         ConvertAM_PM()
         CorrectRounding()
+        ConvertTimeMatch()
     
     Signature:
         str -> str OR None, bool
@@ -205,45 +534,223 @@ def ResolveTime(strStamp):
     Raises:
         TypeError: if the passed argument is not a string.
     
-    Version 0.1.0.0
+    Version 0.2.0.0
+    """
+    tupleResult = ResolveTimeTuple(strStamp)
+    if tupleResult is None:
+        return None, False
+    return "{0:02}:{1:02}:{2:02}".format(*tupleResult), tupleResult[4]
+
+def ResolveTimeUnion(strStamp):
+    """
+    Resolves the passed time stamp exactly as the function ResolveTime(), but
+    all patterns are searched for in a single pass of the union pattern
+    C_TIME_UNION, which is faster for the strings not containing a stamp. See
+    function Search.SearchUnion().
+    
+    Signature:
+        str -> str OR None, bool
+    
+    Returns:
+        tuple(str, bool): unpacked tuple, the resolved time stamp as a string in
+            ISO format 'HH:MM:SS' and the boolean flag if the date must be
+            incremented due to rounding up of the seconds
+        tuple(None, bool): unpacked tuple, if none of the patterns is matched
+    
+    Raises:
+        TypeError: if the passed argument is not a string.
+    
+    Version 0.2.0.0
     """
     if not isinstance(strStamp, basestring):
         strError = '{} of {} is not a string'.format(strStamp, type(strStamp))
         raise TypeError(strError)
-    _strStamp = strStamp.upper()
-    objMatch = C_TIME_PATTERN.match(_strStamp)
-    bIncrementDate = False
+    objMatch = SearchUnion(C_TIME_UNION, C_TIME_SEARCH_PATTERNS,
+                                                            strStamp.upper())
     if objMatch:
-        iHour = ConvertAM_PM(objMatch)
-        if not (iHour is None):
-            iMinute = int(objMatch.group('minute'))
-            iSecond = int(round(float(objMatch.group('second').replace(
-                                                                    ',', '.'))))
-            iHour, iMinute, iSecond, bIncrementDate = CorrectRounding(iHour,
-                                                            iMinute, iSecond)
-            strResult = "{:02}:{:02}:{:02}".format(iHour, iMinute, iSecond)
-        else:
-            strResult = None
+        strResult, bIncrementDate = ConvertTimeMatch(objMatch)
     else:
-        objMatch = C_SHORT_TIME_PATTERN.match(_strStamp)
-        if objMatch:
-            iHour = ConvertAM_PM(objMatch)
-            if not (iHour is None):
-                strResult = "{:02}:{:02}:00".format(iHour,
-                                                int(objMatch.group('minute')))
-            else:
-                strResult = None
+        strResult = None
+        bIncrementDate = False
+    return strResult, bIncrementDate
+
+def FindTimes(strStamp):
+    """
+    Finds all non-overlapping time stamps in the passed string (in all its
+    lines) from the left to the right with a single pass of the union pattern
+    C_TIME_UNION, see function Search.FindUnion(). At each position the
+    patterns are tried in the same order as by the function ResolveTime():
+        TIME_PATTERN, SHORT_TIME_PATTERN, COMPACT_TIME_PATTERN,
+            SHORT_COMPACT_TIME_PATTERN
+    
+    Each found stamp is converted as by the function ResolveTime(), i.e. the
+    time is None if the hour is not compatible with the a.m. / p.m. modifier.
+    
+    Signature:
+        str -> generator(tuple(tuple(int, int), str OR None, bool))
+    
+    Returns:
+        generator(tuple(tuple(int, int), str OR None, bool)): generator of the
+            spans of the found stamps (start and end positions as a slice,
+            including the a.m. / p.m. modifier), the stamps as strings in ISO
+            format 'HH:MM:SS' or None, and the boolean flags if the date must
+            be incremented due to rounding up of the seconds
+    
+    Raises:
+        TypeError: if the passed argument is not a string; raised by the call,
+            not during the iteration
+    
+    Version 0.2.0.0
+    """
+    if not isinstance(strStamp, basestring):
+        strError = '{} of {} is not a string'.format(strStamp, type(strStamp))
+        raise TypeError(strError)
+    return (((iStart, iEnd), ) + ConvertTimeMatch(objMatch)
+                    for iStart, iEnd, objMatch in FindUnion(C_TIME_UNION,
+                                    C_TIME_SEARCH_PATTERNS, strStamp.upper()))
+
+def GetTimeTable(iHour):
+    """
+    Returns the table of the interned results of the hour, i.e. the tuples of
+    the interned ISO time string and the not set date increment flag, which is
+    built on the first call for the hour. The result of the minute and the
+    second is at the index minute * 60 + second.
+    
+    Signature:
+        int -> list(tuple(str, bool))
+    
+    Args:
+        iHour: int, the hour between 0 and 23 inclusively
+    
+    Returns:
+        list(tuple(str, bool)): the interned results ('HH:MM:SS', False)
+    
+    Raises:
+        IndexError: the hour is outside the range of the table
+    
+    Version 0.2.0.0
+    """
+    if iHour < 0:
+        raise IndexError('hour {} is out of the table range'.format(iHour))
+    lstTable = TIME_TABLES[iHour]
+    if lstTable is None:
+        lstTable = [(intern("{:02}:{:02}:{:02}".format(iHour, iMinute,
+                                                        iSecond)), False)
+                        for iMinute in range(60) for iSecond in range(60)]
+        TIME_TABLES[iHour] = lstTable
+    return lstTable
+
+def ResolveTimes(gStamps, strNonString = 'raise', bUnion = False,
+                                            bLazy = False, bInterned = False):
+    """
+    Batch version of the functions ResolveTime() and ResolveTimeUnion(). The
+    per-call setup (name look-ups, choice of the patterns, result formatting
+    method) is done only once for all elements of the passed iterable.
+    
+    With the bInterned flag the results are not formatted, but taken from the
+    precomputed tables of the interned results (see function GetTimeTable()),
+    thus the equal results are the same tuple object with the same string,
+    which saves the memory when many results are kept, e.g. in the lists or
+    data frames.
+    
+    The policy for the elements, which are not strings, is defined by the
+    argument strNonString:
+        'raise' - TypeError exception is raised, as by ResolveTime()
+        'skip' - the element is skipped, i.e. there is no result for it
+        'none' - (None, False) is the result, as for a not matching string
+    
+    Signature:
+        iterable(str), str, bool, bool, bool
+            -> list(tuple(str OR None, bool)) OR
+                generator(tuple(str OR None, bool))
+    
+    Args:
+        gStamps: iterable(str), any iterable of the time stamps
+        strNonString: (optional) str, the policy for the non-string elements,
+            one of the NON_STRING_POLICIES, defaults to 'raise'
+        bUnion: (optional) bool, flag if the single pass union pattern is used
+            as by ResolveTimeUnion(), defaults to False
+        bLazy: (optional) bool, flag if a generator is returned instead of a
+            list, defaults to False
+        bInterned: (optional) bool, flag if the interned results of the
+            precomputed tables are returned, defaults to False
+    
+    Returns:
+        list(tuple(str OR None, bool)): the same tuples as returned by the
+            function ResolveTime() for each element, in the order of elements
+        generator(tuple(str OR None, bool)): the same results, if bLazy is True
+    
+    Raises:
+        ValueError: the passed policy is not one of the NON_STRING_POLICIES
+        TypeError: an element is not a string and the policy is 'raise'; for
+            the generator - raised during the iteration
+    
+    Version 0.2.0.0
+    """
+    if not (strNonString in NON_STRING_POLICIES):
+        strError = '{} is not one of the policies {}'.format(strNonString,
+                                                        NON_STRING_POLICIES)
+        raise ValueError(strError)
+    genResults = GenerateTimes(gStamps, strNonString, bUnion, bInterned)
+    if not bLazy:
+        genResults = list(genResults)
+    return genResults
+
+def GenerateTimes(gStamps, strNonString, bUnion, bInterned = False):
+    """
+    Generator implementing the function ResolveTimes(), the non-string policy
+    is not checked. The interned result of the date increment is
+    TIME_NEXT_DAY.
+    
+    Signature:
+        iterable(str), str, bool, bool -> generator(tuple(str OR None, bool))
+    
+    Version 0.2.0.0
+    """
+    #+ local aliases of the globals
+    tuplePatterns = C_TIME_SEARCH_PATTERNS
+    objUnion = C_TIME_UNION
+    fSearchLast = SearchLast
+    fSearchUnion = SearchUnion
+    fConvert = ConvertTimeMatch
+    fConvertTuple = ConvertTimeMatchTuple
+    lstTables = TIME_TABLES
+    fGetTable = GetTimeTable
+    tupleNextDay = TIME_NEXT_DAY
+    typeString = basestring
+    tupleNone = (None, False)
+    bSkip = strNonString == 'skip'
+    bNone = strNonString == 'none'
+    for gStamp in gStamps:
+        if not isinstance(gStamp, typeString):
+            if bSkip:
+                continue
+            elif bNone:
+                yield tupleNone
+                continue
+            strError = '{} of {} is not a string'.format(gStamp, type(gStamp))
+            raise TypeError(strError)
+        _strStamp = gStamp.upper()
+        if bUnion:
+            objMatch = fSearchUnion(objUnion, tuplePatterns, _strStamp)
         else:
-            objMatch = C_COMPACT_TIME_PATTERN.match(_strStamp)
-            if objMatch:
-                strResult = "{}:{}:{}".format(objMatch.group('hour'),
-                                                objMatch.group('minute'),
-                                                    objMatch.group('second'))
-            else:
-                objMatch = C_SHORT_COMPACT_TIME_PATTERN.match(_strStamp)
+            for objPattern in tuplePatterns:
+                objMatch = fSearchLast(objPattern, _strStamp)
                 if objMatch:
-                    strResult = "{}:{}:00".format(objMatch.group('hour'),
-                                                    objMatch.group('minute'))
-                else:
-                    strResult = None
-    return strResult, bIncrementDate
\ No newline at end of file
+                    break
+        if not objMatch:
+            yield tupleNone
+        elif bInterned:
+            tupleResult = fConvertTuple(objMatch)
+            if tupleResult is None:
+                yield tupleNone
+            elif tupleResult[4]:
+                yield tupleNextDay
+            else:
+                iHour = tupleResult[0]
+                lstTable = lstTables[iHour]
+                if lstTable is None:
+                    lstTable = fGetTable(iHour)
+                yield lstTable[tupleResult[1] * 60 + tupleResult[2]]
+        else:
+            yield fConvert(objMatch)
@@ -0,0 +1,468 @@
+#!/usr/bin/python
+"""
+Module regex_lib.Tokens
+
+Shared tokenization of the string for the resolution of both the date and the
+time stamps. The string is split once into the tokens: the runs of digits,
+the single separator characters ('-', '/', '_', '.', ':' or ','), the a.m. /
+p.m. markers following the digits and the runs of all other characters. The
+date and time stamp grammars are matched against this token sequence instead
+of the raw string, with exactly the same rules (patterns order of priority,
+the last occurrence of the stamp, the new line character limit) as by the
+regular expression patterns of the modules Date and Time, see the functions
+ResolveDateTuple() and ResolveTimeTuple(). Thus a single tokenization serves
+the date, the time and the combined resolution.
+
+All fields of the stamps are the whole digit runs, hence a field is checked by
+a look-up of its digits in the set of all digit strings of the proper length
+fully matching the field pattern of the module Date or Time, e.g. YEAR_PATTERN
+or HOUR_PATTERN.
+
+Patterns:
+    TOKEN_PATTERN - a single token: the digits run, a separator, an a.m. /
+        p.m. marker (case insensitive) or a run of the other characters; the
+        markers are recognized only right after a digit or a digit and a
+        single space, which is a separate token then, since only such markers
+        can be a part of a time stamp
+
+Compiled patterns (compiled on the first use, see Search.LazyPattern):
+    C_TOKEN_PATTERN
+    C_DIGIT - any digit, to skip the strings without digits
+
+Globals:
+    DATE_SEPARATORS - frozenset(str), the separators of the date fields
+    FRACTION_SEPARATORS - frozenset(str), the separators of the fractional
+        part of the seconds
+    YEARS, SHORT_YEARS, MONTHS, DAYS, SCREWED_DAYS, HOURS, MINUTES, SECONDS -
+        frozenset(str), the allowed values of the fields
+    COMPACT_MONTHS, COMPACT_DAYS, COMPACT_HOURS, COMPACT_MINUTES,
+    COMPACT_SECONDS - frozenset(str), the allowed 2 digits values of the
+        fields of the compact stamps
+    DATE_GRAMMAR - tuple(tuple(frozenset(str) x3, tuple(int, int, int))), the
+        allowed values of the three fields of the separated date stamps and
+        the positions of the year, month and day fields, in the order of the
+        priority used by ResolveDate()
+
+Functions:
+    MakeValues()
+        str, tuple(int) -> frozenset(str)
+    Tokenize()
+        str -> list(tuple(str, str, str, str)), int
+    MatchModifier()
+        list(tuple(str, str, str, str)), int, bool -> bool, str OR None
+    MatchDate()
+        list(tuple(str, str, str, str)), int -> tuple(int, int, int) OR None
+    MatchTime()
+        list(tuple(str, str, str, str)), int
+            -> tuple(int, int, int, int, bool) OR None
+    ResolveDateTokens()
+        str -> tuple(int, int, int) OR None
+    ResolveTimeTokens()
+        str -> tuple(int, int, int, int, bool) OR None
+    ResolveDateTimeTokens()
+        str -> tuple(int, int, int, int OR None, int OR None, int OR None,
+                                                    int OR None, bool) OR None
+"""
+
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+
+#imports
+
+#+ standard library
+
+import re
+
+#+ package modules
+
+from .Date import YEAR_PATTERN, MONTH_PATTERN, DAY_PATTERN, \
+                                                        ConvertDateFieldsTuple
+
+from .Time import HOUR_PATTERN, MINUTE_PATTERN, SECOND_PATTERN, \
+                                                        ConvertTimeFieldsTuple
+
+from .Search import LazyPattern
+
+from .Stamp import IncrementDate
+
+#functions
+
+def MakeValues(strPattern, tupleLengths):
+    """
+    Helper function generating the set of all digit strings of the passed
+    lengths, which fully match the passed field pattern, e.g. MONTH_PATTERN.
+    
+    Signature:
+        str, tuple(int) -> frozenset(str)
+    
+    Args:
+        strPattern: str, the field regular expression pattern
+        tupleLengths: tuple(int), the allowed lengths of the field
+    
+    Returns:
+        frozenset(str): the allowed values of the field
+    
+    Version 0.2.0.0
+    """
+    objPattern = re.compile(r"(?:{})$".format(strPattern))
+    setResult = set()
+    for iLength in tupleLengths:
+        for iValue in xrange(10 ** iLength):
+            strValue = '{:0{}}'.format(iValue, iLength)
+            if objPattern.match(strValue):
+                setResult.add(strValue)
+    return frozenset(setResult)
+
+#patterns
+
+TOKEN_PATTERN = r"|".join([r"([0-9]+)", r"([-/_.:,])",
+                        r"((?:(?<=[0-9])|(?<=[0-9] ))[AaPp]\.?[Mm]\.?)",
+                                        r"((?<=[0-9]) |[^-/_.:,0-9]+)"])
+
+#compiled patterns
+
+C_TOKEN_PATTERN = LazyPattern(TOKEN_PATTERN)
+
+C_DIGIT = LazyPattern(r"[0-9]")
+
+#globals
+
+DATE_SEPARATORS = frozenset('-/_.')
+
+FRACTION_SEPARATORS = frozenset('.,')
+
+#+ allowed values of the fields
+
+YEARS = MakeValues(YEAR_PATTERN, (4, ))
+
+SHORT_YEARS = MakeValues(r"[0-9]{2}", (2, ))
+
+MONTHS = MakeValues(MONTH_PATTERN, (1, 2))
+
+DAYS = MakeValues(DAY_PATTERN, (1, 2))
+
+SCREWED_DAYS = frozenset(strDay for strDay in DAYS
+                                        if len(strDay) == 2 and strDay >= '13')
+
+HOURS = MakeValues(HOUR_PATTERN, (1, 2))
+
+MINUTES = MakeValues(MINUTE_PATTERN, (1, 2))
+
+SECONDS = MakeValues(SECOND_PATTERN, (1, 2))
+
+#+ the compact stamps have all fields of exactly 2 digits (except for the year)
+
+COMPACT_MONTHS = frozenset(strItem for strItem in MONTHS if len(strItem) == 2)
+
+COMPACT_DAYS = frozenset(strItem for strItem in DAYS if len(strItem) == 2)
+
+COMPACT_HOURS = frozenset(strItem for strItem in HOURS if len(strItem) == 2)
+
+COMPACT_MINUTES = frozenset(strItem for strItem in MINUTES
+                                                        if len(strItem) == 2)
+
+COMPACT_SECONDS = frozenset(strItem for strItem in SECONDS
+                                                        if len(strItem) == 2)
+
+#+ ISO_DATE, REVERSED_DATE, SCREWED_DATE and SHORT_DATE
+
+DATE_GRAMMAR = ((YEARS, MONTHS, DAYS, (0, 1, 2)),
+                (DAYS, MONTHS, YEARS, (2, 1, 0)),
+                (MONTHS, SCREWED_DAYS, YEARS, (2, 0, 1)),
+                (SHORT_YEARS, MONTHS, DAYS, (0, 1, 2)))
+
+#functions
+
+def Tokenize(strStamp):
+    """
+    Splits the passed string into the tokens. Each token is a tuple of 4
+    strings, with only one of them being not empty: the run of digits, the
+    separator, the a.m. / p.m. marker (as found, not converted to the upper
+    case) or the run of the other characters.
+    
+    A stamp may start not further than right after the first new line
+    character, as with the function Search.SearchLast(), and it cannot contain
+    a new line character, thus the string is tokenized only up to the second
+    new line character. A string without any digits cannot contain a stamp,
+    thus it is not tokenized at all, and the empty list is returned.
+    
+    Signature:
+        str -> list(tuple(str, str, str, str)), int
+    
+    Returns:
+        tuple(list(tuple(str, str, str, str)), int): unpacked tuple, the list
+            of the tokens and the index of the last token, at which a stamp
+            may start
+    
+    Raises:
+        TypeError: if the passed argument is not a string.
+    
+    Version 0.2.0.0
+    """
+    if not isinstance(strStamp, basestring):
+        strError = '{} of {} is not a string'.format(strStamp, type(strStamp))
+        raise TypeError(strError)
+    if C_DIGIT.search(strStamp) is None:
+        return [], -1
+    iLimit = strStamp.find('\n')
+    if iLimit < 0:
+        lstTokens = C_TOKEN_PATTERN.findall(strStamp)
+        iLast = len(lstTokens) - 1
+    else:
+        iLimit += 1
+        lstTokens = C_TOKEN_PATTERN.findall(strStamp, 0, iLimit)
+        iLast = len(lstTokens)
+        iEnd = strStamp.find('\n', iLimit)
+        if iEnd < 0:
+            iEnd = len(strStamp)
+        lstTokens.extend(C_TOKEN_PATTERN.findall(strStamp, iLimit, iEnd))
+    return lstTokens, iLast
+
+def MatchModifier(lstTokens, iIndex, bColon):
+    """
+    Helper function matching the optional a.m. / p.m. modifier (AM_PM_PATTERN
+    of the module Time) starting at the passed token, which follows the
+    minutes or seconds of a time stamp. The modifier is preceded by at most
+    one space, and it is not taken if it is followed by a character not
+    allowed after the stamp (a digit, or also ':' if the flag is True), unless
+    it ends with a dot, which is then left out.
+    
+    Signature:
+        list(tuple(str, str, str, str)), int, bool -> bool, str OR None
+    
+    Args:
+        lstTokens: list(tuple(str, str, str, str)), the tokens of the string
+        iIndex: int, index of the token following the stamp
+        bColon: bool, flag if ':' is not allowed after the stamp
+    
+    Returns:
+        tuple(bool, str OR None): unpacked tuple, the flag if the stamp is
+            matched and the found modifier in the upper case or None
+    
+    Version 0.2.0.0
+    """
+    iTokens = len(lstTokens)
+    if iIndex >= iTokens:
+        return True, None
+    _, strSeparator, strMarker, strOther = lstTokens[iIndex]
+    if strSeparator:
+        return not (bColon and strSeparator == ':'), None
+    if strOther == ' ' and iIndex + 1 < iTokens:
+        iIndex += 1
+        strMarker = lstTokens[iIndex][2]
+    if strMarker and (not strMarker.endswith('.')) and iIndex + 1 < iTokens:
+        strDigits, strSeparator, _, _ = lstTokens[iIndex + 1]
+        if strDigits or (bColon and strSeparator == ':'):
+            strMarker = ''
+    if strMarker:
+        return True, strMarker.upper()
+    return True, None
+
+def MatchDate(lstTokens, iLast):
+    """
+    Matches the date stamp grammars against the tokens in the following order:
+        ISO_DATE, REVERSED_DATE, SCREWED_DATE, SHORT_DATE, COMPACT_DATE
+    
+    The last occurrence of the stamp starting not further than at the passed
+    token index is selected, so the result is the same as of the function
+    ResolveDateTuple() for the tokenized string.
+    
+    Signature:
+        list(tuple(str, str, str, str)), int -> tuple(int, int, int) OR None
+    
+    Args:
+        lstTokens: list(tuple(str, str, str, str)), the tokens of the string
+        iLast: int, index of the last token, at which a stamp may start
+    
+    Returns:
+        tuple(int, int, int): the resolved date stamp as the year, month and
+            day
+        None: none of the grammars is matched
+    
+    Version 0.2.0.0
+    """
+    iTokens = len(lstTokens)
+    lstRuns = [iIndex for iIndex in xrange(min(iLast, iTokens - 1), -1, -1)
+                                                    if lstTokens[iIndex][0]]
+    lstFields = []
+    for iIndex in lstRuns:
+        if (iIndex + 4 < iTokens and
+                    lstTokens[iIndex + 1][1] in DATE_SEPARATORS and
+                            lstTokens[iIndex + 3][1] in DATE_SEPARATORS and
+                                lstTokens[iIndex + 2][0] and
+                                                    lstTokens[iIndex + 4][0]):
+            lstFields.append((lstTokens[iIndex][0], lstTokens[iIndex + 2][0],
+                                                    lstTokens[iIndex + 4][0]))
+    for setFirst, setSecond, setThird, tuplePositions in DATE_GRAMMAR:
+        for tupleFields in lstFields:
+            if (tupleFields[0] in setFirst and tupleFields[1] in setSecond and
+                                                tupleFields[2] in setThird):
+                return ConvertDateFieldsTuple(
+                                        *[tupleFields[iPosition]
+                                            for iPosition in tuplePositions])
+    for iIndex in lstRuns:
+        strDigits = lstTokens[iIndex][0]
+        if (len(strDigits) == 8 and strDigits[:4] in YEARS and
+                                    strDigits[4:6] in COMPACT_MONTHS and
+                                            strDigits[6:] in COMPACT_DAYS):
+            return ConvertDateFieldsTuple(strDigits[:4], strDigits[4:6],
+                                                                strDigits[6:])
+    return None
+
+def MatchTime(lstTokens, iLast):
+    """
+    Matches the time stamp grammars against the tokens in the following order:
+        TIME_PATTERN, SHORT_TIME_PATTERN, COMPACT_TIME_PATTERN,
+        SHORT_COMPACT_TIME_PATTERN
+    
+    The last occurrence of the stamp starting not further than at the passed
+    token index is selected, so the result is the same as of the function
+    ResolveTimeTuple() for the tokenized string.
+    
+    Signature:
+        list(tuple(str, str, str, str)), int
+            -> tuple(int, int, int, int, bool) OR None
+    
+    Args:
+        lstTokens: list(tuple(str, str, str, str)), the tokens of the string
+        iLast: int, index of the last token, at which a stamp may start
+    
+    Returns:
+        tuple(int, int, int, int, bool): the resolved time stamp as the hour,
+            minute, rounded second and microseconds, and the boolean flag if
+            the date must be incremented due to rounding up of the seconds
+        None: if none of the grammars is matched, or the found hour is not
+            compatible with the a.m. / p.m. modifier
+    
+    Version 0.2.0.0
+    """
+    iTokens = len(lstTokens)
+    lstRuns = [iIndex for iIndex in xrange(min(iLast, iTokens - 1), -1, -1)
+                                                    if lstTokens[iIndex][0]]
+    #+ H?H:M?M:S?S
+    for iIndex in lstRuns:
+        if (iIndex + 4 < iTokens and lstTokens[iIndex + 1][1] == ':' and
+                                    lstTokens[iIndex + 3][1] == ':' and
+                                    lstTokens[iIndex][0] in HOURS and
+                                    lstTokens[iIndex + 2][0] in MINUTES and
+                                    lstTokens[iIndex + 4][0] in SECONDS):
+            strSecond = lstTokens[iIndex + 4][0]
+            iNext = iIndex + 5
+            if (iNext + 1 < iTokens and
+                        lstTokens[iNext][1] in FRACTION_SEPARATORS and
+                                                    lstTokens[iNext + 1][0]):
+                strSecond = ''.join([strSecond, lstTokens[iNext][1],
+                                                    lstTokens[iNext + 1][0]])
+                iNext += 2
+            _, strModifier = MatchModifier(lstTokens, iNext, False)
+            return ConvertTimeFieldsTuple(lstTokens[iIndex][0],
+                                lstTokens[iIndex + 2][0], strSecond,
+                                                                strModifier)
+    #+ H?H:M?M, not preceded by ':'
+    for iIndex in lstRuns:
+        if (iIndex + 2 < iTokens and lstTokens[iIndex + 1][1] == ':' and
+                    (iIndex == 0 or lstTokens[iIndex - 1][1] != ':') and
+                                    lstTokens[iIndex][0] in HOURS and
+                                    lstTokens[iIndex + 2][0] in MINUTES):
+            bMatched, strModifier = MatchModifier(lstTokens, iIndex + 3, True)
+            if bMatched:
+                return ConvertTimeFieldsTuple(lstTokens[iIndex][0],
+                                lstTokens[iIndex + 2][0], None, strModifier)
+    #+ HHMMSS
+    for iIndex in lstRuns:
+        strDigits = lstTokens[iIndex][0]
+        if (len(strDigits) == 6 and strDigits[:2] in COMPACT_HOURS and
+                                    strDigits[2:4] in COMPACT_MINUTES and
+                                            strDigits[4:] in COMPACT_SECONDS):
+            return ConvertTimeFieldsTuple(strDigits[:2], strDigits[2:4],
+                                                        strDigits[4:], None)
+    #+ HHMM
+    for iIndex in lstRuns:
+        strDigits = lstTokens[iIndex][0]
+        if (len(strDigits) == 4 and strDigits[:2] in COMPACT_HOURS and
+                                            strDigits[2:] in COMPACT_MINUTES):
+            return ConvertTimeFieldsTuple(strDigits[:2], strDigits[2:], None,
+                                                                        None)
+    return None
+
+def ResolveDateTokens(strStamp):
+    """
+    Resolves the passed date stamp exactly as the function ResolveDateTuple(),
+    but with the date stamp grammars matched against the tokens of the string,
+    see functions Tokenize() and MatchDate().
+    
+    Signature:
+        str -> tuple(int, int, int) OR None
+    
+    Returns:
+        tuple(int, int, int): the resolved date stamp as the year, month and
+            day
+        None: value of none of the patterns is matched.
+    
+    Raises:
+        TypeError: if the passed argument is not a string.
+    
+    Version 0.2.0.0
+    """
+    return MatchDate(*Tokenize(strStamp))
+
+def ResolveTimeTokens(strStamp):
+    """
+    Resolves the passed time stamp exactly as the function ResolveTimeTuple(),
+    but with the time stamp grammars matched against the tokens of the string,
+    see functions Tokenize() and MatchTime().
+    
+    Signature:
+        str -> tuple(int, int, int, int, bool) OR None
+    
+    Returns:
+        tuple(int, int, int, int, bool): the resolved time stamp as the hour,
+            minute, rounded second and microseconds, and the boolean flag if
+            the date must be incremented due to rounding up of the seconds
+        None: if none of the patterns is matched
+    
+    Raises:
+        TypeError: if the passed argument is not a string.
+    
+    Version 0.2.0.0
+    """
+    return MatchTime(*Tokenize(strStamp))
+
+def ResolveDateTimeTokens(strStamp):
+    """
+    Resolves both the date and the time stamps in the passed string exactly as
+    the function ResolveDateTimeTuple() of the module Stamp, but with a single
+    tokenization of the string serving both the date and the time stamp
+    grammars, see functions Tokenize(), MatchDate() and MatchTime().
+    
+    Signature:
+        str -> tuple(int, int, int, int OR None, int OR None, int OR None,
+                                                    int OR None, bool) OR None
+    
+    Returns:
+        tuple(int, int, int, int, int, int, int, bool): the year, month, day,
+            hour, minute, rounded second, microseconds and the boolean flag if
+            the date has been incremented due to rounding up of the seconds
+        tuple(int, int, int, None, None, None, None, bool): the time stamp is
+            not found, the flag is False
+        None: the date stamp is not found
+    
+    Raises:
+        TypeError: if the passed argument is not a string.
+    
+    Version 0.2.0.0
+    """
+    lstTokens, iLast = Tokenize(strStamp)
+    tupleDate = MatchDate(lstTokens, iLast)
+    if tupleDate is None:
+        return None
+    iYear, iMonth, iDay = tupleDate
+    tupleTime = MatchTime(lstTokens, iLast)
+    if tupleTime is None:
+        return iYear, iMonth, iDay, None, None, None, None, False
+    iHour, iMinute, iSecond, iMicrosecond, bIncrementDate = tupleTime
+    if bIncrementDate:
+        iYear, iMonth, iDay = IncrementDate(iYear, iMonth, iDay)
+    return (iYear, iMonth, iDay, iHour, iMinute, iSecond, iMicrosecond,
+                                                                bIncrementDate)
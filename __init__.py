@@ -7,16 +7,34 @@ Regular expression patterns used in the analysis and parsing of the files.
 Modules:
     Date: patterns for the date stamps
     Time: patterns for the time stamps
+    Search: linear time search of the non-digit delimited stamps
+    Cache: bounded memoization of the resolution functions
+    Scanner: streaming resolution of the stamps in the lines of files
+    Stamp: combined single pass resolution of the date and time stamps
+    Crawler: parallel resolution of the stamps in the names of the files
+    Guard: resolution with the bounded work per call for untrusted input
+    Tokens: shared tokenization for the date and time grammars
+    Shape: resolution of the repeated layouts by the remembered placements
+    Adaptive: resolution with the patterns order adapted to the stream
+    Columns: columnar resolution into the numeric buffers
+    Stream: resolution of the stamps in the lines of a network stream
+    Metrics: opt-in instrumentation of the patterns on the hot path
+    Formats: registry of the formats compiled into a single matching engine
+    Encoded: dictionary encoded batch results for the low memory storage
+    Hint: resolution with the positional hint for the uniform log streams
+    Follow: resolution of the stamps in the growing log files with checkpoints
 
-Version 0.1.0.0
+Version 0.2.0.0
 """
 
 __author__ = "Anton Azarov"
 __copyright__ = "(c) 2014-2018 Diagnoptics Technologies B.V."
 __license__ = "GPL"
-__version__ = "0.1.0.0"
-__date__ = "26-10-2018"
+__version__ = "0.2.0.0"
+__date__ = "18-10-2026"
 __status__ = "Development"
 __maintainer__ = "a.azarov@diagnoptics.com"
 
-__all__ = ['Date', 'Time']
\ No newline at end of file
+__all__ = ['Date', 'Time', 'Search', 'Cache', 'Scanner', 'Stamp', 'Crawler',
+'Guard', 'Tokens', 'Shape', 'Adaptive', 'Columns', 'Stream', 'Metrics',
+                                        'Formats', 'Encoded', 'Hint', 'Follow']
\ No newline at end of file